@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+__title__ = "Profile Report"
+__author__ = "Andreea ADAM"
+__version__ = 'Version: 1.0.0'
+__doc__ = """Version = 1.0.0
+Date    = 18.10.2026
+Description:
+Report of all profiled runs of AA-Tools buttons (rotating JSONL log).
+For every button and section: runs, p50/p95 time, average calls and memory (sampled at start/end of a section).
+Counted Revit API calls (GetElement, get_Parameter, Delete, collector passes) are listed per button if available.
+AA-Tools windows are listed as "Dialog: <name>" with open latency:
+"cold" (XAML/styles parsed) and "cached" (reused from the session cache).
+
+How-to:
+-> Run a profiled button a few times (e.g. Batch Replace (Types))
+-> Click the button
+-> Shift+Click to clear the log
+
+Last update:
+- [18.10.2026] - V1.0.0 RELEASE
+- [18.10.2026] - Dialog open latency (cold/cached)
+Author: Andreea ADAM - https://github.com/AA-42
+Repository URL: https://github.com/AA-42/AA-Tools.git
+"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import os
+from pyrevit import forms, EXEC_PARAMS
+from Snippets._profiling import print_report, get_log_path, LOG_BACKUPS
+
+
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    log_path = get_log_path()
+
+    if EXEC_PARAMS.config_mode:
+        if forms.alert('Clear profile log?\n{}'.format(log_path), yes=True, no=True):
+            for path in [log_path] + ['{}.{}'.format(log_path, n) for n in range(1, LOG_BACKUPS + 1)]:
+                if os.path.exists(path):
+                    os.remove(path)
+    else:
+        print_report(log_path)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+__title__ = "Batch Process"
+__author__ = "Andreea ADAM"
+__version__ = 'Version: 1.1.0'
+__doc__ = """Version = 1.1.0
+Date    = 18.10.2026
+Description:
+Run an AA-Tools operation (Batch Rename Types, Remove All Imports&Links, Resave...)
+on many project and family files. Files are opened in the background without UI
+(workshared files are detached), saved and closed one by one.
+Progress is written to a journal after every file - if Revit crashes, run the same
+operation on the same files again to resume where it stopped.
+Read-only operations (Audit/Plan) don't save files.
+Workshared files are never overwritten (central models) - save copies to a folder.
+
+How-to:
+- Select an operation
+- Select a folder or files
+- Select whether original files are overwritten or copies are saved to another folder
+
+Last update:
+- [18.10.2026]
+- [18.10.2026] Read-only operations skip saving
+- [19.10.2026] Workshared files are not overwritten
+Author: Andreea ADAM - https://github.com/AA-42
+Repository URL: https://github.com/AA-42/AA-Tools.git
+"""
+
+# IMPORTS
+#====================================================================================================
+from pyrevit import forms
+
+from Snippets._batch import (OPERATIONS, BatchJournal, BatchProcessor, RevitOpener,
+                             collect_files, get_journal_path, print_batch_report)
+
+# VARIABLES
+#====================================================================================================
+app = __revit__.Application
+
+# MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    # OPERATION
+    operation_name = forms.CommandSwitchWindow.show(list(OPERATIONS), message='Select Operation:')
+    if not operation_name:
+        forms.alert('No operation was selected. Please Try Again.', exitscript=True)
+
+    # FILES
+    source = forms.CommandSwitchWindow.show(['Folder', 'Files'], message='Process Revit files from:')
+    if source == 'Folder':
+        folder = forms.pick_folder()
+        files  = collect_files(folder) if folder else []
+    elif source == 'Files':
+        files  = forms.pick_file(files_filter='Revit Files (*.rvt, *.rfa)|*.rvt;*.rfa', multi_file=True) or []
+        files  = collect_files(list(files))
+    else:
+        files = []
+
+    if not files:
+        forms.alert('No Revit files were selected. Please Try Again.', exitscript=True)
+
+    # OUTPUT
+    operation = OPERATIONS[operation_name]
+    save_mode = None if operation.read_only else \
+                forms.CommandSwitchWindow.show(['Overwrite Original Files', 'Save Copies to Folder'],
+                                               message='Save processed files:')
+    if not save_mode and not operation.read_only:
+        forms.alert('No save option was selected. Please Try Again.', exitscript=True)
+    output_folder = forms.pick_folder() if save_mode == 'Save Copies to Folder' else None
+    if save_mode == 'Save Copies to Folder' and not output_folder:
+        forms.alert('No output folder was selected. Please Try Again.', exitscript=True)
+
+    # RESUME
+    journal = BatchJournal(get_journal_path(operation_name, files))
+    done    = sum(1 for f in files if journal.status(f) == 'done')
+    if done and not forms.alert('This job was already started: {}/{} files are done.'.format(done, len(files)),
+                                sub_msg='Yes - Resume (skip done files)\nNo - Start over', yes=True, no=True):
+        journal.reset()
+
+    # RUN
+    processor = BatchProcessor(RevitOpener(app, output_folder=output_folder), operation, journal,
+                               save=not operation.read_only)
+    with forms.ProgressBar(title='{} ({{value}} of {{max_value}})'.format(operation_name), cancellable=True) as pb:
+        results = processor.run(files, progress=pb)
+
+    print_batch_report(results, title=operation_name)
@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
 __title__ = "Batch Rename Families"
 __author__ = "Andreea ADAM"
-__version__ = 'Version: 1.0.0'
-__doc__ = """Version = 1.0.0
+__version__ = 'Version: 1.1.0'
+__doc__ = """Version = 1.1.0
 Date    = 28.10.2024
 Description:
 Batch rename Revit families based on a predefined mapping dictionary.
+All names are evaluated on every run (only Batch Rename FamilyTypes skips types
+that are unchanged since the last run). Only changed names are renamed.
 
 Last update:
 - [31.10.2024]
+- [19.10.2026] Mapping is read from lib/Renaming/replace_words.json (same as other Batch Replace buttons)
 Author: Andreea ADAM - https://github.com/AA-42
 Repository URL: https://github.com/AA-42/AA-Tools.git
 """
@@ -16,105 +19,17 @@ Repository URL: https://github.com/AA-42/AA-Tools.git
 # IMPORTS
 #====================================================================================================
 from Autodesk.Revit.DB import FilteredElementCollector, Transaction
-import re
 from System import Exception  # General Exception to catch errors in IronPython
+from Snippets._renaming import load_mapping, WordReplacer
 
 # REPLACEMENT DICTIONARY
 #====================================================================================================
-replacements = {
-    'ROYAL': '-',
-    'PRINCE': '-',
-    'CPPA': 'THE CLIENT',
-    'CPPO': 'THE CLIENT',
-    'INVITED PERSONS': 'VIP GUESTS',
-    'FRIENDS': 'VIP GUESTS',
-    'INHABITED CANYON USERS': 'GUESTS',
-    'INHABITED CANYONS USERS': 'GUESTS',
-    'CLUB': 'LOUNGE AREA',
-    'DISCOTHEQUE': 'ENTERTAINMENT AREA',
-    'DANCING AREA': 'GATHERING SPACE',
-    'NIGHTCLUB': 'GATHERING SPACE',
-    'MUSIC STAGE': 'PERFORMANCE STAGE',
-    'DANCING': '-',
-    'JUICE BAR': 'REFRESHMENT AREA',
-    'BAR': 'REFRESHMENT AREA',
-    'COCKTAIL BAR': 'REFRESHMENT AREA',
-    'COCKTAIL': 'REFRESHMENT AREA',
-    'DRINKS': 'BEVERAGES',
-    'MUSIC LOUNGE': 'GATHERING SPACE',
-    'MUSIC': '-',
-    'DJ': 'TECHNICAL STATION',
-    'RESTAURANT': 'DINING AREA',
-    # Case-insensitive mappings
-    'royal': '-',
-    'Royal': '-',
-    'prince': '-',
-    'Prince': '-',
-    'cppa': 'THE CLIENT',
-    'Cppa': 'THE CLIENT',
-    'cppo': 'THE CLIENT',
-    'Cppo': 'THE CLIENT',
-    'invited persons': 'VIP GUESTS',
-    'Invited persons': 'VIP GUESTS',
-    'Invited Persons': 'VIP GUESTS',
-    'friends': 'VIP GUESTS',
-    'Friends': 'VIP GUESTS',
-    'inhabited canyon users': 'GUESTS',
-    'Inhabited canyon users': 'GUESTS',
-    'Inhabited Canyon Users': 'GUESTS',
-    'inhabited canyons users': 'GUESTS',
-    'Inhabited canyons users': 'GUESTS',
-    'Inhabited Canyons Users': 'GUESTS',
-    'club': 'LOUNGE AREA',
-    'Club': 'LOUNGE AREA',
-    'discotheque': 'ENTERTAINMENT AREA',
-    'Discotheque': 'ENTERTAINMENT AREA',
-    'dancing area': 'GATHERING SPACE',
-    'Dancing area': 'GATHERING SPACE',
-    'Dancing Area': 'GATHERING SPACE',
-    'nightclub': 'GATHERING SPACE',
-    'Nightclub': 'GATHERING SPACE',
-    'music stage': 'PERFORMANCE STAGE',
-    'Music stage': 'PERFORMANCE STAGE',
-    'Music Stage': 'PERFORMANCE STAGE',
-    'dancing': '-',
-    'Dancing': '-',
-    'juice bar': 'REFRESHMENT AREA',
-    'Juice bar': 'REFRESHMENT AREA',
-    'Juice Bar': 'REFRESHMENT AREA',
-    'bar': 'REFRESHMENT AREA',
-    'Bar': 'REFRESHMENT AREA',
-    'cocktail bar': 'REFRESHMENT AREA',
-    'Cocktail bar': 'REFRESHMENT AREA',
-    'Cocktail Bar': 'REFRESHMENT AREA',
-    'cocktail': 'REFRESHMENT AREA',
-    'Cocktail': 'REFRESHMENT AREA',
-    'drinks': 'BEVERAGES',
-    'Drinks': 'BEVERAGES',
-    'music lounge': 'GATHERING SPACE',
-    'Music lounge': 'GATHERING SPACE',
-    'Music Lounge': 'GATHERING SPACE',
-    'music': '-',
-    'Music': '-',
-    'dj': 'TECHNICAL STATION',
-    'Dj': 'TECHNICAL STATION',
-    'restaurant': 'DINING AREA',
-    'Restaurant': 'DINING AREA'
-}
+# Shared by all Batch Replace buttons: lib/Renaming/replace_words.json
+# Words are matched case-insensitive, "-" removes the word (same in all Batch Replace buttons).
+replace_words = WordReplacer(load_mapping())
 
 # FUNCTION
 #====================================================================================================
-# Function to replace words with whole word matching
-def replace_words(text, replacements):
-    for old_word, new_word in replacements.items():
-        # Use a regex pattern to replace only whole words
-        pattern = r'\b' + re.escape(old_word) + r'\b'
-        if new_word == '-':
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        else:
-            text = re.sub(pattern, new_word, text, flags=re.IGNORECASE)
-    return text.strip()
-
 # Function to validate name (avoiding prohibited characters like '[]{}:;,' in Revit)
 def is_valid_name(name):
     prohibited_chars = '[]{}:;,'  # Add any other prohibited characters here
@@ -145,7 +60,7 @@ with Transaction(doc, "Batch Rename Families") as trans:
     for element in elements:
         if hasattr(element, "Name"):
             original_name = element.Name
-            new_name = replace_words(original_name, replacements)
+            new_name = replace_words(original_name)
             if new_name != original_name:
                 if safe_rename(element, new_name):
                     print('Renamed: {} -> {}'.format(original_name, new_name))
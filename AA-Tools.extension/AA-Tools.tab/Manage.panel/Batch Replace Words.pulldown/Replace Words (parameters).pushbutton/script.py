@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+__title__ = "Batch Replace Parameters"
+__author__ = "Andreea ADAM"
+__version__ = 'Version: 1.0.0'
+__doc__ = """Version = 1.0.0
+Date    = 18.10.2026
+Description:
+Batch replace words in text parameters (Comments, Mark, sheet parameters, shared parameters...)
+based on the mapping shared by all Batch Replace buttons (lib/Renaming/replace_words.json).
+Words are matched case-insensitive, "-" removes the word (same in all Batch Replace buttons).
+Only changed values are written, in chunks with a single Undo.
+All values are evaluated on every run - elements and parameters can differ between runs,
+so there is no saved state like in Batch Rename FamilyTypes.
+
+How-to:
+- Select elements (or nothing to use all elements in the model)
+- Type parameter names separated by commas (or BuiltInParameter names, e.g. ALL_MODEL_MARK)
+
+Last update:
+- [18.10.2026]
+- [19.10.2026] Same mapping meaning as other Batch Replace buttons
+Author: Andreea ADAM - https://github.com/AA-42
+Repository URL: https://github.com/AA-42/AA-Tools.git
+"""
+
+# IMPORTS
+#====================================================================================================
+from Autodesk.Revit.DB import *
+from pyrevit import forms, script
+
+from Snippets._parameters import ParameterBatchEditor
+from Snippets._renaming import load_mapping
+
+# VARIABLES
+#====================================================================================================
+uidoc  = __revit__.ActiveUIDocument
+doc    = __revit__.ActiveUIDocument.Document
+output = script.get_output()
+
+MAX_ROWS = 500  # Max amount of changes printed in the report
+
+# MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    # GET ELEMENTS
+    elements = [doc.GetElement(el_id) for el_id in uidoc.Selection.GetElementIds()]
+    if not elements:
+        elements = list(FilteredElementCollector(doc).WhereElementIsNotElementType())
+
+    # GET PARAMETERS
+    names = forms.ask_for_string(default='Comments, Mark', prompt='Parameter names (separated by commas):',
+                                 title=__title__)
+    targets = [name.strip() for name in (names or '').split(',') if name.strip()]
+    if not targets:
+        forms.alert('No parameters were given. Please Try Again.', exitscript=True)
+
+    # PLAN
+    editor  = ParameterBatchEditor(doc, elements, targets)
+    changes = editor.plan_replace(load_mapping())
+    if editor.missing:
+        print('Parameters not found: {}'.format(', '.join(editor.missing)))
+    if not changes:
+        forms.alert('Nothing to replace in {} elements.'.format(len(elements)), exitscript=True)
+
+    if not forms.alert('{} values will be changed. Continue?'.format(len(changes)), yes=True, no=True):
+        script.exit()
+
+    # APPLY
+    failed = editor.apply(changes, title=__title__)
+    failed = set((p.Element.Id, target) for target, p, _, _ in failed)
+
+    # REPORT
+    rows = [[output.linkify(p.Element.Id), target, old_value, new_value,
+             'Failed' if (p.Element.Id, target) in failed else 'Changed']
+            for target, p, old_value, new_value in changes[:MAX_ROWS]]
+    output.print_table(table_data=rows, title='{} changed, {} failed'.format(len(changes) - len(failed), len(failed)),
+                       columns=['Element', 'Parameter', 'Old Value', 'New Value', 'Status'])
+    if len(changes) > MAX_ROWS:
+        print('Only first {} of {} changes are listed.'.format(MAX_ROWS, len(changes)))
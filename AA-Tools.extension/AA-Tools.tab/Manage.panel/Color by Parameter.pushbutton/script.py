@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+__title__ = "Color by Parameter"
+__author__ = "Andreea ADAM"
+__version__ = 'Version: 1.0.0'
+__doc__ = """Version = 1.0.0
+Date    = 18.10.2026
+Description:
+Override elements in the active view with a color per distinct parameter value.
+
+How-to:
+- Select elements (or nothing to use all elements visible in the active view)
+- Type a parameter name (instance or type parameter)
+
+Last update:
+- [18.10.2026]
+Author: Andreea ADAM - https://github.com/AA-42
+Repository URL: https://github.com/AA-42/AA-Tools.git
+"""
+
+# IMPORTS
+#====================================================================================================
+from Autodesk.Revit.DB import *
+from pyrevit import forms, script
+
+from Snippets._overrides import color_elements_by_parameter
+
+# VARIABLES
+#====================================================================================================
+uidoc  = __revit__.ActiveUIDocument
+doc    = __revit__.ActiveUIDocument.Document
+view   = doc.ActiveView
+output = script.get_output()
+
+# MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    # GET ELEMENTS
+    elements = [doc.GetElement(el_id) for el_id in uidoc.Selection.GetElementIds()]
+    if not elements:
+        elements = [el for el in FilteredElementCollector(doc, view.Id).WhereElementIsNotElementType().ToElements()
+                    if el.Category and el.Category.CategoryType == CategoryType.Model]
+
+    if not elements:
+        forms.alert('No elements found in the active view.', title=__title__, exitscript=True)
+
+    # GET PARAMETER NAME
+    param_name = forms.ask_for_string(default='Comments', prompt='Parameter Name:', title=__title__)
+    if not param_name:
+        script.exit()
+
+    # COLOR ELEMENTS
+    palette, failed = color_elements_by_parameter(doc, view, elements, param_name)
+
+    # REPORT
+    table = [['<span style="background-color:rgb({},{},{})">&nbsp;&nbsp;&nbsp;&nbsp;</span>'.format(c.Red, c.Green, c.Blue),
+              value if value is not None else '<None>']
+             for value, c in sorted(palette.items(), key=lambda x: (x[0] is None, x[0]))]
+    output.print_table(table_data=table, title='{}: {} values'.format(param_name, len(palette)), columns=['Color', 'Value'])
+
+    if failed:
+        print('{} elements could not be overridden.'.format(len(failed)))
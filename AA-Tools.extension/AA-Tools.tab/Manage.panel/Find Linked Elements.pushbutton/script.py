@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+__title__ = "Find Linked Elements"
+__author__ = "Andreea ADAM"
+__version__ = 'Version: 1.0.0'
+__doc__ = """Version = 1.0.0
+Date    = 18.10.2026
+Description:
+Find elements of all loaded Revit links that are near or inside selected host elements.
+BoundingBoxes of linked elements are read once per link (in host coordinates) and reused
+until the link is reloaded or moved, so repeated queries are fast.
+
+How-to:
+- Select host elements (Rooms, Walls, Equipment...)
+- Select Near or Inside
+- Type a tolerance in feet (Near only)
+
+Last update:
+- [18.10.2026]
+Author: Andreea ADAM - https://github.com/AA-42
+Repository URL: https://github.com/AA-42/AA-Tools.git
+"""
+
+# IMPORTS
+#====================================================================================================
+import time
+
+from pyrevit import forms, script
+
+from Snippets._links import LinkedElementIndex
+from Snippets._selection import get_selected_elements
+
+# VARIABLES
+#====================================================================================================
+uidoc  = __revit__.ActiveUIDocument
+doc    = __revit__.ActiveUIDocument.Document
+output = script.get_output()
+
+# MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    elements = get_selected_elements(uidoc)
+
+    mode = forms.CommandSwitchWindow.show(['Near', 'Inside'], message='Find linked elements:')
+    if not mode:
+        script.exit()
+
+    tolerance = 0.0
+    if mode == 'Near':
+        value = forms.ask_for_string(default='0.5', prompt='Tolerance [ft]:', title=__title__)
+        if value is None:
+            script.exit()
+        try:
+            tolerance = float(value.replace(',', '.'))
+        except ValueError:
+            forms.alert('Tolerance has to be a number.', title=__title__, exitscript=True)
+
+    # INDEX
+    start = time.time()
+    index = LinkedElementIndex(doc)
+    if not index.links:
+        forms.alert('There are no loaded Revit links.', title=__title__, exitscript=True)
+    index_time = time.time() - start
+
+    # QUERY
+    start = time.time()
+    table = []
+    for el in elements:
+        hits = index.near(el, tolerance) if mode == 'Near' else index.inside(el)
+        for hit in hits:
+            linked = hit.element
+            table.append([output.linkify(el.Id), hit.link.Name,
+                          linked.Category.Name if linked.Category else '', linked.Name, hit.element_id.IntegerValue])
+    query_time = time.time() - start
+
+    output.print_table(table_data=table, title='{}: {} linked elements'.format(mode, len(table)),
+                       columns=['Host Element', 'Link', 'Category', 'Name', 'Linked Id'])
+    print('Indexed {} linked elements in {:.2f}s, queried {} host elements in {:.2f}s.'.format(
+        len(index), index_time, len(elements), query_time))
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+__title__ = "Floors&Ceilings from Rooms"
+__author__ = "Andreea ADAM"
+__version__ = 'Version: 1.1.0'
+__persistentengine__ = True     # Modeless window calls back into this script
+__doc__ = """Version = 1.1.0
+Date    = 18.10.2026
+Description:
+Create Floors or Ceilings from selected Rooms in bulk.
+Warnings (overlaps, joins...) are collected and shown in a summary
+with per-room failures instead of blocking Revit dialogs.
+
+The window stays open: select other Rooms in Revit, change Type/Offset
+and click Create again. Types are collected only once.
+
+How-to:
+- Select Rooms
+- Choose Floor/Ceiling Type and Offset
+- Click Create and review the summary
+- Select more Rooms and repeat, close the window when done
+
+Last update:
+- [18.10.2026] Modeless window (ExternalEvent), Rooms are taken from current selection on every run
+- [18.10.2026]
+Author: Andreea ADAM - https://github.com/AA-42
+Repository URL: https://github.com/AA-42/AA-Tools.git
+"""
+
+# IMPORTS
+#====================================================================================================
+from Autodesk.Revit.DB import *
+from Autodesk.Revit.DB.Architecture import Room
+from pyrevit import forms
+
+# .NET
+import clr
+clr.AddReference('System')
+from System.Collections.Generic import List
+
+from GUI.Tools.CreateFromRooms import CreateFromRooms
+from Snippets._selection       import get_selected_rooms
+from Snippets._floors          import CreateFromRoomsBatch
+
+# VARIABLES
+#====================================================================================================
+uidoc = __revit__.ActiveUIDocument
+doc   = __revit__.ActiveUIDocument.Document
+
+# FUNCTIONS
+#====================================================================================================
+def create_from_selected_rooms(doc, element_type, offset):
+    """Function to create Floors/Ceilings from currently selected Rooms. Executed by ExternalEvent."""
+    if element_type.Document.Title != doc.Title:
+        forms.alert('Types were collected in another project. Please restart the tool.', title=__title__)
+        return
+
+    selection = __revit__.ActiveUIDocument.Selection
+    rooms     = [doc.GetElement(e_id) for e_id in selection.GetElementIds()]
+    rooms     = [r for r in rooms if type(r) == Room]
+    if not rooms:
+        forms.alert('No Rooms are selected.\nSelect Rooms in Revit and click Create again.', title=__title__)
+        return
+
+    batch = CreateFromRoomsBatch(doc, rooms, element_type, offset)
+    batch.create()
+    batch.print_summary()
+    return batch
+
+# MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    # GET ROOMS (first run uses them, later runs use current selection)
+    rooms = get_selected_rooms(uidoc, exitscript=True)
+    uidoc.Selection.SetElementIds(List[ElementId]([r.Id for r in rooms]))
+
+    # GET TYPES
+    floor_types   = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Floors).WhereElementIsElementType().ToElements()
+    ceiling_types = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Ceilings).WhereElementIsElementType().ToElements()
+
+    dict_types = {}
+    dict_types.update({'Floor: {}'.format(Element.Name.GetValue(t)): t for t in floor_types})
+    dict_types.update({'Ceiling: {}'.format(Element.Name.GetValue(t)): t for t in ceiling_types})
+
+    # SELECT TYPE + OFFSET -> CREATE (modeless, every click runs create_from_selected_rooms)
+    GUI = CreateFromRooms(items=dict_types, title=__title__, version=__version__,
+                          on_create=create_from_selected_rooms)
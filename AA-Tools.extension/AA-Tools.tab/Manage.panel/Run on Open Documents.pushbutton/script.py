@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+__title__ = "Run on Open Documents"
+__author__ = "Andreea ADAM"
+__version__ = 'Version: 1.0.0'
+__doc__ = """Version = 1.0.0
+Date    = 18.10.2026
+Description:
+Run an AA-Tools operation on all documents that are open in Revit and on
+documents of loaded Revit links, one after another, with a single report.
+Read-only operations (Audit/Plan) run on all documents. Operations that
+modify the model run only on editable documents - linked and read-only
+documents are skipped. Nothing is saved or closed.
+
+How-to:
+- Select an operation
+- Select whether documents of loaded links are included
+- Check the report (status and time per document)
+
+Last update:
+- [18.10.2026]
+Author: Andreea ADAM - https://github.com/AA-42
+Repository URL: https://github.com/AA-42/AA-Tools.git
+"""
+
+# IMPORTS
+#====================================================================================================
+from pyrevit import forms
+
+from Snippets._batch import OPERATIONS, DocumentRunner, get_documents, print_documents_report
+
+# VARIABLES
+#====================================================================================================
+app = __revit__.Application
+
+# MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    # OPERATION
+    operation_name = forms.CommandSwitchWindow.show(list(OPERATIONS), message='Select Operation:')
+    if not operation_name:
+        forms.alert('No operation was selected. Please Try Again.', exitscript=True)
+    operation = OPERATIONS[operation_name]
+
+    # DOCUMENTS
+    include_links = forms.alert('Include documents of loaded Revit links?',
+                                sub_msg='Linked documents are read-only - only Audit/Plan operations run on them.',
+                                yes=True, no=True)
+    documents = get_documents(app, links=include_links)
+    if not documents:
+        forms.alert('There are no open documents.', exitscript=True)
+
+    # RUN
+    runner = DocumentRunner(operation)
+    with forms.ProgressBar(title='{} ({{value}} of {{max_value}})'.format(operation_name), cancellable=True) as pb:
+        results = runner.run(documents, progress=pb)
+
+    print_documents_report(results, title=operation_name)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+__title__ = "Model Health"
+__author__ = "Andreea ADAM"
+__version__ = 'Version: 1.0.0'
+__doc__ = """Version = 1.0.0
+Date    = 18.10.2026
+Description:
+Model health dashboard: warnings, CAD imports/links, in-place families,
+unplaced/redundant rooms, views not on sheets, groups and file size.
+All metrics are collected with a single pass over the model.
+Results are reused until the document is saved again, so opening the dashboard
+again is instant. Every new result is added to a time series of the document,
+which is shown as a trend chart.
+
+How-to:
+- Click to show the dashboard
+- Shift+Click to collect metrics again (e.g. after changes that were not saved yet)
+
+Last update:
+- [18.10.2026]
+Author: Andreea ADAM - https://github.com/AA-42
+Repository URL: https://github.com/AA-42/AA-Tools.git
+"""
+
+# IMPORTS
+#====================================================================================================
+from pyrevit import script, EXEC_PARAMS
+
+from Snippets._health import get_model_health, read_history
+
+# VARIABLES
+#====================================================================================================
+doc    = __revit__.ActiveUIDocument.Document
+output = script.get_output()
+
+TREND_METRICS = ['Warnings', 'CAD Imports', 'In-Place Families', 'Not Enclosed/Redundant Rooms',
+                 'Views not on Sheets', 'Unused Group Types']
+TREND_RECORDS = 30
+
+# MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    record, source = get_model_health(doc, refresh=EXEC_PARAMS.config_mode)
+    history        = read_history(doc)
+
+    # PREVIOUS RECORD
+    previous = None
+    for old in reversed(history):
+        if old != record:
+            previous = dict(old['metrics'])
+            break
+
+    # DASHBOARD
+    table = []
+    for name, value in record['metrics']:
+        old    = previous.get(name) if previous else None
+        change = value - old if isinstance(value, (int, float)) and isinstance(old, (int, float)) else ''
+        table.append([name, value if value is not None else '-', old if old is not None else '-',
+                      '{:+g}'.format(change) if change else ''])
+    output.print_table(table_data=table, title='Model Health: {}'.format(record['document']),
+                       columns=['Metric', 'Value', 'Previous', 'Change'])
+
+    if source == 'collected':
+        print('Collected in {:.2f}s.'.format(record['seconds']))
+    else:
+        print('Cached result from {} (document was not saved since). Shift+Click to refresh.'.format(record['time']))
+
+    # TREND
+    records = history[-TREND_RECORDS:]
+    if len(records) > 1:
+        chart             = output.make_line_chart()
+        chart.data.labels = [r['time'] for r in records]
+        for name in TREND_METRICS:
+            dataset      = chart.data.new_dataset(name)
+            dataset.data = [dict(r['metrics']).get(name) for r in records]
+        chart.draw()
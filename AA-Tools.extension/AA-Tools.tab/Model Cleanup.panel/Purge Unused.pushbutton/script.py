@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+__title__ = "Purge Unused"
+__author__ = "Andreea ADAM"
+__version__ = 'Version: 1.1.0'
+__doc__ = """Version = 1.1.0
+Date    = 18.10.2026
+Description:
+Find unused Families, Types, View Templates, Filters, Line Patterns and Materials
+with a single pass over the model (instances, types, views and categories are read once)
+and delete the selected ones with a single bulk delete (one Undo).
+Line patterns used in category overrides (V/G) of View Templates are kept as well.
+Selected line patterns are searched in category/element overrides of all views before they are deleted.
+
+How-to:
+- Check the report of unused elements
+- Select elements to delete
+
+Last update:
+- [18.10.2026]
+- [19.10.2026] Overrides of all views are searched only for selected line patterns (faster analysis)
+Author: Andreea ADAM - https://github.com/AA-42
+Repository URL: https://github.com/AA-42/AA-Tools.git
+"""
+
+# IMPORTS
+#====================================================================================================
+import time
+
+from Autodesk.Revit.DB import Element, ElementType, LinePatternElement
+from pyrevit import forms, script
+
+from GUI.forms import select_from_dict
+from Snippets._purge import PurgeAnalyzer, delete_elements
+
+# VARIABLES
+#====================================================================================================
+doc    = __revit__.ActiveUIDocument.Document
+output = script.get_output()
+
+# MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    # ANALYZE
+    start    = time.time()
+    analyzer = PurgeAnalyzer(doc)
+    unused   = analyzer.analyze()
+    seconds  = time.time() - start
+
+    table = [[kind, len(elements)] for kind, elements in unused.items()]
+    table.append(['Total', analyzer.count])
+    output.print_table(table_data=table, title='Unused Elements ({:.2f}s)'.format(seconds),
+                       columns=['Kind', 'Unused'], last_line_style='font-weight:bold;')
+
+    if not analyzer.count:
+        forms.alert('There are no unused elements in the model.', title=__title__, exitscript=True)
+
+    # SELECT
+    dict_unused = {}
+    for kind, elements in unused.items():
+        for el in elements:
+            name = Element.Name.GetValue(el)
+            if isinstance(el, ElementType) and el.FamilyName:
+                name = '{} - {}'.format(el.FamilyName, name)
+            dict_unused['{}: {} [{}]'.format(kind, name, el.Id.IntegerValue)] = el
+
+    selected = select_from_dict(dict_unused, title=__title__, label='Select Elements to Delete:',
+                                button_name='Delete', version=__version__)
+    if not selected:
+        script.exit()
+
+    # KEEP LINE PATTERNS USED IN OVERRIDES OF VIEWS
+    patterns = [el for el in selected if isinstance(el, LinePatternElement)]
+    if patterns:
+        kept_ids = set(p.Id for p in analyzer.find_overridden_patterns(patterns))
+        if kept_ids:
+            print('{} line patterns are used in overrides (V/G) of views and were kept.'.format(len(kept_ids)))
+            selected = [el for el in selected if el.Id not in kept_ids]
+
+    # DELETE
+    deleted = delete_elements(doc, selected, title=__title__)
+    print('Deleted {} elements.'.format(deleted))
@@ -1,28 +1,24 @@
 # -*- coding: utf-8 -*-
 __title__ = "Remove All CAD Imports"
 __author__ = "Andreea ADAM"
-__version__ = 'Version: 1.0.0'
-__doc__ = """Version = 1.0.0
+__version__ = 'Version: 1.1.0'
+__doc__ = """Version = 1.1.0
 Date    = 31.10.2024
 Description:
-Batch rename Revit element types based on a predefined mapping dictionary.
+Remove all Revit links (instances and types) and CAD link types from the model.
+Elements owned by other users in workshared models are skipped and reported.
 
 Last update:
 - [31.10.2024]
+- [19.10.2026] Report amount of removed and skipped links instead of "all removed".
 Author: Andreea ADAM - https://github.com/AA-42
 Repository URL: https://github.com/AA-42/AA-Tools.git
 """
 
 # IMPORTS
 #====================================================================================================
-from pyrevit import script
-from Autodesk.Revit.DB import (
-    FilteredElementCollector,
-    RevitLinkInstance,
-    RevitLinkType,
-    CADLinkType,
-    Transaction
-)
+from pyrevit import script, forms
+from Snippets._links import remove_all_links
 
 # VARIABLES
 #====================================================================================================
@@ -31,30 +27,17 @@ doc = __revit__.ActiveUIDocument.Document
 
 # FUNCTION
 #====================================================================================================
-# Start a PyRevit transaction
-with Transaction(doc, "Remove All Links") as t:
-    t.Start()
-
-    # Collect all Revit link instances and types in the model
-    revit_link_instances = FilteredElementCollector(doc).OfClass(RevitLinkInstance).ToElements()
-    revit_link_types = FilteredElementCollector(doc).OfClass(RevitLinkType).ToElements()
-    
-    # Collect all CAD link types in the model
-    cad_link_types = FilteredElementCollector(doc).OfClass(CADLinkType).ToElements()
-
-    # Remove all Revit link instances
-    for link_instance in revit_link_instances:
-        doc.Delete(link_instance.Id)
-    
-    # Remove all Revit link types
-    for link_type in revit_link_types:
-        doc.Delete(link_type.Id)
-
-    # Remove all CAD link types
-    for cad_type in cad_link_types:
-        doc.Delete(cad_type.Id)
-
-    t.Commit()
+# Remove all Revit link instances, Revit link types and CAD link types
+# (checked out at once in workshared models, elements owned by other users are skipped)
+blocked = {}
+try:
+    deleted = remove_all_links(doc, blocked=blocked)
+except Exception as e:
+    forms.alert(str(e), title=__title__, exitscript=True)
 
 # Notify the user
-script.get_logger().info("All Revit and CAD links have been removed from the model.")
+if blocked:
+    script.get_logger().warning("{} Revit and CAD links have been removed. "
+                                "{} links are owned by other users and were skipped.".format(deleted, len(blocked)))
+else:
+    script.get_logger().info("{} Revit and CAD links have been removed from the model.".format(deleted))
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+__title__ = "Warnings Analyzer"
+__author__ = "Andreea ADAM"
+__version__ = 'Version: 1.1.0'
+__persistentengine__ = True     # Modeless window calls back into this script
+__doc__ = """Version = 1.1.0
+Date    = 18.10.2026
+Description:
+Triage model warnings. All warnings are read once and grouped by warning type
+(failure definition), with an index of elements behind every warning.
+
+How-to:
+- Check the report of warning types
+- Select Elements: pick warning types, their elements are selected in Revit.
+  The window stays open, so you can check other warning types and select again.
+- By Level / By Workset: amount of warnings of every type per Level/Workset
+- Export CSV: one row per warning and element
+
+Last update:
+- [18.10.2026]
+- [19.10.2026] Modeless Select Elements window
+Author: Andreea ADAM - https://github.com/AA-42
+Repository URL: https://github.com/AA-42/AA-Tools.git
+"""
+
+# IMPORTS
+#====================================================================================================
+import time
+
+from Autodesk.Revit.DB import ElementId
+from pyrevit import forms, script
+from System.Collections.Generic import List
+
+from GUI.forms import select_from_dict
+from Snippets._warnings import WarningsIndex
+
+# VARIABLES
+#====================================================================================================
+uidoc  = __revit__.ActiveUIDocument
+doc    = __revit__.ActiveUIDocument.Document
+output = script.get_output()
+
+# FUNCTIONS
+#====================================================================================================
+def select_warning_elements(doc, keys):
+    """Function to select elements of given warning types in Revit. Executed by ExternalEvent."""
+    # Same title can be open twice (e.g. detached copy) - compare the documents themselves
+    if not index.doc.IsValidObject or not doc.Equals(index.doc):
+        forms.alert('Warnings were read in another project. Please restart the tool.', title=__title__)
+        return
+
+    element_ids = [el_id for key in keys for el_id in index.get_element_ids(key)
+                   if doc.GetElement(el_id) is not None]
+    __revit__.ActiveUIDocument.Selection.SetElementIds(List[ElementId](element_ids))
+    print('Selected {} elements.'.format(len(element_ids)))
+
+# MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    # INDEX
+    start = time.time()
+    index = WarningsIndex(doc)
+    if not len(index):
+        forms.alert('There are no warnings in the model.', title=__title__, exitscript=True)
+
+    table = [[len(indexes), len(index.get_element_ids(key)), index.get_description(key)]
+             for key, indexes in index.groups.items()]
+    output.print_table(table_data=table, columns=['Warnings', 'Elements', 'Description'],
+                       title='{} Warnings of {} types ({:.2f}s)'.format(len(index), len(index.groups),
+                                                                        time.time() - start))
+
+    # DRILL-DOWN
+    mode = forms.CommandSwitchWindow.show(['Select Elements', 'By Level', 'By Workset', 'Export CSV'],
+                                          message='Select Option:')
+    if mode == 'Select Elements':
+        dict_groups = {'[{}] {}'.format(len(indexes), index.get_description(key)): key
+                       for key, indexes in index.groups.items()}
+        select_from_dict(dict_groups, title=__title__, label='Select Warning Types:',
+                         button_name='Select Elements', version=__version__, on_select=select_warning_elements)
+
+    elif mode in ('By Level', 'By Workset'):
+        groups = index.group_by_level() if mode == 'By Level' else index.group_by_workset()
+        for name in sorted(groups):
+            counts = groups[name]
+            table  = [[count, index.get_description(key)] for key, count in counts.items()]
+            output.print_table(table_data=table, columns=['Warnings', 'Description'],
+                               title='{}: {} ({} warnings)'.format(mode[3:], name, sum(counts.values())))
+
+    elif mode == 'Export CSV':
+        path = forms.save_file(file_ext='csv', default_name='{} - Warnings'.format(doc.Title))
+        if path:
+            print('Exported to: {}'.format(index.export_csv(path)))
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Offline stand-in for the Revit API to benchmark and test lib/ on plain CPython (3.7+).
+
+FakeRevit is kept outside of lib/ on purpose, so it's never imported inside of Revit.
+
+It registers in-memory modules for:
+    Autodesk.Revit.DB (+ Architecture), Autodesk.Revit.UI (+ Selection), Autodesk.Revit.Exceptions,
+    Autodesk.Revit.ApplicationServices, System (+ Collections.Generic), clr, wpf and pyrevit.
+Any other submodule of these packages is created on demand, and any unknown class name
+resolves to an empty placeholder class, so lib/ modules can be imported as they are.
+
+Example:
+    import sys
+    sys.path.append('AA-Tools.extension/dev')
+    import FakeRevit
+    from FakeRevit import generate_model
+
+    doc = generate_model(n_views=500, n_sheets=200, n_rooms=1000, n_types=300)
+    FakeRevit.install(doc)                  # sets __revit__ and adds lib/ to sys.path
+    from Snippets._sheets import ViewSheetMap
+    ...
+    FakeRevit.uninstall()                   # removes fake modules and lib/ modules imported with them"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import os
+import sys
+import types
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+from FakeRevit import _db, _architecture, _application, _exceptions, _ui, _system, _pyrevit
+from FakeRevit._model import generate_model     # re-exported: FakeRevit.generate_model()
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+LIB_PATH    = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+GUI_PATH    = os.path.join(LIB_PATH, 'GUI')     # GUI modules use implicit relative imports (IronPython 2.7)
+LIB_ROOTS   = ('Snippets', 'Selection', 'GUI', 'Renaming', 'SelectFromDict', 'FindReplace', 'WPF_Base')
+FAKE_ROOTS  = ('Autodesk', 'System', 'clr', 'wpf', 'pyrevit')
+
+_installed = {'modules': {}, 'finder': None}
+
+__all__ = ['generate_model', 'install', 'set_document', 'unload_lib', 'uninstall', 'build_modules']
+
+
+# ╔╦╗╔═╗╔╦╗╦ ╦╦  ╔═╗╔═╗
+# ║║║║ ║ ║║║ ║║  ║╣ ╚═╗
+# ╩ ╩╚═╝═╩╝╚═╝╩═╝╚═╝╚═╝ MODULES
+#====================================================================================================
+class AutoModule(types.ModuleType):
+    """Module/package where every unknown CamelCase name is a placeholder class."""
+    def __init__(self, name, base=object):
+        super(AutoModule, self).__init__(name)
+        self.__path__ = []
+        self._base    = base
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not name[:1].isupper():
+            raise AttributeError(name)
+        value = _db.placeholder(name, self._base)
+        setattr(self, name, value)
+        return value
+
+
+class _AutoModuleFinder(object):
+    """sys.meta_path finder that creates AutoModules for missing submodules of FAKE_ROOTS."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname.split('.')[0] not in FAKE_ROOTS:
+            return None
+        import importlib.machinery
+        return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+
+    def create_module(self, spec):
+        base = _db.Element if spec.name.startswith('Autodesk.Revit.DB') else object
+        module = AutoModule(spec.name, base)
+        _installed['modules'][spec.name] = module
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+def _module(name, source=None, base=object):
+    """Function to create a module from another module's namespace (or an empty AutoModule)."""
+    module = AutoModule(name, base)
+    if source is not None:
+        items = source.__dict__ if hasattr(source, '__dict__') else source
+        for key, value in items.items():
+            if not key.startswith('__'):
+                setattr(module, key, value)
+    return module
+
+
+def build_modules():
+    """Function to build all fake modules.
+    :return: dict {module_name: module}"""
+    db = _module('Autodesk.Revit.DB', _db, _db.Element)
+    db.__all__ = sorted(set(k for k in vars(_db) if not k.startswith('_')) | set(_db.PLACEHOLDER_NAMES))
+    db.Architecture = _module('Autodesk.Revit.DB.Architecture', _architecture, _db.Element)
+
+    ui = _module('Autodesk.Revit.UI', _ui)
+    ui.Selection = _module('Autodesk.Revit.UI.Selection', _ui)
+
+    revit = _module('Autodesk.Revit')
+    revit.DB, revit.UI = db, ui
+    revit.Exceptions          = _module('Autodesk.Revit.Exceptions', _exceptions)
+    revit.ApplicationServices = _module('Autodesk.Revit.ApplicationServices', _application)
+
+    autodesk = _module('Autodesk')
+    autodesk.Revit = revit
+
+    system = _module('System', _system)
+    system.Collections = _module('System.Collections')
+    system.Collections.Generic = _module('System.Collections.Generic', {'List'      : _system.List,
+                                                                         'HashSet'   : _system.HashSet,
+                                                                         'Dictionary': _system.Dictionary})
+    # Classes that are imported as modules in IronPython: from System.Windows.Window import DragMove
+    system.Windows     = _module('System.Windows', {'Window': _system.Window, 'ResourceDictionary': _system.ResourceDictionary})
+    system.Diagnostics = _module('System.Diagnostics', {'Process': _system.Process})
+    system.IO          = _module('System.IO', {'StringReader': _system.StringReader})
+    clr = _module('clr', {k: getattr(_system.clr, k) for k in dir(_system.clr) if not k.startswith('_')})
+
+    modules = {'Autodesk'                           : autodesk,
+               'Autodesk.Revit'                     : revit,
+               'Autodesk.Revit.DB'                  : db,
+               'Autodesk.Revit.DB.Architecture'     : db.Architecture,
+               'Autodesk.Revit.UI'                  : ui,
+               'Autodesk.Revit.UI.Selection'        : ui.Selection,
+               'Autodesk.Revit.Exceptions'          : revit.Exceptions,
+               'Autodesk.Revit.ApplicationServices' : revit.ApplicationServices,
+               'System'                             : system,
+               'System.Collections'                 : system.Collections,
+               'System.Collections.Generic'         : system.Collections.Generic,
+               'System.Windows'                     : system.Windows,
+               'System.Windows.Window'              : _system.Window,
+               'System.Diagnostics'                 : system.Diagnostics,
+               'System.Diagnostics.Process'         : _system.Process,
+               'System.IO'                          : system.IO,
+               'clr'                                : clr}
+    modules.update(_pyrevit.build_modules())
+    return modules
+
+
+# ╦╔╗╔╔═╗╔╦╗╔═╗╦  ╦
+# ║║║║╚═╗ ║ ╠═╣║  ║
+# ╩╝╚╝╚═╝ ╩ ╩ ╩╩═╝╩═╝ INSTALL
+#====================================================================================================
+def install(doc=None, version=2023, username='user'):
+    """Function to register fake modules, add lib/ to sys.path and set __revit__.
+    :param doc:      Document that becomes active (a new empty one if None)
+    :param version:  Revit version (Application.VersionNumber). Used by modules that check rvt_year.
+    :param username: Application.Username (current user for worksharing)
+    :return:         UIApplication (__revit__)"""
+    if not _installed['modules']:
+        _installed['modules'] = build_modules()
+        sys.modules.update(_installed['modules'])
+        _installed['finder'] = _AutoModuleFinder()
+        sys.meta_path.insert(0, _installed['finder'])
+
+    for path in (GUI_PATH, LIB_PATH):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    app   = _application.Application(version, username)
+    doc   = doc if doc is not None else _db.Document()
+    app.add_document(doc)
+    uiapp = _ui.UIApplication(app, doc)
+    builtins.__revit__ = uiapp
+    return uiapp
+
+
+def set_document(doc, reload_lib=True):
+    """Function to make another Document active.
+    :param reload_lib: if True - lib/ modules are removed from sys.modules, like a new engine in Revit.
+                       Use False to check that cached modules follow the active document (rocket mode)."""
+    uiapp = builtins.__revit__
+    if doc not in uiapp.Application.Documents:
+        uiapp.Application.add_document(doc)
+    uiapp.set_active_document(doc)
+    if reload_lib:
+        unload_lib()
+    return uiapp
+
+
+def unload_lib():
+    """Function to remove lib/ modules from sys.modules."""
+    for name in list(sys.modules):
+        if name.split('.')[0] in LIB_ROOTS:
+            del sys.modules[name]
+
+
+def uninstall():
+    """Function to remove fake modules, lib/ modules and __revit__."""
+    unload_lib()
+    for name in list(sys.modules):
+        if name.split('.')[0] in FAKE_ROOTS and name in _installed['modules']:
+            del sys.modules[name]
+    if _installed['finder'] in sys.meta_path:
+        sys.meta_path.remove(_installed['finder'])
+    _installed['modules'] = {}
+    _installed['finder']  = None
+
+    for path in (GUI_PATH, LIB_PATH):
+        if path in sys.path:
+            sys.path.remove(path)
+    if hasattr(builtins, '__revit__'):
+        del builtins.__revit__
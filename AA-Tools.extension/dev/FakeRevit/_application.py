@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-in for Autodesk.Revit.ApplicationServices."""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+from FakeRevit._db import Document, ICollection, placeholder
+from FakeRevit._exceptions import FileNotFoundException
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class Application(object):
+    """Revit Application with a list of open Documents.
+    Documents that can be opened with OpenDocumentFile are registered in self.files {path: Document}."""
+
+    def __init__(self, version=2023, username='user'):
+        self.VersionNumber = str(version)
+        self.VersionName   = 'Autodesk Revit {}'.format(version)
+        self.VersionBuild  = '{}.0.0.0'.format(version)
+        self.Username      = username
+        self.Language      = 'English_USA'
+        self.files         = {}
+        self._documents    = []
+
+    @property
+    def Documents(self):
+        return ICollection(d for d in self._documents if d.IsValidObject)
+
+    def add_document(self, doc):
+        """Function to register an open Document (not a Revit API method)."""
+        doc.Application   = self
+        doc._current_user = self.Username
+        self._documents.append(doc)
+        return doc
+
+    def OpenDocumentFile(self, path, options=None):
+        path = getattr(path, 'path', path)     # ModelPath or str
+        if path not in self.files:
+            raise FileNotFoundException('File does not exist: {}'.format(path))
+        doc = self.files[path]
+        doc.IsValidObject = True
+        doc.IsDetached    = bool(doc.IsWorkshared and options is not None and
+                                 str(options.DetachFromCentralOption) != 'DoNotDetach')
+        if doc not in self._documents:
+            self.add_document(doc)
+        return doc
+
+    def NewProjectDocument(self, template=None):
+        return self.add_document(Document('Project{}'.format(len(self._documents) + 1)))
+
+
+def __getattr__(name):
+    if name.startswith('_'):
+        raise AttributeError(name)
+    return placeholder(name, object)
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-in for Autodesk.Revit.DB.Architecture."""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+from FakeRevit._db import SpatialElement, ElementType, BuiltInCategory, placeholder
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class Room(SpatialElement):         category = BuiltInCategory.OST_Rooms
+class RailingType(ElementType):     category = BuiltInCategory.OST_StairsRailing
+class StairsType(ElementType):      category = BuiltInCategory.OST_Stairs
+class HandRailType(ElementType):    category = BuiltInCategory.OST_RailingHandRail
+
+
+def __getattr__(name):
+    if name.startswith('_'):
+        raise AttributeError(name)
+    return placeholder(name)
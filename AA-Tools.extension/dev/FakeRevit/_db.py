@@ -0,0 +1,1868 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-in for Autodesk.Revit.DB.
+
+Only the parts of the API that are used in lib/ are implemented:
+Elements, Parameters, Documents, FilteredElementCollector, ElementFilters,
+Transactions (with real RollBack) and a few utilities.
+Any other name imported from this module is created on demand as an empty Element subclass,
+so modules can be imported even if they reference classes that are not implemented here."""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import math
+import itertools
+
+from FakeRevit._exceptions import (ArgumentException,
+                                   InvalidOperationException,
+                                   ModificationOutsideTransactionException,
+                                   FileNotFoundException)
+
+
+# ╔═╗╔╗╔╦ ╦╔╦╗╔═╗
+# ║╣ ║║║║ ║║║║╚═╗
+# ╚═╝╝╚╝╚═╝╩ ╩╚═╝ ENUMS
+#====================================================================================================
+_enum_values = itertools.count(1)
+
+
+class _EnumMember(object):
+    """Member of a fake .NET Enum. Created on first access, e.g. BuiltInCategory.OST_Walls"""
+    def __init__(self, enum, name, value):
+        self.enum  = enum
+        self.name  = name
+        self.value = value
+
+    def __int__(self):          return self.value
+    def __index__(self):        return self.value
+    def __hash__(self):         return hash((self.enum.__name__, self.name))
+    def __eq__(self, other):    return isinstance(other, _EnumMember) and (self.enum, self.name) == (other.enum, other.name)
+    def __ne__(self, other):    return not self == other
+    def __repr__(self):         return '{}.{}'.format(self.enum.__name__, self.name)
+    def __str__(self):          return self.name
+    def ToString(self):         return self.name
+
+
+class _EnumMeta(type):
+    """Metaclass that creates Enum members on first access."""
+    def __getattr__(cls, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        members = cls.__dict__['_members']
+        if name not in members:
+            # Built-in Categories/Parameters have negative ids in Revit
+            value = -next(_enum_values) if cls.__dict__.get('_negative') else next(_enum_values)
+            members[name] = _EnumMember(cls, name, value)
+        return members[name]
+
+    def __iter__(cls):
+        return iter(cls.__dict__['_members'].values())
+
+
+def _enum(name, negative=False):
+    return _EnumMeta(name, (object,), {'_members': {}, '_negative': negative})
+
+
+BuiltInCategory                = _enum('BuiltInCategory', negative=True)
+BuiltInParameter               = _enum('BuiltInParameter', negative=True)
+ViewType                       = _enum('ViewType')
+ViewDiscipline                 = _enum('ViewDiscipline')
+StorageType                    = _enum('StorageType')
+CategoryType                   = _enum('CategoryType')
+TransactionStatus              = _enum('TransactionStatus')
+FailureSeverity                = _enum('FailureSeverity')
+FailureProcessingResult        = _enum('FailureProcessingResult')
+CheckoutStatus                 = _enum('CheckoutStatus')
+ModelUpdatesStatus             = _enum('ModelUpdatesStatus')
+RevisionNumberType             = _enum('RevisionNumberType')
+RevisionVisibility             = _enum('RevisionVisibility')
+SpatialElementBoundaryLocation = _enum('SpatialElementBoundaryLocation')
+ElementOnPhaseStatus           = _enum('ElementOnPhaseStatus')
+ViewDetailLevel                = _enum('ViewDetailLevel')
+DisplayUnitType                = _enum('DisplayUnitType')
+WallKind                       = _enum('WallKind')
+ElementTypeGroup               = _enum('ElementTypeGroup')
+WorksetKind                    = _enum('WorksetKind')
+DetachFromCentralOption        = _enum('DetachFromCentralOption')
+
+
+# ╔╗ ╔═╗╔═╗╦╔═╗  ╔╦╗╦ ╦╔═╗╔═╗╔═╗
+# ╠╩╗╠═╣╚═╗║║     ║ ╚╦╝╠═╝║╣ ╚═╗
+# ╚═╝╩ ╩╚═╝╩╚═╝   ╩  ╩ ╩  ╚═╝╚═╝ BASIC TYPES
+#====================================================================================================
+class _ClrProperty(property):
+    """Property that also supports IronPython access on the class: Element.Name.GetValue(element)."""
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        return property.__get__(self, obj, cls)
+
+    def GetValue(self, obj):
+        return self.__get__(obj)
+
+    def SetValue(self, obj, value):
+        self.__set__(obj, value)
+
+
+class ElementId(object):
+    def __init__(self, value):
+        self.IntegerValue = int(value)
+
+    @property
+    def Value(self):
+        return self.IntegerValue
+
+    def __hash__(self):         return hash(self.IntegerValue)
+    def __eq__(self, other):    return isinstance(other, ElementId) and self.IntegerValue == other.IntegerValue
+    def __ne__(self, other):    return not self == other
+    def __lt__(self, other):    return self.IntegerValue < other.IntegerValue
+    def __repr__(self):         return 'ElementId({})'.format(self.IntegerValue)
+    def __str__(self):          return str(self.IntegerValue)
+    def ToString(self):         return str(self.IntegerValue)
+
+ElementId.InvalidElementId = ElementId(-1)
+
+
+class Reference(object):
+    """Reference(element) as in Revit, Selection.PickObjects creates it from an ElementId."""
+    def __init__(self, element):
+        self.ElementId = getattr(element, 'Id', element)
+
+
+class XYZ(object):
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.X, self.Y, self.Z = float(x), float(y), float(z)
+
+    def __add__(self, other):   return XYZ(self.X + other.X, self.Y + other.Y, self.Z + other.Z)
+    def __sub__(self, other):   return XYZ(self.X - other.X, self.Y - other.Y, self.Z - other.Z)
+    def __mul__(self, k):       return XYZ(self.X * k, self.Y * k, self.Z * k)
+    def __div__(self, k):       return XYZ(self.X / k, self.Y / k, self.Z / k)
+    __truediv__ = __div__
+    __rmul__    = __mul__
+    def __neg__(self):          return XYZ(-self.X, -self.Y, -self.Z)
+    def __getitem__(self, i):   return (self.X, self.Y, self.Z)[i]
+    def __repr__(self):         return 'XYZ({}, {}, {})'.format(self.X, self.Y, self.Z)
+
+    def Add(self, other):       return self + other
+    def Subtract(self, other):  return self - other
+    def Multiply(self, k):      return self * k
+    def Divide(self, k):        return self / k
+    def Negate(self):           return -self
+    def DotProduct(self, o):    return self.X * o.X + self.Y * o.Y + self.Z * o.Z
+    def CrossProduct(self, o):  return XYZ(self.Y * o.Z - self.Z * o.Y, self.Z * o.X - self.X * o.Z, self.X * o.Y - self.Y * o.X)
+    def GetLength(self):        return math.sqrt(self.DotProduct(self))
+    def DistanceTo(self, o):    return (self - o).GetLength()
+    def IsZeroLength(self):     return self.GetLength() < 1e-9
+
+    def Normalize(self):
+        length = self.GetLength()
+        return self / length if length else XYZ()
+
+    def IsAlmostEqualTo(self, other, tolerance=1e-9):
+        return self.DistanceTo(other) <= tolerance
+
+XYZ.Zero   = XYZ(0, 0, 0)
+XYZ.BasisX = XYZ(1, 0, 0)
+XYZ.BasisY = XYZ(0, 1, 0)
+XYZ.BasisZ = XYZ(0, 0, 1)
+
+
+class UV(object):
+    def __init__(self, u=0.0, v=0.0):
+        self.U, self.V = float(u), float(v)
+
+
+class BoundingBoxXYZ(object):
+    def __init__(self, min_pt=None, max_pt=None):
+        self.Min     = min_pt or XYZ()
+        self.Max     = max_pt or XYZ()
+        self.Enabled = True
+        self.Transform = Transform.Identity
+
+
+class BoundingBoxUV(object):
+    def __init__(self, min_u=0.0, min_v=0.0, max_u=0.0, max_v=0.0):
+        self.Min = UV(min_u, min_v)
+        self.Max = UV(max_u, max_v)
+
+
+class Outline(object):
+    def __init__(self, min_pt, max_pt):
+        self.MinimumPoint = min_pt
+        self.MaximumPoint = max_pt
+
+
+class Transform(object):
+    def __init__(self, origin=None):
+        self.Origin = origin or XYZ()
+        self.BasisX, self.BasisY, self.BasisZ = XYZ.BasisX, XYZ.BasisY, XYZ.BasisZ
+
+    @staticmethod
+    def CreateTranslation(vector):
+        return Transform(vector)
+
+    def OfPoint(self, point):
+        return self.Origin + self.BasisX * point.X + self.BasisY * point.Y + self.BasisZ * point.Z
+
+    def OfVector(self, vector):
+        return self.BasisX * vector.X + self.BasisY * vector.Y + self.BasisZ * vector.Z
+
+    @property
+    def IsIdentity(self):
+        return self.Origin.IsZeroLength()
+
+Transform.Identity = Transform()
+
+
+class Color(object):
+    def __init__(self, red, green, blue):
+        self.Red, self.Green, self.Blue = red, green, blue
+
+    @property
+    def IsValid(self):
+        return True
+
+
+# ╔═╗╔═╗╔═╗╔╦╗╔═╗╔╦╗╦═╗╦ ╦
+# ║ ╦║╣ ║ ║║║║║╣  ║ ╠╦╝╚╦╝
+# ╚═╝╚═╝╚═╝╩ ╩╚═╝ ╩ ╩╚═ ╩  GEOMETRY
+#====================================================================================================
+class Curve(object):
+    def __init__(self, start, end):
+        self._points = (start, end)
+
+    def GetEndPoint(self, index):
+        return self._points[index]
+
+    @property
+    def Length(self):
+        return self._points[0].DistanceTo(self._points[1])
+
+    def Evaluate(self, parameter, normalized=True):
+        start, end = self._points
+        return start + (end - start) * parameter
+
+
+class Line(Curve):
+    @staticmethod
+    def CreateBound(start, end):
+        return Line(start, end)
+
+    @property
+    def Direction(self):
+        return (self._points[1] - self._points[0]).Normalize()
+
+
+class CurveLoop(list):
+    @staticmethod
+    def Create(curves):
+        return CurveLoop(curves)
+
+
+class CurveArray(list):
+    def Append(self, curve):
+        self.append(curve)
+
+    @property
+    def Size(self):
+        return len(self)
+
+
+class LocationPoint(object):
+    def __init__(self, point):
+        self.Point    = point
+        self.Rotation = 0.0
+
+
+class LocationCurve(object):
+    def __init__(self, curve):
+        self.Curve = curve
+
+
+class BoundarySegment(object):
+    def __init__(self, curve, element_id=None):
+        self._curve    = curve
+        self.ElementId = element_id or ElementId.InvalidElementId
+
+    def GetCurve(self):
+        return self._curve
+
+
+class SpatialElementBoundaryOptions(object):
+    def __init__(self):
+        self.SpatialElementBoundaryLocation = SpatialElementBoundaryLocation.Finish
+        self.StoreFreeBoundaryFaces         = False
+
+
+# ╔═╗╔═╗╦═╗╔═╗╔╦╗╔═╗╔╦╗╔═╗╦═╗╔═╗
+# ╠═╝╠═╣╠╦╝╠═╣║║║║╣  ║ ║╣ ╠╦╝╚═╗
+# ╩  ╩ ╩╩╚═╩ ╩╩ ╩╚═╝ ╩ ╚═╝╩╚═╚═╝ PARAMETERS
+#====================================================================================================
+class Definition(object):
+    def __init__(self, name, built_in=None):
+        self.Name             = name
+        self.BuiltInParameter = built_in if built_in is not None else BuiltInParameter.INVALID
+
+
+class Parameter(object):
+    """Parameter that either stores its own value or reads/writes an attribute of its Element.
+    :param element:  Owner Element
+    :param name:     Definition Name
+    :param value:    Initial value (str, float, int or ElementId)
+    :param built_in: BuiltInParameter member (Id is ElementId(built_in))
+    :param attr:     Name of an Element attribute to read/write instead of own value (e.g. '_name')"""
+    def __init__(self, element, name, value=None, built_in=None, attr=None, read_only=False, storage=None):
+        self.Element    = element
+        self.Definition = Definition(name, built_in)
+        self.IsReadOnly = read_only
+        self.IsShared   = False
+        self.GUID       = None
+        self._attr      = attr
+        self._value     = value
+        self.Id         = ElementId(built_in) if built_in is not None else ElementId(-next(_enum_values) - 10**6)
+        self.StorageType = storage or self._guess_storage(self._get())
+
+    @staticmethod
+    def _guess_storage(value):
+        if isinstance(value, ElementId):            return StorageType.ElementId
+        if isinstance(value, bool):                 return StorageType.Integer
+        if isinstance(value, int):                  return StorageType.Integer
+        if isinstance(value, float):                return StorageType.Double
+        return StorageType.String
+
+    def _get(self):
+        if self._attr:
+            return getattr(self.Element, self._attr)
+        return self._value
+
+    @property
+    def HasValue(self):
+        return self._get() not in (None, '')
+
+    def AsString(self):
+        value = self._get()
+        if self.StorageType != StorageType.String:
+            return None
+        return value
+
+    def AsValueString(self):
+        value = self._get()
+        if isinstance(value, ElementId):
+            element = self.Element.Document.GetElement(value) if self.Element.Document else None
+            return element.Name if element else None
+        return None if value is None else str(value)
+
+    def AsDouble(self):     return float(self._get() or 0.0)
+    def AsInteger(self):    return int(self._get() or 0)
+
+    def AsElementId(self):
+        value = self._get()
+        return value if isinstance(value, ElementId) else ElementId.InvalidElementId
+
+    def Set(self, value):
+        if self.IsReadOnly:
+            raise InvalidOperationException('Parameter {} is read-only.'.format(self.Definition.Name))
+        old = self._get()
+        if self._attr:
+            self.Element._modify(self._attr, value)
+        else:
+            doc = self.Element.Document
+            if doc is not None:
+                doc._record(lambda: setattr(self, '_value', old))
+            self._value = value
+        return True
+
+
+# ╔═╗╦  ╔═╗╔╦╗╔═╗╔╗╔╔╦╗╔═╗
+# ║╣ ║  ║╣ ║║║║╣ ║║║ ║ ╚═╗
+# ╚═╝╩═╝╚═╝╩ ╩╚═╝╝╚╝ ╩ ╚═╝ ELEMENTS
+#====================================================================================================
+class Category(object):
+    def __init__(self, built_in, name=None, category_type=None):
+        self.BuiltInCategory = built_in
+        self.Id              = ElementId(built_in)
+        self.Name            = name or built_in.name.replace('OST_', '')
+        self.CategoryType    = category_type or CategoryType.Model
+        self.SubCategories   = []
+        self.Material        = None
+        self._line_patterns  = {}   # {GraphicsStyleType: ElementId}
+        self.AllowsBoundParameters = True
+
+    def GetLinePatternId(self, graphics_style_type):
+        return self._line_patterns.get(graphics_style_type, ElementId.InvalidElementId)
+
+    def SetLinePatternId(self, line_pattern_id, graphics_style_type):
+        self._line_patterns[graphics_style_type] = line_pattern_id
+
+    @staticmethod
+    def GetCategory(doc, built_in):
+        if isinstance(built_in, ElementId):
+            for cat in doc.Settings.Categories:
+                if cat.Id == built_in:
+                    return cat
+            return None
+        return doc.Settings.get_category(built_in)
+
+
+class Element(object):
+    """Base Element. Parameters are stored per Element in a dict {name: Parameter}."""
+    category = None     # Default BuiltInCategory of a class
+
+    def __init__(self, name='', category=None, type_id=None, level_id=None, **params):
+        self.Id            = ElementId.InvalidElementId
+        self.UniqueId      = ''
+        self.Document      = None
+        self.IsValidObject = True
+        self.OwnerViewId   = ElementId.InvalidElementId
+        self.GroupId       = ElementId.InvalidElementId
+        self.WorksetId     = None
+        self.Location      = None
+        self.Pinned        = False
+        self._name         = name
+        self._type_id      = type_id  or ElementId.InvalidElementId
+        self.LevelId       = level_id or ElementId.InvalidElementId
+        self._category     = category or self.category
+        self._bbox         = None
+        self._params       = {}
+        self._bip          = {}
+        self._init_parameters()
+        for name, value in params.items():
+            self.add_parameter(name, value)
+
+    def _init_parameters(self):
+        """Function to create built-in parameters that are bound to attributes."""
+        self.add_parameter('Type', attr='_type_id', built_in=BuiltInParameter.ELEM_TYPE_PARAM)
+        self.add_parameter('Level', attr='LevelId', built_in=BuiltInParameter.LEVEL_PARAM, read_only=True)
+
+    def add_parameter(self, name, value=None, built_in=None, attr=None, read_only=False, storage=None, guid=None):
+        """Function to add a Parameter (not a Revit API method). Parameters with a guid are shared parameters."""
+        p = Parameter(self, name, value, built_in, attr, read_only, storage)
+        if guid is not None:
+            p.IsShared, p.GUID = True, guid
+        self._params[name] = p
+        if built_in is not None:
+            self._bip[built_in] = p
+        return p
+
+    def _modify(self, attr, value):
+        """Function to change an attribute with undo record in an open Transaction."""
+        old = getattr(self, attr)
+        if self.Document is not None:
+            self.Document._record(lambda: setattr(self, attr, old))
+        setattr(self, attr, value)
+
+    # PROPERTIES
+    def _get_name(self):
+        return self._name
+
+    def _set_name(self, value):
+        if not value or any(c in value for c in '{}[]|;<>?`~\\:'):
+            raise ArgumentException('Name is not valid: {}'.format(value))
+        self._modify('_name', value)
+
+    Name = _ClrProperty(_get_name, _set_name)
+
+    @property
+    def Category(self):
+        if self._category is None or self.Document is None:
+            return None
+        return self.Document.Settings.get_category(self._category)
+
+    @property
+    def Parameters(self):
+        return list(self._params.values())
+
+    # METHODS
+    def LookupParameter(self, name):
+        return self._params.get(name)
+
+    def get_Parameter(self, key):
+        if isinstance(key, _EnumMember):
+            return self._bip.get(key)
+        if isinstance(key, Definition) or isinstance(key, str):
+            return self._params.get(getattr(key, 'Name', key))
+        for p in self._params.values():         # Shared parameter GUID
+            if p.GUID is not None and p.GUID == key:
+                return p
+        return None
+
+    def GetParameters(self, name):
+        return [p for p in self._params.values() if p.Definition.Name == name]
+
+    def GetTypeId(self):
+        return self._type_id
+
+    def ChangeTypeId(self, type_id):
+        self._modify('_type_id', type_id)
+        return self.Id
+
+    def get_BoundingBox(self, view):
+        return self._bbox
+
+    def GetMaterialIds(self, return_paint_materials):
+        if return_paint_materials:
+            return ICollection(getattr(self, '_paint_material_ids', []))
+        return ICollection(getattr(self, '_material_ids', []))
+
+    def GetDependentElements(self, element_filter):
+        return [el.Id for el in self.Document._elements.values()
+                if el.GetTypeId() == self.Id and (element_filter is None or element_filter.PassesFilter(el))]
+
+    def __repr__(self):
+        return '<{} {} [{}]>'.format(type(self).__name__, self._name, self.Id.IntegerValue)
+
+
+class ElementType(Element):
+    def _init_parameters(self):
+        super(ElementType, self)._init_parameters()
+        self.FamilyName = ''
+        self.add_parameter('Type Name', attr='_name', built_in=BuiltInParameter.ALL_MODEL_TYPE_NAME)
+        self.add_parameter('Type Name', attr='_name', built_in=BuiltInParameter.SYMBOL_NAME_PARAM)
+        self.add_parameter('Family Name', attr='FamilyName', built_in=BuiltInParameter.ALL_MODEL_FAMILY_NAME, read_only=True)
+
+
+class Family(Element):
+    def __init__(self, name='', category=None, **params):
+        super(Family, self).__init__(name, category, **params)
+        self.FamilyCategory = None
+        self.IsEditable     = True
+        self.IsInPlace      = False
+        self._symbol_ids    = []
+
+    def GetFamilySymbolIds(self):
+        return list(self._symbol_ids)
+
+
+class FamilySymbol(ElementType):
+    def __init__(self, name='', category=None, family=None, **params):
+        super(FamilySymbol, self).__init__(name, category, **params)
+        self.Family   = family
+        self.IsActive = True
+        if family is not None:
+            self.FamilyName = family.Name
+
+    def Activate(self):
+        self.IsActive = True
+
+
+class _InstanceElement(Element):
+    """Model element with Comments and Mark."""
+    def _init_parameters(self):
+        super(_InstanceElement, self)._init_parameters()
+        self.add_parameter('Comments', '', built_in=BuiltInParameter.ALL_MODEL_INSTANCE_COMMENTS)
+        self.add_parameter('Mark',     '', built_in=BuiltInParameter.ALL_MODEL_MARK)
+
+
+class FamilyInstance(_InstanceElement):
+    @property
+    def Symbol(self):
+        return self.Document.GetElement(self._type_id) if self.Document else None
+
+
+class Level(Element):
+    category = BuiltInCategory.OST_Levels
+
+    def __init__(self, name='', elevation=0.0, **params):
+        super(Level, self).__init__(name, **params)
+        self.Elevation = elevation
+        self.add_parameter('Elevation', attr='Elevation', built_in=BuiltInParameter.LEVEL_ELEV)
+
+
+class WallType(ElementType):        category = BuiltInCategory.OST_Walls
+class FloorType(ElementType):       category = BuiltInCategory.OST_Floors
+class CeilingType(ElementType):     category = BuiltInCategory.OST_Ceilings
+class RoofType(ElementType):        category = BuiltInCategory.OST_Roofs
+class TextNoteType(ElementType):    category = BuiltInCategory.OST_TextNotes
+class GroupType(ElementType):       category = BuiltInCategory.OST_IOSModelGroups
+class LinePatternElement(Element):  category = BuiltInCategory.OST_LinePatterns
+class FillPatternElement(Element):  category = BuiltInCategory.OST_FillPatterns
+class Material(Element):            category = BuiltInCategory.OST_Materials
+class Wall(_InstanceElement):       category = BuiltInCategory.OST_Walls
+class Floor(Element):               category = BuiltInCategory.OST_Floors
+class Ceiling(Element):             category = BuiltInCategory.OST_Ceilings
+class Group(Element):               category = BuiltInCategory.OST_IOSModelGroups
+class ParameterFilterElement(Element):  pass
+class RevitLinkType(ElementType):   category = BuiltInCategory.OST_RvtLinks
+class CADLinkType(ElementType):     pass
+class ImportInstance(Element):
+    def __init__(self, name='', is_linked=False, **params):
+        super(ImportInstance, self).__init__(name, **params)
+        self.IsLinked = is_linked
+
+
+class RevitLinkInstance(Element):
+    category = BuiltInCategory.OST_RvtLinks
+
+    def __init__(self, name='', link_document=None, transform=None, **params):
+        super(RevitLinkInstance, self).__init__(name, **params)
+        self._link_document = link_document
+        self._transform     = transform or Transform.Identity
+
+    def GetLinkDocument(self):          return self._link_document
+    def GetTotalTransform(self):        return self._transform
+    def GetTransform(self):             return self._transform
+
+
+class Revision(Element):
+    category = BuiltInCategory.OST_Revisions
+
+    def __init__(self, name='', **params):
+        super(Revision, self).__init__(name, **params)
+        self.Description    = name
+        self.RevisionDate   = ''
+        self.SequenceNumber = 0
+        self.Issued         = False
+        self.Visibility     = RevisionVisibility.CloudAndTagVisible
+        self.NumberType     = RevisionNumberType.Numeric
+
+    @staticmethod
+    def Create(doc):
+        revision = doc.add(Revision())
+        revision.SequenceNumber = len(doc.of_class(Revision))
+        return revision
+
+    @staticmethod
+    def GetAllRevisionIds(doc):
+        return [r.Id for r in sorted(doc.of_class(Revision), key=lambda r: r.SequenceNumber)]
+
+
+class SpatialElement(Element):
+    """Rectangular Room/Area. Geometry is given as extents (min_x, min_y, max_x, max_y) on its Level.
+    Unplaced rooms have extents=None and Area 0."""
+
+    def __init__(self, name='', number='', extents=None, elevation=0.0, height=10.0, **params):
+        super(SpatialElement, self).__init__(name, **params)
+        self.Number   = number
+        self._extents = extents
+        self._z       = (elevation, elevation + height)
+        self.add_parameter('Name', attr='_name', built_in=BuiltInParameter.ROOM_NAME)
+        self.add_parameter('Number', attr='Number', built_in=BuiltInParameter.ROOM_NUMBER)
+        self.add_parameter('Area', attr='Area', built_in=BuiltInParameter.ROOM_AREA, read_only=True)
+        if extents:
+            min_x, min_y, max_x, max_y = extents
+            self._bbox    = BoundingBoxXYZ(XYZ(min_x, min_y, self._z[0]), XYZ(max_x, max_y, self._z[1]))
+            self.Location = LocationPoint(XYZ((min_x + max_x) / 2.0, (min_y + max_y) / 2.0, self._z[0]))
+
+    @property
+    def Area(self):
+        if not self._extents:
+            return 0.0
+        min_x, min_y, max_x, max_y = self._extents
+        return (max_x - min_x) * (max_y - min_y)
+
+    @property
+    def Level(self):
+        return self.Document.GetElement(self.LevelId) if self.Document else None
+
+    def GetBoundarySegments(self, options):
+        if not self._extents:
+            return []
+        min_x, min_y, max_x, max_y = self._extents
+        z   = self._z[0]
+        pts = [XYZ(min_x, min_y, z), XYZ(max_x, min_y, z), XYZ(max_x, max_y, z), XYZ(min_x, max_y, z)]
+        return [[BoundarySegment(Line.CreateBound(pts[i], pts[(i + 1) % 4])) for i in range(4)]]
+
+    def IsPointInRoom(self, point):
+        if not self._extents:
+            return False
+        min_x, min_y, max_x, max_y = self._extents
+        return min_x <= point.X <= max_x and min_y <= point.Y <= max_y and self._z[0] <= point.Z <= self._z[1]
+
+
+class Area(SpatialElement):      category = BuiltInCategory.OST_Areas
+
+
+# ╦  ╦╦╔═╗╦ ╦╔═╗
+# ╚╗╔╝║║╣ ║║║╚═╗
+#  ╚╝ ╩╚═╝╚╩╝╚═╝ VIEWS
+#====================================================================================================
+class View(Element):
+    category = BuiltInCategory.OST_Views
+
+    def __init__(self, name='', view_type=None, is_template=False, scale=100, **params):
+        super(View, self).__init__(name, **params)
+        self.ViewType       = view_type or ViewType.FloorPlan
+        self.IsTemplate     = is_template
+        self.Scale          = scale
+        self.ViewTemplateId = ElementId.InvalidElementId
+        self.CropBoxActive  = False
+        self.CropBox        = BoundingBoxXYZ()
+        self.Outline        = BoundingBoxUV(0.0, 0.0, 0.5, 0.4)
+        self.GenLevel       = None
+        self._overrides     = {}
+        self._category_overrides = {}
+        self._filters       = []
+        self._filter_overrides = {}
+        self._hidden        = set()
+        self.add_parameter('View Name', attr='_name', built_in=BuiltInParameter.VIEW_NAME)
+        self.add_parameter('View Template', attr='ViewTemplateId', built_in=BuiltInParameter.VIEW_TEMPLATE)
+        self.add_parameter('Sheet Number', attr='_viewer_sheet_number', built_in=BuiltInParameter.VIEWER_SHEET_NUMBER,
+                           read_only=True)
+
+    @property
+    def _viewer_sheet_number(self):
+        """Number of the sheet where the view is placed with a Viewport ('---' if it's not placed)."""
+        if self.Document is not None:
+            for vp in self.Document.of_class(Viewport):
+                if vp.ViewId == self.Id:
+                    sheet = self.Document.GetElement(vp.SheetId)
+                    return sheet.SheetNumber if sheet else '---'
+        return '---'
+
+    @property
+    def Title(self):
+        return '{}: {}'.format(self.ViewType, self._name)
+
+    def CanBePrinted(self):                         return not self.IsTemplate
+    def GetElementOverrides(self, element_id):      return self._overrides.get(element_id, OverrideGraphicSettings())
+    def GetCategoryOverrides(self, category_id):    return self._category_overrides.get(category_id, OverrideGraphicSettings())
+    def SetCategoryOverrides(self, category_id, s): self._category_overrides[category_id] = s
+    def GetFilters(self):                           return list(self._filters)
+    def GetFilterOverrides(self, filter_id):        return self._filter_overrides.get(filter_id, OverrideGraphicSettings())
+    def SetFilterOverrides(self, filter_id, s):     self._filter_overrides[filter_id] = s
+    def AddFilter(self, filter_id):                 self._filters.append(filter_id)
+    def GetPlacementOnSheetStatus(self):            return None
+
+    def SetElementOverrides(self, element_id, settings):
+        old = self._overrides.get(element_id)
+        self.Document._record(lambda: self._overrides.__setitem__(element_id, old))
+        self._overrides[element_id] = settings
+
+    def HideElements(self, element_ids):
+        self._hidden.update(element_ids)
+
+    def UnhideElements(self, element_ids):
+        self._hidden.difference_update(element_ids)
+
+
+class ViewPlan(View):       pass
+class ViewSection(View):    pass
+class ViewDrafting(View):   pass
+
+
+class View3D(View):
+    def __init__(self, name='', **kwargs):
+        kwargs.setdefault('view_type', ViewType.ThreeD)
+        super(View3D, self).__init__(name, **kwargs)
+        self.IsPerspective = False
+
+
+class ViewSchedule(View):
+    category = BuiltInCategory.OST_Schedules
+
+    def __init__(self, name='', **kwargs):
+        kwargs.setdefault('view_type', ViewType.Schedule)
+        super(ViewSchedule, self).__init__(name, **kwargs)
+        self.IsTitleblockRevisionSchedule = False
+        self.IsInternalKeynoteSchedule    = False
+
+
+class ViewSheet(View):
+    category = BuiltInCategory.OST_Sheets
+
+    def __init__(self, name='', number='', **kwargs):
+        kwargs.setdefault('view_type', ViewType.DrawingSheet)
+        super(ViewSheet, self).__init__(name, **kwargs)
+        self.SheetNumber   = number
+        self.IsPlaceholder = False
+        self._revision_ids = []
+        self.add_parameter('Sheet Name', attr='_name', built_in=BuiltInParameter.SHEET_NAME)
+        self.add_parameter('Sheet Number', attr='SheetNumber', built_in=BuiltInParameter.SHEET_NUMBER)
+
+    @staticmethod
+    def Create(doc, title_block_type_id):
+        sheet = doc.add(ViewSheet('Unnamed', 'A{}'.format(len(doc.of_class(ViewSheet)) + 1)))
+        if title_block_type_id and title_block_type_id != ElementId.InvalidElementId:
+            title_block = FamilyInstance('Title Block', BuiltInCategory.OST_TitleBlocks, type_id=title_block_type_id)
+            title_block._bbox = BoundingBoxXYZ(XYZ(0, 0, 0), XYZ(2.76, 1.95, 0))
+            title_block.OwnerViewId = sheet.Id
+            doc.add(title_block)
+        return sheet
+
+    def _viewports(self):
+        return [vp for vp in self.Document.of_class(Viewport) if vp.SheetId == self.Id]
+
+    def GetAllViewports(self):
+        return [vp.Id for vp in self._viewports()]
+
+    def GetAllPlacedViews(self):
+        views = [vp.ViewId for vp in self._viewports()]
+        views += [s.ScheduleId for s in self.Document.of_class(ScheduleSheetInstance) if s.OwnerViewId == self.Id]
+        return views
+
+    def GetAdditionalRevisionIds(self):
+        return list(self._revision_ids)
+
+    def SetAdditionalRevisionIds(self, revision_ids):
+        self._modify('_revision_ids', list(revision_ids))
+
+    def GetAllRevisionIds(self):
+        return list(self._revision_ids)
+
+    def GetRevisionNumberOnSheet(self, revision_id):
+        revision = self.Document.GetElement(revision_id)
+        return str(revision.SequenceNumber) if revision_id in self._revision_ids else None
+
+
+class Viewport(Element):
+    category = BuiltInCategory.OST_Viewports
+
+    def __init__(self, sheet_id=None, view_id=None, center=None, **params):
+        super(Viewport, self).__init__('Viewport', **params)
+        self.SheetId = sheet_id or ElementId.InvalidElementId
+        self.ViewId  = view_id  or ElementId.InvalidElementId
+        self._center = center   or XYZ()
+
+    def GetBoxCenter(self):         return self._center
+    def SetBoxCenter(self, point):  self._modify('_center', point)
+
+    @staticmethod
+    def CanAddViewToSheet(doc, sheet_id, view_id):
+        view = doc.GetElement(view_id)
+        if view is None or view.IsTemplate or isinstance(view, ViewSheet):
+            return False
+        if view.ViewType in (ViewType.Legend, ViewType.Schedule):
+            return True
+        return not any(vp.ViewId == view_id for vp in doc.of_class(Viewport))
+
+    @staticmethod
+    def Create(doc, sheet_id, view_id, point):
+        if not Viewport.CanAddViewToSheet(doc, sheet_id, view_id):
+            raise ArgumentException('View can not be added to the sheet.')
+        return doc.add(Viewport(sheet_id, view_id, point))
+
+
+class ScheduleSheetInstance(Element):
+    category = BuiltInCategory.OST_ScheduleGraphics
+
+    def __init__(self, schedule_id=None, sheet_id=None, **params):
+        super(ScheduleSheetInstance, self).__init__('Schedule Graphics', **params)
+        self.ScheduleId  = schedule_id or ElementId.InvalidElementId
+        self.OwnerViewId = sheet_id    or ElementId.InvalidElementId
+        self.IsTitleblockRevisionSchedule = False
+
+
+# ╔═╗╦  ╦╔═╗╦═╗╦═╗╦╔╦╗╔═╗╔═╗
+# ║ ║╚╗╔╝║╣ ╠╦╝╠╦╝║ ║║║╣ ╚═╗
+# ╚═╝ ╚╝ ╚═╝╩╚═╩╚═╩═╩╝╚═╝╚═╝ OVERRIDES
+#====================================================================================================
+class OverrideGraphicSettings(object):
+    """Stores every Set...() call in self.settings {method_name: args}."""
+    def __init__(self, other=None):
+        self.settings = dict(other.settings) if other is not None else {}
+
+    def __getattr__(self, name):
+        if name.startswith('Set'):
+            def setter(*args):
+                self.settings[name] = args
+                return self
+            return setter
+        raise AttributeError(name)
+
+    @property
+    def ProjectionLinePatternId(self):
+        return self.settings.get('SetProjectionLinePatternId', (ElementId.InvalidElementId,))[0]
+
+    @property
+    def CutLinePatternId(self):
+        return self.settings.get('SetCutLinePatternId', (ElementId.InvalidElementId,))[0]
+
+
+# ╔═╗╔═╗╦  ╦  ╔═╗╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ║  ║ ║║  ║  ║╣ ║   ║ ║║ ║║║║╚═╗
+# ╚═╝╚═╝╩═╝╩═╝╚═╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ COLLECTIONS
+#====================================================================================================
+class ICollection(list):
+    """list with .NET ICollection members."""
+    @property
+    def Count(self):
+        return len(self)
+
+    def Add(self, item):
+        self.append(item)
+
+    def Contains(self, item):
+        return item in self
+
+
+# ╔═╗╦╦ ╔╦╗╔═╗╦═╗╔═╗
+# ╠╣ ║║  ║ ║╣ ╠╦╝╚═╗
+# ╚  ╩╩═╝╩ ╚═╝╩╚═╚═╝ FILTERS
+#====================================================================================================
+class ElementFilter(object):
+    def __init__(self, inverted=False):
+        self.Inverted = inverted
+
+    def _passes(self, element):
+        raise NotImplementedError
+
+    def PassesFilter(self, *args):
+        """PassesFilter(element) or PassesFilter(doc, element_id)"""
+        element = args[0] if len(args) == 1 else args[0].GetElement(args[1])
+        return self._passes(element) != self.Inverted
+
+    @property
+    def IsQuickFilter(self):
+        return isinstance(self, ElementQuickFilter)
+
+
+class ElementQuickFilter(ElementFilter):    pass
+class ElementSlowFilter(ElementFilter):     pass
+
+
+def _category_id(category):
+    return category if isinstance(category, ElementId) else ElementId(category)
+
+
+class ElementCategoryFilter(ElementQuickFilter):
+    def __init__(self, category, inverted=False):
+        super(ElementCategoryFilter, self).__init__(inverted)
+        self.CategoryId = _category_id(category)
+
+    def _passes(self, element):
+        cat = element.Category
+        return cat is not None and cat.Id == self.CategoryId
+
+
+class ElementMulticategoryFilter(ElementQuickFilter):
+    def __init__(self, categories, inverted=False):
+        super(ElementMulticategoryFilter, self).__init__(inverted)
+        self.CategoryIds = set(_category_id(c) for c in categories)
+
+    def GetCategoryIds(self):
+        return list(self.CategoryIds)
+
+    def _passes(self, element):
+        cat = element.Category
+        return cat is not None and cat.Id in self.CategoryIds
+
+
+class ElementClassFilter(ElementQuickFilter):
+    def __init__(self, element_class, inverted=False):
+        super(ElementClassFilter, self).__init__(inverted)
+        self.ElementClass = element_class
+
+    def _passes(self, element):
+        return isinstance(element, self.ElementClass)
+
+
+class ElementMulticlassFilter(ElementQuickFilter):
+    def __init__(self, element_classes, inverted=False):
+        super(ElementMulticlassFilter, self).__init__(inverted)
+        self.ElementClasses = tuple(element_classes)
+
+    def _passes(self, element):
+        return isinstance(element, self.ElementClasses)
+
+
+class ElementIsElementTypeFilter(ElementQuickFilter):
+    def _passes(self, element):
+        return isinstance(element, ElementType)
+
+
+class ElementOwnerViewFilter(ElementQuickFilter):
+    def __init__(self, view_id, inverted=False):
+        super(ElementOwnerViewFilter, self).__init__(inverted)
+        self.ViewId = view_id
+
+    def _passes(self, element):
+        return element.OwnerViewId == self.ViewId
+
+
+class VisibleInViewFilter(ElementQuickFilter):
+    """Approximation: model elements and elements owned by the view, that are not hidden in it."""
+    def __init__(self, doc, view_id, inverted=False):
+        super(VisibleInViewFilter, self).__init__(inverted)
+        self.ViewId = view_id
+        self.view   = doc.GetElement(view_id)
+
+    def _passes(self, element):
+        if isinstance(element, ElementType) or element.Id in getattr(self.view, '_hidden', ()):
+            return False
+        return element.OwnerViewId in (self.ViewId, ElementId.InvalidElementId)
+
+
+class ElementLevelFilter(ElementQuickFilter):
+    def __init__(self, level_id, inverted=False):
+        super(ElementLevelFilter, self).__init__(inverted)
+        self.LevelId = level_id
+
+    def _passes(self, element):
+        return element.LevelId == self.LevelId
+
+
+class ExclusionFilter(ElementQuickFilter):
+    def __init__(self, element_ids, inverted=False):
+        super(ExclusionFilter, self).__init__(inverted)
+        self.ElementIds = set(element_ids)
+
+    def _passes(self, element):
+        return element.Id not in self.ElementIds
+
+
+class ElementIdSetFilter(ElementQuickFilter):
+    """Not a Revit API class - used by FilteredElementCollector(doc, element_ids)."""
+    def __init__(self, element_ids, inverted=False):
+        super(ElementIdSetFilter, self).__init__(inverted)
+        self.ElementIds = set(element_ids)
+
+    def _passes(self, element):
+        return element.Id in self.ElementIds
+
+
+class BoundingBoxIntersectsFilter(ElementQuickFilter):
+    def __init__(self, outline, inverted=False):
+        super(BoundingBoxIntersectsFilter, self).__init__(inverted)
+        self.Outline = outline
+
+    def _passes(self, element):
+        BB = element.get_BoundingBox(None)
+        if BB is None:
+            return False
+        lo, hi = self.Outline.MinimumPoint, self.Outline.MaximumPoint
+        return (BB.Min.X <= hi.X and BB.Max.X >= lo.X and
+                BB.Min.Y <= hi.Y and BB.Max.Y >= lo.Y and
+                BB.Min.Z <= hi.Z and BB.Max.Z >= lo.Z)
+
+
+class _LogicalFilter(ElementFilter):
+    def __init__(self, *filters):
+        super(_LogicalFilter, self).__init__(False)
+        self._filters = list(filters[0]) if len(filters) == 1 else list(filters)
+
+    def GetFilters(self):
+        return list(self._filters)
+
+    @property
+    def IsQuickFilter(self):
+        return all(f.IsQuickFilter for f in self._filters)
+
+
+class LogicalOrFilter(_LogicalFilter):
+    def _passes(self, element):
+        return any(f.PassesFilter(element) for f in self._filters)
+
+
+class LogicalAndFilter(_LogicalFilter):
+    def _passes(self, element):
+        return all(f.PassesFilter(element) for f in self._filters)
+
+
+# RULES
+class ParameterValueProvider(object):
+    def __init__(self, parameter_id):
+        self.Parameter = parameter_id
+
+    def get_parameter(self, element):
+        for p in element._params.values():
+            if p.Id == self.Parameter:
+                return p
+        for p in element._bip.values():
+            if p.Id == self.Parameter:
+                return p
+        # Like Revit - type parameters (e.g. ALL_MODEL_TYPE_NAME) are checked for instances
+        element_type = element.Document._elements.get(element.GetTypeId()) if element.Document else None
+        if element_type is not None and element_type is not element:
+            return self.get_parameter(element_type)
+        return None
+
+
+class FilterStringRuleEvaluator(object):
+    def __init__(self, func=None):
+        self._func = func
+
+    def Evaluate(self, value, rule_value, case_sensitive=True):
+        if not case_sensitive:
+            value, rule_value = value.lower(), rule_value.lower()
+        return self._func(value, rule_value)
+
+
+class FilterNumericRuleEvaluator(object):
+    def __init__(self, func=None):
+        self._func = func
+
+    def Evaluate(self, value, rule_value, epsilon=0.0):
+        return self._func(value, rule_value, epsilon)
+
+
+def FilterStringEquals():           return FilterStringRuleEvaluator(lambda a, b: a == b)
+def FilterStringContains():         return FilterStringRuleEvaluator(lambda a, b: b in a)
+def FilterStringBeginsWith():       return FilterStringRuleEvaluator(lambda a, b: a.startswith(b))
+def FilterStringEndsWith():         return FilterStringRuleEvaluator(lambda a, b: a.endswith(b))
+def FilterStringGreater():          return FilterStringRuleEvaluator(lambda a, b: a > b)
+def FilterStringLess():             return FilterStringRuleEvaluator(lambda a, b: a < b)
+def FilterNumericEquals():          return FilterNumericRuleEvaluator(lambda a, b, e: abs(a - b) <= e)
+def FilterNumericGreater():         return FilterNumericRuleEvaluator(lambda a, b, e: a - b > e)
+def FilterNumericGreaterOrEqual():  return FilterNumericRuleEvaluator(lambda a, b, e: a - b >= -e)
+def FilterNumericLess():            return FilterNumericRuleEvaluator(lambda a, b, e: b - a > e)
+def FilterNumericLessOrEqual():     return FilterNumericRuleEvaluator(lambda a, b, e: b - a >= -e)
+
+
+class FilterRule(object):
+    def __init__(self, provider, evaluator, value):
+        self.provider  = provider
+        self.evaluator = evaluator
+        self.value     = value
+
+    def ElementPasses(self, element):
+        p = self.provider.get_parameter(element)
+        return p is not None and self._evaluate(p)
+
+
+class FilterStringRule(FilterRule):
+    def __init__(self, provider, evaluator, value, case_sensitive=True):
+        super(FilterStringRule, self).__init__(provider, evaluator, value)
+        self.case_sensitive = case_sensitive
+
+    def _evaluate(self, p):
+        value = p.AsString()
+        return value is not None and self.evaluator.Evaluate(value, self.value, self.case_sensitive)
+
+
+class FilterElementIdRule(FilterRule):
+    def _evaluate(self, p):
+        return self.evaluator.Evaluate(p.AsElementId().IntegerValue, self.value.IntegerValue)
+
+
+class FilterIntegerRule(FilterRule):
+    def _evaluate(self, p):
+        return self.evaluator.Evaluate(p.AsInteger(), self.value)
+
+
+class FilterDoubleRule(FilterRule):
+    def __init__(self, provider, evaluator, value, epsilon):
+        super(FilterDoubleRule, self).__init__(provider, evaluator, value)
+        self.epsilon = epsilon
+
+    def _evaluate(self, p):
+        return self.evaluator.Evaluate(p.AsDouble(), self.value, self.epsilon)
+
+
+class FilterInverseRule(object):
+    def __init__(self, rule):
+        self.rule = rule
+
+    def ElementPasses(self, element):
+        return not self.rule.ElementPasses(element)
+
+
+class ParameterFilterRuleFactory(object):
+    @staticmethod
+    def CreateEqualsRule(parameter_id, value, *args):
+        provider = ParameterValueProvider(parameter_id)
+        if isinstance(value, ElementId):
+            return FilterElementIdRule(provider, FilterNumericEquals(), value)
+        if isinstance(value, float):
+            return FilterDoubleRule(provider, FilterNumericEquals(), value, args[0] if args else 1e-9)
+        if isinstance(value, int):
+            return FilterIntegerRule(provider, FilterNumericEquals(), value)
+        return FilterStringRule(provider, FilterStringEquals(), value, args[0] if args else True)
+
+    @staticmethod
+    def CreateNotEqualsRule(parameter_id, value, *args):
+        return FilterInverseRule(ParameterFilterRuleFactory.CreateEqualsRule(parameter_id, value, *args))
+
+    @staticmethod
+    def CreateContainsRule(parameter_id, value, case_sensitive=True):
+        return FilterStringRule(ParameterValueProvider(parameter_id), FilterStringContains(), value, case_sensitive)
+
+    @staticmethod
+    def CreateBeginsWithRule(parameter_id, value, case_sensitive=True):
+        return FilterStringRule(ParameterValueProvider(parameter_id), FilterStringBeginsWith(), value, case_sensitive)
+
+    @staticmethod
+    def CreateGreaterRule(parameter_id, value, epsilon=1e-9):
+        return FilterDoubleRule(ParameterValueProvider(parameter_id), FilterNumericGreater(), value, epsilon)
+
+    @staticmethod
+    def CreateLessRule(parameter_id, value, epsilon=1e-9):
+        return FilterDoubleRule(ParameterValueProvider(parameter_id), FilterNumericLess(), value, epsilon)
+
+
+class ElementParameterFilter(ElementSlowFilter):
+    def __init__(self, rules, inverted=False):
+        super(ElementParameterFilter, self).__init__(inverted)
+        self._rules = list(rules) if isinstance(rules, (list, tuple)) else [rules]
+
+    def GetRules(self):
+        return list(self._rules)
+
+    def _passes(self, element):
+        return all(rule.ElementPasses(element) for rule in self._rules)
+
+
+# ╔═╗╔═╗╦  ╦  ╔═╗╔═╗╔╦╗╔═╗╦═╗
+# ║  ║ ║║  ║  ║╣ ║   ║ ║ ║╠╦╝
+# ╚═╝╚═╝╩═╝╩═╝╚═╝╚═╝ ╩ ╚═╝╩╚═ COLLECTOR
+#====================================================================================================
+class FilteredElementCollector(object):
+    """Lazy collector. Filters are stored and applied in a single pass when results are requested.
+    Every materialized pass is counted in doc.stats['collector_passes']."""
+
+    def __init__(self, doc, arg=None):
+        self.doc      = doc
+        self._filters = []
+        if isinstance(arg, ElementId):
+            self._filters.append(VisibleInViewFilter(doc, arg))
+        elif arg is not None:
+            self._filters.append(ElementIdSetFilter(arg))
+
+    def WherePasses(self, element_filter):
+        self._filters.append(element_filter)
+        return self
+
+    def OfClass(self, element_class):               return self.WherePasses(ElementClassFilter(element_class))
+    def OfCategory(self, category):                 return self.WherePasses(ElementCategoryFilter(category))
+    def OfCategoryId(self, category_id):            return self.WherePasses(ElementCategoryFilter(category_id))
+    def WhereElementIsElementType(self):            return self.WherePasses(ElementIsElementTypeFilter())
+    def WhereElementIsNotElementType(self):         return self.WherePasses(ElementIsElementTypeFilter(True))
+    def OwnedByView(self, view_id):                 return self.WherePasses(ElementOwnerViewFilter(view_id))
+    def WhereElementIsViewIndependent(self):        return self.OwnedByView(ElementId.InvalidElementId)
+    def Excluding(self, element_ids):               return self.WherePasses(ExclusionFilter(element_ids))
+
+    def UnionWith(self, other):
+        own, others = list(self._filters), list(other._filters)
+        self._filters = [LogicalOrFilter(LogicalAndFilter(own) if own else _AllFilter(),
+                                         LogicalAndFilter(others) if others else _AllFilter())]
+        return self
+
+    def IntersectWith(self, other):
+        self._filters.extend(other._filters)
+        return self
+
+    def _iter(self):
+        self.doc.stats['collector_passes'] += 1
+        filters  = self._filters
+        # OfClass as the first filter narrows the pass to one class (like Revit's quick class filter)
+        elements = (self.doc.of_class(filters[0].ElementClass)
+                    if filters and type(filters[0]) is ElementClassFilter and not filters[0].Inverted
+                    else list(self.doc._elements.values()))
+        for element in elements:
+            if all(f.PassesFilter(element) for f in filters):
+                yield element
+
+    def __iter__(self):                 return self._iter()
+    def ToElements(self):               return ICollection(self._iter())
+    def ToElementIds(self):             return ICollection(el.Id for el in self._iter())
+    def GetElementCount(self):          return sum(1 for _ in self._iter())
+
+    def FirstElement(self):
+        for element in self._iter():
+            return element
+        return None
+
+    def FirstElementId(self):
+        element = self.FirstElement()
+        return element.Id if element else ElementId.InvalidElementId
+
+
+class Workset(object):
+    def __init__(self, workset_id, name, kind=None):
+        self.Id        = workset_id
+        self.Name      = name
+        self.Kind      = kind or WorksetKind.UserWorkset
+        self.IsOpen    = True
+        self.Owner     = ''
+
+
+class FilteredWorksetCollector(object):
+    """Worksets are stored in doc._worksets."""
+    def __init__(self, doc):
+        self.doc   = doc
+        self._kind = None
+
+    def OfKind(self, kind):
+        self._kind = kind
+        return self
+
+    def ToWorksets(self):
+        return ICollection(w for w in self.doc._worksets if self._kind is None or w.Kind == self._kind)
+
+    def __iter__(self):
+        return iter(self.ToWorksets())
+
+
+class _AllFilter(ElementQuickFilter):
+    def _passes(self, element):
+        return True
+
+
+# ╔╦╗╦═╗╔═╗╔╗╔╔═╗╔═╗╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+#  ║ ╠╦╝╠═╣║║║╚═╗╠═╣║   ║ ║║ ║║║║╚═╗
+#  ╩ ╩╚═╩ ╩╝╚╝╚═╝╩ ╩╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ TRANSACTIONS
+#====================================================================================================
+class IFailuresPreprocessor(object):
+    def PreprocessFailures(self, failures_accessor):
+        return FailureProcessingResult.Continue
+
+
+class FailureHandlingOptions(object):
+    def __init__(self):
+        self.preprocessor        = None
+        self.clear_after_rollback = False
+
+    def SetFailuresPreprocessor(self, preprocessor):    self.preprocessor = preprocessor
+    def SetClearAfterRollback(self, value):             self.clear_after_rollback = value
+    def GetFailuresPreprocessor(self):                  return self.preprocessor
+
+
+class FailureMessage(object):
+    def __init__(self, description, element_ids=None, severity=None, definition_id=None):
+        self._description  = description
+        self._element_ids  = list(element_ids or [])
+        self._severity     = severity or FailureSeverity.Warning
+        self._definition   = definition_id or FailureDefinitionId(description)
+
+    def GetDescriptionText(self):       return self._description
+    def GetFailingElementIds(self):     return list(self._element_ids)
+    def GetFailingElements(self):       return list(self._element_ids)
+    def GetSeverity(self):              return self._severity
+    def GetFailureDefinitionId(self):   return self._definition
+    def HasResolutions(self):           return False
+    def GetAdditionalElements(self):    return []
+
+
+class FailureDefinitionId(object):
+    def __init__(self, key):
+        import uuid
+        self.Guid = uuid.uuid5(uuid.NAMESPACE_OID, str(key))
+
+
+class FailuresAccessor(object):
+    def __init__(self, messages):
+        self._messages = list(messages)
+        self.deleted   = []
+
+    def GetFailureMessages(self):       return list(self._messages)
+    def DeleteWarning(self, message):   self.deleted.append(message)
+    def DeleteAllWarnings(self):        self.deleted.extend(self._messages)
+    def ResolveFailure(self, message):  self.deleted.append(message)
+
+
+class Transaction(object):
+    def __init__(self, doc, name=''):
+        self.doc      = doc
+        self._name    = name
+        self._status  = TransactionStatus.Uninitialized
+        self._options = FailureHandlingOptions()
+        self._journal = []
+
+    def __enter__(self):                return self
+    def __exit__(self, *args):
+        if self.HasStarted() and not self.HasEnded():
+            self.RollBack()
+
+    def GetName(self):                      return self._name
+    def SetName(self, name):                self._name = name
+    def GetStatus(self):                    return self._status
+    def HasStarted(self):                   return self._status != TransactionStatus.Uninitialized
+    def HasEnded(self):                     return self._status in (TransactionStatus.Committed, TransactionStatus.RolledBack)
+    def GetFailureHandlingOptions(self):    return self._options
+    def SetFailureHandlingOptions(self, o): self._options = o
+
+    def Start(self, name=None):
+        if self.doc._transaction is not None:
+            raise InvalidOperationException('Another Transaction is already open.')
+        if name:
+            self._name = name
+        self.doc._transaction = self
+        self.doc.stats['transactions'] += 1
+        self._status = TransactionStatus.Started
+        return self._status
+
+    def _end(self, status):
+        self.doc._transaction = None
+        self._status = status
+        return status
+
+    def Commit(self):
+        # FAILURES
+        messages = self.doc._pending_failures
+        self.doc._pending_failures = []
+        preprocessor = self._options.preprocessor
+        if messages and preprocessor is not None:
+            accessor = FailuresAccessor(messages)
+            result   = preprocessor.PreprocessFailures(accessor)
+            if result == FailureProcessingResult.ProceedWithRollBack:
+                return self.RollBack()
+        elif any(m.GetSeverity() != FailureSeverity.Warning for m in messages):
+            return self.RollBack()
+
+        if self.doc._groups:
+            self.doc._groups[-1]._journal.extend(self._journal)
+        return self._end(TransactionStatus.Committed)
+
+    def RollBack(self):
+        for undo in reversed(self._journal):
+            undo()
+        self._journal = []
+        self.doc._pending_failures = []
+        return self._end(TransactionStatus.RolledBack)
+
+
+class SubTransaction(object):
+    """Changes since Start() are undone on RollBack. Has to be inside an open Transaction."""
+    def __init__(self, doc):
+        self.doc     = doc
+        self._status = TransactionStatus.Uninitialized
+        self._mark   = 0
+
+    def GetStatus(self):    return self._status
+    def HasStarted(self):   return self._status != TransactionStatus.Uninitialized
+    def HasEnded(self):     return self._status in (TransactionStatus.Committed, TransactionStatus.RolledBack)
+
+    def Start(self):
+        if self.doc._transaction is None:
+            raise InvalidOperationException('SubTransaction can be started only inside a Transaction.')
+        self._mark   = len(self.doc._transaction._journal)
+        self._status = TransactionStatus.Started
+        return self._status
+
+    def Commit(self):
+        self._status = TransactionStatus.Committed
+        return self._status
+
+    def RollBack(self):
+        journal = self.doc._transaction._journal
+        for undo in reversed(journal[self._mark:]):
+            undo()
+        del journal[self._mark:]
+        self._status = TransactionStatus.RolledBack
+        return self._status
+
+
+class TransactionGroup(object):
+    def __init__(self, doc, name=''):
+        self.doc      = doc
+        self._name    = name
+        self._status  = TransactionStatus.Uninitialized
+        self._journal = []
+
+    def GetStatus(self):    return self._status
+    def HasStarted(self):   return self._status != TransactionStatus.Uninitialized
+    def HasEnded(self):     return self._status in (TransactionStatus.Committed, TransactionStatus.RolledBack)
+
+    def Start(self):
+        self.doc._groups.append(self)
+        self._status = TransactionStatus.Started
+        return self._status
+
+    def _end(self, status):
+        self.doc._groups.remove(self)
+        if status == TransactionStatus.Committed and self.doc._groups:
+            self.doc._groups[-1]._journal.extend(self._journal)
+        self._status = status
+        return status
+
+    def Commit(self):       return self._end(TransactionStatus.Committed)
+    def Assimilate(self):   return self._end(TransactionStatus.Committed)
+
+    def RollBack(self):
+        for undo in reversed(self._journal):
+            undo()
+        self._journal = []
+        return self._end(TransactionStatus.RolledBack)
+
+
+# ╔╦╗╔═╗╔═╗╦ ╦╔╦╗╔═╗╔╗╔╔╦╗
+#  ║║║ ║║  ║ ║║║║║╣ ║║║ ║
+# ═╩╝╚═╝╚═╝╚═╝╩ ╩╚═╝╝╚╝ ╩  DOCUMENT
+#====================================================================================================
+class Settings(object):
+    def __init__(self):
+        self._categories = {}
+
+    def get_category(self, built_in):
+        if built_in not in self._categories:
+            self._categories[built_in] = Category(built_in)
+        return self._categories[built_in]
+
+    @property
+    def Categories(self):
+        return list(self._categories.values())
+
+
+class DocumentVersion(object):
+    def __init__(self, title, saves):
+        self.VersionGUID   = '{}-{}'.format(title, saves)
+        self.NumberOfSaves = saves
+
+
+class Document(object):
+    """In-memory Document. Elements are stored in a dict {ElementId: Element} in creation order.
+    Any modification outside of a Transaction raises ModificationOutsideTransactionException.
+    self.stats counts collector passes, GetElement calls and Transactions."""
+    _hash_codes = itertools.count(1)
+
+    def __init__(self, title='Project1', path='', application=None, workshared=False, is_family=False):
+        self.Title              = title
+        self.PathName           = path
+        self._saves             = 0
+        self.Application        = application
+        self.IsWorkshared       = workshared
+        self.IsFamilyDocument   = is_family
+        self.IsLinked           = False
+        self.IsDetached         = False
+        self.IsModified         = False
+        self.IsValidObject      = True
+        self.IsReadOnly         = False
+        self.Settings           = Settings()
+        self.ActiveView         = None
+        self.Create             = _DocumentCreate(self)
+        self.stats              = {'collector_passes': 0, 'get_element': 0, 'transactions': 0}
+
+        self._elements          = {}
+        self._by_unique_id      = {}
+        self._by_type           = {}        # {python class: {ElementId: Element}}
+        self._next_id           = itertools.count(100000)
+        self._transaction       = None
+        self._groups            = []
+        self._pending_failures  = []
+        self._default_types     = {}
+        self._owners            = {}        # {ElementId: user name} (worksharing)
+        self._current_user      = 'user'
+        self._warnings          = []
+        self._worksets          = []
+        self._hash_code         = next(Document._hash_codes)
+
+    # NOT REVIT API
+    def _record(self, undo):
+        """Function to add undo function to the open Transaction."""
+        if self._transaction is None:
+            raise ModificationOutsideTransactionException('Attempt to modify the model outside of transaction.')
+        self._transaction._journal.append(undo)
+        self.IsModified = True
+
+    def add(self, element):
+        """Function to add an Element to the Document. Inside a Transaction it is undone on RollBack."""
+        if self._transaction is not None:
+            self._record(lambda: self._remove(element))
+        element.Id       = ElementId(next(self._next_id))
+        element.UniqueId = '{}-{:08x}'.format(self._hash_code, element.Id.IntegerValue)
+        element.Document = self
+        element.IsValidObject = True
+        self._restore(element)
+        return element
+
+    def extend(self, elements):
+        return [self.add(el) for el in elements]
+
+    def _remove(self, element):
+        self._elements.pop(element.Id, None)
+        self._by_unique_id.pop(element.UniqueId, None)
+        self._by_type.get(type(element), {}).pop(element.Id, None)
+        element.IsValidObject = False
+
+    def _restore(self, element):
+        self._elements[element.Id]           = element
+        self._by_unique_id[element.UniqueId] = element
+        self._by_type.setdefault(type(element), {})[element.Id] = element
+        element.IsValidObject = True
+
+    def of_class(self, element_class):
+        """Function to get all Elements of a class (with subclasses) without a collector pass."""
+        groups = [elements for cls, elements in self._by_type.items() if issubclass(cls, element_class)]
+        if len(groups) == 1:
+            return list(groups[0].values())
+        return sorted((el for elements in groups for el in elements.values()), key=lambda el: el.Id.IntegerValue)
+
+    def post_failure(self, description, element_ids=None, severity=None):
+        """Function to simulate a failure that is posted on the next Commit."""
+        self._pending_failures.append(FailureMessage(description, element_ids, severity))
+
+    # REVIT API
+    def GetHashCode(self):
+        return self._hash_code
+
+    def Equals(self, other):
+        return other is self
+
+    def GetElement(self, key):
+        self.stats['get_element'] += 1
+        key = getattr(key, 'ElementId', key)        # Reference
+        if isinstance(key, ElementId):
+            return self._elements.get(key)
+        return self._by_unique_id.get(key)
+
+    def _dependents_map(self):
+        """Function to map ElementId -> Elements that are deleted with it (instances, viewports, view-specific elements)."""
+        dependents = {}
+        for el in self._elements.values():
+            for ref in (el.GetTypeId(), el.OwnerViewId, getattr(el, 'SheetId', None),
+                        getattr(el, 'ViewId', None), getattr(el, 'ScheduleId', None)):
+                if ref is not None and ref != ElementId.InvalidElementId:
+                    dependents.setdefault(ref, []).append(el)
+        return dependents
+
+    def Delete(self, element_ids):
+        if isinstance(element_ids, ElementId):
+            element_ids = [element_ids]
+
+        dependents = self._dependents_map()
+        deleted    = []
+        queue      = list(element_ids)
+        while queue:
+            element = self._elements.get(queue.pop())
+            if element is None:
+                continue
+            self._record(lambda el=element: self._restore(el))
+            self._remove(element)
+            deleted.append(element.Id)
+            queue.extend(el.Id for el in dependents.get(element.Id, []))
+        if not deleted:
+            raise ArgumentException('Element can not be deleted.')
+        return ICollection(deleted)
+
+    def Regenerate(self):
+        pass
+
+    def GetDefaultElementTypeId(self, type_group):
+        return self._default_types.get(type_group, ElementId.InvalidElementId)
+
+    def GetWarnings(self):
+        return list(self._warnings)
+
+    def GetWorksetTable(self):
+        return None
+
+    @property
+    def IsModifiable(self):
+        return self._transaction is not None
+
+    def Save(self, options=None):
+        if self.IsDetached:
+            raise InvalidOperationException('Detached Document has to be saved with SaveAs.')
+        self.IsModified = False
+        self.saved_to   = self.PathName
+        self._saves    += 1
+
+    def SaveAs(self, path, options=None):
+        path = getattr(path, 'path', path)
+        if self.IsWorkshared and options is not None and options._worksharing is None:
+            raise InvalidOperationException('Workshared Document has to be saved as central (WorksharingSaveAsOptions).')
+        self.PathName   = path
+        self.IsModified = False
+        self.IsDetached = False
+        self.saved_to   = path
+        self._saves    += 1
+
+    def get_TypeOfStorage(self, built_in):
+        """StorageType of a BuiltInParameter (read from the first element that has it)."""
+        for element in self._elements.values():
+            p = element.get_Parameter(built_in)
+            if p is not None:
+                return p.StorageType
+        return getattr(StorageType, 'None')
+
+    @staticmethod
+    def GetDocumentVersion(doc):
+        """Revit 2021+. Changes every time the document is saved."""
+        return DocumentVersion(doc.Title, doc._saves)
+
+    def Close(self, save_modified=False):
+        self.IsValidObject = False
+        return True
+
+
+class _DocumentCreate(object):
+    """doc.Create - only methods that are used in lib/ are implemented."""
+    def __init__(self, doc):
+        self.doc = doc
+
+    def NewFloor(self, curve_array, floor_type, level, structural):
+        return self.doc.add(Floor('Floor', type_id=floor_type.Id, level_id=level.Id))
+
+
+# ╦ ╦╔╦╗╦╦  ╦╔╦╗╦╔═╗╔═╗
+# ║ ║ ║ ║║  ║ ║ ║║╣ ╚═╗
+# ╚═╝ ╩ ╩╩═╝╩ ╩ ╩╚═╝╚═╝ UTILITIES
+#====================================================================================================
+class ForgeTypeId(object):
+    def __init__(self, type_id):
+        self.TypeId = type_id
+
+    def __hash__(self):         return hash(self.TypeId)
+    def __eq__(self, other):    return isinstance(other, ForgeTypeId) and self.TypeId == other.TypeId
+    def __ne__(self, other):    return not self == other
+
+
+# Factors to internal units (feet, square feet, cubic feet, radians)
+_UNIT_FACTORS = {
+    'Feet': 1.0, 'Inches': 1.0 / 12, 'Meters': 1.0 / 0.3048, 'Centimeters': 1.0 / 30.48, 'Millimeters': 1.0 / 304.8,
+    'SquareFeet': 1.0, 'SquareMeters': 1.0 / 0.09290304, 'SquareCentimeters': 1.0 / 929.0304,
+    'SquareMillimeters': 1.0 / 92903.04, 'CubicFeet': 1.0, 'CubicMeters': 1.0 / 0.028316846592,
+    'Radians': 1.0, 'Degrees': math.pi / 180,
+}
+
+
+class _UnitTypeIdMeta(type):
+    def __getattr__(cls, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return ForgeTypeId('autodesk.unit.unit:' + name[0].lower() + name[1:])
+
+UnitTypeId = _UnitTypeIdMeta('UnitTypeId', (object,), {})
+
+
+def _unit_factor(unit):
+    if isinstance(unit, ForgeTypeId):
+        name = unit.TypeId.split(':')[-1]
+        name = name[0].upper() + name[1:]
+    else:
+        # DisplayUnitType: DUT_SQUARE_METERS -> SquareMeters
+        name = ''.join(part.capitalize() for part in str(unit).replace('DUT_', '').replace('DECIMAL_', '').split('_'))
+    if name not in _UNIT_FACTORS:
+        raise ArgumentException('Unit is not supported: {}'.format(unit))
+    return _UNIT_FACTORS[name]
+
+
+class UnitUtils(object):
+    @staticmethod
+    def ConvertToInternalUnits(value, unit):
+        return value * _unit_factor(unit)
+
+    @staticmethod
+    def ConvertFromInternalUnits(value, unit):
+        return value / _unit_factor(unit)
+
+
+class ModelPath(object):
+    def __init__(self, path):
+        self.path = path
+
+    def __str__(self):      return self.path
+
+
+class ModelPathUtils(object):
+    @staticmethod
+    def ConvertUserVisiblePathToModelPath(path):   return ModelPath(path)
+
+    @staticmethod
+    def ConvertModelPathToUserVisiblePath(path):   return path.path
+
+
+class OpenOptions(object):
+    def __init__(self):
+        self.DetachFromCentralOption = DetachFromCentralOption.DoNotDetach
+        self.Audit                   = False
+
+    def SetOpenWorksetsConfiguration(self, config):
+        pass
+
+
+class WorksharingSaveAsOptions(object):
+    def __init__(self):
+        self.SaveAsCentral = False
+
+
+class SaveAsOptions(object):
+    def __init__(self):
+        self.OverwriteExistingFile = False
+        self.MaximumBackups        = 0
+        self.Compact               = False
+        self._worksharing          = None
+
+    def SetWorksharingOptions(self, options):
+        self._worksharing = options
+
+
+class BasicFileInfo(object):
+    """Info is read from files registered in Application.files of the active __revit__."""
+    def __init__(self, doc):
+        self.IsWorkshared = doc.IsWorkshared
+        self.IsCentral    = doc.IsWorkshared
+        self.Format       = doc.Application.VersionNumber if doc.Application else ''
+
+    @staticmethod
+    def Extract(path):
+        try:
+            import builtins
+        except ImportError:
+            import __builtin__ as builtins
+        files = builtins.__revit__.Application.files
+        if path not in files:
+            raise FileNotFoundException('File does not exist: {}'.format(path))
+        return BasicFileInfo(files[path])
+
+
+class WorksharingTooltipInfo(object):
+    def __init__(self, owner='', creator='', last_changed_by=''):
+        self.Owner         = owner
+        self.Creator       = creator
+        self.LastChangedBy = last_changed_by
+
+
+class WorksharingUtils(object):
+    """Ownership is stored in doc._owners {ElementId: user name}."""
+    @staticmethod
+    def GetCheckoutStatus(doc, element_id):
+        owner = doc._owners.get(element_id)
+        if not owner:
+            return CheckoutStatus.NotOwned
+        if owner == doc._current_user:
+            return CheckoutStatus.OwnedByCurrentUser
+        return CheckoutStatus.OwnedByOtherUser
+
+    @staticmethod
+    def GetModelUpdatesStatus(doc, element_id):
+        return ModelUpdatesStatus.CurrentWithCentral
+
+    @staticmethod
+    def GetWorksharingTooltipInfo(doc, element_id):
+        return WorksharingTooltipInfo(doc._owners.get(element_id, ''))
+
+    @staticmethod
+    def CheckoutElements(doc, element_ids):
+        if doc._transaction is not None:
+            raise InvalidOperationException('Elements can not be checked out inside of a Transaction.')
+        checked_out = ICollection()
+        for el_id in element_ids:
+            owner = doc._owners.get(el_id)
+            if not owner or owner == doc._current_user:
+                doc._owners[el_id] = doc._current_user
+                checked_out.append(el_id)
+        return checked_out
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╦ ╦╔═╗╦  ╔╦╗╔═╗╦═╗╔═╗
+# ╠═╝║  ╠═╣║  ║╣ ╠═╣║ ║║   ║║║╣ ╠╦╝╚═╗
+# ╩  ╩═╝╩ ╩╚═╝╚═╝╩ ╩╚═╝╩═╝═╩╝╚═╝╩╚═╚═╝ PLACEHOLDERS
+#====================================================================================================
+class _PlaceholderMeta(type):
+    """Metaclass for classes that are not implemented. Unknown attributes are Enum members."""
+    def __getattr__(cls, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        members = cls.__dict__.get('_members')
+        if members is None:
+            members = {}
+            setattr(cls, '_members', members)
+        if name not in members:
+            members[name] = _EnumMember(cls, name, next(_enum_values))
+        return members[name]
+
+
+# Revit classes that are not implemented, but are exported by "from Autodesk.Revit.DB import *"
+PLACEHOLDER_NAMES = ['AnnotationSymbol', 'AnnotationSymbolType', 'AssemblyInstance', 'BeamSystemType',
+                     'CurtainSystemType', 'CurveElement', 'DetailArc', 'DetailCurve', 'DetailEllipse', 'DetailLine',
+                     'DetailNurbSpline', 'Dimension', 'DimensionType', 'ElementTransformUtils', 'FamilyManager',
+                     'FilledRegion', 'FilledRegionType', 'FormattedText', 'GeometryInstance',
+                     'Grid', 'GridType', 'IndependentTag', 'ModelArc', 'ModelCurve', 'ModelEllipse', 'ModelLine',
+                     'ModelNurbSpline', 'MullionType', 'Options', 'ParameterElement', 'Phase', 'Plane',
+                     'ReferencePlane', 'RevisionCloud', 'SharedParameterElement', 'SketchPlane', 'Solid',
+                     'SpotDimensionType', 'TextNote', 'ViewFamily', 'ViewFamilyType']
+
+_placeholders = {}
+
+def placeholder(name, base=Element):
+    """Function to get a placeholder class for a name that is not implemented."""
+    if name not in _placeholders:
+        _placeholders[name] = _PlaceholderMeta(name, (base,), {})
+    return _placeholders[name]
+
+
+def __getattr__(name):
+    # PEP 562 (CPython 3.7+): from Autodesk.Revit.DB import NotImplementedClass
+    if name.startswith('_'):
+        raise AttributeError(name)
+    return placeholder(name)
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-in for Autodesk.Revit.Exceptions."""
+
+
+class ApplicationException(Exception):                          pass
+class ArgumentException(ApplicationException):                  pass
+class ArgumentNullException(ArgumentException):                 pass
+class ArgumentOutOfRangeException(ArgumentException):           pass
+class InvalidOperationException(ApplicationException):          pass
+class InvalidObjectException(InvalidOperationException):        pass
+class ModificationOutsideTransactionException(InvalidOperationException): pass
+class OperationCanceledException(ApplicationException):         pass
+class FileNotFoundException(ApplicationException):              pass
+class CentralModelException(ApplicationException):              pass
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Synthetic model generator for FakeRevit.
+
+Generated models are deterministic for the same arguments (seed), so benchmark runs can be compared.
+Names contain words from the Batch Replace Words mappings (CLUB, BAR, MUSIC...) so rename engines have work to do."""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import random
+
+from FakeRevit._db import (Document, ElementTypeGroup, BuiltInCategory, BoundingBoxXYZ,
+                           BoundingBoxUV, LocationPoint, XYZ, Level, Family, FamilySymbol, FamilyInstance,
+                           WallType, FloorType, CeilingType, TextNoteType, Wall, Material, LinePatternElement,
+                           ParameterFilterElement, Revision, View, ViewPlan, ViewSection, View3D, ViewDrafting,
+                           ViewSchedule, ViewSheet, Viewport, ScheduleSheetInstance, ViewType, Area)
+from FakeRevit._architecture import Room
+from FakeRevit._system import Guid
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+ZONE_GUID = Guid('6f1c2b3a-0000-4000-8000-00000000a001')     # Shared parameter 'Zone' of FamilyInstances
+
+WORDS = ['CLUB', 'Bar', 'music lounge', 'RESTAURANT', 'Office', 'Lobby', 'Storage', 'Cocktail Bar',
+         'Kitchen', 'DJ', 'Meeting', 'Corridor', 'Nightclub', 'WC', 'Stair', 'Juice bar']
+
+FAMILY_CATEGORIES = [BuiltInCategory.OST_Furniture, BuiltInCategory.OST_Doors, BuiltInCategory.OST_Windows,
+                     BuiltInCategory.OST_GenericModel, BuiltInCategory.OST_LightingFixtures]
+
+VIEW_CLASSES = [(ViewPlan,      ViewType.FloorPlan),
+                (ViewPlan,      ViewType.CeilingPlan),
+                (ViewSection,   ViewType.Section),
+                (ViewSection,   ViewType.Elevation),
+                (View3D,        ViewType.ThreeD),
+                (ViewDrafting,  ViewType.DraftingView),
+                (View,          ViewType.Legend),
+                (ViewSchedule,  ViewType.Schedule)]
+
+
+# ╔═╗╔═╗╔╗╔╔═╗╦═╗╔═╗╔╦╗╔═╗╦═╗
+# ║ ╦║╣ ║║║║╣ ╠╦╝╠═╣ ║ ║ ║╠╦╝
+# ╚═╝╚═╝╝╚╝╚═╝╩╚═╩ ╩ ╩ ╚═╝╩╚═ GENERATOR
+#====================================================================================================
+def _name(rnd, prefix, n):
+    return '{} {} {:04d}'.format(prefix, rnd.choice(WORDS), n)
+
+
+def generate_model(n_levels=3, n_views=100, n_sheets=50, n_rooms=200, n_types=100, n_instances=500,
+                   n_revisions=5, n_templates=10, n_unused=20, room_size=15.0, workshared=False,
+                   owners=None, seed=0, title='Synthetic Model', path=''):
+    #type:(int, int, int, int, int, int, int, int, int, float, bool, dict, int, str, str) -> Document
+    """Function to generate a Document with a synthetic model.
+
+    :param n_levels:    Amount of Levels (every 12 ft)
+    :param n_views:     Amount of Views (mix of plans, sections, 3D, drafting, legends, schedules)
+    :param n_sheets:    Amount of Sheets. Roughly half of the views are placed on sheets.
+    :param n_rooms:     Amount of Rooms, placed on a grid on every Level (every 10th Room is not placed)
+    :param n_types:     Amount of FamilySymbols (+ a few Wall/Floor/Ceiling types)
+    :param n_instances: Amount of FamilyInstances placed inside/around Rooms
+    :param n_revisions: Amount of Revisions. Each sheet gets some of them.
+    :param n_templates: Amount of View Templates (some are assigned to views)
+    :param n_unused:    Amount of unused elements per purgeable kind (types, materials, line patterns, filters)
+    :param room_size:   Room width/depth in feet
+    :param workshared:  doc.IsWorkshared
+    :param owners:      {user_name: ratio} - part of elements that are checked out by other users, e.g. {'bob': 0.1}
+    :param seed:        Random seed
+    :return:            Document"""
+    rnd = random.Random(seed)
+    doc = Document(title, path=path, workshared=workshared)
+
+    # LEVELS
+    levels = doc.extend(Level('Level {}'.format(i), elevation=i * 12.0) for i in range(max(1, n_levels)))
+
+    # TYPES
+    families = []
+    for i, category in enumerate(FAMILY_CATEGORIES):
+        families.append(doc.add(Family(_name(rnd, 'Family', i), category)))
+
+    symbols = []
+    for i in range(n_types):
+        family = families[i % len(families)]
+        symbol = doc.add(FamilySymbol(_name(rnd, 'Type', i), family._category, family))
+        family._symbol_ids.append(symbol.Id)
+        symbols.append(symbol)
+
+    wall_types    = doc.extend(WallType(_name(rnd, 'Wall', i))       for i in range(5))
+    floor_types   = doc.extend(FloorType(_name(rnd, 'Floor', i))     for i in range(3))
+    ceiling_types = doc.extend(CeilingType(_name(rnd, 'Ceiling', i)) for i in range(3))
+    doc.extend(TextNoteType(_name(rnd, 'Text', i)) for i in range(3))
+    doc._default_types[ElementTypeGroup.FloorType]   = floor_types[0].Id
+    doc._default_types[ElementTypeGroup.CeilingType] = ceiling_types[0].Id
+    doc._default_types[ElementTypeGroup.WallType]    = wall_types[0].Id
+
+    title_block_family = doc.add(Family('Title Block A1', BuiltInCategory.OST_TitleBlocks))
+    title_block_type   = doc.add(FamilySymbol('A1', BuiltInCategory.OST_TitleBlocks, title_block_family))
+
+    # UNUSED (PURGEABLE) ELEMENTS
+    doc.extend(FamilySymbol(_name(rnd, 'Unused Type', i), BuiltInCategory.OST_Furniture, families[0])
+               for i in range(n_unused))
+    doc.extend(Material(_name(rnd, 'Material', i))          for i in range(n_unused))
+    doc.extend(LinePatternElement(_name(rnd, 'Pattern', i)) for i in range(n_unused))
+    doc.extend(ParameterFilterElement(_name(rnd, 'Filter', i)) for i in range(n_unused))
+
+    # ROOMS
+    per_row = 10
+    rooms   = []
+    for i in range(n_rooms):
+        level = levels[i % len(levels)]
+        n     = i // len(levels)
+        x, y  = (n % per_row) * room_size, (n // per_row) * room_size
+        extents = None if i % 10 == 9 else (x, y, x + room_size, y + room_size)
+        rooms.append(doc.add(Room(_name(rnd, 'Room', i).replace('Room ', ''), '{:03d}'.format(i),
+                                  extents=extents, elevation=level.Elevation, level_id=level.Id)))
+    doc.extend(Area(_name(rnd, 'Area', i).replace('Area ', ''), 'A{:03d}'.format(i), level_id=levels[0].Id,
+                    extents=(0.0, i * room_size, room_size, (i + 1) * room_size)) for i in range(n_rooms // 10))
+
+    # INSTANCES
+    placed_rooms = [r for r in rooms if r.Area > 0]
+    for i in range(n_instances):
+        symbol = symbols[i % len(symbols)] if symbols else title_block_type
+        if placed_rooms:
+            room = placed_rooms[i % len(placed_rooms)]
+            min_x, min_y, max_x, max_y = room._extents
+            level_id, z = room.LevelId, room._z[0]
+        else:
+            min_x, min_y, max_x, max_y = 0.0, 0.0, 100.0, 100.0
+            level_id, z = levels[0].Id, 0.0
+        point = XYZ(rnd.uniform(min_x, max_x), rnd.uniform(min_y, max_y), z + 1.0)
+        instance = FamilyInstance(symbol.Name, symbol._category, type_id=symbol.Id, level_id=level_id)
+        instance.Location = LocationPoint(point)
+        instance._bbox    = BoundingBoxXYZ(point - XYZ(0.5, 0.5, 1.0), point + XYZ(0.5, 0.5, 2.0))
+        instance._params['Mark']._value = 'M-{:05d}'.format(i)
+        if i % 2 == 0:
+            instance._params['Comments']._value = _name(rnd, 'Comment', i)
+        instance.add_parameter('Zone', _name(rnd, 'Zone', i % 20), guid=ZONE_GUID)
+        doc.add(instance)
+
+    for i in range(n_levels * 4):
+        wall_type = wall_types[i % len(wall_types)]
+        doc.add(Wall(wall_type.Name, type_id=wall_type.Id, level_id=levels[i % len(levels)].Id))
+
+    # VIEWS
+    templates = doc.extend(ViewPlan(_name(rnd, 'Template', i), is_template=True) for i in range(n_templates))
+    views = []
+    for i in range(n_views):
+        view_class, view_type = VIEW_CLASSES[i % len(VIEW_CLASSES)]
+        level = levels[i % len(levels)]
+        view  = view_class(_name(rnd, str(view_type), i), view_type=view_type, scale=rnd.choice([50, 100, 200]))
+        view.Outline = BoundingBoxUV(0.0, 0.0, rnd.uniform(0.2, 1.2), rnd.uniform(0.2, 0.9))
+        if view_type in (ViewType.FloorPlan, ViewType.CeilingPlan):
+            view.GenLevel = level
+            view.LevelId  = level.Id
+            if templates and i % 3 == 0:
+                view.ViewTemplateId = templates[i % len(templates)].Id
+        views.append(doc.add(view))
+    doc.ActiveView = views[0] if views else None
+
+    # REVISIONS
+    revisions = []
+    for i in range(n_revisions):
+        revision = doc.add(Revision('Revision {}'.format(i + 1)))
+        revision.SequenceNumber = i + 1
+        revision.RevisionDate   = '2026-{:02d}-01'.format(i % 12 + 1)
+        revisions.append(revision)
+
+    # SHEETS
+    sheets = []
+    for i in range(n_sheets):
+        sheet = doc.add(ViewSheet(_name(rnd, 'Sheet', i), 'A{:03d}'.format(i + 1)))
+        title_block = FamilyInstance('A1', BuiltInCategory.OST_TitleBlocks, type_id=title_block_type.Id)
+        title_block.OwnerViewId = sheet.Id
+        title_block._bbox       = BoundingBoxXYZ(XYZ(0, 0, 0), XYZ(2.76, 1.95, 0))
+        doc.add(title_block)
+        if revisions:
+            sheet._revision_ids = [r.Id for r in rnd.sample(revisions, rnd.randint(0, len(revisions)))]
+        sheets.append(sheet)
+
+    if sheets:
+        for i, view in enumerate(views[::2]):
+            sheet = sheets[i % len(sheets)]
+            if view.ViewType == ViewType.Schedule:
+                doc.add(ScheduleSheetInstance(view.Id, sheet.Id))
+            elif view.ViewType != ViewType.Legend:
+                doc.add(Viewport(sheet.Id, view.Id, XYZ(1.0, 1.0, 0)))
+
+    # WORKSHARING
+    if owners:
+        all_ids = list(doc._elements)
+        for user, ratio in sorted(owners.items()):
+            for el_id in rnd.sample(all_ids, int(len(all_ids) * ratio)):
+                doc._owners[el_id] = user
+
+    doc.IsModified = False
+    return doc
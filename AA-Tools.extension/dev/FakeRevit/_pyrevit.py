@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-in for pyrevit (forms, script, revit) and wpf.
+
+Dialogs don't show anything. Answers are taken from a queue:
+    from pyrevit import forms
+    forms.responses.append(['Sheet A', 'Sheet B'])    # next SelectFromList.show() returns this
+If the queue is empty - dialogs return None (as if a user cancelled them)."""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import os
+import sys
+import types
+import logging
+import tempfile
+
+from FakeRevit._system import Window
+
+
+# ╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ╠╣ ║ ║╠╦╝║║║╚═╗
+# ╚  ╚═╝╩╚═╩ ╩╚═╝ FORMS
+#====================================================================================================
+responses = []      # Answers for the next dialogs
+alerts    = []      # Messages of all shown alerts
+
+
+def _respond(default=None):
+    return responses.pop(0) if responses else default
+
+
+def alert(msg, title=None, sub_msg=None, ok=True, cancel=False, yes=False, no=False, exitscript=False, **kwargs):
+    alerts.append(msg)
+    answer = _respond(True if (ok or yes) else None)
+    if exitscript and not answer:
+        sys.exit()
+    return answer
+
+
+class _Dialog(object):
+    @classmethod
+    def show(cls, *args, **kwargs):
+        return _respond()
+
+
+class SelectFromList(_Dialog):          pass
+class CommandSwitchWindow(_Dialog):     pass
+
+
+def ask_for_string(*args, **kwargs):    return _respond(kwargs.get('default'))
+def ask_for_one_item(*args, **kwargs):  return _respond(kwargs.get('default'))
+def select_views(*args, **kwargs):      return _respond()
+def select_sheets(*args, **kwargs):     return _respond()
+def select_titleblocks(*args, **kwargs):return _respond()
+def select_levels(*args, **kwargs):     return _respond()
+def pick_file(*args, **kwargs):         return _respond()
+def pick_folder(*args, **kwargs):       return _respond()
+def save_file(*args, **kwargs):         return _respond()
+def check_modeldoc(*args, **kwargs):    return True
+
+
+class WPFWindow(Window):
+    def __init__(self, xaml_source=None, *args, **kwargs):
+        self.xaml_source = xaml_source
+
+    def show(self, modal=False):        pass
+    def show_dialog(self):              return _respond()
+    def ShowDialog(self):               return _respond()
+    def Show(self):                     pass
+    def Close(self):                    pass
+
+
+class WarningBar(object):
+    def __init__(self, title='', **kwargs):
+        self.title = title
+
+    def __enter__(self):            return self
+    def __exit__(self, *args):      return False
+
+
+class ProgressBar(object):
+    def __init__(self, title='', cancellable=False, step=1, **kwargs):
+        self.title     = title
+        self.cancelled = False
+        self.progress  = (0, 0)
+
+    def __enter__(self):            return self
+    def __exit__(self, *args):      return False
+
+    def update_progress(self, new_value, max_value=1):
+        self.progress = (new_value, max_value)
+
+
+# ╔═╗╔═╗╦═╗╦╔═╗╔╦╗
+# ╚═╗║  ╠╦╝║╠═╝ ║
+# ╚═╝╚═╝╩╚═╩╩   ╩  SCRIPT
+#====================================================================================================
+class _ChartDataset(object):
+    def __init__(self, label):
+        self.label = label
+        self.data  = []
+
+    def set_color(self, *args):     pass
+
+
+class _ChartData(object):
+    def __init__(self):
+        self.labels   = []
+        self.datasets = []
+
+    def new_dataset(self, label):
+        dataset = _ChartDataset(label)
+        self.datasets.append(dataset)
+        return dataset
+
+
+class _Chart(object):
+    """pyrevit.output.charts.PyRevitOutputChart"""
+    def __init__(self):
+        self.data      = _ChartData()
+        self.options   = types.SimpleNamespace()
+        self.drawn     = False
+
+    def draw(self):                 self.drawn = True
+
+
+class Output(object):
+    """Collects everything that would be printed to pyRevit output window."""
+    def __init__(self):
+        self.tables   = []     # [(title, columns, rows), ...]
+        self.markdown = []
+        self.charts   = []
+
+    def print_table(self, table_data, title='', columns=None, formats=None, last_line_style=''):
+        self.tables.append((title, columns, table_data))
+
+    def print_md(self, md_str):             self.markdown.append(md_str)
+    def print_html(self, html_str):         self.markdown.append(html_str)
+    def print_code(self, code_str):         self.markdown.append(code_str)
+    def linkify(self, element_ids, title=None):
+        ids = element_ids if isinstance(element_ids, (list, tuple)) else [element_ids]
+        return title or ', '.join(str(i) for i in ids)
+    def set_title(self, title):             pass
+    def set_width(self, width):             pass
+    def set_height(self, height):           pass
+    def center(self):                       pass
+    def close(self):                        pass
+    def close_others(self, all_open_outputs=False): pass
+    def self_destruct(self, seconds):       pass
+    def freeze(self):                       pass
+    def unfreeze(self):                     pass
+    def update_progress(self, cur, total):  pass
+    def indeterminate_progress(self, state):pass
+    def insert_divider(self, level=''):     pass
+    def log_error(self, msg):               self.markdown.append(msg)
+    def log_warning(self, msg):             self.markdown.append(msg)
+    def make_line_chart(self, version=None):
+        chart = _Chart()
+        self.charts.append(chart)
+        return chart
+
+
+_output = Output()
+
+def get_output():                   return _output
+def get_logger():                   return logging.getLogger('pyrevit')
+def exit():                         sys.exit()
+
+
+def _data_file(file_id, file_ext, add_cmd_name=False):
+    folder = os.path.join(tempfile.gettempdir(), 'pyRevit_fake')
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    return os.path.join(folder, '{}.{}'.format(file_id, file_ext))
+
+get_universal_data_file   = _data_file
+get_document_data_file    = _data_file
+get_instance_data_file    = _data_file
+get_data_file             = _data_file
+
+_envvars = {}       # pyRevit keeps them in AppDomain data (whole Revit session)
+
+def get_envvar(envvar):             return _envvars.get(envvar)
+def set_envvar(envvar, value):      _envvars[envvar] = value
+
+
+# ╦═╗╔═╗╦  ╦╦╔╦╗
+# ╠╦╝║╣ ╚╗╔╝║ ║
+# ╩╚═╚═╝ ╚╝ ╩ ╩  REVIT
+#====================================================================================================
+class _Transaction(object):
+    """pyrevit.revit.Transaction"""
+    def __init__(self, name=None, doc=None, **kwargs):
+        from Autodesk.Revit.DB import Transaction
+        self._t = Transaction(doc or _get_active_doc(), name or 'pyRevit Transaction')
+
+    def __enter__(self):
+        self._t.Start()
+        return self._t
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._t.Commit()
+        else:
+            self._t.RollBack()
+        return False
+
+
+def _get_active_doc():
+    uiapp = _get_uiapp()
+    return uiapp.ActiveUIDocument.Document if uiapp and uiapp.ActiveUIDocument else None
+
+
+def _get_uiapp():
+    try:
+        import builtins
+    except ImportError:
+        import __builtin__ as builtins
+    return getattr(builtins, '__revit__', None)
+
+
+def _revit_getattr(name):
+    uiapp = _get_uiapp()
+    if name == 'doc':   return _get_active_doc()
+    if name == 'uidoc': return uiapp.ActiveUIDocument if uiapp else None
+    raise AttributeError(name)
+
+
+# ╔╦╗╔═╗╔╦╗╦ ╦╦  ╔═╗╔═╗
+# ║║║║ ║ ║║║ ║║  ║╣ ╚═╗
+# ╩ ╩╚═╝═╩╝╚═╝╩═╝╚═╝╚═╝ MODULES
+#====================================================================================================
+def build_modules():
+    """Function to build module objects: pyrevit, pyrevit.forms, pyrevit.script, pyrevit.revit and wpf.
+    :return: dict {module_name: module}"""
+    g = globals()
+
+    forms = types.ModuleType('pyrevit.forms')
+    for name in ['responses', 'alerts', 'alert', 'SelectFromList', 'CommandSwitchWindow', 'WPFWindow', 'ProgressBar', 'WarningBar',
+                 'ask_for_string', 'ask_for_one_item', 'select_views', 'select_sheets', 'select_titleblocks',
+                 'select_levels', 'pick_file', 'pick_folder', 'save_file', 'check_modeldoc']:
+        setattr(forms, name, g[name])
+
+    script = types.ModuleType('pyrevit.script')
+    for name in ['Output', 'get_output', 'get_logger', 'exit', 'get_universal_data_file', 'get_document_data_file',
+                 'get_instance_data_file', 'get_data_file', 'get_envvar', 'set_envvar']:
+        setattr(script, name, g[name])
+
+    revit = types.ModuleType('pyrevit.revit')
+    revit.Transaction = _Transaction
+    revit.get_doc     = _get_active_doc
+    revit.__getattr__ = _revit_getattr     # revit.doc / revit.uidoc are resolved on access
+
+    pyrevit = types.ModuleType('pyrevit')
+    pyrevit.__path__ = []
+    pyrevit.forms, pyrevit.script, pyrevit.revit = forms, script, revit
+    pyrevit.EXEC_PARAMS = types.ModuleType('EXEC_PARAMS')
+    pyrevit.EXEC_PARAMS.command_name = 'FakeRevit'
+    pyrevit.EXEC_PARAMS.command_path = ''
+    pyrevit.EXEC_PARAMS.config_mode  = False
+
+    wpf = types.ModuleType('wpf')
+    wpf.LoadComponent = lambda window, xaml_path: window
+
+    return {'pyrevit': pyrevit, 'pyrevit.forms': forms, 'pyrevit.script': script,
+            'pyrevit.revit': revit, 'wpf': wpf}
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-in for System (.NET) and clr.
+Only generic collections and a few basic types are implemented,
+other names are created on demand by the module finder in FakeRevit.__init__."""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import uuid
+import datetime
+
+from FakeRevit._db import ICollection
+
+
+# ╔═╗╔═╗╔╗╔╔═╗╦═╗╦╔═╗╔═╗
+# ║ ╦║╣ ║║║║╣ ╠╦╝║║  ╚═╗
+# ╚═╝╚═╝╝╚╝╚═╝╩╚═╩╚═╝╚═╝ GENERICS
+#====================================================================================================
+class _GenericMeta(type):
+    """List[ElementId] -> List. Type arguments are ignored."""
+    def __getitem__(cls, type_args):
+        return cls
+
+
+List = _GenericMeta('List', (ICollection,), {})
+
+
+class _HashSet(set):
+    @property
+    def Count(self):                return len(self)
+    def Add(self, item):
+        is_new = item not in self
+        self.add(item)
+        return is_new
+    def Contains(self, item):       return item in self
+    def Remove(self, item):
+        is_removed = item in self
+        self.discard(item)
+        return is_removed
+
+HashSet = _GenericMeta('HashSet', (_HashSet,), {})
+
+
+class _Dictionary(dict):
+    @property
+    def Count(self):                return len(self)
+    @property
+    def Keys(self):                 return list(self.keys())
+    @property
+    def Values(self):               return list(self.values())
+    def Add(self, key, value):
+        if key in self:
+            raise ValueError('An item with the same key has already been added.')
+        self[key] = value
+    def ContainsKey(self, key):     return key in self
+    def Remove(self, key):          return self.pop(key, None) is not None
+
+Dictionary = _GenericMeta('Dictionary', (_Dictionary,), {})
+
+
+# ╔╗ ╔═╗╔═╗╦╔═╗  ╔╦╗╦ ╦╔═╗╔═╗╔═╗
+# ╠╩╗╠═╣╚═╗║║     ║ ╚╦╝╠═╝║╣ ╚═╗
+# ╚═╝╩ ╩╚═╝╩╚═╝   ╩  ╩ ╩  ╚═╝╚═╝ BASIC TYPES
+#====================================================================================================
+Exception = Exception
+
+
+class Uri(object):
+    def __init__(self, path, *args):
+        self.OriginalString = path
+        self.LocalPath      = path
+
+
+class Guid(object):
+    def __init__(self, value=None):
+        self._value = uuid.UUID(str(value)) if value else uuid.UUID(int=0)
+
+    @staticmethod
+    def NewGuid():
+        return Guid(uuid.uuid4())
+
+    def ToString(self):         return str(self._value)
+    def __str__(self):          return str(self._value)
+    def __eq__(self, other):    return isinstance(other, Guid) and self._value == other._value
+    def __hash__(self):         return hash(self._value)
+
+
+class DateTime(object):
+    @staticmethod
+    def Now():
+        return datetime.datetime.now()
+
+
+class Action(object):
+    def __init__(self, func):
+        self.func = func
+
+    def Invoke(self, *args):
+        return self.func(*args)
+
+    __call__ = Invoke
+
+
+# ╦ ╦╦╔╗╔╔╦╗╔═╗╦ ╦╔═╗
+# ║║║║║║║ ║║║ ║║║║╚═╗
+# ╚╩╝╩╝╚╝═╩╝╚═╝╚╩╝╚═╝ WINDOWS
+#====================================================================================================
+class _NoOp(object):
+    """Any attribute/call chain that does nothing: window.UI_list.ItemsSource = ..., window.ShowDialog()"""
+    def __call__(self, *args, **kwargs):    return None
+    def __getattr__(self, name):            return _NoOp()
+    def __iter__(self):                     return iter([])
+    def __iadd__(self, handler):            return self     # window.Closed += handler
+    def __bool__(self):                     return False
+    __nonzero__ = __bool__
+
+
+class Window(object):
+    """WPF Window without UI. Unknown attributes are no-ops, ShowDialog() returns None (cancelled)."""
+    def DragMove(self):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _NoOp()
+
+
+class ResourceDictionary(object):
+    def __init__(self):
+        self.Source = None
+        self.MergedDictionaries = ICollection()
+
+
+class StringReader(object):
+    def __init__(self, text):
+        self.text = text
+
+    def ReadToEnd(self):
+        return self.text
+
+
+class Process(object):
+    @staticmethod
+    def Start(*args):
+        return None
+
+
+# ╔═╗╦  ╦═╗
+# ║  ║  ╠╦╝
+# ╚═╝╩═╝╩╚═ CLR
+#====================================================================================================
+class clr(object):
+    """Module-like namespace for clr."""
+    references = []
+
+    @staticmethod
+    def AddReference(name):
+        clr.references.append(name)
+
+    AddReferenceByName        = AddReference
+    AddReferenceByPartialName = AddReference
+    AddReferenceToFile        = AddReference
+
+    @staticmethod
+    def AddReferenceToFileAndPath(path):
+        clr.references.append(path)
+
+    @staticmethod
+    def GetClrType(cls):
+        return cls
+
+    @staticmethod
+    def Convert(value, cls):
+        return value
+
+    class Reference(object):
+        def __init__(self, value=None):
+            self.Value = value
+
+    Reference = _GenericMeta('Reference', (Reference,), {})
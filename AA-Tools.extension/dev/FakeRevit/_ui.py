@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-in for Autodesk.Revit.UI and Autodesk.Revit.UI.Selection."""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+from FakeRevit._db import ICollection, Reference, _enum, placeholder
+from FakeRevit._exceptions import OperationCanceledException
+
+
+# ╔═╗╔═╗╦  ╔═╗╔═╗╔╦╗╦╔═╗╔╗╔
+# ╚═╗║╣ ║  ║╣ ║   ║ ║║ ║║║║
+# ╚═╝╚═╝╩═╝╚═╝╚═╝ ╩ ╩╚═╝╝╚╝ SELECTION
+#====================================================================================================
+ObjectType = _enum('ObjectType')
+
+
+class ISelectionFilter(object):
+    def AllowElement(self, element):            return True
+    def AllowReference(self, reference, point): return True
+
+
+class Selection(object):
+    """Current selection is stored as a list of ElementIds.
+    Pick methods return self.picks (set it before calling) or raise OperationCanceledException."""
+
+    def __init__(self, uidoc):
+        self.uidoc = uidoc
+        self._ids  = []
+        self.picks = None
+
+    def GetElementIds(self):
+        return ICollection(self._ids)
+
+    def SetElementIds(self, element_ids):
+        self._ids = list(element_ids)
+
+    def _pick(self, selection_filter=None):
+        if self.picks is None:
+            raise OperationCanceledException('Selection was cancelled.')
+        doc = self.uidoc.Document
+        return [el_id for el_id in self.picks
+                if selection_filter is None or selection_filter.AllowElement(doc.GetElement(el_id))]
+
+    def PickObjects(self, object_type, *args):
+        selection_filter = next((a for a in args if isinstance(a, ISelectionFilter)), None)
+        return [Reference(el_id) for el_id in self._pick(selection_filter)]
+
+    def PickObject(self, object_type, *args):
+        refs = self.PickObjects(object_type, *args)
+        if not refs:
+            raise OperationCanceledException('Selection was cancelled.')
+        return refs[0]
+
+    def PickElementsByRectangle(self, *args):
+        selection_filter = next((a for a in args if isinstance(a, ISelectionFilter)), None)
+        doc = self.uidoc.Document
+        return [doc.GetElement(el_id) for el_id in self._pick(selection_filter)]
+
+
+# ╦ ╦╦
+# ║ ║║
+# ╚═╝╩ UI
+#====================================================================================================
+class UIDocument(object):
+    def __init__(self, doc):
+        self.Document  = doc
+        self.Selection = Selection(self)
+
+    @property
+    def ActiveView(self):
+        return self.Document.ActiveView
+
+    @ActiveView.setter
+    def ActiveView(self, view):
+        self.Document.ActiveView = view
+
+    @property
+    def ActiveGraphicalView(self):
+        return self.Document.ActiveView
+
+    def RefreshActiveView(self):            pass
+    def ShowElements(self, element_ids):    pass
+    def GetOpenUIViews(self):               return []
+
+
+class UIApplication(object):
+    """__revit__ object. ActiveUIDocument follows the first open Document unless it is set."""
+    def __init__(self, application, active_doc=None):
+        self.Application      = application
+        self._active_uidoc    = UIDocument(active_doc) if active_doc is not None else None
+
+    @property
+    def ActiveUIDocument(self):
+        return self._active_uidoc
+
+    def set_active_document(self, doc):
+        """Function to switch the active Document (not a Revit API method)."""
+        self._active_uidoc = UIDocument(doc) if doc is not None else None
+        return self._active_uidoc
+
+    def OpenAndActivateDocument(self, path):
+        return self.set_active_document(self.Application.OpenDocumentFile(path))
+
+
+# ╔═╗═╗ ╦╔╦╗╔═╗╦═╗╔╗╔╔═╗╦    ╔═╗╦  ╦╔═╗╔╗╔╔╦╗╔═╗
+# ║╣ ╔╩╦╝ ║ ║╣ ╠╦╝║║║╠═╣║    ║╣ ╚╗╔╝║╣ ║║║ ║ ╚═╗
+# ╚═╝╩ ╚═ ╩ ╚═╝╩╚═╝╚╝╩ ╩╩═╝  ╚═╝ ╚╝ ╚═╝╝╚╝ ╩ ╚═╝ EXTERNAL EVENTS
+#====================================================================================================
+ExternalEventRequest = _enum('ExternalEventRequest')
+
+
+class IExternalEventHandler(object):
+    def Execute(self, uiapp):   pass
+    def GetName(self):          return type(self).__name__
+
+
+class ExternalEvent(object):
+    """Raise() only queues a request. Call ExternalEvent.run_pending(uiapp) to simulate Revit idling."""
+    _pending = []
+
+    def __init__(self, handler):
+        self.handler   = handler
+        self.IsPending = False
+
+    @staticmethod
+    def Create(handler):
+        return ExternalEvent(handler)
+
+    def Raise(self):
+        if self.IsPending:
+            return ExternalEventRequest.Pending
+        self.IsPending = True
+        ExternalEvent._pending.append(self)
+        return ExternalEventRequest.Accepted
+
+    @staticmethod
+    def run_pending(uiapp):
+        """Function to execute all raised events (not a Revit API method)."""
+        pending, ExternalEvent._pending = ExternalEvent._pending, []
+        for event in pending:
+            event.IsPending = False
+            event.handler.Execute(uiapp)
+        return len(pending)
+
+    def Dispose(self):
+        self.IsPending = False
+
+
+class TaskDialog(object):
+    messages = []
+
+    @staticmethod
+    def Show(title, message, *args):
+        TaskDialog.messages.append((title, message))
+        return None
+
+
+def __getattr__(name):
+    if name.startswith('_'):
+        raise AttributeError(name)
+    return placeholder(name, object)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Benchmark lib/ on plain CPython with FakeRevit and a synthetic model.
+
+Usage:
+    python AA-Tools.extension/dev/benchmark.py [scale]
+
+scale multiplies the size of the synthetic model (default 1 = 500 views, 200 sheets, 1000 rooms, 5000 instances)."""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import FakeRevit
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def timed(results, doc, name, func, *args):
+    """Function to run func once and store (name, seconds, collector passes, GetElement calls)."""
+    stats = dict(doc.stats)
+    start = time.time()
+    value = func(*args)
+    results.append((name, time.time() - start,
+                    doc.stats['collector_passes'] - stats['collector_passes'],
+                    doc.stats['get_element']      - stats['get_element']))
+    return value
+
+
+def run(scale=1):
+    doc = FakeRevit.generate_model(n_views=500 * scale, n_sheets=200 * scale, n_rooms=1000 * scale,
+                                   n_types=300 * scale, n_instances=5000 * scale)
+    FakeRevit.install(doc)
+
+    from Autodesk.Revit.DB import FilteredElementCollector, FamilyInstance, ViewSheet
+    from Snippets._sheets    import ViewSheetMap
+    from Snippets._revisions import RevisionMatrix
+    from Snippets._rooms     import RoomIndex
+
+    results   = []
+    instances = FilteredElementCollector(doc).OfClass(FamilyInstance).WhereElementIsNotElementType().ToElements()
+    sheets    = FilteredElementCollector(doc).OfClass(ViewSheet).ToElements()
+
+    ViewSheetMap._cache.clear()
+    timed(results, doc, 'ViewSheetMap.build',         lambda: ViewSheetMap.get(doc))
+    timed(results, doc, 'RevisionMatrix.export',      lambda: RevisionMatrix(doc).export_to_csv(
+                                                         os.path.join(tempfile.gettempdir(), 'rev_matrix.csv')))
+    timed(results, doc, 'RoomIndex.assign',           lambda: RoomIndex(doc).assign(instances))
+    timed(results, doc, 'GetAllPlacedViews (sheets)', lambda: [s.GetAllPlacedViews() for s in sheets])
+
+    print('{} elements'.format(len(doc._elements)))
+    print('{:<30} {:>10} {:>12} {:>12}'.format('Benchmark', 'Seconds', 'Collectors', 'GetElement'))
+    for name, seconds, passes, get_element in results:
+        print('{:<30} {:>10.4f} {:>12} {:>12}'.format(name, seconds, passes, get_element))
+
+    FakeRevit.uninstall()
+    return results
+
+
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+#====================================================================================================
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1)
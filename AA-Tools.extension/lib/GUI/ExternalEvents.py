@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import time
+import threading
+import traceback
+from collections import deque
+
+from Autodesk.Revit.DB import SubTransaction, TransactionStatus
+from Autodesk.Revit.UI import IExternalEventHandler, ExternalEvent
+
+# CUSTOM IMPORTS
+from Snippets._context_manager import ef_Transaction
+from Snippets._context         import ctx
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def execute_request(doc, request, sub_transaction=False):
+    """Function to execute a Request. Errors are stored in request.error instead of being raised.
+    :param sub_transaction: if True - request is executed in a SubTransaction (has to be inside a Transaction),
+                            so only this request is rolled back if it fails."""
+    st = SubTransaction(doc) if sub_transaction else None
+    try:
+        if st: st.Start()
+        request.result = request.func(doc, *request.args)
+        if st: st.Commit()
+    except Exception:
+        request.error = traceback.format_exc()
+        if st and st.HasStarted() and not st.HasEnded():
+            st.RollBack()
+    return request
+
+
+def execute_in_transaction(doc, title, requests):
+    """Function to execute Requests in a single Transaction (each one in a SubTransaction).
+    If the Transaction is rolled back (e.g. by a failure on Commit) - every Request gets an error,
+    because none of their changes were kept."""
+    with ef_Transaction(doc, title, debug=False) as t:
+        for request in requests:
+            execute_request(doc, request, sub_transaction=True)
+
+    if t.GetStatus() != TransactionStatus.Committed:
+        for request in requests:
+            request.error = request.error or 'Transaction [{}] was rolled back.'.format(title)
+    return requests
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class Request(object):
+    """Single operation that was queued from a modeless window."""
+    def __init__(self, name, func, args, transaction=True, callback=None):
+        self.name        = name
+        self.func        = func
+        self.args        = args
+        self.transaction = transaction
+        self.callback    = callback
+        self.result      = None
+        self.error       = None     # Traceback text if the operation failed
+
+
+class ExternalEventQueue(IExternalEventHandler):
+    """IExternalEventHandler with a queue of requests for modeless windows.
+
+    Modeless windows can't modify the model from their own event handlers (no valid API context),
+    so operations are queued and executed when Revit raises the ExternalEvent (one tick).
+
+    - All requests queued until the next tick are executed together.
+    - Consecutive requests with transaction=True share a single Transaction (single Undo per tick),
+      each of them runs in a SubTransaction, so a failed request is rolled back without the others.
+    - Requests with transaction=False manage their own Transactions (e.g. CreateFromRoomsBatch).
+    - Callbacks are called after the tick with the Request (result/error).
+
+    Example:
+        queue = ExternalEventQueue('Find and Replace')
+        queue.submit('Rename', rename_views, views, rule, callback=lambda request: print(request.result))
+        ...
+        queue.dispose()     # when the window is closed"""
+
+    def __init__(self, name='AA-Tools'):
+        self.name     = name
+        self.requests = deque()
+        self.lock     = threading.Lock()
+        self.ticks    = []      # [(amount of requests, seconds), ...]
+        self.event    = ExternalEvent.Create(self)
+
+    def submit(self, name, func, *args, **kwargs):
+        """Function to queue an operation func(doc, *args) and raise the ExternalEvent.
+        :param name:        Name of the operation (Transaction name if it's the only request in a tick)
+        :param func:        function(doc, *args). doc is the active Document when the request is executed.
+        :param transaction: (kwarg) if True - func is executed inside a Transaction. Default: True
+        :param callback:    (kwarg) function(request) that is called after the tick.
+        :return:            Request"""
+        request = Request(name, func, args, kwargs.get('transaction', True), kwargs.get('callback'))
+        with self.lock:
+            self.requests.append(request)
+        self.event.Raise()      # Pending event is not raised again - request is executed in the same tick
+        return request
+
+    @property
+    def pending(self):
+        return len(self.requests)
+
+    # ╔═╗═╗ ╦╔═╗╔═╗╦ ╦╔╦╗╔═╗
+    # ║╣ ╔╩╦╝║╣ ║  ║ ║ ║ ║╣
+    # ╚═╝╩ ╚═╚═╝╚═╝╚═╝ ╩ ╚═╝ EXECUTE (Revit API context)
+    #==================================================
+    def Execute(self, uiapp):
+        with self.lock:
+            requests = list(self.requests)
+            self.requests.clear()
+        if not requests or uiapp.ActiveUIDocument is None:
+            return
+
+        start = time.time()
+        doc   = uiapp.ActiveUIDocument.Document
+
+        # Split into runs of consecutive requests of the same kind, so the order is kept.
+        runs = []
+        for request in requests:
+            if runs and runs[-1][0].transaction == request.transaction:
+                runs[-1].append(request)
+            else:
+                runs.append([request])
+
+        for run in runs:
+            if not run[0].transaction:
+                for request in run:
+                    execute_request(doc, request)
+                continue
+
+            title = run[0].name if len(run) == 1 else '{} ({} operations)'.format(self.name, len(run))
+            execute_in_transaction(doc, title, run)
+
+        self.ticks.append((len(requests), time.time() - start))
+
+        for request in requests:
+            if request.callback:
+                try:
+                    request.callback(request)
+                except Exception:
+                    print(traceback.format_exc())
+
+    def GetName(self):
+        return self.name
+
+    def dispose(self):
+        """Function to drop queued requests and release the ExternalEvent."""
+        with self.lock:
+            self.requests.clear()
+        self.event.Dispose()
+
+
+class ModelessMixin(object):
+    """Mixin for WPF windows that can be shown without blocking Revit.
+    Buttons that use it have to set __persistentengine__ = True, so the window can call back into the engine.
+
+    Example:
+        class MyWindow(ModelessMixin, my_WPF):
+            def button_run(self, sender, e):
+                self.run_in_revit('Do Something', do_something, self.get_values())
+
+        MyWindow().show_modeless('My Tool')"""
+    queue = None
+
+    @property
+    def is_modeless(self):
+        return self.queue is not None
+
+    def show_modeless(self, name):
+        """Function to show the window without blocking Revit. Model changes are queued with run_in_revit."""
+        self.queue   = ExternalEventQueue(name)
+        self.Closed += self._on_closed
+        self.Show()
+
+    def run_in_revit(self, name, func, *args, **kwargs):
+        """Function to queue func(doc, *args) for the next ExternalEvent (see ExternalEventQueue.submit).
+        In a modal window func is executed right away (same behaviour, no queue)."""
+        if self.is_modeless:
+            return self.queue.submit(name, func, *args, **kwargs)
+
+        doc     = ctx.doc
+        request = Request(name, func, args, kwargs.get('transaction', True), kwargs.get('callback'))
+        if request.transaction:
+            execute_in_transaction(doc, name, [request])
+        else:
+            execute_request(doc, request)
+        if request.callback:
+            request.callback(request)
+        return request
+
+    def _on_closed(self, sender, e):
+        self.queue.dispose()
@@ -16,7 +16,8 @@ from Autodesk.Revit.DB import ( Transaction,
 from Autodesk.Revit.Exceptions import ArgumentException
 
 #CUSTOM
-from GUI.forms import my_WPF
+from GUI.forms          import my_WPF
+from GUI.ExternalEvents import ModelessMixin
 
 # .NET IMPORTS
 from clr import AddReference
@@ -24,7 +25,6 @@ AddReference("System")
 from System.Diagnostics.Process import Start
 from System.Windows.Window import DragMove
 from System.Windows.Input import MouseButtonState
-import wpf
 
 
 
@@ -38,21 +38,27 @@ PATH_SCRIPT = os.path.dirname(__file__)
 # ║║║╠═╣║║║║
 # ╩ ╩╩ ╩╩╝╚╝MAIN
 #====================================================================================================
-class FindReplace(my_WPF):
+class FindReplace(ModelessMixin, my_WPF):
     """GUI for [Views: Find and Replace]"""
     run = False
 
-    def __init__(self, title, label = "Find and Replace", button_name = "Rename"):
-        self.add_wpf_resource()
-
+    def __init__(self, title, label = "Find and Replace", button_name = "Rename", on_run = None):
+        """
+        :param on_run: function(doc, rule) - if given, the window is modeless and stays open.
+                       Every click on the main button queues on_run with a snapshot of the rule
+                       (function(name) -> new name) for the next ExternalEvent (single Transaction)."""
+        self.on_run = on_run
         path_xaml_file = os.path.join(PATH_SCRIPT, 'FindReplace.xaml')
-        wpf.LoadComponent(self, path_xaml_file)
+        self.load_xaml(path_xaml_file)
         # self.form = forms.WPFWindow.__init__(self, path_xaml_file)
 
         self.UI_label.Content       = label
         self.UI_main_button.Content = button_name
         self.main_title.Text        = title
-        self.ShowDialog()
+        if on_run:
+            self.show_modeless(title)
+        else:
+            self.ShowDialog()
 
 
     def find_replace(self, name):
@@ -63,6 +69,12 @@ class FindReplace(my_WPF):
         """
         return self.prefix + str(name).replace(self.find, self.replace) + self.suffix
 
+    def get_rule(self):
+        """Function to get current FindReplace logic as a function(name) -> new name.
+        Values are copied, so the rule doesn't change if the user keeps typing before it's executed."""
+        find, replace, prefix, suffix = self.find, self.replace, self.prefix, self.suffix
+        return lambda name: prefix + str(name).replace(find, replace) + suffix
+
 
     @property
     def find(self):
@@ -86,7 +98,8 @@ class FindReplace(my_WPF):
     def button_close(self,sender,e):
         """Stop application by clicking on a <Close> button in the top right corner."""
         self.Close()
-        sys.exit()
+        if not self.is_modeless:
+            sys.exit()
 
     def Hyperlink_RequestNavigate(self, sender, e):
         """Forwarding for a Hyperlink"""
@@ -100,4 +113,7 @@ class FindReplace(my_WPF):
     def button_run(self, sender, e):
         """Button action: Rename view with given """
         # view_rename(selected_views,self.find,self.replace, self.prefix, self.suffix)
-        self.Close()
+        if self.is_modeless:
+            self.run_in_revit(self.main_title.Text, self.on_run, self.get_rule())
+        else:
+            self.Close()
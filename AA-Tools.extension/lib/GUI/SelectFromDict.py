@@ -10,7 +10,8 @@ import os
 from pyrevit import forms # Needed for wpf import to work.
 
 # Custom Imports
-from GUI.forms import my_WPF
+from GUI.forms          import my_WPF
+from GUI.ExternalEvents import ModelessMixin
 
 #>>>>>>>>>> .NET IMPORTS
 import clr
@@ -18,7 +19,6 @@ clr.AddReference("System.Windows.Forms")
 clr.AddReference("System")
 from System.Collections.Generic import List
 from System.Windows             import Visibility
-import wpf
 
 # ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
 # ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
@@ -26,14 +26,6 @@ import wpf
 #====================================================================================================
 PATH_SCRIPT = os.path.dirname(__file__)
 
-uidoc   = __revit__.ActiveUIDocument
-app     = __revit__.Application
-doc     = __revit__.ActiveUIDocument.Document
-
-active_view_id      = doc.ActiveView.Id
-active_view         = doc.GetElement(active_view_id)
-active_view_level   = active_view.GenLevel
-
 class ListItem:
     """Helper Class for displaying selected sheets in my custom GUI."""
     def __init__(self,  Name='Unnamed', element = None, checked = False):
@@ -45,22 +37,25 @@ class ListItem:
 # ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
 # ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
 #====================================================================================================
-class SelectFromDict(my_WPF):
+class SelectFromDict(ModelessMixin, my_WPF):
     def __init__(self, items,
                  title = '__title',
                  label = "Select Elements:" ,
                  button_name = 'Select',
                  version = 'version= 1.0',
-                 SelectMultiple = True):
+                 SelectMultiple = True,
+                 on_select = None,
+                 transaction = False):
         self.SelectMultiple = SelectMultiple
+        self.on_select      = on_select
+        self.transaction    = transaction
         self.given_dict_items = {k:v for k,v in items.items() if k}
 
         self.items          = self.generate_list_items()
         self.selected_items = []
-        #>>>>>>>>>> SET RESOURCES FOR WPF
-        self.add_wpf_resource()
+        #>>>>>>>>>> SET RESOURCES AND LOAD WPF (cached)
         path_xaml_file = os.path.join(PATH_SCRIPT, 'SelectFromDict.xaml')
-        wpf.LoadComponent(self, path_xaml_file )
+        self.load_xaml(path_xaml_file)
 
         # UPDATE GUI ELEMENTS
         self.main_title.Text        = title
@@ -72,7 +67,10 @@ class SelectFromDict(my_WPF):
 
 
         self.main_ListBox.ItemsSource = self.items
-        self.ShowDialog()
+        if on_select:
+            self.show_modeless(title)
+        else:
+            self.ShowDialog()
 
     def __iter__(self):
         """Return selected items."""
@@ -157,6 +155,13 @@ class SelectFromDict(my_WPF):
 
     def button_select(self, sender, e):
         """Button to finilize selection"""
+        # MODELESS - Window stays open (and keeps its items), selection is sent to Revit
+        if self.is_modeless:
+            self.selected_items = [item.element for item in self.items if item.IsChecked]
+            self.run_in_revit(self.main_title.Text, self.on_select, list(self.selected_items),
+                              transaction=self.transaction)
+            return
+
         # Reset Filter
         self.textbox_filter.Text = ''
         self.Close()
@@ -181,8 +186,10 @@ def select_from_dict(elements_dict,
                      label          = "Select Elements:" ,
                      button_name    = 'Select',
                      version        = 'Version: 1.0',
-                     SelectMultiple = True):
-    #type:(any, str,str,str,str,bool) -> list
+                     SelectMultiple = True,
+                     on_select      = None,
+                     transaction    = False):
+    #type:(any, str,str,str,str,bool,any,bool) -> list
     """Function to present a DialogBox to a user to select elements from the list based on the dict keys.
     :param elements_dict:   Dictonary or list of elements {name : element}.
                                 if list is provided it will be converted to dict {i:i}.
@@ -191,7 +198,11 @@ def select_from_dict(elements_dict,
     :param button_name:     Text in Button
     :param version:         Version of the script for footer.
     :param SelectMultiple:  By default it allows multiple selection. Set False if you need only single item selection.
-    :return:                Selected elements. (dict values)"""
+    :param on_select:       function(doc, selected elements). If given - the window is modeless and stays open,
+                            every click on the main button queues on_select for the next ExternalEvent.
+                            Button script has to set __persistentengine__ = True.
+    :param transaction:     if True - on_select is executed inside a Transaction (modeless only).
+    :return:                Selected elements. (dict values). Empty list in modeless mode."""
 
     # CONVERT LIST TO DICT
     if isinstance(elements_dict,list):
@@ -202,5 +213,7 @@ def select_from_dict(elements_dict,
                                 label          = label,
                                 button_name    = button_name,
                                 version        = version,
-                                SelectMultiple = SelectMultiple)
-    return list(GUI_select)
+                                SelectMultiple = SelectMultiple,
+                                on_select      = on_select,
+                                transaction    = transaction)
+    return [] if on_select else list(GUI_select)
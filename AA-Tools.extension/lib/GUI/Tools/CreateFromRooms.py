@@ -9,13 +9,13 @@ import os, clr, traceback, sys
 from pyrevit import forms # Needed for wpf import to work.
 
 # Custom Imports
-from GUI.forms         import my_WPF
-from Snippets._convert import convert_internal_units
+from GUI.forms          import my_WPF
+from GUI.ExternalEvents import ModelessMixin
+from Snippets._convert  import convert_internal_units
 
 #>>>>>>>>>> .NET IMPORTS
 clr.AddReference("System")
 from System.Collections.Generic import List
-import wpf
 
 # ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
 # ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
@@ -23,14 +23,6 @@ import wpf
 #====================================================================================================
 PATH_SCRIPT = os.path.dirname(__file__)
 
-uidoc   = __revit__.ActiveUIDocument
-app     = __revit__.Application
-doc     = __revit__.ActiveUIDocument.Document
-
-active_view_id      = doc.ActiveView.Id
-active_view         = doc.GetElement(active_view_id)
-active_view_level   = active_view.GenLevel
-
 class ListItem:
     """Helper Class for displaying selected sheets in my custom GUI."""
     def __init__(self,  Name='Unnamed', element = None, checked = False):
@@ -42,33 +34,40 @@ class ListItem:
 # ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
 # ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
 #====================================================================================================
-class CreateFromRooms(my_WPF):
+class CreateFromRooms(ModelessMixin, my_WPF):
     selected_type = []
     offset         = 0
 
     def __init__(self, items, title       = '__title',
                               label       = "Select Type:" ,
                               button_name = 'Create',
-                              version     = 'version= 1.0'):
+                              version     = 'version= 1.0',
+                              on_create   = None):
         """Function to show GUI to a user to Select Type and offset for creating elements from Rooms
             :param items:           Dictionary of items {e.Name:e}
             :param title:           Title of the window.
             :param label:           Label that is displayed above ListBox
             :param button_name:     Text in Button
-            :param version:         Version of the script for footer."""
+            :param version:         Version of the script for footer.
+            :param on_create:       function(doc, selected_type, offset). If given - the window is modeless
+                                    and stays open, every click on the main button queues on_create
+                                    for the next ExternalEvent (it manages its own Transactions)."""
         self.items       = items        #type: dict
         self.title       = title        #type: str
         self.label       = label        #type: str
         self.button_name = button_name  #type: str
         self.version     = version      #type: str
+        self.on_create   = on_create
 
-        #>>>>>>>>>> SET RESOURCES AND LOAD WPF
-        super(CreateFromRooms, self).add_wpf_resource()
+        #>>>>>>>>>> SET RESOURCES AND LOAD WPF (cached)
         path_xaml_file = os.path.join(PATH_SCRIPT, 'CreateFromRooms.xaml')
-        wpf.LoadComponent(self, path_xaml_file )
+        self.load_xaml(path_xaml_file)
 
         self.update_UI()
-        self.ShowDialog()
+        if on_create:
+            self.show_modeless(title)
+        else:
+            self.ShowDialog()
 
     def update_UI(self):
         """Function to make updates to UI based on provided arguments."""
@@ -142,24 +141,30 @@ class CreateFromRooms(my_WPF):
     def button_close(self, sender, e):
         """Stop application by clicking on a <Close> button in the top right corner."""
         self.Close()
-        sys.exit()
+        if not self.is_modeless:
+            sys.exit()
 
     def button_run(self, sender, e):
         """Button to finilize selection"""
+        if self.is_modeless:
+            # Window stays open with the same Types, current values are sent to Revit
+            self.read_values()
+            if self.selected_type:
+                self.run_in_revit(self.title, self.on_create, self.selected_type, self.offset, transaction=False)
+            return
+
         self.textbox_filter.Text = ''
         self.Close()
+        self.read_values()
 
+    def read_values(self):
+        """Function to read selected Type and Offset from the GUI."""
+        selected_items     = [item.element for item in self.items if item.IsChecked]
+        self.selected_type = selected_items[0] if selected_items else []
         try:
-            selected_items = [item.element for item in self.main_ListBox.ItemsSource if item.IsChecked]
             self.offset    = convert_internal_units(float(self.UI_offset.Text),
                                                         get_internal=True,
                                                         units = 'cm')
-
-            # if not selected_items:
-            #     forms.alert('Type was not selected. Please Try Again', title='Create from Rooms',exitscript=True)
-
-            self.selected_type = selected_items[0]
-
         except:
             # print(traceback.format_exc())
 
@@ -7,8 +7,8 @@ __author__ = "Erik Frits"
 # ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
 # ==================================================
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> .NET IMPORTS
-import os, sys
-from pyrevit import revit, forms
+import os, sys, io, contextlib
+from pyrevit import revit, forms, script
 
 import os, clr
 clr.AddReference("System")
@@ -18,8 +18,96 @@ from System.Windows.Window import DragMove
 from System.Windows.Input import MouseButtonState
 import wpf
 from System.Windows import Application, Window, ResourceDictionary
+from System.IO import StringReader
 from System import Uri
 
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> CUSTOM IMPORTS
+from Snippets._profiling import ProfileSession
+from Snippets._context_manager import profiled
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+PATH_STYLES = os.path.join(os.path.dirname(__file__), 'Resources', 'WPF_styles.xaml')
+CACHE_KEY   = 'AA_TOOLS_WPF_CACHE'      # pyRevit env var (AppDomain data) - shared by all commands in Revit session
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def get_cache():
+    #type:() -> dict
+    """Function to get the process-wide cache {path: (modified time, value)}.
+    It's stored in pyRevit env vars, so it's kept between command runs until Revit is closed."""
+    cache = script.get_envvar(CACHE_KEY)
+    if cache is None:
+        cache = {}
+        script.set_envvar(CACHE_KEY, cache)
+    return cache
+
+
+def is_cached(path):
+    #type:(str) -> bool
+    """Function to check if a file is cached and wasn't modified since then."""
+    entry = get_cache().get(path)
+    return entry is not None and entry[0] == os.path.getmtime(path)
+
+
+def get_cached(path, loader):
+    """Function to get a value loaded from a file. File is loaded again only if it was modified.
+    :param path:   Path to a file
+    :param loader: function(path) -> value
+    :return:       Cached value"""
+    cache = get_cache()
+    mtime = os.path.getmtime(path)
+    entry = cache.get(path)
+    if entry is None or entry[0] != mtime:
+        entry = (mtime, loader(path))
+        cache[path] = entry
+    return entry[1]
+
+
+def _load_styles(path):
+    r        = ResourceDictionary()
+    r.Source = Uri(path)        # Parsed right away
+    return r
+
+
+def _read_text(path):
+    with io.open(path, 'r', encoding='utf-8-sig') as f:
+        return f.read()
+
+
+def get_styles(path=PATH_STYLES):
+    #type:(str) -> ResourceDictionary
+    """Function to get parsed WPF styles. Parsed once and shared by all windows (MergedDictionaries)."""
+    return get_cached(path, _load_styles)
+
+
+def get_xaml(path):
+    #type:(str) -> str
+    """Function to get XAML text of a window. Each window needs its own objects, so XAML is still
+    parsed by wpf.LoadComponent, but the file is read only once."""
+    return get_cached(path, _read_text)
+
+
+def load_component(window, path):
+    """Function to load XAML into a window from the cache (see get_xaml)."""
+    wpf.LoadComponent(window, StringReader(get_xaml(path)))
+
+
+@contextlib.contextmanager
+def dialog_timer(name, *paths):
+    """ContextManager to measure how long a window takes to load.
+    Logged as command 'Dialog: <name>' with section 'cold' (files were parsed) or 'cached',
+    so Profile Report shows both latencies.
+    :param name:  Name of the window
+    :param paths: Cached files that the window uses (XAML, styles)"""
+    state = 'cached' if all(is_cached(path) for path in paths) else 'cold'
+    with ProfileSession('Dialog: {}'.format(name)), profiled(state):
+        yield
+
 # ╦ ╦╔═╗╔═╗  ╔╦╗╔═╗╔╦╗╔═╗╦  ╔═╗╔╦╗╔═╗
 # ║║║╠═╝╠╣    ║ ║╣ ║║║╠═╝║  ╠═╣ ║ ║╣
 # ╚╩╝╩  ╚     ╩ ╚═╝╩ ╩╩  ╩═╝╩ ╩ ╩ ╚═╝ WPF TEMPLATE
@@ -31,13 +119,17 @@ class my_WPF(Window):
     # ╩ ╩╚═╝ ╩ ╩ ╩╚═╝═╩╝╚═╝ METHODS
     #==================================================
     def add_wpf_resource(self):
-        """Function to add WPF resources."""
-        dir_path        = os.path.dirname(__file__)
-        path_styles     = os.path.join(dir_path, 'Resources/WPF_styles.xaml')
+        """Function to add WPF resources. Styles are parsed once per session (see get_styles)."""
         r               = ResourceDictionary()
-        r.Source        = Uri(path_styles)
+        r.MergedDictionaries.Add(get_styles())
         self.Resources  = r
 
+    def load_xaml(self, path):
+        """Function to add WPF resources and load XAML of the window (both cached, see dialog_timer)."""
+        with dialog_timer(type(self).__name__, PATH_STYLES, path):
+            self.add_wpf_resource()
+            load_component(self, path)
+
     # ╔═╗╦ ╦╦  ╔═╗╦  ╦╔═╗╔╗╔╔╦╗╔═╗
     # ║ ╦║ ║║  ║╣ ╚╗╔╝║╣ ║║║ ║ ╚═╗
     # ╚═╝╚═╝╩  ╚═╝ ╚╝ ╚═╝╝╚╝ ╩ ╚═╝ GUI EVENTS
@@ -16,23 +16,35 @@ from System.Windows.Input import MouseButtonState
 
 import os
 
+# CUSTOM IMPORTS
+from GUI.ExternalEvents import ModelessMixin
+from GUI.WPF_Base       import dialog_timer, get_xaml
+
 # ╔╗ ╔═╗╔═╗╔═╗  ╔═╗╦  ╔═╗╔═╗╔═╗
 # ╠╩╗╠═╣╚═╗║╣   ║  ║  ╠═╣╚═╗╚═╗
 # ╚═╝╩ ╩╚═╝╚═╝  ╚═╝╩═╝╩ ╩╚═╝╚═╝ BASE CLASS
 #====================================================================================================
 
-class BaseRenaming(forms.WPFWindow):
+class BaseRenaming(ModelessMixin, forms.WPFWindow):
     """GUI for [Views: Find and Replace]"""
-    def start(self, title, version="Version: _"):
+    def start(self, title, version="Version: _", modeless=False):
+        """
+        :param modeless: if True - the window stays open after renaming. Every run is queued for the next
+                         ExternalEvent and uses elements that are selected in Revit at that moment.
+                         rename_elements has to start its own Transaction (same as in a modal window).
+                         Button script has to set __persistentengine__ = True."""
         xaml_dir_abs_path = os.path.abspath(os.path.dirname(__file__))
         xaml_file_name = os.path.join(xaml_dir_abs_path,"GUI_BaseRename.xaml")
 
-        self.form = forms.WPFWindow.__init__(self, xaml_file_name)
+        with dialog_timer(type(self).__name__, xaml_file_name):
+            self.form = forms.WPFWindow.__init__(self, get_xaml(xaml_file_name), literal_string=True)
         self.main_title.Text     = title
         self.footer_version.Text = version
         self.selected_elements   = self.get_selected_elements()
 
-        if self.selected_elements:
+        if self.selected_elements and modeless:
+            self.show_modeless(title)
+        elif self.selected_elements:
             self.ShowDialog()
         else:
             forms.alert("No matching elements for renaming were selected. \nPlease Try again.", exitscript=True, title="Script Cancelled.")
@@ -105,4 +117,13 @@ class BaseRenaming(forms.WPFWindow):
 
     def button_run(self, sender, e):
         """Button action: Rename view with given """
-        self.rename_elements()
+        if self.is_modeless:
+            self.run_in_revit(self.main_title.Text, self._rename_current_selection, transaction=False)
+        else:
+            self.rename_elements()
+
+    def _rename_current_selection(self, doc):
+        """Modeless run: selection could be changed since the window was opened."""
+        self.selected_elements = self.get_selected_elements()
+        if self.selected_elements:
+            self.rename_elements()
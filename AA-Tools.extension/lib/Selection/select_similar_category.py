@@ -9,59 +9,34 @@ __author__ = "Erik Frits"
 import clr, sys
 clr.AddReference("System")
 from System.Collections.Generic import List
-from Autodesk.Revit.DB import ( FilteredElementCollector,
-                                FilterNumericEquals,
-                                FilterElementIdRule,
-                                ElementFilter,
-                                ElementParameterFilter,
-                                LogicalOrFilter,
-                                ParameterValueProvider,
-                                BuiltInParameter,
-                                ElementId,
+from Autodesk.Revit.DB import ElementId
 
-                                )
+from Snippets._query   import query_ids
+from Snippets._context import ctx
 
-default_uidoc = __revit__.ActiveUIDocument
-default_doc = default_uidoc.Document
-
-#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> FUNCTIONS
-def create_filter(key_parameter, element_value):
-    """Function to create a RevitAPI filter."""
-    f_parameter = ParameterValueProvider(ElementId(key_parameter))
-    f_parameter_value = element_value #e.g. element.Category.Id
-    f_rule = FilterElementIdRule(f_parameter, FilterNumericEquals(), f_parameter_value)
-    filter = ElementParameterFilter(f_rule)
-    return filter
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> MAIN
 
-def select(mode, uidoc = default_uidoc ):
+def select(mode, uidoc = None ):
     """Run Super Select: all in model/view based on given mode."""
+    uidoc = uidoc or ctx.uidoc
     doc = uidoc.Document
-    #>>>>>>>>>> FILTERS CONTAINER
-    list_of_filters = List[ElementFilter]()
-
     #>>>>>>>>>> GET CURRENT SELECTION
     current_selection_ids = uidoc.Selection.GetElementIds()
 
-    #>>>>>>>>>> LOOP THROUGH SELECTION
+    #>>>>>>>>>> GET CATEGORIES OF SELECTION
+    categories = set()
     for id in current_selection_ids:
         element = uidoc.Document.GetElement(id)
+        if element.Category:
+            categories.add(element.Category.Id)
 
-        #>>>>>>>>>> CREATE CATEGORY FILTER
-        filter = create_filter(key_parameter=BuiltInParameter.ELEM_CATEGORY_PARAM,
-                               element_value=element.Category.Id)
-        list_of_filters.Add(filter)
-
-
-    if list_of_filters:
-        #>>>>>>>>>> COMBINE FILTERS
-        multiple_filters = LogicalOrFilter(list_of_filters)
-
-        #>>>>>>>>>> GET ELEMENTS BASED ON SELECTION MODE
+    if categories:
+        #>>>>>>>>>> GET ELEMENTS BASED ON SELECTION MODE (single ElementMulticategoryFilter)
+        query = 'category in $categories and kind = instance'
         if mode == "view":
-            elems = FilteredElementCollector(doc, doc.ActiveView.Id).WherePasses(multiple_filters).WhereElementIsNotElementType().ToElementIds()
+            elems = query_ids(doc, query, doc.ActiveView.Id, categories=list(categories))
         elif mode == "model":
-            elems = FilteredElementCollector(doc).WherePasses(multiple_filters).WhereElementIsNotElementType().ToElementIds()
+            elems = query_ids(doc, query, categories=list(categories))
         else:
             print("ERROR occured: 'wrong mode'.\n Please contact developer.")
             sys.exit()
@@ -12,6 +12,7 @@ How-to:
 - Get All instances of the same family in Model
 _____________________________________________________________________
 Last update:
+- [18.10.2026] - Filter is compiled by Snippets._query (rvt_year check moved there)
 - [22.08.2022] - 1.0 RELEASE
 _____________________________________________________________________
 """
@@ -24,6 +25,9 @@ clr.AddReference("System")
 from System.Collections.Generic import List
 from Autodesk.Revit.DB import *
 
+# CUSTOM IMPORTS
+from Snippets._query import query_ids
+
 # ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
 # ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
 #  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝
@@ -31,7 +35,6 @@ from Autodesk.Revit.DB import *
 # doc   = __revit__.ActiveUIDocument.Document
 # uidoc = __revit__.ActiveUIDocument
 app     = __revit__.Application
-rvt_year = int(app.VersionNumber)
 
 # ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔
 # ╠╣ ║ ║║║║║   ║ ║║ ║║║║
@@ -49,29 +52,18 @@ def select_similar_by_family(uidoc, mode):
 
         selected_element = doc.GetElement(selected_elements[0])
 
-        # CREATE FILTER RULE
+        # GET FAMILY NAME
         elem_type_id = selected_element.get_Parameter(BuiltInParameter.ELEM_TYPE_PARAM).AsElementId()
         elem_type = doc.GetElement(elem_type_id)
         elem_family_name = elem_type.FamilyName
-        f_parameter = ParameterValueProvider(ElementId(BuiltInParameter.ALL_MODEL_FAMILY_NAME))
-        f_parameter_value = elem_family_name
-
-        if rvt_year < 2023:
-            f_rule = FilterStringRule(f_parameter, FilterStringEquals(), f_parameter_value,True)
-        else:
-            f_rule = FilterStringRule(f_parameter, FilterStringEquals(), f_parameter_value)
-
-        # CREATE FILTER
-        filter_family_name = ElementParameterFilter(f_rule)
 
         # GET ELEMENTS
+        query = 'kind = instance and family.name = $family'
         elements_by_f_name = []
         if mode   == 'model':
-            elements_by_f_name = FilteredElementCollector(doc)\
-                    .WherePasses(filter_family_name).WhereElementIsNotElementType().ToElementIds()
+            elements_by_f_name = query_ids(doc, query, family=elem_family_name)
         elif mode == 'view':
-            elements_by_f_name = FilteredElementCollector(doc, doc.ActiveView.Id)\
-                    .WherePasses(filter_family_name).WhereElementIsNotElementType().ToElementIds()
+            elements_by_f_name = query_ids(doc, query, doc.ActiveView.Id, family=elem_family_name)
 
         # SET SELECTION
         if elements_by_f_name:
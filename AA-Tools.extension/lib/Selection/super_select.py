@@ -20,6 +20,9 @@ How-to:
 Select a few instances in the model and run the script.
 _____________________________________________________________________
 Last update:
+- [18.10.2026] - Rules are combined into a single query (Snippets._query):
+                 categories -> one ElementMulticategoryFilter
+- [18.10.2026] - Fixed rule for MatchLine (-2000193)
 - [10.06.2021] - 1.2 RELEASE
 - [10.06.2021] - Script was refactorred and placed in lib/Selection/ 
 - [10.06.2021] - Selection rule added - [Rooms/Area]
@@ -56,13 +59,6 @@ from Autodesk.Revit.DB import ( ModelLine,
                                 PropertyLine,
                                 RevisionCloud,
                                 ReferencePlane,
-                                FilteredElementCollector,
-                                FilterNumericEquals,
-                                FilterElementIdRule,
-                                ElementFilter,
-                                ElementParameterFilter,
-                                LogicalOrFilter,
-                                ParameterValueProvider,
                                 BuiltInParameter,
                                 ElementId,
                                 DetailCurve,
@@ -73,22 +69,18 @@ from Autodesk.Revit.DB import ( ModelLine,
                                 ModelArc,
                                 ModelEllipse,
                                 ModelNurbSpline,
-                                ElementCategoryFilter,
-                                BuiltInCategory,
                                 )
 
+from Snippets._query import query_ids
 
+#____________________________________________________________________ VARIABLES
+# Every rule adds a value to one of these groups. Empty groups are dropped by the planner.
+SUPER_SELECT_QUERY = """category in $categories
+                        or type in $types
+                        or BUILDING_CURVE_GSTYLE in $line_styles
+                        or CLINE_SUBCATEGORY in $subcategories
+                        or REVISION_CLOUD_REVISION in $revisions"""
 
-
-
-#____________________________________________________________________ FUNCTIONS
-def create_filter(key_parameter, element_value):
-    """Function to create a RevitAPI filter."""
-    f_parameter = ParameterValueProvider(ElementId(key_parameter))
-    f_parameter_value = element_value #e.g. element.Category.Id
-    f_rule = FilterElementIdRule(f_parameter, FilterNumericEquals(), f_parameter_value)
-    filter = ElementParameterFilter(f_rule)
-    return filter
 #____________________________________________________________________ MAIN
 
 def select(mode):
@@ -99,8 +91,8 @@ def select(mode):
     # print(doc.Title)
 
 
-    # FILTERS CONTAINER
-    list_of_filters = List[ElementFilter]()
+    # VALUES CONTAINER
+    groups = dict(categories=[], types=[], line_styles=[], subcategories=[], revisions=[])
 
     # GET CURRENT SELECTION
     current_selection_ids = uidoc.Selection.GetElementIds()
@@ -116,85 +108,44 @@ def select(mode):
         if element_type in line_types:
             # [FILTER FOR CATEGORY] - RoomSeparation(-2000066)  / AreaBoundary(-2000079)
             if element.Category.Id == ElementId(-2000066) or element.Category.Id == ElementId(-2000079):
-                filter = create_filter(key_parameter=BuiltInParameter.ELEM_CATEGORY_PARAM,
-                                       element_value=element.Category.Id)
-                list_of_filters.Add(filter)
+                groups['categories'].append(element.Category.Id)
 
             # [FILTER FOR LINESTYLE] - Other Lines
             else:
-                filter = create_filter(key_parameter=BuiltInParameter.BUILDING_CURVE_GSTYLE,
-                                       element_value=element.LineStyle.Id)
-                list_of_filters.Add(filter)
+                groups['line_styles'].append(element.LineStyle.Id)
 
 
         # [RULE] - ReferencePlane
         elif element_type == ReferencePlane:
-            filter = create_filter(key_parameter=BuiltInParameter.CLINE_SUBCATEGORY,
-                                   element_value=element.get_Parameter(
-                                       BuiltInParameter.CLINE_SUBCATEGORY).AsElementId())
-            list_of_filters.Add(filter)
+            groups['subcategories'].append(element.get_Parameter(BuiltInParameter.CLINE_SUBCATEGORY).AsElementId())
 
         # [RULE] - PropertyLine
         elif element_type == PropertyLine:
-            filter = create_filter(key_parameter=BuiltInParameter.ELEM_CATEGORY_PARAM,
-                                   element_value=element.Category.Id)
-            list_of_filters.Add(filter)
+            groups['categories'].append(element.Category.Id)
 
         # [RULE] - RevisionClouds
         elif element_type == RevisionCloud:
-            filter = create_filter(key_parameter=BuiltInParameter.REVISION_CLOUD_REVISION,
-                                   element_value=element.get_Parameter(
-                                       BuiltInParameter.REVISION_CLOUD_REVISION).AsElementId())
-            list_of_filters.Add(filter)
-
-        # [RULE] - ROOMS(-2000160)
-        elif element.Category.Id == ElementId(-2000160):
-            list_of_filters.Add(ElementCategoryFilter(BuiltInCategory.OST_Rooms))
-
-        # [RULE] - AREAS(-2003200)
-        elif element.Category.Id == ElementId(-2003200):
-            list_of_filters.Add(ElementCategoryFilter(BuiltInCategory.OST_Areas))
-
-        # [RULE] - ScopeBox(-2006000)
-        elif element.Category.Id == ElementId(-2006000):
-            filter = create_filter(key_parameter=BuiltInParameter.ELEM_CATEGORY_PARAM,
-                                   element_value=element.Category.Id)
-            list_of_filters.Add(filter)
-
-        # [RULE] - PlanRegion(-2000191)
-        elif element.Category.Id == ElementId(-2000191):
-            filter = create_filter(key_parameter=BuiltInParameter.ELEM_CATEGORY_PARAM,
-                                   element_value=element.Category.Id)
-            list_of_filters.Add(filter)
-
-        # [RULE] - MatchLine(-2000193)
-        elif element.Category.Id == ElementId(-2000191):
-            filter = create_filter(key_parameter=BuiltInParameter.ELEM_CATEGORY_PARAM,
-                                   element_value=element.Category.Id)
-            list_of_filters.Add(filter)
+            groups['revisions'].append(element.get_Parameter(BuiltInParameter.REVISION_CLOUD_REVISION).AsElementId())
+
+        # [RULE] - ROOMS(-2000160) / AREAS(-2003200) / ScopeBox(-2006000) / PlanRegion(-2000191) / MatchLine(-2000193)
+        elif element.Category.Id in (ElementId(-2000160), ElementId(-2003200), ElementId(-2006000),
+                                     ElementId(-2000191), ElementId(-2000193)):
+            groups['categories'].append(element.Category.Id)
 
         # [RULE] - Others
         else:
-            filter = create_filter(key_parameter=BuiltInParameter.ELEM_TYPE_PARAM,
-                                   element_value=element.GetTypeId())
-            list_of_filters.Add(filter)
-
-    if list_of_filters:
-        # COMBINE FILTERS
-        multiple_filters = LogicalOrFilter(list_of_filters)
+            groups['types'].append(element.GetTypeId())
 
+    if any(groups.values()):
         # GET ELEMENTS BASED ON SELECTION MODE
         if mode == "view":
-            elems = FilteredElementCollector(doc, doc.ActiveView.Id).WherePasses(multiple_filters).ToElementIds()
+            elems = query_ids(doc, SUPER_SELECT_QUERY, doc.ActiveView.Id, **groups)
         elif mode == "model":
-            elems = FilteredElementCollector(doc).WherePasses(multiple_filters).ToElementIds()
+            elems = query_ids(doc, SUPER_SELECT_QUERY, **groups)
         else:
             print("ERROR occured: 'wrong mode'.\n Please contact developer.")
             sys.exit()
 
         # SET SELECTION
         if elems:
-            uidoc.Selection.SetElementIds(List[ElementId](elems))
-
-
-
+            uidoc.Selection.SetElementIds(List[ElementId](elems))
\ No newline at end of file
@@ -9,7 +9,6 @@ from pyrevit import forms
 
 # CUSTOM IMPORTS
 from Snippets._convert import convert_cm_to_feet
-from Snippets._filtered_element_collector import all_legends
 
 #>>>>>>>>>> .NET IMPORTS
 import clr
@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import io, os, re, json, time, hashlib, tempfile
+from collections import OrderedDict
+
+from Autodesk.Revit.DB import (ModelPathUtils,
+                               OpenOptions,
+                               DetachFromCentralOption,
+                               SaveAsOptions,
+                               WorksharingSaveAsOptions,
+                               BasicFileInfo,
+                               FilteredElementCollector,
+                               RevitLinkInstance)
+
+# CUSTOM IMPORTS
+from Snippets._csv import to_text
+from Snippets._health import get_model_health
+from Snippets._links import remove_all_links, get_all_links
+from Snippets._purge import PurgeAnalyzer, delete_elements, SAFE_PURGE_KINDS
+from Snippets._renaming import rename_types, plan_rename_types
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+EXTENSIONS = ('.rvt', '.rfa')
+RE_BACKUP  = re.compile(r'\.\d{4}\.(rvt|rfa)$', re.IGNORECASE)    # Revit backups: Model.0001.rvt
+
+OPERATIONS = OrderedDict()      # {name: func(doc) -> result} - operations available for batch processing
+                                # func.read_only - True if the operation doesn't modify documents
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def register_operation(name, read_only=False):
+    """Decorator to make a function(doc) available for batch processing under given name.
+    :param read_only: True for audits/plans - they can run on linked and read-only documents,
+                      and files are not saved after them."""
+    def decorator(func):
+        func.read_only   = read_only
+        OPERATIONS[name] = func
+        return func
+    return decorator
+
+
+def get_documents(app, links=True):
+    #type:(Application, bool) -> list
+    """Function to get all documents open in Revit and documents of loaded Revit links (each one once).
+    :param app:   Autodesk.Revit.ApplicationServices.Application
+    :param links: if True - documents of RevitLinkInstances are included.
+    :return:      List of (Document, source), source is 'Open' or 'Link (<host title>)'."""
+    documents = []
+    seen      = set()
+
+    def add(doc, source):
+        key = doc.PathName or doc.Title
+        if key not in seen:
+            seen.add(key)
+            documents.append((doc, source))
+
+    hosts = [doc for doc in app.Documents if not doc.IsLinked]
+    for doc in hosts:
+        add(doc, 'Open')
+
+    if links:
+        for host in hosts:
+            if host.IsFamilyDocument:
+                continue
+            for link in FilteredElementCollector(host).OfClass(RevitLinkInstance):
+                link_doc = link.GetLinkDocument()      # None if the link is unloaded
+                if link_doc is not None:
+                    add(link_doc, 'Link ({})'.format(host.Title))
+        for doc in app.Documents:
+            if doc.IsLinked:
+                add(doc, 'Link')
+    return documents
+
+
+def get_read_only_reason(doc):
+    #type:(Document) -> str
+    """Function to get the reason why a document can't be modified (None if it can)."""
+    if doc.IsLinked:
+        return 'Linked document (read-only)'
+    if doc.IsReadOnly:
+        return 'Document is read-only'
+    return None
+
+
+def collect_files(sources, extensions=EXTENSIONS, recursive=False):
+    #type:(list, tuple, bool) -> list
+    """Function to get Revit files from folders and/or file paths. Revit backups (*.0001.rvt) are skipped.
+    :param sources:    Folder, file path or a list of both
+    :param extensions: File extensions to include
+    :param recursive:  if True - subfolders are included
+    :return:           Sorted list of unique file paths."""
+    if not isinstance(sources, (list, tuple)):
+        sources = [sources]
+
+    files = set()
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, names in os.walk(source):
+                files.update(os.path.join(root, name) for name in names)
+                if not recursive:
+                    break
+        else:
+            files.add(source)
+
+    return sorted(f for f in files
+                  if f.lower().endswith(extensions) and not RE_BACKUP.search(f))
+
+
+def get_journal_path(operation_name, files):
+    #type:(str, list) -> str
+    """Function to get a journal path for a job. The same operation on the same files gets the same journal,
+    so a job that was stopped can be resumed."""
+    key = hashlib.md5(json.dumps([operation_name] + sorted(files)).encode('utf-8')).hexdigest()[:12]
+    try:
+        from pyrevit import script
+        return script.get_universal_data_file('AA_Tools_batch_{}'.format(key), 'jsonl')
+    except Exception:
+        return os.path.join(tempfile.gettempdir(), 'AA_Tools_batch_{}.jsonl'.format(key))
+
+
+def print_batch_report(results, title='Batch Report'):
+    """Function to print results of BatchProcessor.run with per-file timing."""
+    from pyrevit import script
+    output = script.get_output()
+
+    rows  = []
+    total = 0.0
+    for entry in results:
+        timings = entry.get('timings', {})
+        seconds = sum(timings.values())
+        total  += seconds
+        rows.append([os.path.basename(entry['file']), entry['status'],
+                     '{:.1f}'.format(timings.get('open', 0.0)),
+                     '{:.1f}'.format(timings.get('operation', 0.0)),
+                     '{:.1f}'.format(timings.get('save', 0.0)),
+                     '{:.1f}'.format(seconds),
+                     entry.get('error') or to_text(entry.get('result', ''))])
+
+    done = sum(1 for e in results if e['status'] == 'done')
+    rows.append(['{}/{} done'.format(done, len(results)), '', '', '', '', '{:.1f}'.format(total), ''])
+    output.print_table(table_data=rows, title=title, last_line_style='font-weight:bold;',
+                       columns=['File', 'Status', 'Open [s]', 'Operation [s]', 'Save [s]', 'Total [s]', 'Result'])
+
+
+def print_documents_report(results, title='Documents Report'):
+    """Function to print results of DocumentRunner.run in a single table with per-document timing."""
+    from pyrevit import script
+    output = script.get_output()
+
+    rows  = []
+    total = 0.0
+    for entry in results:
+        seconds = entry['timings'].get('operation', 0.0)
+        total  += seconds
+        rows.append([entry['document'], entry['source'], entry['status'], '{:.2f}'.format(seconds),
+                     entry.get('error') or to_text(entry.get('result', ''))])
+
+    done = sum(1 for e in results if e['status'] == 'done')
+    rows.append(['{}/{} done'.format(done, len(results)), '', '', '{:.2f}'.format(total), ''])
+    output.print_table(table_data=rows, title=title, last_line_style='font-weight:bold;',
+                       columns=['Document', 'Source', 'Status', 'Time [s]', 'Result'])
+
+
+# ╔═╗╔═╗╔═╗╦═╗╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ║ ║╠═╝║╣ ╠╦╝╠═╣ ║ ║║ ║║║║╚═╗
+# ╚═╝╩  ╚═╝╩╚═╩ ╩ ╩ ╩╚═╝╝╚╝╚═╝ OPERATIONS
+#====================================================================================================
+@register_operation('Resave (Upgrade)')
+def resave(doc):
+    """Nothing is changed - files are only opened and saved (e.g. to upgrade them to the current version)."""
+    return None
+
+
+@register_operation('Batch Rename Types')
+def batch_rename_types(doc):
+    return 'Renamed: {}'.format(rename_types(doc, debug=False))
+
+
+@register_operation('Remove All Imports&Links')
+def batch_remove_links(doc):
+    return 'Deleted: {}'.format(remove_all_links(doc, debug=False))
+
+
+@register_operation('Purge Unused')
+def batch_purge_unused(doc):
+    """Unused View Templates and Filters are deleted (SAFE_PURGE_KINDS, see PurgeAnalyzer).
+    Other unused elements are only reported - review them with Purge Unused button."""
+    unused  = PurgeAnalyzer(doc).analyze()
+    deleted = delete_elements(doc, [el for kind in SAFE_PURGE_KINDS for el in unused[kind]], debug=False)
+    review  = ', '.join('{}: {}'.format(kind, len(elements)) for kind, elements in unused.items()
+                        if kind not in SAFE_PURGE_KINDS and elements)
+    return 'Deleted: {}'.format(deleted) + (' (to review - {})'.format(review) if review else '')
+
+
+@register_operation('Plan: Rename Types', read_only=True)
+def batch_plan_rename_types(doc):
+    """Types that would be renamed by Batch Rename Types (nothing is changed)."""
+    return 'To rename: {}'.format(len(plan_rename_types(doc)))
+
+
+@register_operation('Audit: Unused Elements', read_only=True)
+def batch_audit_unused(doc):
+    unused = PurgeAnalyzer(doc).analyze()
+    return ', '.join('{}: {}'.format(kind, len(elements)) for kind, elements in unused.items())
+
+
+@register_operation('Audit: Model Health', read_only=True)
+def batch_audit_health(doc):
+    """Model health metrics (added to the time series of the document, see get_model_health)."""
+    record, _ = get_model_health(doc)
+    return ', '.join('{}: {}'.format(name, value) for name, value in record['metrics'])
+
+
+@register_operation('Audit: Imports&Links', read_only=True)
+def batch_audit_links(doc):
+    links = get_all_links(doc)
+    return 'Links/Imports: {}'.format(len(links))
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class BatchJournal(object):
+    """Append-only JSONL journal of a batch job. Every line is a single event:
+        {"file": ..., "status": "started"}
+        {"file": ..., "status": "done",   "timings": {...}, "result": ...}
+        {"file": ..., "status": "failed", "timings": {...}, "error": ...}
+    If Revit crashes, the last event of a file stays "started" - it's retried on resume
+    until max_attempts is reached, so a file that crashes Revit can't block the job forever."""
+
+    def __init__(self, path):
+        self.path     = path
+        self.entries  = {}      # {file: last event}
+        self.attempts = {}      # {file: amount of "started" events}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with io.open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue    # Last line can be incomplete after a crash
+                if entry.get('status') == 'started':
+                    self.attempts[entry['file']] = self.attempts.get(entry['file'], 0) + 1
+                self.entries[entry['file']] = entry
+
+    def _write(self, entry):
+        folder = os.path.dirname(self.path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+        with io.open(self.path, 'a', encoding='utf-8') as f:
+            f.write(to_text(json.dumps(entry, sort_keys=True)) + u'\n')
+            f.flush()
+        self.entries[entry['file']] = entry
+        return entry
+
+    def status(self, path):
+        #type:(str) -> str
+        """Function to get the last status of a file: None, 'started', 'done' or 'failed'."""
+        return self.entries.get(path, {}).get('status')
+
+    def start(self, path):
+        self.attempts[path] = self.attempts.get(path, 0) + 1
+        return self._write({'file': path, 'status': 'started', 'time': time.strftime('%Y-%m-%dT%H:%M:%S')})
+
+    def finish(self, path, timings, result=None):
+        if not (result is None or isinstance(result, (int, float, bool))):
+            result = to_text(result)
+        return self._write({'file': path, 'status': 'done', 'timings': timings, 'result': result})
+
+    def fail(self, path, timings, error):
+        return self._write({'file': path, 'status': 'failed', 'timings': timings, 'error': to_text(error)})
+
+    def reset(self):
+        """Function to delete the journal, so all files are processed again."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.entries  = {}
+        self.attempts = {}
+
+
+class RevitOpener(object):
+    """Opens documents in the background (no UI), detached from central for workshared files.
+
+    Any object with open(path), save(doc, path) and close(doc) can be used instead
+    (e.g. to test BatchProcessor without Revit)."""
+
+    def __init__(self, app, detach=True, audit=False, output_folder=None, max_backups=1):
+        """
+        :param app:           Autodesk.Revit.ApplicationServices.Application
+        :param detach:        if True - workshared files are opened detached (worksets are preserved).
+        :param audit:         if True - files are audited on open.
+        :param output_folder: Save copies to this folder (workshared files are saved as a new central model).
+                              If None - original files are overwritten. Workshared files are never overwritten,
+                              so a live central model can't be replaced by a detached copy.
+        :param max_backups:   SaveAsOptions.MaximumBackups"""
+        self.app           = app
+        self.detach        = detach
+        self.audit         = audit
+        self.output_folder = output_folder
+        self.max_backups   = max_backups
+
+    def _is_workshared(self, path):
+        try:
+            return BasicFileInfo.Extract(path).IsWorkshared
+        except Exception:
+            return False
+
+    def open(self, path):
+        options       = OpenOptions()
+        options.Audit = self.audit
+        if self.detach and self._is_workshared(path):
+            options.DetachFromCentralOption = DetachFromCentralOption.DetachAndPreserveWorksets
+        model_path = ModelPathUtils.ConvertUserVisiblePathToModelPath(path)
+        return self.app.OpenDocumentFile(model_path, options)
+
+    def save(self, doc, path):
+        target = os.path.join(self.output_folder, os.path.basename(path)) if self.output_folder else path
+        if target == path and doc.IsWorkshared:
+            raise Exception('Workshared file is not overwritten (central model). Save copies to an output folder.')
+        if target == path:
+            doc.Save()
+            return target
+
+        options                       = SaveAsOptions()
+        options.OverwriteExistingFile = True
+        options.MaximumBackups        = self.max_backups
+        if doc.IsWorkshared:
+            ws_options               = WorksharingSaveAsOptions()
+            ws_options.SaveAsCentral = True
+            options.SetWorksharingOptions(ws_options)
+        doc.SaveAs(target, options)
+        return target
+
+    def close(self, doc):
+        doc.Close(False)
+
+
+class DocumentRunner(object):
+    """Runs an operation on documents that are already open in Revit: open projects/families
+    and documents of loaded Revit links (see get_documents). Nothing is opened, saved or closed.
+
+    - Read-only operations (audits, plans) run on all documents.
+    - Other operations run only on documents that can be modified, linked/read-only ones are skipped.
+
+    Example:
+        runner  = DocumentRunner(OPERATIONS['Plan: Rename Types'])
+        results = runner.run(get_documents(app))
+        print_documents_report(results)"""
+
+    def __init__(self, operation, read_only=None):
+        """
+        :param operation: function(doc) -> result
+        :param read_only: Default: operation.read_only (see register_operation)"""
+        self.operation = operation
+        self.read_only = getattr(operation, 'read_only', False) if read_only is None else read_only
+
+    def process(self, doc, source=''):
+        #type:(Document, str) -> dict
+        """Function to run the operation on a single document. Exceptions are stored in the result.
+        :return: {'document', 'source', 'status', 'timings', 'result' or 'error'}"""
+        entry = {'document': '', 'source': source, 'timings': {}}
+        start = time.time()
+        try:
+            # Document can be closed or unloaded (links) while the previous ones are processed
+            if not doc.IsValidObject:
+                entry.update(status='skipped', error='Document is closed or unloaded.')
+                return entry
+            entry['document'] = doc.Title
+
+            reason = None if self.read_only else get_read_only_reason(doc)
+            if reason:
+                entry.update(status='skipped', error=reason)
+                return entry
+
+            entry.update(status='done', result=self.operation(doc))
+        except Exception as e:
+            entry.update(status='failed', error=to_text(e))
+        entry['timings']['operation'] = time.time() - start
+        return entry
+
+    def run(self, documents, progress=None):
+        #type:(list, object) -> list
+        """Function to run the operation on all documents.
+        :param documents: List of Documents or (Document, source) from get_documents
+        :param progress:  Optional pyrevit.forms.ProgressBar. Stops after the current document if it's cancelled.
+        :return:          List of results (one per document)."""
+        results = []
+        for n, item in enumerate(documents):
+            if progress is not None:
+                if progress.cancelled:
+                    break
+                progress.update_progress(n, len(documents))
+            doc, source = item if isinstance(item, tuple) else (item, '')
+            results.append(self.process(doc, source))
+        return results
+
+
+class BatchProcessor(object):
+    """Runs an operation on many files: open -> operation(doc) -> save -> close.
+    Progress is written to a BatchJournal after every file, so a job can be resumed after a crash.
+
+    Example:
+        files     = collect_files(r'C:\\Projects\\Families')
+        journal   = BatchJournal(get_journal_path('Batch Rename Types', files))
+        processor = BatchProcessor(RevitOpener(app), OPERATIONS['Batch Rename Types'], journal)
+        results   = processor.run(files)
+        print_batch_report(results)"""
+
+    def __init__(self, opener, operation, journal, save=True, max_attempts=2):
+        """
+        :param opener:       RevitOpener or any object with open(path), save(doc, path), close(doc)
+        :param operation:    function(doc) -> result (stored in the journal)
+        :param journal:      BatchJournal
+        :param save:         if True - documents are saved before closing.
+        :param max_attempts: Files that were started this many times without finishing (crash) are skipped."""
+        self.opener       = opener
+        self.operation    = operation
+        self.journal      = journal
+        self.save         = save
+        self.max_attempts = max_attempts
+
+    def process(self, path):
+        #type:(str) -> dict
+        """Function to process a single file. Exceptions are stored in the journal.
+        :return: Journal entry."""
+        self.journal.start(path)
+        timings = {}
+        doc     = None
+        try:
+            start = time.time()
+            doc   = self.opener.open(path)
+            timings['open'] = time.time() - start
+
+            start  = time.time()
+            result = self.operation(doc)
+            timings['operation'] = time.time() - start
+
+            if self.save:
+                start = time.time()
+                self.opener.save(doc, path)
+                timings['save'] = time.time() - start
+
+            start = time.time()
+            self.opener.close(doc)
+            doc   = None
+            timings['close'] = time.time() - start
+            return self.journal.finish(path, timings, result)
+
+        except Exception as e:
+            if doc is not None:
+                try:
+                    self.opener.close(doc)
+                except Exception:
+                    pass
+            return self.journal.fail(path, timings, e)
+
+    def run(self, files, progress=None):
+        #type:(list, object) -> list
+        """Function to process all files that are not done yet.
+        :param files:    List of file paths
+        :param progress: Optional pyrevit.forms.ProgressBar. Job stops after the current file if it's cancelled.
+        :return:         List of journal entries (one per file, including files done in previous runs)."""
+        results = []
+        for n, path in enumerate(files):
+            if progress is not None:
+                if progress.cancelled:
+                    break
+                progress.update_progress(n, len(files))
+
+            status = self.journal.status(path)
+            if status == 'done':
+                results.append(self.journal.entries[path])
+            elif status == 'started' and self.journal.attempts.get(path, 0) >= self.max_attempts:
+                results.append({'file': path, 'status': 'skipped', 'timings': {},
+                                'error': 'Stopped {} times while processing (crash?)'.format(self.max_attempts)})
+            else:
+                results.append(self.process(path))
+        return results
@@ -21,4 +21,33 @@ def is_point_in_BB_2D(BB, p):
     :return:  bool              - True/False"""
     if BB.Min.X < p.X and BB.Min.Y < p.Y and BB.Max.X > p.X and BB.Max.Y > p.Y:
         return True
-    return False
\ No newline at end of file
+    return False
+
+def get_BB_extents(BB):
+    # type:(BoundingBoxXYZ) -> tuple
+    """ Function to read BoundingBox coordinates once into a plain tuple.
+    Comparing floats in a tuple is much faster than accessing BB.Min/BB.Max
+    properties of a Revit object in a loop over thousands of elements.
+    :param BB: BoundingBoxXYZ   - Bounding Box of a Revit element
+    :return:   tuple            - (min_x, min_y, min_z, max_x, max_y, max_z)"""
+    return (BB.Min.X, BB.Min.Y, BB.Min.Z, BB.Max.X, BB.Max.Y, BB.Max.Z)
+
+
+def is_point_in_extents_2D(extents, x, y):
+    # type:(tuple, float, float) -> bool
+    """ Function to determine if a point is located inside of given extents in 2D space(XY).
+    :param extents: tuple       - (min_x, min_y, min_z, max_x, max_y, max_z) from get_BB_extents
+    :param x:       float       - Point X
+    :param y:       float       - Point Y
+    :return:        bool        - True/False"""
+    return extents[0] < x < extents[3] and extents[1] < y < extents[4]
+
+
+def is_point_in_extents_3D(extents, x, y, z):
+    # type:(tuple, float, float, float) -> bool
+    """ Function to determine if a point is located inside of given extents in 3D space.
+    :param extents: tuple       - (min_x, min_y, min_z, max_x, max_y, max_z) from get_BB_extents
+    :return:        bool        - True/False"""
+    return (extents[0] < x < extents[3] and
+            extents[1] < y < extents[4] and
+            extents[2] <= z <= extents[5])
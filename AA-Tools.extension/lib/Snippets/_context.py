@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class DocContext(object):
+    """Active Revit document and view, resolved on every access.
+
+    pyRevit rocket mode keeps imported modules between commands, so library modules
+    must not store doc/uidoc/active view at import time (it would be the document
+    that was active when the module was imported first). Use ctx instead.
+
+    Example:
+        from Snippets._context import ctx
+
+        def get_walls(doc=None):
+            doc = doc or ctx.doc
+            ..."""
+
+    @property
+    def uiapp(self):
+        return __revit__
+
+    @property
+    def app(self):
+        return __revit__.Application
+
+    @property
+    def rvt_year(self):
+        #type:() -> int
+        return int(__revit__.Application.VersionNumber)
+
+    @property
+    def uidoc(self):
+        return __revit__.ActiveUIDocument
+
+    @property
+    def doc(self):
+        uidoc = __revit__.ActiveUIDocument
+        return uidoc.Document if uidoc else None
+
+    @property
+    def selection(self):
+        return __revit__.ActiveUIDocument.Selection
+
+    @property
+    def active_view(self):
+        return self.doc.ActiveView
+
+    @property
+    def active_level(self):
+        """GenLevel of the active view (None for views without a level)."""
+        return self.active_view.GenLevel
+
+
+class DocCache(object):
+    """Per-document cache {Document: {key: value}}.
+
+    Documents are matched by identity (Document.GetHashCode), so the same cache works
+    for all open documents. Entries of closed documents are dropped on the next access.
+
+    Example:
+        _cache = DocCache()
+
+        def get_levels(doc):
+            return _cache.get(doc, 'levels', lambda: FilteredElementCollector(doc).OfClass(Level).ToElements())
+
+        _cache.clear(doc)     # after the levels were modified"""
+
+    def __init__(self):
+        self._docs = {}     # {doc hash: (Document, {key: value})}
+
+    def _purge(self):
+        for doc_key, (doc, _) in list(self._docs.items()):
+            if not doc.IsValidObject:
+                del self._docs[doc_key]
+
+    def get_values(self, doc):
+        #type:(Document) -> dict
+        """Function to get all cached values of a document {key: value}."""
+        self._purge()
+        entry = self._docs.get(doc.GetHashCode())
+        if entry is None:
+            entry = (doc, {})
+            self._docs[doc.GetHashCode()] = entry
+        return entry[1]
+
+    def get(self, doc, key, factory):
+        """Function to get a cached value of a document.
+        :param doc:     Revit Document
+        :param key:     Any hashable key
+        :param factory: function() -> value. Called only if the value is not cached yet."""
+        values = self.get_values(doc)
+        if key not in values:
+            values[key] = factory()
+        return values[key]
+
+    def clear(self, doc=None):
+        """Function to drop cached values of a document (or of all documents if doc is None)."""
+        if doc is None:
+            self._docs.clear()
+        else:
+            self._docs.pop(doc.GetHashCode(), None)
+
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+ctx = DocContext()
@@ -1,9 +1,19 @@
 # -*- coding: utf-8 -*-
-from Autodesk.Revit.DB import Transaction
+from Autodesk.Revit.DB import Transaction, TransactionGroup, TransactionStatus
 import contextlib
+import functools
 import traceback
+import time
 
 import sys, os
+
+# CUSTOM IMPORTS
+from Snippets._failures import FailuresPreprocessor, set_failures_preprocessor
+from Snippets._profiling import current_session, get_memory
+
+# FailuresPreprocessors of currently open ef_TransactionGroups (last one is used by ef_Transaction)
+_group_failures = []
+
 # ╔═╗╔═╗╔╗╔╔╦╗╔═╗═╗ ╦╔╦╗  ╔╦╗╔═╗╔╗╔╔═╗╔═╗╔═╗╦═╗╔═╗
 # ║  ║ ║║║║ ║ ║╣ ╔╩╦╝ ║   ║║║╠═╣║║║╠═╣║ ╦║╣ ╠╦╝╚═╗
 # ╚═╝╚═╝╝╚╝ ╩ ╚═╝╩ ╚═ ╩   ╩ ╩╩ ╩╝╚╝╩ ╩╚═╝╚═╝╩╚═╚═╝ CONTEXT MANAGERS
@@ -22,14 +32,84 @@ def try_except(debug=False):
             print("*"*20)
 
 
+class profiled(object):
+    """ContextManager and decorator to measure a section of a command:
+    wall time, amount of calls and memory sampled at start/end of a section (not a true peak).
+    Results are recorded into the current ProfileSession (Snippets._profiling).
+    Without an open ProfileSession it does nothing.
+
+    Example:
+        @profiled('collect types')
+        def get_all_types(): ...
+
+        with ProfileSession(__title__, count_api=True):
+            types = get_all_types()
+            with profiled('rename'):
+                ...
+    :param section: Name of the section in the report"""
+
+    def __init__(self, section):
+        self.section = section
+        self._starts = []   # Stack, so the same section can be nested (recursion)
+
+    def __enter__(self):
+        if current_session() is None:
+            self._starts.append(None)
+        else:
+            self._starts.append((time.time(), get_memory()))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        start   = self._starts.pop()
+        session = current_session()
+        if start is not None and session is not None:
+            start_time, start_memory = start
+            session.add(self.section, time.time() - start_time, max(start_memory, get_memory()))
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return wrapper
+
+
 @contextlib.contextmanager
-def ef_Transaction(doc, title, debug = True, exitscript = False ):
+def ef_Transaction(doc, title, debug = True, exitscript = False, failures = None, checkout = None):
+    """ContextManager for Transaction. Transaction is rolled back if an Exception occurs.
+    :param doc:        Revit Document
+    :param title:      Transaction Name
+    :param debug:      if True - Exception error will be displayed with traceback.format_exc()
+    :param exitscript: if True - Script is stopped after Exception.
+    :param failures:   IFailuresPreprocessor (e.g. FailuresPreprocessor()) or True for a default one.
+                       If None - FailuresPreprocessor of the current ef_TransactionGroup is used (if any).
+                       Failures are logged at the end if debug is True (by ef_TransactionGroup for its own one).
+    :param checkout:   PreCheckout (Snippets._worksharing) that is run before the Transaction is started.
+                       Use checkout.filter(elements) inside to skip elements owned by other users."""
+    if checkout is not None and not checkout.done:
+        checkout.run()
+        if debug:
+            checkout.report()
+
     t = Transaction(doc, title)
+
+    own_failures = failures is not None     # Failures of ef_TransactionGroup are logged by the group
+    if failures is True:
+        failures = FailuresPreprocessor()
+    elif failures is None and _group_failures:
+        failures = _group_failures[-1]
+    if failures:
+        set_failures_preprocessor(t, failures)
+
     t.Start()
 
     try:
-        yield
-        t.Commit()
+        yield t
+        status = t.Commit()
+
+        if debug and status != TransactionStatus.Committed:
+            print("Transaction [{}] was Rollbacked by FailuresPreprocessor!".format(title))
 
     except Exception as e:
         if debug:
@@ -37,14 +117,96 @@ def ef_Transaction(doc, title, debug = True, exitscript = False ):
             print("Exception occured - Transaction is being Rollbacked!")
             print(traceback.format_exc())
             print("*"*20)
-        t.RollBack()
+        if t.HasStarted() and not t.HasEnded():
+            t.RollBack()
 
         if exitscript:
             print('*Script Excution stopped!*')
             sys.exit()
 
+    finally:
+        if debug and own_failures and hasattr(failures, 'log'):
+            failures.log(title)
+
+
+@contextlib.contextmanager
+def ef_TransactionGroup(doc, title, debug = True, failures = None, assimilate = True):
+    """ContextManager for TransactionGroup. All Transactions inside are merged into a single Undo.
+    :param doc:        Revit Document
+    :param title:      TransactionGroup Name
+    :param debug:      if True - Exception error and aggregated failures will be displayed.
+    :param failures:   IFailuresPreprocessor (or True for a default one) that is installed into every
+                       ef_Transaction inside this group. Each Transaction is still rolled back separately,
+                       so only the failing chunk is lost.
+    :param assimilate: if True - Assimilate, otherwise Commit the TransactionGroup."""
+    if failures is True:
+        failures = FailuresPreprocessor()
 
+    tg = TransactionGroup(doc, title)
+    tg.Start()
+    if failures:
+        _group_failures.append(failures)
 
+    try:
+        yield tg
+        if assimilate:  tg.Assimilate()
+        else:           tg.Commit()
 
+    except Exception as e:
+        if debug:
+            print("*"*20)
+            print("Exception occured - TransactionGroup is being Rollbacked!")
+            print(traceback.format_exc())
+            print("*"*20)
+        if tg.HasStarted() and not tg.HasEnded():
+            tg.RollBack()
+
+    finally:
+        if failures:
+            _group_failures.remove(failures)
+            if debug:
+                failures.log(title)
+
+
+# ╔═╗╦ ╦╦ ╦╔╗╔╦╔═╔═╗
+# ║  ╠═╣║ ║║║║╠╩╗╚═╗
+# ╚═╝╩ ╩╚═╝╝╚╝╩ ╩╚═╝ CHUNKS
+#====================================================================================================
+def chunks(items, chunk_size=500):
+    """Generator to split given items into lists of chunk_size.
+    :param items:      Any iterable
+    :param chunk_size: Max amount of items in a single chunk."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
+def chunked_transactions(doc, title, items, func, chunk_size=500, debug=True, failures=None, on_rollback=None):
+    """Function to apply func to every item in chunked Transactions.
+    All chunks are assimilated into a single TransactionGroup, so it's a single Undo for a user.
+    If a chunk fails - only that chunk is rolled back.
+    :param doc:        Revit Document
+    :param title:      Title of the TransactionGroup
+    :param items:      Items to process
+    :param func:       Function that takes a single item
+    :param chunk_size: Max amount of items per Transaction
+    :param failures:   IFailuresPreprocessor (or True for a default one) for every chunk.
+    :param on_rollback: Function that takes the list of items of a rolled back chunk
+                        (e.g. to report them as failed or to undo counters).
+    :return:           Amount of chunks that were rolled back."""
+    failed = 0
+    with ef_TransactionGroup(doc, title, debug=debug, failures=failures):
+        for n, chunk in enumerate(chunks(items, chunk_size)):
+            with ef_Transaction(doc, '{} [{}]'.format(title, n + 1), debug=debug) as t:
+                for item in chunk:
+                    func(item)
+            if t.GetStatus() != TransactionStatus.Committed:
+                failed += 1
+                if on_rollback is not None:
+                    on_rollback(chunk)
+    return failed
@@ -3,6 +3,9 @@
 # ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
 # ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
 # ==================================================
+import math
+from array import array
+
 from Autodesk.Revit.DB import *
 
 # ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
@@ -12,6 +15,115 @@ from Autodesk.Revit.DB import *
 app      = __revit__.Application
 rvt_year = int(app.VersionNumber)
 
+# ╔╦╗╔═╗╔╗ ╦  ╔═╗╔═╗
+#  ║ ╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╩ ╩ ╩╚═╝╩═╝╚═╝╚═╝ CONVERSION TABLES
+# ==================================================
+# units: (dimension, factor to internal units, UnitTypeId name (RVT 2021+), DisplayUnitType name (RVT < 2021))
+# Internal units: feet, square feet, cubic feet, radians.
+UNITS = {
+    'ft' : ('length', 1.0,                        'Feet',              'DUT_DECIMAL_FEET'),
+    'in' : ('length', 1.0 / 12,                   'Inches',            'DUT_DECIMAL_INCHES'),
+    'm'  : ('length', 1.0 / 0.3048,               'Meters',            'DUT_METERS'),
+    'cm' : ('length', 1.0 / 30.48,                'Centimeters',       'DUT_CENTIMETERS'),
+    'mm' : ('length', 1.0 / 304.8,                'Millimeters',       'DUT_MILLIMETERS'),
+    'ft2': ('area',   1.0,                        'SquareFeet',        'DUT_SQUARE_FEET'),
+    'm2' : ('area',   1.0 / 0.09290304,           'SquareMeters',      'DUT_SQUARE_METERS'),
+    'cm2': ('area',   1.0 / 929.0304,             'SquareCentimeters', 'DUT_SQUARE_CENTIMETERS'),
+    'mm2': ('area',   1.0 / 92903.04,             'SquareMillimeters', 'DUT_SQUARE_MILLIMETERS'),
+    'ft3': ('volume', 1.0,                        'CubicFeet',         'DUT_CUBIC_FEET'),
+    'm3' : ('volume', 1.0 / 0.028316846592,       'CubicMeters',       'DUT_CUBIC_METERS'),
+    'rad': ('angle',  1.0,                        'Radians',           'DUT_RADIANS'),
+    'deg': ('angle',  math.pi / 180,              'Degrees',           'DUT_DECIMAL_DEGREES'),
+}
+
+
+def get_revit_unit(units):
+    """Function to get UnitTypeId (RVT 2021+) or DisplayUnitType (RVT < 2021) for a unit key ('m', 'cm', 'm2'...)."""
+    _, _, unit_type_id, display_unit_type = UNITS[units]
+    if rvt_year >= 2021:
+        from Autodesk.Revit.DB import UnitTypeId
+        return getattr(UnitTypeId, unit_type_id)
+    from Autodesk.Revit.DB import DisplayUnitType
+    return getattr(DisplayUnitType, display_unit_type)
+
+
+def _resolve_factor(units):
+    """Function to get a factor to internal units from UnitUtils (once), with a constant as a fallback."""
+    try:
+        return UnitUtils.ConvertToInternalUnits(1.0, get_revit_unit(units))
+    except:
+        return UNITS[units][1]
+
+
+# Resolved once at import: value_internal = value * TO_INTERNAL[units]
+TO_INTERNAL   = {units: _resolve_factor(units) for units in UNITS}
+FROM_INTERNAL = {units: 1.0 / factor for units, factor in TO_INTERNAL.items()}
+
+
+# ╔═╗╔═╗╔╗╔╦  ╦╔═╗╦═╗╔╦╗╔═╗╦═╗
+# ║  ║ ║║║║╚╗╔╝║╣ ╠╦╝ ║ ║╣ ╠╦╝
+# ╚═╝╚═╝╝╚╝ ╚╝ ╚═╝╩╚═ ╩ ╚═╝╩╚═ CONVERTER
+# ==================================================
+class UnitConverter(object):
+    """Converter between two units with a factor that is resolved only once.
+    Converting is a pure multiplication, so it's safe to use for millions of values.
+
+    Example:
+        to_m = get_converter('ft', 'm')
+        to_m(10.0)                          # float
+        to_m.convert_list([1.0, 2.0])       # list
+        to_m.convert_array(array('d', ...)) # array('d')"""
+
+    def __init__(self, from_units, to_units):
+        if UNITS[from_units][0] != UNITS[to_units][0]:
+            raise ValueError('Can not convert {} to {}'.format(from_units, to_units))
+        self.from_units = from_units
+        self.to_units   = to_units
+        self.factor     = TO_INTERNAL[from_units] * FROM_INTERNAL[to_units]
+
+    def __call__(self, value):
+        return value * self.factor
+
+    def convert_list(self, values):
+        """Function to convert a list of values. :return: new list"""
+        factor = self.factor
+        return [v * factor for v in values]
+
+    def convert_array(self, values, in_place=False):
+        """Function to convert array('d') buffer.
+        :param in_place: if True - given array is modified, otherwise a new array is returned."""
+        factor = self.factor
+        if not in_place:
+            return array('d', [v * factor for v in values])
+        for i in range(len(values)):
+            values[i] *= factor
+        return values
+
+
+_converters = {}
+
+def get_converter(from_units, to_units):
+    #type:(str, str) -> UnitConverter
+    """Function to get a cached UnitConverter. e.g. get_converter('ft', 'm')"""
+    key = (from_units, to_units)
+    if key not in _converters:
+        _converters[key] = UnitConverter(from_units, to_units)
+    return _converters[key]
+
+
+def verify_factors(tolerance=1e-9):
+    """Function to verify conversion tables against UnitUtils in the current Revit version.
+    :return: list of (units, table_factor, revit_factor) that don't match within tolerance."""
+    mismatches = []
+    for units, (_, factor, _, _) in sorted(UNITS.items()):
+        revit_factor = UnitUtils.ConvertToInternalUnits(1.0, get_revit_unit(units))
+        if abs(revit_factor - factor) > tolerance * max(1.0, abs(factor)):
+            mismatches.append((units, factor, revit_factor))
+        if abs(UnitUtils.ConvertFromInternalUnits(1.0, get_revit_unit(units)) * factor - 1.0) > tolerance:
+            mismatches.append((units, 1.0 / factor, UnitUtils.ConvertFromInternalUnits(1.0, get_revit_unit(units))))
+    return mismatches
+
 
 # ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
 # ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
@@ -22,23 +134,17 @@ def convert_internal_units(value, get_internal = True, units='m'):
     """Function to convert Internal units to meters or vice versa.
     :param value:        Value to convert
     :param get_internal: True to get internal units, False to get Meters
-    :param units:        Select desired Units: ['m', 'm2']
+    :param units:        Select desired Units: ['m', 'm2', 'cm', ...] (keys of UNITS)
     :return:             Length in Internal units or Meters."""
-
-    if rvt_year >= 2021:
-        from Autodesk.Revit.DB import UnitTypeId
-        if   units == 'm' : units = UnitTypeId.Meters
-        elif units == "m2": units = UnitTypeId.SquareMeters
-        elif units == 'cm': units = UnitTypeId.Centimeters
-    else:
-        from Autodesk.Revit.DB import DisplayUnitType
-        if   units == 'm' : units = DisplayUnitType.DUT_METERS
-        elif units == "m2": units = DisplayUnitType.DUT_SQUARE_METERS
-        elif units == "cm": units = DisplayUnitType.DUT_CENTIMETERS
+    if units not in TO_INTERNAL:
+        # UnitTypeId/DisplayUnitType was given directly
+        if get_internal:
+            return UnitUtils.ConvertToInternalUnits(value, units)
+        return UnitUtils.ConvertFromInternalUnits(value, units)
 
     if get_internal:
-        return UnitUtils.ConvertToInternalUnits(value, units)
-    return UnitUtils.ConvertFromInternalUnits(value, units)
+        return value * TO_INTERNAL[units]
+    return value * FROM_INTERNAL[units]
 
 
 
@@ -64,77 +170,27 @@ def convert_internal_units(value, get_internal = True, units='m'):
 # ╚═╝╚═╝╚═╝╚═╝╩═╝╚═╝ ╩ ╚═╝ OBSOLETE ( still need to refactor the code)
 def convert_cm_to_feet(length):
     """Function to convert cm to feet."""
-
-    # RVT >= 2022
-    if rvt_year < 2022:
-        from Autodesk.Revit.DB import DisplayUnitType
-        return UnitUtils.Convert(length,
-                                DisplayUnitType.DUT_CENTIMETERS,
-                                DisplayUnitType.DUT_DECIMAL_FEET)
-    # RVT >= 2022
-    else:
-        from Autodesk.Revit.DB import UnitTypeId
-        return UnitUtils.ConvertToInternalUnits(length, UnitTypeId.Centimeters)
+    return length * TO_INTERNAL['cm']
 
 def convert_m_to_feet(length):
     """Function to convert cm to feet."""
-
-    # RVT >= 2022
-    if rvt_year < 2022:
-        from Autodesk.Revit.DB import DisplayUnitType
-        return UnitUtils.Convert(length,
-                                 DisplayUnitType.DUT_METERS,
-                                 DisplayUnitType.DUT_DECIMAL_FEET)
-    # RVT >= 2022
-    else:
-        from Autodesk.Revit.DB import UnitTypeId
-        return UnitUtils.ConvertToInternalUnits(length, UnitTypeId.Meters)
+    return length * TO_INTERNAL['m']
 
 
 
 def convert_internal_to_m(length):
     """Function to convert internal to meters."""
-
-    # RVT >= 2022
-    if rvt_year < 2022:
-        from Autodesk.Revit.DB import DisplayUnitType
-        return UnitUtils.Convert(length,
-                                 DisplayUnitType.DUT_DECIMAL_FEET,
-                                 DisplayUnitType.DUT_METERS)
-    # RVT >= 2022
-    else:
-        from Autodesk.Revit.DB import UnitTypeId
-        return UnitUtils.ConvertFromInternalUnits(length, UnitTypeId.Meters)
+    return length * FROM_INTERNAL['m']
 
 
 
 def convert_internal_to_cm(length):
     """Function to convert internal to centimeters."""
-
-    # RVT >= 2022
-    if rvt_year < 2022:
-        from Autodesk.Revit.DB import DisplayUnitType
-        return UnitUtils.Convert(length,
-                                 DisplayUnitType.DUT_DECIMAL_FEET,
-                                 DisplayUnitType.DUT_CENTIMETERS)
-    # RVT >= 2022
-    else:
-        from Autodesk.Revit.DB import UnitTypeId
-        return UnitUtils.ConvertFromInternalUnits(length, UnitTypeId.Centimeters)
+    return length * FROM_INTERNAL['cm']
 
 
 
 
 def convert_internal_to_m2(area):
     """Function to convert internal to meters."""
-
-    # RVT >= 2022
-    if rvt_year < 2022:
-        from Autodesk.Revit.DB import DisplayUnitType
-        return UnitUtils.Convert(area,
-                                 DisplayUnitType.DUT_SQUARE_FEET,
-                                 DisplayUnitType.DUT_SQUARE_METERS)
-    # RVT >= 2022
-    else:
-        from Autodesk.Revit.DB import UnitTypeId
-        return UnitUtils.ConvertFromInternalUnits(area, UnitTypeId.SquareMeters)
\ No newline at end of file
+    return area * FROM_INTERNAL['m2']
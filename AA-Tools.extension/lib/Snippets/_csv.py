@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import io, os
+
+try:
+    text_type = unicode     # IronPython 2.7
+except NameError:
+    text_type = str         # CPython 3
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def to_text(value):
+    """Function to convert any value (str, int, ElementId...) to unicode text."""
+    if value is None:
+        return u''
+    if isinstance(value, text_type):
+        return value
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return text_type(value)
+
+
+def csv_cell(value, delimiter=','):
+    """Function to quote a single value for CSV if needed."""
+    text = to_text(value)
+    if any(char in text for char in (delimiter, '"', '\n', '\r')):
+        text = u'"{}"'.format(text.replace(u'"', u'""'))
+    return text
+
+
+def write_csv(path, rows, header=None, delimiter=','):
+    #type:(str, list, list, str) -> str
+    """Function to write rows to a CSV file (UTF-8).
+    Works the same in IronPython and CPython, unlike csv module with unicode.
+    :param path:      Path to a CSV file. Folders will be created if needed.
+    :param rows:      List of rows. Each row is a list of values.
+    :param header:    Optional list of column names.
+    :param delimiter: Column delimiter.
+    :return:          Path to a CSV file."""
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+
+    with io.open(path, 'w', encoding='utf-8') as f:
+        if header:
+            f.write(delimiter.join(csv_cell(c, delimiter) for c in header) + u'\n')
+        for row in rows:
+            f.write(delimiter.join(csv_cell(c, delimiter) for c in row) + u'\n')
+    return path
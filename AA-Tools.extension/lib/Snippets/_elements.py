@@ -1,9 +1,12 @@
 from Autodesk.Revit.DB import *
 
+from Snippets._context import ctx
 
 
-all_floor_types = FilteredElementCollector(doc).OfCategory(
-    BuiltInCategory.OST_Floors).WhereElementIsElementType().ToElements()
+def get_all_floor_types(doc=None):
+    """Function to get all FloorTypes (active document by default)."""
+    return FilteredElementCollector(doc or ctx.doc).OfCategory(
+        BuiltInCategory.OST_Floors).WhereElementIsElementType().ToElements()
 
 def dict_name_element(given_elements, dotNet=False):
     dict_output = {Element.Name.GetValue(fr): fr for fr in given_elements}
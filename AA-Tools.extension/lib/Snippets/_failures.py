@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+from Autodesk.Revit.DB import (IFailuresPreprocessor,
+                               FailureSeverity,
+                               FailureProcessingResult)
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class FailuresPreprocessor(IFailuresPreprocessor):
+    """Configurable IFailuresPreprocessor for bulk operations.
+
+    - Warnings are deleted (or kept) without showing a dialog to a user.
+    - Errors are resolved with their default resolution (if resolve_errors=True and possible),
+      otherwise the Transaction is rolled back without a dialog.
+    - All failures are aggregated by FailureDefinitionId, so the same warning
+      repeated 1000 times is reported once with a count.
+
+    The same instance can be reused for many Transactions to get a single report.
+
+    Example:
+        failures = FailuresPreprocessor(resolve_errors=True)
+        with ef_TransactionGroup(doc, 'Bulk Rename', failures=failures):
+            for chunk in chunks(elements):
+                with ef_Transaction(doc, 'Rename Chunk'):    # failures are taken from ef_TransactionGroup
+                    ...
+        failures.log()"""
+
+    def __init__(self, delete_warnings=True, resolve_errors=False):
+        """
+        :param delete_warnings: Delete Warnings so they are not shown to a user.
+        :param resolve_errors:  Try to resolve Errors with default resolution instead of rolling back."""
+        self.delete_warnings = delete_warnings
+        self.resolve_errors  = resolve_errors
+
+        self.warnings      = []     # [(description, [ElementId, ...]), ...]
+        self.errors        = []     # [(description, [ElementId, ...]), ...]
+        self.by_definition = {}     # {definition_guid: {'description', 'severity', 'count', 'element_ids'}}
+        self.rollbacks     = 0
+
+    def _aggregate(self, failure, severity):
+        """Function to add a FailureMessage to aggregated results."""
+        description = failure.GetDescriptionText()
+        el_ids      = list(failure.GetFailingElementIds())
+        key         = str(failure.GetFailureDefinitionId().Guid)
+
+        item = self.by_definition.setdefault(key, {'description': description,
+                                                   'severity'   : severity,
+                                                   'count'      : 0,
+                                                   'element_ids': []})
+        item['count'] += 1
+        item['element_ids'].extend(el_ids)
+        return (description, el_ids)
+
+    def PreprocessFailures(self, failuresAccessor):
+        has_errors = False
+        resolved   = False
+
+        for failure in failuresAccessor.GetFailureMessages():
+            if failure.GetSeverity() == FailureSeverity.Warning:
+                self.warnings.append(self._aggregate(failure, 'Warning'))
+                if self.delete_warnings:
+                    failuresAccessor.DeleteWarning(failure)
+                continue
+
+            self.errors.append(self._aggregate(failure, 'Error'))
+            if self.resolve_errors and failure.HasResolutions():
+                failuresAccessor.ResolveFailure(failure)
+                resolved = True
+            else:
+                has_errors = True
+
+        if has_errors:
+            self.rollbacks += 1
+            return FailureProcessingResult.ProceedWithRollBack
+        if resolved:
+            return FailureProcessingResult.ProceedWithCommit
+        return FailureProcessingResult.Continue
+
+    def clear(self):
+        """Function to reset collected failures."""
+        self.warnings      = []
+        self.errors        = []
+        self.by_definition = {}
+        self.rollbacks     = 0
+
+    def log(self, title='Failures'):
+        """Function to log aggregated failures (single line per FailureDefinition)."""
+        if not self.by_definition:
+            return
+        from pyrevit import script
+        logger = script.get_logger()
+
+        items = sorted(self.by_definition.values(), key=lambda x: -x['count'])
+        logger.warning('{}: {} Warnings, {} Errors, {} Transactions rolled back.'.format(
+            title, len(self.warnings), len(self.errors), self.rollbacks))
+        for item in items:
+            logger.warning('[{}] x{} - {}'.format(item['severity'], item['count'], item['description']))
+
+
+class WarningSwallower(FailuresPreprocessor):
+    """IFailuresPreprocessor that deletes all Warnings instead of showing them to a user.
+    Warnings and Errors are collected, so they can be reported at the end of the script.
+    If any Error occurs - Transaction is rolled back without showing a dialog.
+
+    Example:
+        swallower = WarningSwallower()
+        t = Transaction(doc, 'Create Floors')
+        set_failures_preprocessor(t, swallower)
+        t.Start()
+        ...
+        t.Commit()
+        print(swallower.warnings)"""
+
+    def __init__(self):
+        super(WarningSwallower, self).__init__(delete_warnings=True, resolve_errors=False)
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def set_failures_preprocessor(transaction, preprocessor):
+    #type:(Transaction, IFailuresPreprocessor) -> None
+    """Function to attach IFailuresPreprocessor to a Transaction.
+    It has to be done before Transaction.Commit()"""
+    options = transaction.GetFailureHandlingOptions()
+    options.SetFailuresPreprocessor(preprocessor)
+    options.SetClearAfterRollback(True)
+    transaction.SetFailureHandlingOptions(options)
@@ -25,11 +25,11 @@ if __name__ == '__main__':
 
     #>>>>>>>>>> ACTIVE VIEW
     view = doc.ActiveView
-    #>>>>>>>>>> CREATE FILTER FROM VIEW's VIEWER SHEET NUMBER
-    my_filter = create_string_filter(key_parameter = BuiltInParameter.SHEET_NUMBER,
-                                     element_value= view.get_Parameter(BuiltInParameter.VIEWER_SHEET_NUMBER).AsString())
     #>>>>>>>>>> GET SHEET
-    sheet = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Sheets).WhereElementIsNotElementType().WherePasses(my_filter).FirstElement()
+    # create_string_filter(SHEET_NUMBER) + FilteredElementCollector works for a single view,
+    # but ViewSheetMap reads all Viewports once and is much faster for many views.
+    from Snippets._sheets import ViewSheetMap
+    sheet = ViewSheetMap.get(doc).get_sheet(view)
 
     #>>>>>>>>>> PRINT RESULTS
     if sheet:   print('Sheet Found: {} - {}'.format(sheet.SheetNumber, sheet.Name))
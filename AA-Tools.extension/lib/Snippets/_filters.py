@@ -6,12 +6,16 @@
 
 from Autodesk.Revit.DB import *
 from pyrevit.forms import alert
+
+# CUSTOM IMPORTS
+from Snippets._query   import query_elements
+from Snippets._context import ctx
+
 # ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
 # ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
 #  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
 # ==================================================
-doc   = __revit__.ActiveUIDocument.Document     # Document   class from RevitAPI that represents project. Used to Create, Delete, Modify and Query elements from the project.
-uidoc = __revit__.ActiveUIDocument              # UIDocument class from RevitAPI that represents Revit project opened in the Revit UI.
+# Active doc/uidoc are resolved when a function is called: ctx.doc, ctx.uidoc (Snippets._context)
 app   = __revit__.Application                   # Represents the Autodesk Revit Application, providing access to documents, options and other application wide data and settings.
 
 # ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
@@ -31,17 +35,12 @@ def create_filter(key_parameter, element_value):
 # group = FilteredElementCollector(doc).WherePasses(filter).FirstElement()
 
 
-def get_family_types(family_name):
-    """Function to get FamilyTypes of a given FamilyName. It has to be written exactly the same."""
-    pvp         = ParameterValueProvider(ElementId(BuiltInParameter.ALL_MODEL_FAMILY_NAME))
-    condition   = FilterStringEquals()
-    ruleValue   = family_name
-    fRule       = FilterStringRule(pvp, condition, ruleValue, True)
-    my_filter   = ElementParameterFilter(fRule)
-
-    family_types = FilteredElementCollector(doc).WherePasses(my_filter).WhereElementIsElementType().ToElements()
+def get_family_types(family_name, doc=None):
+    """Function to get FamilyTypes of a given FamilyName. It has to be written exactly the same.
+    :param doc: Revit Document. Default: active document"""
+    family_types = query_elements(doc or ctx.doc, 'kind = type and family.name = $family', family=family_name)
 
     if not family_types:
-        alert("Could not find a Family with a name: " + ruleValue, title = 'Family Not Found.', exitscript=True)
+        alert("Could not find a Family with a name: " + family_name, title = 'Family Not Found.', exitscript=True)
 
     return family_types
\ No newline at end of file
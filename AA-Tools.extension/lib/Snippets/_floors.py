@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+from Autodesk.Revit.DB import (TransactionStatus,
+                               SpatialElementBoundaryOptions,
+                               SpatialElementBoundaryLocation,
+                               BuiltInParameter,
+                               BuiltInCategory,
+                               Floor,
+                               Ceiling,
+                               Curve,
+                               CurveLoop,
+                               CurveArray,
+                               ElementId)
+
+# CUSTOM IMPORTS
+from Snippets._context_manager import chunks, ef_Transaction, ef_TransactionGroup
+from Snippets._failures        import WarningSwallower
+from Snippets._rooms           import get_room_label
+
+#.NET
+import clr
+clr.AddReference('System')
+from System.Collections.Generic import List
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+app      = __revit__.Application
+rvt_year = int(app.VersionNumber)
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def get_room_boundary_curves(room, boundary_location=SpatialElementBoundaryLocation.Finish):
+    """Function to get Room boundary as a list of loops with Curves.
+    :param room:              Room
+    :param boundary_location: SpatialElementBoundaryLocation (Finish/Center...)
+    :return:                  [[Curve, ...], ...]  (First loop is an outer boundary)"""
+    options = SpatialElementBoundaryOptions()
+    options.SpatialElementBoundaryLocation = boundary_location
+
+    loops = []
+    for loop in room.GetBoundarySegments(options) or []:
+        loops.append([segment.GetCurve() for segment in loop])
+    return loops
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class CreateFromRoomsBatch(object):
+    """Class to create Floors or Ceilings from many Rooms at once.
+
+    - Room boundaries are extracted once before any Transaction is started.
+    - Elements are created in chunked Transactions (single TransactionGroup = single Undo).
+    - Warnings are deleted by WarningSwallower instead of showing Revit dialogs.
+    - If a chunk fails, its Rooms are retried one by one to find which Room caused the issue.
+
+    Example:
+        batch = CreateFromRoomsBatch(doc, rooms, floor_type, offset)
+        batch.create()
+        batch.print_summary()"""
+
+    def __init__(self, doc, rooms, element_type, offset=0.0, chunk_size=100):
+        """
+        :param doc:          Revit Document
+        :param rooms:        List of Rooms
+        :param element_type: FloorType or CeilingType
+        :param offset:       Height Offset from Level in internal units (feet)
+        :param chunk_size:   Amount of Rooms per Transaction"""
+        self.doc          = doc
+        self.rooms        = rooms
+        self.element_type = element_type
+        self.offset       = offset
+        self.chunk_size   = chunk_size
+
+        cat_id          = element_type.Category.Id
+        self.is_ceiling = cat_id == ElementId(BuiltInCategory.OST_Ceilings)
+
+        self.boundaries = {}   # room_id -> [[Curve, ...], ...]
+        self.created    = {}   # room_id -> ElementId
+        self.failed     = {}   # room_id -> reason
+        self.warnings   = {}   # room_id -> [description, ...]
+        self.swallower  = WarningSwallower()
+
+    @property
+    def kind(self):
+        return 'Ceiling' if self.is_ceiling else 'Floor'
+
+    # ╔═╗╦═╗╔═╗╔═╗╔═╗╔═╗╔═╗
+    # ╠═╝╠╦╝║╣ ╠═╝╠═╣╠╦╝║╣
+    # ╩  ╩╚═╚═╝╩  ╩ ╩╩╚═╚═╝ PREPARE
+    #==================================================
+    def prepare(self):
+        """Function to read all Room boundaries once (outside of any Transaction)."""
+        for room in self.rooms:
+            try:
+                loops = get_room_boundary_curves(room)
+            except:
+                loops = []
+
+            if not loops:
+                self.failed[room.Id] = 'Room is not enclosed or not placed.'
+                continue
+            self.boundaries[room.Id] = loops
+
+    # ╔═╗╦═╗╔═╗╔═╗╔╦╗╔═╗
+    # ║  ╠╦╝║╣ ╠═╣ ║ ║╣
+    # ╚═╝╩╚═╚═╝╩ ╩ ╩ ╚═╝ CREATE
+    #==================================================
+    def _create_element(self, room):
+        """Function to create a single Floor/Ceiling for a Room. Has to be used inside a Transaction."""
+        loops = self.boundaries[room.Id]
+
+        if rvt_year >= 2022:
+            curve_loops = List[CurveLoop]()
+            for loop in loops:
+                curve_loops.Add(CurveLoop.Create(List[Curve](loop)))
+            if self.is_ceiling:
+                new_el = Ceiling.Create(self.doc, curve_loops, self.element_type.Id, room.LevelId)
+            else:
+                new_el = Floor.Create(self.doc, curve_loops, self.element_type.Id, room.LevelId)
+        else:
+            if self.is_ceiling:
+                raise Exception('Ceilings can be created only in Revit 2022+')
+            curve_array = CurveArray()
+            for curve in loops[0]:
+                curve_array.Append(curve)
+            new_el = self.doc.Create.NewFloor(curve_array, self.element_type, room.Level, False)
+
+        bip = BuiltInParameter.CEILING_HEIGHTABOVELEVEL_PARAM if self.is_ceiling else BuiltInParameter.FLOOR_HEIGHTABOVELEVEL_PARAM
+        p_offset = new_el.get_Parameter(bip)
+        if p_offset and not p_offset.IsReadOnly:
+            p_offset.Set(self.offset)
+        return new_el.Id
+
+    def _run_chunk(self, rooms_chunk, title):
+        """Function to create elements for a chunk of Rooms in a single Transaction.
+        :return: True if Transaction was committed."""
+        self.swallower.clear()
+        created = {}
+
+        with ef_Transaction(self.doc, title, debug=False, failures=self.swallower) as t:
+            for room in rooms_chunk:
+                try:
+                    created[room.Id] = self._create_element(room)
+                except Exception as e:
+                    self.failed[room.Id] = str(e)
+
+        if t.GetStatus() != TransactionStatus.Committed:
+            return False
+
+        # MATCH WARNINGS TO ROOMS
+        room_by_el_id = {el_id: room_id for room_id, el_id in created.items()}
+        for description, el_ids in self.swallower.warnings:
+            room_ids = set(room_by_el_id[el_id] for el_id in el_ids if el_id in room_by_el_id)
+            for room_id in room_ids:
+                self.warnings.setdefault(room_id, []).append(description)
+
+        self.created.update(created)
+        return True
+
+    def create(self):
+        """Function to create Floors/Ceilings for all Rooms.
+        :return: dict {Room.Id: ElementId} of created elements."""
+        if not self.boundaries:
+            self.prepare()
+
+        rooms = [r for r in self.rooms if r.Id in self.boundaries]
+        title = 'Create {}s from Rooms'.format(self.kind)
+
+        with ef_TransactionGroup(self.doc, title):
+            for n, rooms_chunk in enumerate(chunks(rooms, self.chunk_size)):
+                if self._run_chunk(rooms_chunk, '{} [{}]'.format(title, n + 1)):
+                    continue
+
+                # RETRY FAILED CHUNK ROOM BY ROOM
+                for room in rooms_chunk:
+                    if room.Id in self.failed:
+                        continue
+                    if not self._run_chunk([room], '{} [{}]'.format(title, room.Id)):
+                        errors = [d for d, _ in self.swallower.errors]
+                        self.failed[room.Id] = '; '.join(errors) if errors else 'Transaction was rolled back.'
+        return self.created
+
+    # ╔═╗╦ ╦╔╦╗╔╦╗╔═╗╦═╗╦ ╦
+    # ╚═╗║ ║║║║║║║╠═╣╠╦╝╚╦╝
+    # ╚═╝╚═╝╩ ╩╩ ╩╩ ╩╩╚═ ╩  SUMMARY
+    #==================================================
+    def print_summary(self):
+        """Function to print a summary with per-room failures and warnings."""
+        from pyrevit import script
+        output = script.get_output()
+
+        rooms_by_id = {room.Id: room for room in self.rooms}
+        print('{} {}s created from {} Rooms.'.format(len(self.created), self.kind, len(self.rooms)))
+
+        if self.failed:
+            table = [[output.linkify(room_id), get_room_label(rooms_by_id[room_id]), reason]
+                     for room_id, reason in self.failed.items()]
+            output.print_table(table_data=table, title='Failed Rooms', columns=['Room', 'Name', 'Reason'])
+
+        if self.warnings:
+            table = [[output.linkify(room_id), get_room_label(rooms_by_id[room_id]), '<br>'.join(sorted(set(descriptions)))]
+                     for room_id, descriptions in self.warnings.items()]
+            output.print_table(table_data=table, title='Warnings', columns=['Room', 'Name', 'Warnings'])
+
@@ -5,26 +5,29 @@
 # ╩╩ ╩╩  ╚═╝╩╚═ ╩  IMPORT
 #==================================================
 
+from collections import OrderedDict
+
 from Autodesk.Revit.DB import *
 from pyrevit import forms
 
 # CUSTOM IMPORTS
-from GUI.forms           import select_from_dict
-
+from GUI.forms                 import select_from_dict
+from Snippets._context_manager import chunked_transactions
+from Snippets._context         import ctx
+from Snippets._profiling       import get_element, get_parameter
 
-default_doc     = __revit__.ActiveUIDocument.Document
-default_uidoc   = __revit__.ActiveUIDocument
-default_app     = __revit__.Application
+# uidoc = None -> active UIDocument at the moment of the call (ctx.uidoc)
 
 
 
-def select_group_types(given_groups = None, uidoc = default_uidoc ,title='__title__', version = 'Version 0.1' ,exit_if_none = False):
+def select_group_types(given_groups = None, uidoc = None ,title='__title__', version = 'Version 0.1' ,exit_if_none = False):
     """Function to select group names from a list.
     :param given_groups: List of groups. If none then all groups in project will be used.
     :param uidoc:
     :param exit_if_none:
     :return: list of selected group types_names
     """
+    uidoc = uidoc or ctx.uidoc
 
     #TODO if given_groups , verify that all elements are Groups
     if not given_groups:
@@ -51,20 +54,64 @@ def select_group_types(given_groups = None, uidoc = default_uidoc ,title='__titl
 
 
 
-def select_attached_groups(list_of_groups, uidoc = default_uidoc, title="__title__", label = "Select Groups:", version = 'Version 0.1', exit_if_none = False):
+def get_attached_groups(group, doc, cache=None):
+    """Function to get available attached detail groups of a group in the order of the Revit API.
+    Result is memoised per GroupType in given cache, so instances of the same type are read only once.
+    :param group: Group instance
+    :param doc:   Revit Document
+    :param cache: dict {group_type_id: [(name, attached_group_type_id), ...]}
+    :return:      [(name, attached_group_type_id), ...]"""
+    if cache is None:
+        cache = {}
+
+    type_id = group.GetTypeId()
+    if type_id not in cache:
+        attached_groups = []
+        for a_group_id in group.GetAvailableAttachedDetailGroupTypeIds():
+            a_group      = get_element(doc, a_group_id)
+            a_group_name = get_parameter(a_group, BuiltInParameter.ALL_MODEL_TYPE_NAME).AsString()
+            attached_groups.append((a_group_name, a_group_id))
+        cache[type_id] = attached_groups
+    return cache[type_id]
+
+
+def get_attached_groups_map(group, doc, cache=None):
+    """Function to get available attached detail groups of a group as OrderedDict {name: GroupType.Id}
+    in the order of the Revit API (the last Id is kept for a repeated name).
+    :param cache: dict for get_attached_groups"""
+    names_map = OrderedDict()
+    for a_group_name, a_group_id in get_attached_groups(group, doc, cache):
+        if a_group_name:
+            names_map[a_group_name] = a_group_id
+    return names_map
+
+
+def get_attached_group_to_show(group, doc, names, cache=None):
+    """Function to get the attached group to show: the last one (in the order of the Revit API)
+    with a name from given names.
+    :param cache: dict for get_attached_groups
+    :return:      attached_group_type_id or None"""
+    attached_group_id = None
+    for a_group_name, a_group_id in get_attached_groups(group, doc, cache):
+        if a_group_name in names:
+            attached_group_id = a_group_id
+    return attached_group_id
+
+
+def select_attached_groups(list_of_groups, uidoc = None, title="__title__", label = "Select Groups:", version = 'Version 0.1', exit_if_none = False):
     """Function to select attached groups from given list of groups.
     :param list_of_groups: List containing groups from which to take attached groups.
     :return: List of selected attached groups
     """
+    uidoc = uidoc or ctx.uidoc
+    doc   = uidoc.Document
+    cache = {}
     dict_of_attached_group_names = {}
 
     for g in list_of_groups:
-        attached_groups_ids = g.GetAvailableAttachedDetailGroupTypeIds()
-        for a_group_id in attached_groups_ids:
-            a_group = uidoc.Document.GetElement(a_group_id)
-            a_group_name = a_group.get_Parameter(BuiltInParameter.ALL_MODEL_TYPE_NAME).AsString()
+        for a_group_name, a_group_id in get_attached_groups(g, doc, cache):
             if a_group_name and a_group_name not in dict_of_attached_group_names:
-                dict_of_attached_group_names[a_group_name] = a_group
+                dict_of_attached_group_names[a_group_name] = get_element(doc, a_group_id)
 
 
     selected_a_groups = select_from_dict(elements_dict = dict_of_attached_group_names,
@@ -81,24 +128,69 @@ def select_attached_groups(list_of_groups, uidoc = default_uidoc, title="__title
 
 
 
-def show_attached_group(view, group, list_a_group_names_to_show, uidoc = default_uidoc):
+def show_attached_group(view, group, list_a_group_names_to_show, uidoc = None, cache = None):
     """Function to show attached groups that match list_a_groups_to_show in the selected view for selected groups.
+    When called in a loop, pass the same cache dict, so attached groups are read only once per GroupType
+    (or use show_attached_groups for many groups and views).
     :param view:
     :param group:
     :param list_a_group_names_to_show:
+    :param cache: dict for get_attached_groups
     :return:
     """
-    all_attached_groups = group.GetAvailableAttachedDetailGroupTypeIds()
-    attached_group_id = None
-    # print("\n\nAtached Groups:")
-    for a_group_id in all_attached_groups:
-        a_group = uidoc.Document.GetElement(a_group_id)
-        a_group_name = a_group.get_Parameter(BuiltInParameter.ALL_MODEL_TYPE_NAME).AsString()
-        # print(a_group_name)
-        if a_group_name in list_a_group_names_to_show:
-            attached_group_id = a_group_id
-
+    uidoc = uidoc or ctx.uidoc
+    attached_group_id = get_attached_group_to_show(group, uidoc.Document, list_a_group_names_to_show, cache)
 
     if attached_group_id:
         print("Showing attached group on the group [{}] in view - [{}]".format(group.Id, view.Name))
         group.ShowAttachedDetailGroups(view,attached_group_id )
+
+
+
+
+def show_attached_groups(views, groups, list_a_group_names_to_show, uidoc = None, chunk_size = 500):
+    """Function to show attached groups that match list_a_group_names_to_show for many groups in many views.
+    Attached groups are resolved once per GroupType and everything is done in chunked Transactions (single Undo).
+    A summary is printed instead of a line per group.
+    :param views:                      List of Views
+    :param groups:                     List of Group instances
+    :param list_a_group_names_to_show: List of attached group names to show.
+    :return:                           (shown, failed) - counts"""
+    uidoc = uidoc or ctx.uidoc
+    doc   = uidoc.Document
+    names = set(list_a_group_names_to_show)
+    cache = {}
+
+    # PREPARE (view, group, attached_group_id)
+    items = []
+    for group in groups:
+        a_group_id = get_attached_group_to_show(group, doc, names, cache)
+        if not a_group_id:
+            continue
+        for view in views:
+            items.append((view, group, a_group_id))
+
+    # SHOW
+    counter = {'shown': 0, 'failed': 0}
+    shown   = set()     # Indexes of shown items
+    def show(i):
+        view, group, a_group_id = items[i]
+        try:
+            group.ShowAttachedDetailGroups(view, a_group_id)
+            shown.add(i)
+            counter['shown'] += 1
+        except:
+            counter['failed'] += 1
+
+    def rolled_back(chunk):
+        # Items of a rolled back chunk are not shown anymore
+        undone = shown.intersection(chunk)
+        counter['shown']  -= len(undone)
+        counter['failed'] += len(undone)
+
+    chunked_transactions(doc, 'Show Attached Groups', range(len(items)), show, chunk_size,
+                         failures=True, on_rollback=rolled_back)
+
+    print("Attached groups shown: {} (Groups: {}, Views: {}). Failed: {}.".format(
+        counter['shown'], len(groups), len(views), counter['failed']))
+    return counter['shown'], counter['failed']
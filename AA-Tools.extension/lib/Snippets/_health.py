@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import os, time, tempfile
+
+from Autodesk.Revit.DB import (FilteredElementCollector,
+                               LogicalOrFilter,
+                               ElementIsElementTypeFilter,
+                               BuiltInCategory,
+                               ElementId,
+                               Family,
+                               ImportInstance,
+                               Group,
+                               GroupType,
+                               View,
+                               ViewSheet,
+                               ViewType,
+                               Viewport,
+                               ScheduleSheetInstance)
+from Autodesk.Revit.DB.Architecture import Room
+
+# CUSTOM IMPORTS
+from Snippets._context import DocCache
+from Snippets._profiling import write_record, read_records, count_api
+from Snippets._renaming import get_document_key
+from Snippets._sheets import get_document_version_key
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+METRICS = []            # Metric classes in the order of the report
+
+HISTORY_MAX_BYTES = 512 * 1024
+HISTORY_BACKUPS   = 1
+
+# Views that can't be placed on sheets
+SKIP_VIEW_TYPES = ['ProjectBrowser', 'SystemBrowser', 'Internal', 'Undefined', 'DrawingSheet']
+
+_cache = DocCache()
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def register_metric(cls):
+    """Decorator to add a Metric class to the model health report."""
+    METRICS.append(cls)
+    return cls
+
+
+def get_history_path(doc):
+    #type:(Document) -> str
+    """Function to get the path to the time series of a document (one JSON record per line)."""
+    file_id = 'AA_Tools_health_{}'.format(get_document_key(doc))
+    try:
+        from pyrevit import script
+        return script.get_universal_data_file(file_id, 'jsonl')
+    except Exception:
+        return os.path.join(tempfile.gettempdir(), file_id + '.jsonl')
+
+
+def read_history(doc, path=None):
+    #type:(Document, str) -> list
+    """Function to read all health records of a document (oldest first)."""
+    return read_records(path or get_history_path(doc), backups=HISTORY_BACKUPS)
+
+
+def get_model_health(doc, refresh=False, path=None):
+    #type:(Document, bool, str) -> tuple
+    """Function to get model health metrics of a document.
+    Results are reused while the document version is the same (the document was not saved since):
+    from memory in the same session, otherwise from the last record of the time series.
+    New results are appended to the time series.
+    :param refresh: if True - metrics are always collected again.
+    :return:        (record, source) - source is 'memory', 'history' or 'collected'."""
+    path    = path or get_history_path(doc)
+    version = get_document_version_key(doc)
+    version = list(version) if version else None     # JSON has no tuples
+    values  = _cache.get_values(doc)
+
+    if not refresh and version:
+        cached = values.get('health')
+        if cached and cached['version'] == version:
+            return cached, 'memory'
+
+        history = read_history(doc, path)
+        if history and history[-1].get('version') == version:
+            values['health'] = history[-1]
+            return history[-1], 'history'
+
+    record            = ModelHealth(doc).collect()
+    record['version'] = version
+    write_record(record, path, max_bytes=HISTORY_MAX_BYTES, backups=HISTORY_BACKUPS)
+    values['health']  = record
+    return record, 'collected'
+
+
+# ╔╦╗╔═╗╔╦╗╦═╗╦╔═╗╔═╗
+# ║║║║╣  ║ ╠╦╝║║  ╚═╗
+# ╩ ╩╚═╝ ╩ ╩╚═╩╚═╝╚═╝ METRICS
+#====================================================================================================
+class Metric(object):
+    """Base class of a health metric.
+    Elements of given classes are passed to visit() during the shared element pass,
+    so a metric doesn't need its own FilteredElementCollector.
+
+    Example:
+        @register_metric
+        class TextNotes(Metric):
+            classes = (TextNote,)
+            def visit(self, element):
+                self.count += 1
+            def values(self):
+                return [('Text Notes', self.count)]"""
+    classes = ()        # Element classes that are passed to visit()
+
+    def __init__(self, doc):
+        self.doc   = doc
+        self.count = 0
+
+    def visit(self, element):
+        self.count += 1
+
+    def values(self):
+        #type:() -> list
+        """:return: [(name, value), ...]"""
+        return []
+
+
+@register_metric
+class WarningsMetric(Metric):
+    def values(self):
+        return [('Warnings', len(self.doc.GetWarnings()))]
+
+
+@register_metric
+class ImportsMetric(Metric):
+    classes = (ImportInstance,)
+
+    def __init__(self, doc):
+        super(ImportsMetric, self).__init__(doc)
+        self.linked = 0
+
+    def visit(self, element):
+        if element.IsLinked:
+            self.linked += 1
+        else:
+            self.count  += 1
+
+    def values(self):
+        return [('CAD Imports', self.count), ('CAD Links', self.linked)]
+
+
+@register_metric
+class InPlaceFamiliesMetric(Metric):
+    classes = (Family,)
+
+    def visit(self, element):
+        if element.IsInPlace:
+            self.count += 1
+
+    def values(self):
+        return [('In-Place Families', self.count)]
+
+
+@register_metric
+class RoomsMetric(Metric):
+    """Rooms with Area 0: without Location - unplaced, otherwise not enclosed or redundant."""
+    classes = (Room,)
+
+    def __init__(self, doc):
+        super(RoomsMetric, self).__init__(doc)
+        self.unplaced  = 0
+        self.redundant = 0
+
+    def visit(self, room):
+        self.count += 1
+        if room.Area > 0:
+            return
+        if room.Location is None:
+            self.unplaced  += 1
+        else:
+            self.redundant += 1
+
+    def values(self):
+        return [('Rooms', self.count), ('Unplaced Rooms', self.unplaced),
+                ('Not Enclosed/Redundant Rooms', self.redundant)]
+
+
+@register_metric
+class ViewsMetric(Metric):
+    """Views that are not placed on any sheet (View Templates, Sheets and browsers are not counted)."""
+    classes = (View, Viewport, ScheduleSheetInstance)
+
+    def __init__(self, doc):
+        super(ViewsMetric, self).__init__(doc)
+        self.views     = []
+        self.placed    = set()
+        self.skip      = set(getattr(ViewType, name) for name in SKIP_VIEW_TYPES)
+
+    def visit(self, element):
+        if isinstance(element, Viewport):
+            self.placed.add(element.ViewId)
+        elif isinstance(element, ScheduleSheetInstance):
+            self.placed.add(element.ScheduleId)
+        elif not (element.IsTemplate or isinstance(element, ViewSheet) or element.ViewType in self.skip or
+                  getattr(element, 'IsTitleblockRevisionSchedule', False)):
+            self.views.append(element.Id)
+
+    def values(self):
+        return [('Views', len(self.views)), ('Views not on Sheets', sum(1 for v in self.views if v not in self.placed))]
+
+
+@register_metric
+class GroupsMetric(Metric):
+    """Detail Groups incl. Attached Detail Groups, all other groups are Model Groups."""
+    classes = (Group, GroupType)
+
+    def __init__(self, doc):
+        super(GroupsMetric, self).__init__(doc)
+        self.model  = 0
+        self.detail = 0
+        self.types  = set()
+        self.used   = set()
+        self.detail_categories = set(ElementId(bic) for bic in (BuiltInCategory.OST_IOSDetailGroups,
+                                                                BuiltInCategory.OST_IOSAttachedDetailGroups))
+
+    def visit(self, element):
+        if isinstance(element, GroupType):
+            self.types.add(element.Id)
+            return
+        self.used.add(element.GetTypeId())
+        if element.Category and element.Category.Id in self.detail_categories:
+            self.detail += 1
+        else:
+            self.model  += 1
+
+    def values(self):
+        return [('Model Groups', self.model), ('Detail Groups', self.detail),
+                ('Unused Group Types', len(self.types - self.used))]
+
+
+@register_metric
+class FileSizeMetric(Metric):
+    def values(self):
+        path = self.doc.PathName
+        size = round(os.path.getsize(path) / (1024.0 * 1024.0), 1) if path and os.path.exists(path) else None
+        return [('File Size [MB]', size)]
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class ModelHealth(object):
+    """Collects all registered metrics (see register_metric) with a single pass over all elements.
+    Every element is passed only to metrics that are interested in its class.
+
+    Example:
+        record, source = get_model_health(doc)      # cached per document version
+        record         = ModelHealth(doc).collect() # always collected"""
+
+    def __init__(self, doc, metrics=None):
+        """
+        :param doc:     Revit Document
+        :param metrics: List of Metric classes. Default: METRICS"""
+        self.doc     = doc
+        self.metrics = [cls(doc) for cls in (metrics or METRICS)]
+
+    def collect(self):
+        #type:() -> dict
+        """Function to read all elements once and get values of all metrics.
+        :return: {'time', 'document', 'seconds', 'metrics': [[name, value], ...]}"""
+        start    = time.time()
+        handlers = {}       # {python type: [metrics]} - isinstance is resolved once per type
+        elements = 0
+
+        everything = LogicalOrFilter(ElementIsElementTypeFilter(False), ElementIsElementTypeFilter(True))
+        for element in FilteredElementCollector(self.doc).WherePasses(everything):
+            elements += 1
+            cls = type(element)
+            if cls not in handlers:
+                handlers[cls] = [m for m in self.metrics if m.classes and isinstance(element, m.classes)]
+            for metric in handlers[cls]:
+                metric.visit(element)
+        count_api('collector_passes')
+
+        values = [['Elements', elements]]
+        for metric in self.metrics:
+            values.extend([name, value] for name, value in metric.values())
+
+        return {'time':     time.strftime('%Y-%m-%d %H:%M:%S'),
+                'document': self.doc.Title,
+                'seconds':  round(time.time() - start, 3),
+                'metrics':  values}
@@ -11,13 +11,8 @@ from Autodesk.Revit.DB import *
 # ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
 #  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
 #==================================================
-uidoc   = __revit__.ActiveUIDocument
 app     = __revit__.Application
-doc     = __revit__.ActiveUIDocument.Document
-
-active_view_id      = doc.ActiveView.Id
-active_view         = doc.GetElement(active_view_id)
-active_view_level   = active_view.GenLevel
+# Active document/view are taken from given uidoc (or Snippets._context.ctx), not at import time.
 
 # ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
 # ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
@@ -63,11 +58,14 @@ def get_line_styles(uidoc):
 
     :return: list of Available LineStyles"""
 
+    doc         = uidoc.Document
+    active_view = doc.ActiveView
+
     # CREATE TEMP LINE
     with Transaction(doc, "temp - Create DetailLine") as t:
         t.Start()
         new_line         = Line.CreateBound(XYZ(0,0,0), XYZ(1,1,0))
-        random_line      = uidoc.Document.Create.NewDetailCurve(active_view, new_line)
+        random_line      = doc.Create.NewDetailCurve(active_view, new_line)
         line_styles_ids  = random_line.GetLineStyleIds()
         t.RollBack()
     line_styles = [doc.GetElement(line_style) for line_style in line_styles_ids]
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import math
+from array import array
+from collections import namedtuple
+
+from Autodesk.Revit.DB import (FilteredElementCollector,
+                               RevitLinkInstance,
+                               RevitLinkType,
+                               CADLinkType,
+                               CategoryType,
+                               BuiltInCategory,
+                               ElementMulticategoryFilter,
+                               TransactionStatus)
+from System.Collections.Generic import List
+
+# CUSTOM IMPORTS
+from Snippets._boundingbox import get_BB_extents
+from Snippets._context import DocCache
+from Snippets._context_manager import ef_Transaction
+from Snippets._profiling import count_api
+from Snippets._sheets import get_document_version_key
+from Snippets._worksharing import PreCheckout
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def get_all_links(doc):
+    #type:(Document) -> list
+    """Function to get all Revit link instances, Revit link types and CAD link types."""
+    elements = []
+    for cls in (RevitLinkInstance, RevitLinkType, CADLinkType):
+        elements.extend(FilteredElementCollector(doc).OfClass(cls).ToElements())
+        count_api('collector_passes')
+    return elements
+
+
+def get_loaded_links(doc):
+    #type:(Document) -> list
+    """Function to get all RevitLinkInstances with a loaded link document."""
+    return [link for link in FilteredElementCollector(doc).OfClass(RevitLinkInstance)
+            if link.GetLinkDocument() is not None]
+
+
+def get_transform_key(transform):
+    #type:(Transform) -> tuple
+    """Function to read a Transform once into a plain tuple.
+    :return: (origin x, y, z, BasisX x, y, z, BasisY x, y, z, BasisZ x, y, z)"""
+    return tuple(v for pt in (transform.Origin, transform.BasisX, transform.BasisY, transform.BasisZ)
+                 for v in (pt.X, pt.Y, pt.Z))
+
+
+def transform_extents(extents, tf):
+    #type:(tuple, tuple) -> tuple
+    """Function to transform extents and get new axis-aligned extents that contain the transformed box
+    (same result as transforming all 8 corners, but only with float math).
+    :param extents: (min_x, min_y, min_z, max_x, max_y, max_z)
+    :param tf:      Transform tuple from get_transform_key
+    :return:        (min_x, min_y, min_z, max_x, max_y, max_z)"""
+    lo = list(tf[0:3])
+    hi = list(tf[0:3])
+    for axis in range(3):                   # input axis: X, Y, Z
+        a, b = extents[axis], extents[axis + 3]
+        for out in range(3):                # output coordinate: x, y, z
+            basis = tf[3 + axis * 3 + out]
+            e, f  = basis * a, basis * b
+            if e < f:
+                lo[out] += e
+                hi[out] += f
+            else:
+                lo[out] += f
+                hi[out] += e
+    return (lo[0], lo[1], lo[2], hi[0], hi[1], hi[2])
+
+
+def get_element_extents(element):
+    """Function to get extents of an element from its BoundingBox (None if it doesn't have one)."""
+    BB = element.get_BoundingBox(None)
+    if BB:
+        return get_BB_extents(BB)
+
+
+def remove_all_links(doc, debug=True, blocked=None):
+    #type:(Document, bool, dict) -> int
+    """Function to remove all Revit and CAD links/imports in a single Transaction.
+    Elements owned by other users in workshared models are skipped.
+    :param blocked: dict that is updated with skipped elements {ElementId: reason}.
+    :return: Amount of deleted link instances and types.
+    :raise:  Exception if the Transaction was rolled back (nothing was deleted)."""
+    # Checkout everything at once (workshared models) and skip elements owned by other users
+    elements = get_all_links(doc)
+    pre      = PreCheckout(doc, elements)
+
+    deleted = 0
+    with ef_Transaction(doc, "Remove All Links", debug=debug, checkout=pre) as t:
+        for element in pre.filter(elements):
+            if element.IsValidObject:
+                doc.Delete(element.Id)
+                count_api('Delete')
+                deleted += 1
+
+    if blocked is not None:
+        blocked.update(pre.blocked)
+    if t.GetStatus() != TransactionStatus.Committed:
+        raise Exception('Transaction [Remove All Links] was rolled back - nothing was deleted.')
+    return deleted
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class LinkedHit(namedtuple('LinkedHit', ['link', 'element_id'])):
+    """Element of a linked document found by LinkedElementIndex."""
+
+    @property
+    def element(self):
+        return self.link.GetLinkDocument().GetElement(self.element_id)
+
+
+class LinkedElements(object):
+    """Model elements of a single RevitLinkInstance with their BoundingBoxes in host coordinates.
+
+    Extents are stored in a flat array('d') (6 values per element) and placed into a 2D grid of cells,
+    so queries only compare floats of elements from matching cells.
+    Use LinkedElements.get(doc, link) to reuse cached data - it's collected again only
+    if the link was reloaded (new link document or version) or moved (transform)."""
+    _cache = DocCache()
+
+    def __init__(self, link, categories=None, cell_size=20.0):
+        """
+        :param link:       RevitLinkInstance with a loaded link document
+        :param categories: List of BuiltInCategories. Default: all model categories.
+        :param cell_size:  Size of a grid cell in feet."""
+        self.link      = link
+        self.link_doc  = link.GetLinkDocument()
+        self.key       = self.get_key(link)
+        self.cell_size = float(cell_size)
+        self.ids       = []             # [ElementId, ...]
+        self.extents   = array('d')     # [min_x, min_y, min_z, max_x, max_y, max_z, ...] per element (host coordinates)
+        self.bounds    = None           # Extents of all elements
+        self._grid     = {}             # {(ix, iy): [index, ...]}
+        self.build(categories)
+
+    @staticmethod
+    def get_key(link):
+        """Key that changes when a link is reloaded or moved."""
+        link_doc = link.GetLinkDocument()
+        return (link_doc.GetHashCode(), get_document_version_key(link_doc),
+                get_transform_key(link.GetTotalTransform()))
+
+    @classmethod
+    def get(cls, doc, link, categories=None, cell_size=20.0):
+        #type:(Document, RevitLinkInstance, list, float) -> LinkedElements
+        """Function to get cached LinkedElements of a link in the host document."""
+        values = cls._cache.get_values(doc)
+        key    = (cls, link.Id, tuple(categories) if categories else None, cell_size)
+        cached = values.get(key)
+        if not cached or cached.key != cls.get_key(link):
+            cached = values[key] = cls(link, categories, cell_size)
+        return cached
+
+    def _cells(self, min_x, min_y, max_x, max_y):
+        """Generator of grid cells that overlap given extents."""
+        size = self.cell_size
+        for ix in range(int(math.floor(min_x / size)), int(math.floor(max_x / size)) + 1):
+            for iy in range(int(math.floor(min_y / size)), int(math.floor(max_y / size)) + 1):
+                yield (ix, iy)
+
+    def build(self, categories=None):
+        """Function to read BoundingBoxes of linked elements once and transform them into host coordinates."""
+        collector = FilteredElementCollector(self.link_doc).WhereElementIsNotElementType()
+        if categories:
+            collector = collector.WherePasses(ElementMulticategoryFilter(List[BuiltInCategory](categories)))
+
+        tf     = get_transform_key(self.link.GetTotalTransform())
+        bounds = None
+        for element in collector:
+            cat = element.Category
+            if cat is None or cat.CategoryType != CategoryType.Model:
+                continue
+            extents = get_element_extents(element)
+            if not extents:
+                continue
+            extents = transform_extents(extents, tf)
+
+            index = len(self.ids)
+            self.ids.append(element.Id)
+            self.extents.extend(extents)
+            for cell in self._cells(extents[0], extents[1], extents[3], extents[4]):
+                self._grid.setdefault(cell, []).append(index)
+
+            bounds = extents if bounds is None else (min(bounds[0], extents[0]), min(bounds[1], extents[1]),
+                                                     min(bounds[2], extents[2]), max(bounds[3], extents[3]),
+                                                     max(bounds[4], extents[4]), max(bounds[5], extents[5]))
+        self.bounds = bounds
+
+    def query(self, extents, inside=False):
+        #type:(tuple, bool) -> list
+        """Function to find elements that intersect given extents (host coordinates).
+        :param extents: (min_x, min_y, min_z, max_x, max_y, max_z)
+        :param inside:  if True - only elements that are completely inside the extents.
+        :return:        List of indexes (see self.ids)"""
+        b = self.bounds
+        min_x, min_y, min_z, max_x, max_y, max_z = extents
+        if b is None or b[0] > max_x or b[3] < min_x or b[1] > max_y or b[4] < min_y or b[2] > max_z or b[5] < min_z:
+            return []
+
+        values = self.extents
+        found  = set()
+        for cell in self._cells(min_x, min_y, max_x, max_y):
+            for i in self._grid.get(cell, ()):
+                if i in found:
+                    continue
+                o = i * 6
+                if inside:
+                    hit = (min_x <= values[o]     and values[o + 3] <= max_x and
+                           min_y <= values[o + 1] and values[o + 4] <= max_y and
+                           min_z <= values[o + 2] and values[o + 5] <= max_z)
+                else:
+                    hit = (values[o]     <= max_x and min_x <= values[o + 3] and
+                           values[o + 1] <= max_y and min_y <= values[o + 4] and
+                           values[o + 2] <= max_z and min_z <= values[o + 5])
+                if hit:
+                    found.add(i)
+        return sorted(found)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class LinkedElementIndex(object):
+    """Index of elements in all loaded Revit links of a document for clash-style queries
+    ("which linked elements are near/inside this host element") without opening the links.
+
+    Each link is collected once (see LinkedElements) and reused until it's reloaded or moved.
+
+    Example:
+        index = LinkedElementIndex(doc, [BuiltInCategory.OST_DuctCurves, BuiltInCategory.OST_PipeCurves])
+        for hit in index.near(wall, tolerance=0.5):
+            print(hit.link.Name, hit.element.Name)
+        for hit in index.inside(room):
+            ..."""
+
+    def __init__(self, doc, categories=None, cell_size=20.0):
+        """
+        :param doc:        Host Document
+        :param categories: List of BuiltInCategories of linked elements. Default: all model categories.
+        :param cell_size:  Size of a grid cell in feet."""
+        self.doc   = doc
+        self.links = [LinkedElements.get(doc, link, categories, cell_size) for link in get_loaded_links(doc)]
+
+    def query(self, extents, tolerance=0.0, inside=False):
+        #type:(tuple, float, bool) -> list
+        """Function to find linked elements by extents in host coordinates.
+        :param extents:   (min_x, min_y, min_z, max_x, max_y, max_z)
+        :param tolerance: Extents are enlarged by tolerance (feet) in all directions.
+        :param inside:    if True - only elements that are completely inside the extents.
+        :return:          List of LinkedHit"""
+        if tolerance:
+            extents = tuple(v - tolerance for v in extents[:3]) + tuple(v + tolerance for v in extents[3:])
+        hits = []
+        for linked in self.links:
+            hits.extend(LinkedHit(linked.link, linked.ids[i]) for i in linked.query(extents, inside))
+        return hits
+
+    def near(self, element, tolerance=0.0):
+        #type:(Element, float) -> list
+        """Function to find linked elements whose BoundingBox intersects the BoundingBox of a host element.
+        :param tolerance: Distance in feet that still counts as near."""
+        extents = get_element_extents(element)
+        return self.query(extents, tolerance) if extents else []
+
+    def inside(self, element, tolerance=0.0):
+        #type:(Element, float) -> list
+        """Function to find linked elements whose BoundingBox is completely inside the BoundingBox of a host element."""
+        extents = get_element_extents(element)
+        return self.query(extents, tolerance, inside=True) if extents else []
+
+    def __len__(self):
+        return sum(len(linked) for linked in self.links)
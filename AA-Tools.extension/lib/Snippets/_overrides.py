@@ -1,69 +1,217 @@
 # -*- coding: utf-8 -*-
-from Autodesk.Revit.DB import ElementId, OverrideGraphicSettings, Color
+import colorsys
+
+from Autodesk.Revit.DB import (ElementId, OverrideGraphicSettings, Color,
+                               FilteredElementCollector, FillPatternElement, StorageType)
+
+# CUSTOM IMPORTS
+from Snippets._context_manager import chunked_transactions
 def override_graphics_region(doc, view, region,
                              fg_pattern_id, fg_color,
                              bg_pattern_id, bg_color,
-                             line_color = None, line_pattern_id=None, lineweight= None):
+                             line_color = None, line_pattern_id=None, lineweight= None, batch = None):
     """Function to ovverride given region with the override settings.
+    Surface colour is white if a pattern is not given (ElementId(-1)).
+    Settings are reused from a BatchOverrides, this function runs inside of the caller's Transaction.
+    Use BatchOverrides.add/apply to override many regions in chunked Transactions.
+    Region is not deleted if the overrides can't be applied (e.g. model pattern is used).
     :param doc:             Revit Document
     :param region:          FilledRegion to apply OverrideGraphicsSettings
     :param fg_pattern_id:   Foreground - Pattern id
     :param fg_color:        Foreground - Colour
     :param bg_pattern_id:   Background - Pattern id
     :param bg_color:        Background - Colour
-    :return:                None """
+    :param batch:           BatchOverrides to reuse settings from. Default: shared one of this module.
+    :return:                True if overrides were applied"""
     try:
-        override_settings = OverrideGraphicSettings()
-        if fg_pattern_id != ElementId(-1):
-            override_settings.SetSurfaceForegroundPatternId(fg_pattern_id)
-            override_settings.SetSurfaceForegroundPatternColor(fg_color)
-        else:
-            override_settings.SetSurfaceForegroundPatternColor(Color(255, 255, 255))
-
-        if bg_pattern_id != ElementId(-1):
-            override_settings.SetSurfaceBackgroundPatternId(bg_pattern_id)
-            override_settings.SetSurfaceBackgroundPatternColor(bg_color)
-        else:
-            override_settings.SetSurfaceBackgroundPatternColor(Color(255, 255, 255))
-
-        # LINE
-        if line_color:      override_settings.SetProjectionLineColor(line_color)
-        if line_pattern_id: override_settings.SetProjectionLinePatternId(line_pattern_id)
-        if lineweight:      override_settings.SetProjectionLineWeight(lineweight)
+        no_pattern = ElementId(-1)
+        if fg_pattern_id == no_pattern: fg_color = Color(255, 255, 255)
+        if bg_pattern_id == no_pattern: bg_color = Color(255, 255, 255)
 
+        _, override_settings = (batch or _shared_settings).get_settings(fg_pattern_id, fg_color,
+                                                                        bg_pattern_id, bg_color,
+                                                                        line_color, line_pattern_id, lineweight)
         view.SetElementOverrides(region.Id, override_settings)
-
-    except:
-        # DELETE REGIONS IF MODEL PATTERN IS USED ?
-        doc.Delete(region.Id)
+        return True
+    except Exception as e:
+        print("Could not override region {}: {}".format(getattr(region, "Id", region), e))
+        return False
 
 
 
 
 def override_graphics_line(doc, view, line,
-                             line_color = None, line_pattern_id=None, lineweight= None):
-    """Function to ovverride given region with the override settings.
+                             line_color = None, line_pattern_id=None, lineweight= None, batch = None):
+    """Function to ovverride given line with the override settings.
+    Settings are reused from a BatchOverrides, this function runs inside of the caller's Transaction.
     :param doc:             Revit Document
     :param line:            DetailCurve to apply OverrideGraphicsSettings
-    :param fg_pattern_id:   Foreground - Pattern id
-    :param fg_color:        Foreground - Colour
-    :param bg_pattern_id:   Background - Pattern id
-    :param bg_color:        Background - Colour
-    :return:                None """
-
+    :param line_color:      Line - Colour
+    :param line_pattern_id: Line - Pattern id
+    :param lineweight:      Line - Weight
+    :param batch:           BatchOverrides to reuse settings from. Default: shared one of this module.
+    :return:                True if overrides were applied"""
     try:
-        override_settings = OverrideGraphicSettings()
-        # LINE
-        if line_color:      override_settings.SetProjectionLineColor(line_color)
-        if line_pattern_id: override_settings.SetProjectionLinePatternId(line_pattern_id)
-        if lineweight:      override_settings.SetProjectionLineWeight(lineweight)
-
+        _, override_settings = (batch or _shared_settings).get_settings(line_color=line_color,
+                                                                        line_pattern_id=line_pattern_id,
+                                                                        lineweight=lineweight)
         view.SetElementOverrides(line.Id, override_settings)
+        return True
+    except Exception as e:
+        print("Could not override line {}: {}".format(getattr(line, "Id", line), e))
+        return False
+
+
+
+
+# ╔╗ ╔═╗╔╦╗╔═╗╦ ╦  ╔═╗╦  ╦╔═╗╦═╗╦═╗╦╔╦╗╔═╗╔═╗
+# ╠╩╗╠═╣ ║ ║  ╠═╣  ║ ║╚╗╔╝║╣ ╠╦╝╠╦╝║ ║║║╣ ╚═╗
+# ╚═╝╩ ╩ ╩ ╚═╝╩ ╩  ╚═╝ ╚╝ ╚═╝╩╚═╩╚═╩═╩╝╚═╝╚═╝ BATCH OVERRIDES
+#====================================================================================================
+def _id_key(el_id):
+    return str(el_id) if el_id else None
+
+def _color_key(color):
+    return (color.Red, color.Green, color.Blue) if color else None
+
+
+class BatchOverrides(object):
+    """Class to apply OverrideGraphicSettings to many elements at once.
+
+    - Identical settings are created only once and reused (interned by key).
+    - Elements are grouped per View.
+    - Settings are applied in chunked Transactions (single Undo).
+    - Elements that failed are reported instead of being deleted.
+
+    Example:
+        batch = BatchOverrides(doc)
+        for el in elements:
+            batch.add(view, el.Id, fg_pattern_id=solid_id, fg_color=Color(255,0,0))
+        failed = batch.apply()"""
+
+    def __init__(self, doc):
+        self.doc      = doc
+        self.settings = {}      # {key: OverrideGraphicSettings}
+        self.groups   = {}      # {view_id: {key: [ElementId, ...]}}
+        self.views    = {}      # {view_id: View}
+        self.failed   = []      # [(view_id, ElementId, error), ...]
+
+    def get_settings(self, fg_pattern_id=None, fg_color=None, bg_pattern_id=None, bg_color=None,
+                     line_color=None, line_pattern_id=None, lineweight=None):
+        """Function to get OverrideGraphicSettings for given options.
+        Settings with the same options are created only once.
+        :return: (key, OverrideGraphicSettings)"""
+        key = (_id_key(fg_pattern_id), _color_key(fg_color), _id_key(bg_pattern_id), _color_key(bg_color),
+               _color_key(line_color), _id_key(line_pattern_id), lineweight)
+
+        if key not in self.settings:
+            override_settings = OverrideGraphicSettings()
+            if fg_pattern_id and fg_pattern_id != ElementId(-1):
+                override_settings.SetSurfaceForegroundPatternId(fg_pattern_id)
+            if fg_color:        override_settings.SetSurfaceForegroundPatternColor(fg_color)
+            if bg_pattern_id and bg_pattern_id != ElementId(-1):
+                override_settings.SetSurfaceBackgroundPatternId(bg_pattern_id)
+            if bg_color:        override_settings.SetSurfaceBackgroundPatternColor(bg_color)
+            if line_color:      override_settings.SetProjectionLineColor(line_color)
+            if line_pattern_id: override_settings.SetProjectionLinePatternId(line_pattern_id)
+            if lineweight:      override_settings.SetProjectionLineWeight(lineweight)
+            self.settings[key] = override_settings
+
+        return key, self.settings[key]
+
+    def add(self, view, element_id, **kwargs):
+        """Function to add an element to override. kwargs are the same as in get_settings()."""
+        key, _ = self.get_settings(**kwargs)
+        self.views[view.Id] = view
+        self.groups.setdefault(view.Id, {}).setdefault(key, []).append(element_id)
+
+    def _apply_one(self, item):
+        view_id, key, el_id = item
+        try:
+            self.views[view_id].SetElementOverrides(el_id, self.settings[key])
+        except Exception as e:
+            self.failed.append((view_id, el_id, str(e)))
+
+    def apply(self, title='Override Graphics', chunk_size=1000):
+        """Function to apply all overrides.
+        :return: list of failed (view_id, ElementId, error)"""
+        items = [(view_id, key, el_id)
+                 for view_id, groups in self.groups.items()
+                 for key, el_ids in groups.items()
+                 for el_id in el_ids]
+        chunked_transactions(self.doc, title, items, self._apply_one, chunk_size, failures=True)
+        return self.failed
+
+
+_shared_settings = BatchOverrides(None)     # Only its settings are used (override_graphics_region/line)
+
+
+# ╔═╗╔═╗╦  ╔═╗╦═╗  ╔╗ ╦ ╦  ╔═╗╔═╗╦═╗╔═╗╔╦╗╔═╗╔╦╗╔═╗╦═╗
+# ║  ║ ║║  ║ ║╠╦╝  ╠╩╗╚╦╝  ╠═╝╠═╣╠╦╝╠═╣║║║║╣  ║ ║╣ ╠╦╝
+# ╚═╝╚═╝╩═╝╚═╝╩╚═  ╚═╝ ╩   ╩  ╩ ╩╩╚═╩ ╩╩ ╩╚═╝ ╩ ╚═╝╩╚═ COLOR BY PARAMETER
+#====================================================================================================
+def get_solid_fill_pattern_id(doc):
+    """Function to get ElementId of a Solid Fill pattern (Drafting)."""
+    for fp in FilteredElementCollector(doc).OfClass(FillPatternElement):
+        if fp.GetFillPattern().IsSolidFill:
+            return fp.Id
+
+
+def generate_palette(n, saturation=0.6, value=0.95):
+    """Function to generate n distinct colors by spreading Hue with the golden ratio.
+    :return: list of Color"""
+    colors = []
+    hue    = 0.0
+    for i in range(n):
+        r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
+        colors.append(Color(int(r * 255), int(g * 255), int(b * 255)))
+        hue = (hue + 0.618033988749895) % 1
+    return colors
+
+
+def get_parameter_value(element, param_name, type_cache=None):
+    """Function to get a parameter value as a string from an element or its type.
+    :param type_cache: dict {type_id: ElementType} to avoid repeated GetElement calls."""
+    p = element.LookupParameter(param_name)
+    if not p:
+        type_id = element.GetTypeId()
+        if type_cache is not None:
+            if type_id not in type_cache:
+                type_cache[type_id] = element.Document.GetElement(type_id)
+            el_type = type_cache[type_id]
+        else:
+            el_type = element.Document.GetElement(type_id)
+        p = el_type.LookupParameter(param_name) if el_type else None
+    if not p or not p.HasValue:
+        return None
+    if p.StorageType == StorageType.String:
+        return p.AsString()
+    return p.AsValueString()
 
-    except:
-        import traceback
-        print(traceback.format_exc())
 
+def color_elements_by_parameter(doc, view, elements, param_name, color_lines=True):
+    """Function to override elements in a view with a color per distinct parameter value.
+    Values are read in a single pass and the palette is computed once for all distinct values.
+    :return: (dict {value: Color}, list of failed elements)"""
+    # READ VALUES
+    type_cache = {}
+    values     = {}     # {value: [ElementId, ...]}
+    for el in elements:
+        value = get_parameter_value(el, param_name, type_cache)
+        values.setdefault(value, []).append(el.Id)
 
+    # PALETTE
+    sorted_values = sorted(values.keys(), key=lambda v: (v is None, v))
+    palette       = dict(zip(sorted_values, generate_palette(len(sorted_values))))
 
+    # OVERRIDES
+    solid_id = get_solid_fill_pattern_id(doc)
+    batch    = BatchOverrides(doc)
+    for value, el_ids in values.items():
+        color = palette[value]
+        for el_id in el_ids:
+            batch.add(view, el_id, fg_pattern_id=solid_id, fg_color=color,
+                      line_color=color if color_lines else None)
 
+    failed = batch.apply(title='Color by Parameter: {}'.format(param_name))
+    return palette, failed
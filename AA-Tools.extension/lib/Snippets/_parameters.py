@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import re
+from collections import OrderedDict
+
+from Autodesk.Revit.DB import BuiltInParameter, StorageType
+
+# CUSTOM IMPORTS
+from Snippets._context_manager import chunked_transactions
+from Snippets._renaming import WordReplacer, IGNORE_CASE, REMOVE_WORD
+from Snippets._worksharing import PreCheckout
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+RE_BUILTIN_NAME = re.compile(r'^[A-Z][A-Z0-9]*(_[A-Z0-9]+)+$')     # e.g. ALL_MODEL_INSTANCE_COMMENTS
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def resolve_parameter(elements, target):
+    """Function to resolve a parameter once, so it can be read with element.get_Parameter(key)
+    instead of a LookupParameter(name) string lookup per element.
+    :param elements: Elements that have this parameter (the first one that has it is used)
+    :param target:   BuiltInParameter, BuiltInParameter name ('ALL_MODEL_MARK') or parameter name ('Comments')
+    :return:         BuiltInParameter, shared parameter GUID or Definition (None if no element has it)"""
+    if not isinstance(target, str):
+        return target                                       # BuiltInParameter, Guid or Definition
+
+    if RE_BUILTIN_NAME.match(target):
+        try:
+            return getattr(BuiltInParameter, target)
+        except AttributeError:
+            pass
+
+    for element in elements:
+        p = element.LookupParameter(target)
+        if p is None:
+            continue
+        if p.Definition.BuiltInParameter != BuiltInParameter.INVALID:
+            return p.Definition.BuiltInParameter
+        if p.IsShared:
+            return p.GUID
+        return p.Definition                                 # Project parameter
+    return None
+
+
+def apply_changes(doc, changes, title='Parameter Batch Edit', chunk_size=500, debug=True):
+    """Function to write changed cells [(target, Parameter, old value, new value), ...]
+    in chunked Transactions (single TransactionGroup). Changes of many ParameterBatchEditors can be combined.
+    Has to be called outside of a Transaction (elements are checked out in workshared models).
+    :return: List of changes that were not written (owned by other users, invalid or rolled back)."""
+    owners = dict((p.Element.Id, p.Element) for _, p, _, _ in changes)
+    pre    = PreCheckout(doc, owners.values())
+    pre.run()
+    if debug:
+        pre.report()
+
+    def write(change):
+        try:
+            change[1].Set(change[3])
+        except Exception:
+            pass    # e.g. duplicate View Name - only this cell is skipped, not the whole chunk
+
+    editable = [c for c in changes if pre.is_editable(c[1].Element)]
+    chunked_transactions(doc, title, editable, write, chunk_size=chunk_size, debug=debug, failures=True)
+
+    # Skipped cells and chunks that were rolled back still have old values
+    return [c for c in changes if (c[1].AsString() or '') != c[3]]
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class ParameterBatchEditor(object):
+    """Batch editor for text parameters of many elements.
+
+    - Every target parameter is resolved once (BuiltInParameter, shared parameter GUID or Definition).
+    - Values are read column-wise (one target at a time) into plain Python lists.
+    - Changes are computed in pure Python, only changed cells are written in chunked Transactions
+      (single Undo, elements owned by other users are skipped in workshared models).
+
+    Example:
+        editor  = ParameterBatchEditor(doc, elements, ['Comments', 'ALL_MODEL_MARK', 'Zone'])
+        changes = editor.plan_replace(load_mapping())
+        failed  = editor.apply(changes)"""
+
+    def __init__(self, doc, elements, targets):
+        """
+        :param doc:      Revit Document
+        :param elements: Elements to edit
+        :param targets:  List of BuiltInParameters, BuiltInParameter names or parameter names"""
+        self.doc      = doc
+        self.elements = list(elements)
+        self.keys     = OrderedDict((target, resolve_parameter(self.elements, target)) for target in targets)
+        self.columns  = None
+
+    @property
+    def missing(self):
+        """List of targets that were not found on any element."""
+        return [target for target, key in self.keys.items() if key is None]
+
+    def read(self):
+        """Function to read all target values column-wise. Only editable text parameters are read.
+        :return: {target: [(Parameter, value), ...]}"""
+        self.columns = OrderedDict()
+        for target, key in self.keys.items():
+            column = []
+            if key is not None:
+                for element in self.elements:
+                    p = element.get_Parameter(key)
+                    if p is None or p.IsReadOnly or p.StorageType != StorageType.String:
+                        continue
+                    column.append((p, p.AsString() or ''))
+            self.columns[target] = column
+        return self.columns
+
+    def plan(self, func):
+        """Function to compute new values in pure Python.
+        :param func: function(value) -> new value
+        :return:     List of changed cells [(target, Parameter, old value, new value), ...]"""
+        if self.columns is None:
+            self.read()
+        changes = []
+        for target, column in self.columns.items():
+            for p, value in column:
+                new_value = func(value)
+                if new_value != value:
+                    changes.append((target, p, value, new_value))
+        return changes
+
+    def plan_replace(self, mapping, ignore_case=IGNORE_CASE, remove=REMOVE_WORD):
+        """Function to compute a whole-word find/replace with a mapping {find: replace} (see WordReplacer)."""
+        return self.plan(WordReplacer(mapping, ignore_case, remove))
+
+    def apply(self, changes, title='Parameter Batch Edit', chunk_size=500, debug=True):
+        """Function to write changed cells (see apply_changes).
+        :return: List of changes that were not written (owned by other users or rolled back)."""
+        return apply_changes(self.doc, changes, title, chunk_size, debug)
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import io, os, json, time, tempfile
+
+# CUSTOM IMPORTS
+from Snippets._csv import to_text
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+LOG_NAME      = 'AA_Tools_profile'
+LOG_MAX_BYTES = 1024 * 1024     # Log is rotated when it gets bigger than 1 MB
+LOG_BACKUPS   = 3               # AA_Tools_profile.jsonl.1 ... .3
+
+_sessions = []      # Open ProfileSessions. profiled() records into the last one.
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def get_memory():
+    #type:() -> int
+    """Function to get memory used by the current process in bytes (0 if it can't be measured).
+    IronPython: managed heap size (System.GC.GetTotalMemory). CPython: tracemalloc (if tracing) or max RSS."""
+    try:
+        from System import GC
+        return int(GC.GetTotalMemory(False))
+    except Exception:
+        pass
+    try:
+        import tracemalloc
+        if tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+    except ImportError:
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except Exception:
+        return 0
+
+
+def get_command_name():
+    #type:() -> str
+    """Function to get the name of the running pyRevit command."""
+    try:
+        from pyrevit import EXEC_PARAMS
+        return EXEC_PARAMS.command_name or 'Unknown'
+    except Exception:
+        return 'Unknown'
+
+
+def get_log_path():
+    #type:() -> str
+    """Function to get the path to the profile log (pyRevit universal data file or temp folder)."""
+    try:
+        from pyrevit import script
+        return script.get_universal_data_file(LOG_NAME, 'jsonl')
+    except Exception:
+        return os.path.join(tempfile.gettempdir(), LOG_NAME + '.jsonl')
+
+
+def current_session():
+    #type:() -> ProfileSession
+    """Function to get the innermost open ProfileSession (or None)."""
+    return _sessions[-1] if _sessions else None
+
+
+def count_api(name, amount=1):
+    #type:(str, int) -> None
+    """Function to count Revit API calls of AA-Tools helpers in the current ProfileSession
+    (does nothing if the session doesn't count API calls). Helpers count every call where it happens.
+    :param name:   'GetElement', 'get_Parameter', 'Delete' or 'collector_passes'
+    :param amount: Amount of calls"""
+    session = current_session()
+    if session is not None and session.counter is not None:
+        session.counter.add(name, amount)
+
+
+def get_element(doc, element_id):
+    #type:(Document, ElementId) -> Element
+    """Function to get an element with doc.GetElement and count the call (see count_api)."""
+    count_api('GetElement')
+    return doc.GetElement(element_id)
+
+
+def get_parameter(element, built_in_parameter):
+    #type:(Element, BuiltInParameter) -> Parameter
+    """Function to get a built-in parameter with element.get_Parameter and count the call (see count_api)."""
+    count_api('get_Parameter')
+    return element.get_Parameter(built_in_parameter)
+
+
+def _rotate(path, backups):
+    """Function to rotate log files: path -> path.1 -> path.2 ... Oldest one is removed."""
+    oldest = '{}.{}'.format(path, backups)
+    if os.path.exists(oldest):
+        os.remove(oldest)
+    for n in range(backups - 1, 0, -1):
+        src = '{}.{}'.format(path, n)
+        if os.path.exists(src):
+            os.rename(src, '{}.{}'.format(path, n + 1))
+    if backups:
+        os.rename(path, path + '.1')
+    else:
+        os.remove(path)
+
+
+def write_record(record, path=None, max_bytes=LOG_MAX_BYTES, backups=LOG_BACKUPS):
+    #type:(dict, str, int, int) -> str
+    """Function to append a single record to a rotating JSONL log.
+    :param record:    dict that can be serialized to JSON
+    :param path:      Path to the log. Default: get_log_path()
+    :param max_bytes: Log is rotated before it gets bigger than max_bytes
+    :param backups:   Amount of rotated logs to keep
+    :return:          Path to the log."""
+    path = path or get_log_path()
+    line = to_text(json.dumps(record, sort_keys=True)) + u'\n'
+
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+    if os.path.exists(path) and os.path.getsize(path) + len(line) > max_bytes:
+        _rotate(path, backups)
+
+    with io.open(path, 'a', encoding='utf-8') as f:
+        f.write(line)
+    return path
+
+
+def read_records(path=None, backups=LOG_BACKUPS):
+    #type:(str, int) -> list
+    """Function to read all records from a rotating JSONL log (oldest first). Broken lines are skipped."""
+    path    = path or get_log_path()
+    paths   = ['{}.{}'.format(path, n) for n in range(backups, 0, -1)] + [path]
+    records = []
+    for p in paths:
+        if not os.path.exists(p):
+            continue
+        with io.open(p, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    return records
+
+
+def percentile(values, p):
+    #type:(list, float) -> float
+    """Function to get p-th percentile (0-100) of values with linear interpolation."""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100.0
+    f = int(k)
+    c = min(f + 1, len(values) - 1)
+    return values[f] + (values[c] - values[f]) * (k - f)
+
+
+def aggregate(records):
+    #type:(list) -> dict
+    """Function to aggregate profile records per command.
+    :return: {command: {'runs': int,
+                        'seconds': [..],
+                        'sections': {section: {'seconds': [..], 'calls': [..], 'memory_sampled': int}},
+                        'api_calls': {name: [..]}}}"""
+    commands = {}
+    for record in records:
+        command = commands.setdefault(record.get('command', 'Unknown'),
+                                      {'runs': 0, 'seconds': [], 'sections': {}, 'api_calls': {}})
+        command['runs'] += 1
+        command['seconds'].append(record.get('seconds', 0.0))
+
+        for name, data in record.get('sections', {}).items():
+            section = command['sections'].setdefault(name, {'seconds': [], 'calls': [], 'memory_sampled': 0})
+            section['seconds'].append(data.get('seconds', 0.0))
+            section['calls'].append(data.get('calls', 0))
+            memory  = data.get('memory_sampled', data.get('memory_peak', 0))   # memory_peak - older records
+            section['memory_sampled'] = max(section['memory_sampled'], memory)
+
+        for name, count in record.get('api_calls', {}).items():
+            command['api_calls'].setdefault(name, []).append(count)
+    return commands
+
+
+def print_report(path=None, command=None):
+    #type:(str, str) -> list
+    """Function to print p50/p95 per command and section across all logged runs.
+    :param path:    Path to the log. Default: get_log_path()
+    :param command: Only report this command (all if None)
+    :return:        Table rows [command, section, runs, p50, p95, avg calls, sampled memory MB]"""
+    from pyrevit import script
+    output = script.get_output()
+
+    rows = []
+    for name, data in sorted(aggregate(read_records(path)).items()):
+        if command and name != command:
+            continue
+        rows.append([name, '(total)', data['runs'],
+                     '{:.3f}'.format(percentile(data['seconds'], 50)),
+                     '{:.3f}'.format(percentile(data['seconds'], 95)), '', ''])
+        for section_name, section in sorted(data['sections'].items()):
+            rows.append([name, section_name, len(section['seconds']),
+                         '{:.3f}'.format(percentile(section['seconds'], 50)),
+                         '{:.3f}'.format(percentile(section['seconds'], 95)),
+                         '{:.1f}'.format(sum(section['calls']) / float(len(section['calls']))),
+                         '{:.1f}'.format(section['memory_sampled'] / 1048576.0)])
+        for api_name, counts in sorted(data['api_calls'].items()):
+            rows.append([name, 'API: ' + api_name, len(counts),
+                         '{:.0f}'.format(percentile(counts, 50)),
+                         '{:.0f}'.format(percentile(counts, 95)), '', ''])
+
+    if rows:
+        output.print_table(table_data=rows, title='Profile Report',
+                           columns=['Command', 'Section', 'Runs', 'p50 [s]', 'p95 [s]', 'Avg Calls', 'Memory [MB]'])
+    else:
+        print('No profile records found in: {}'.format(path or get_log_path()))
+    return rows
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class ApiCounter(object):
+    """Counts Revit API calls (GetElement, get_Parameter, Delete, collector passes) of a command.
+
+    Revit API classes are .NET types and can't be patched with counting wrappers,
+    so AA-Tools helpers count every call where it happens: get_element(), get_parameter()
+    and count_api() next to doc.Delete and FilteredElementCollector. Calls made directly by a script are not counted.
+
+    Example:
+        with ProfileSession(__title__, count_api=True) as session:
+            rename_types(doc)
+        print(session.counter.counts)     # {'get_Parameter': 1200, 'collector_passes': 1, ...}"""
+
+    def __init__(self):
+        self.counts = {}
+
+    def add(self, name, amount=1):
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+
+class ProfileSession(object):
+    """Profile of a single command run. profiled() sections inside are recorded into it.
+    On exit, a record is appended to the rotating JSONL log (see print_report).
+
+    Example:
+        with ProfileSession(__title__, count_api=True):
+            with profiled('collect'):
+                ...
+            with profiled('transaction'):
+                ..."""
+
+    def __init__(self, command=None, count_api=False, log_path=None, save=True):
+        """
+        :param command:   Name of the command (button). Default: pyRevit command name.
+        :param count_api: if True - Revit API calls of AA-Tools helpers are counted (see ApiCounter).
+        :param log_path:  Path to the log. Default: get_log_path()
+        :param save:      if True - record is written to the log on exit."""
+        self.command   = command or get_command_name()
+        self.log_path  = log_path
+        self.save      = save
+        self.counter   = ApiCounter() if count_api else None
+        self.sections  = {}     # {section: {'calls', 'seconds', 'max_seconds', 'memory_sampled'}}
+        self.start     = None
+        self.seconds   = 0.0
+
+    def add(self, section, seconds, memory):
+        """Function to record a single call of a section.
+        :param memory: Memory sampled at start/end of the section (the largest sample is kept, not a true peak)."""
+        data = self.sections.setdefault(section, {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0,
+                                                  'memory_sampled': 0})
+        data['calls']          += 1
+        data['seconds']        += seconds
+        data['max_seconds']     = max(data['max_seconds'], seconds)
+        data['memory_sampled']  = max(data['memory_sampled'], memory)
+
+    def to_dict(self):
+        #type:() -> dict
+        return {'command'  : self.command,
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.start or time.time())),
+                'seconds'  : round(self.seconds, 6),
+                'sections' : self.sections,
+                'api_calls': dict(self.counter.counts) if self.counter else {}}
+
+    def __enter__(self):
+        self.start = time.time()
+        _sessions.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.seconds = time.time() - self.start
+        if self in _sessions:
+            _sessions.remove(self)
+        if self.save:
+            try:
+                write_record(self.to_dict(), self.log_path)
+            except (IOError, OSError):
+                pass    # Profiling should never break a command
+        return False
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+from collections import Counter, OrderedDict
+
+from Autodesk.Revit.DB import (FilteredElementCollector,
+                               ElementId,
+                               ElementTypeGroup,
+                               StorageType,
+                               FamilySymbol,
+                               HostObjAttributes,
+                               View,
+                               ViewSheet,
+                               ViewFamilyType,
+                               ParameterFilterElement,
+                               SelectionFilterElement,
+                               LinePatternElement,
+                               Material,
+                               GraphicsStyleType)
+from System.Collections.Generic import List
+
+# CUSTOM IMPORTS
+from Snippets._context_manager import ef_Transaction, profiled
+from Snippets._profiling import count_api
+from Snippets._renaming import RENAMABLE_TYPES
+from Snippets._worksharing import PreCheckout
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+# Default types of these groups (used for new elements) are never reported as unused
+DEFAULT_TYPE_GROUPS = ['WallType', 'FloorType', 'CeilingType', 'RoofType', 'TextNoteType', 'DimensionType',
+                       'SpotElevationType', 'CurtainSystemType', 'GridType', 'LevelType', 'FilledRegionType',
+                       'ModelGroupType', 'DetailGroupType', 'StairsType', 'RailingsTypeForStairs']
+
+PURGE_KINDS = ['Families', 'Types', 'View Templates', 'Filters', 'Line Patterns', 'Materials']
+
+# Kinds that can be deleted without a review (e.g. Batch Process) - other kinds are only reported
+SAFE_PURGE_KINDS = ['View Templates', 'Filters']
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def get_default_type_ids(doc):
+    #type:(Document) -> set
+    """Function to get Ids of default element types (DEFAULT_TYPE_GROUPS)."""
+    type_ids = set()
+    for name in DEFAULT_TYPE_GROUPS:
+        try:
+            type_ids.add(doc.GetDefaultElementTypeId(getattr(ElementTypeGroup, name)))
+        except Exception:
+            pass    # Group is not available in this Revit version
+    return type_ids
+
+
+def delete_elements(doc, elements, title='Purge Unused', debug=True):
+    #type:(Document, list, str, bool) -> int
+    """Function to delete elements with a single bulk doc.Delete in one Transaction.
+    Elements owned by other users in workshared models are skipped.
+    If Revit refuses the bulk delete, elements are deleted one by one (only failing ones are skipped).
+    :return: Amount of deleted elements (incl. dependent elements deleted by Revit)."""
+    pre     = PreCheckout(doc, elements)
+    deleted = 0
+    with ef_Transaction(doc, title, debug=debug, checkout=pre):
+        element_ids = [el.Id for el in pre.filter(elements) if el.IsValidObject]
+        try:
+            count_api('Delete')
+            deleted = doc.Delete(List[ElementId](element_ids)).Count
+        except Exception:
+            for el_id in element_ids:
+                try:
+                    count_api('Delete')
+                    deleted += doc.Delete(el_id).Count
+                except Exception:
+                    if debug: print("Could not delete element {}.".format(el_id.IntegerValue))
+    return deleted
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class PurgeAnalyzer(object):
+    """Finds unused Families, Types, View Templates, Filters, Line Patterns and Materials
+    with a single pass over the model instead of a collector query per type.
+
+    - Instances:  type usage histogram {type id: amount} from GetTypeId() + material and paint material ids.
+    - Types:      ElementId parameters of all element types (profiles, nested types, materials)
+                  + compound structure materials.
+    - Views:      used View Templates, Filters and line patterns of filter overrides.
+    - Categories: line patterns and materials of categories and subcategories.
+    - Overrides:  line patterns of category overrides in View Templates (V/G).
+                  Overrides of all views (incl. element overrides) are a call per category and element
+                  in every view, so they are searched only on request: analyze(scan_overrides=True)
+                  or find_overridden_patterns() for line patterns that a user wants to delete.
+
+    Example:
+        analyzer = PurgeAnalyzer(doc)
+        unused   = analyzer.analyze()          # {kind: [element, ...]}
+        delete_elements(doc, unused['Materials'])
+        kept     = analyzer.find_overridden_patterns(unused['Line Patterns'])"""
+
+    def __init__(self, doc):
+        self.doc        = doc
+        self.categories = []            # Categories and subcategories (read by _read_categories)
+        self.views      = []            # All views (read by analyze)
+        self.type_usage = Counter()     # {type id: amount of instances}
+        self.used_ids   = set()         # Ids referenced by instances, types, views and categories
+        self.unused     = OrderedDict((kind, []) for kind in PURGE_KINDS)
+
+    # ╔═╗╔═╗╔═╗╔═╗
+    # ╠═╝╠═╣╚═╗╚═╗
+    # ╩  ╩ ╩╚═╝╚═╝ SINGLE PASS
+    #==================================================
+    def _read_instances(self):
+        type_usage, used_ids = self.type_usage, self.used_ids
+        count_api('collector_passes')
+        for el in FilteredElementCollector(self.doc).WhereElementIsNotElementType():
+            type_usage[el.GetTypeId()] += 1
+            used_ids.update(el.GetMaterialIds(False))
+            used_ids.update(el.GetMaterialIds(True))     # Paint
+
+    def _read_types(self, types):
+        used_ids = self.used_ids
+        for typ in types:
+            for p in typ.Parameters:
+                if p.StorageType == StorageType.ElementId and p.HasValue:
+                    used_ids.add(p.AsElementId())
+            if isinstance(typ, HostObjAttributes):
+                structure = typ.GetCompoundStructure()
+                if structure:
+                    used_ids.update(layer.MaterialId for layer in structure.GetLayers())
+
+    def _read_views(self, views):
+        used_ids = self.used_ids
+        for view in views:
+            used_ids.add(view.ViewTemplateId)
+            try:
+                filter_ids = view.GetFilters()
+            except Exception:
+                continue    # Views that don't support filters (e.g. schedules)
+            for filter_id in filter_ids:
+                used_ids.add(filter_id)
+                overrides = view.GetFilterOverrides(filter_id)
+                used_ids.add(overrides.ProjectionLinePatternId)
+                used_ids.add(overrides.CutLinePatternId)
+
+        count_api('collector_passes')
+        for view_family_type in FilteredElementCollector(self.doc).OfClass(ViewFamilyType):
+            used_ids.add(view_family_type.DefaultTemplateId)
+
+    def _read_categories(self):
+        used_ids   = self.used_ids
+        categories = self.categories = list(self.doc.Settings.Categories)
+        for cat in categories:
+            categories.extend(cat.SubCategories)
+            if cat.Material:
+                used_ids.add(cat.Material.Id)
+            for style_type in (GraphicsStyleType.Projection, GraphicsStyleType.Cut):
+                used_ids.add(cat.GetLinePatternId(style_type))
+
+    def _read_overrides(self, views, pattern_ids):
+        """Function to find given line patterns in category overrides of views and element overrides
+        of views that are not templates. Stops as soon as all of them are found.
+        :param pattern_ids: Ids of line patterns that are not used anywhere else."""
+        pattern_ids = set(pattern_ids)
+        for view in views:
+            if not pattern_ids:
+                return
+            if isinstance(view, ViewSheet):
+                continue
+            overrides = []
+            for cat in self.categories:
+                try:
+                    overrides.append(view.GetCategoryOverrides(cat.Id))
+                except Exception:
+                    pass    # Category can't be overridden in this view
+            if not view.IsTemplate:
+                try:
+                    count_api('collector_passes')
+                    element_ids = FilteredElementCollector(self.doc, view.Id).ToElementIds()
+                except Exception:
+                    element_ids = []    # Views without elements (e.g. schedules)
+                overrides.extend(view.GetElementOverrides(el_id) for el_id in element_ids)
+
+            for settings in overrides:
+                for pattern_id in (settings.ProjectionLinePatternId, settings.CutLinePatternId):
+                    if pattern_id in pattern_ids:
+                        pattern_ids.discard(pattern_id)
+                        self.used_ids.add(pattern_id)
+
+    # ╔═╗╔╗╔╔═╗╦ ╦ ╦╔═╗╔═╗
+    # ╠═╣║║║╠═╣║ ╚╦╝╚═╗║╣
+    # ╩ ╩╝╚╝╩ ╩╩═╝╩ ╚═╝╚═╝ ANALYZE
+    #==================================================
+    def analyze(self, scan_overrides=False):
+        #type:(bool) -> OrderedDict
+        """Function to read the model once and find unused elements.
+        :param scan_overrides: if True - line patterns are searched in category and element overrides
+                               of all views (slow), otherwise only in View Templates.
+        :return: {kind: [element, ...]} (see PURGE_KINDS)"""
+        doc = self.doc
+        with profiled('collect'):
+            all_types = list(FilteredElementCollector(doc).WhereElementIsElementType())
+            count_api('collector_passes')
+            types     = [typ for typ in all_types if type(typ) in RENAMABLE_TYPES]    # Types that can be purged
+            views     = self.views = list(FilteredElementCollector(doc).OfClass(View))
+            count_api('collector_passes')
+
+        with profiled('single pass'):
+            self._read_instances()
+            self._read_types(all_types)
+            self._read_views(views)
+            self._read_categories()
+
+        with profiled('overrides'):
+            patterns = list(FilteredElementCollector(doc).OfClass(LinePatternElement))
+            count_api('collector_passes')
+            self._read_overrides(views if scan_overrides else [v for v in views if v.IsTemplate],
+                                 [p.Id for p in patterns if p.Id not in self.used_ids])
+
+        with profiled('evaluate'):
+            self._evaluate_types(types, get_default_type_ids(doc))
+            used = self.used_ids
+            self.unused['View Templates'] = [v for v in views if v.IsTemplate and v.Id not in used]
+            for cls in (ParameterFilterElement, SelectionFilterElement):
+                count_api('collector_passes')
+                self.unused['Filters'].extend(f for f in FilteredElementCollector(doc).OfClass(cls)
+                                              if f.Id not in used)
+            self.unused['Line Patterns']  = [p for p in patterns if p.Id not in used]
+            count_api('collector_passes')
+            self.unused['Materials']      = [m for m in FilteredElementCollector(doc).OfClass(Material)
+                                             if m.Id not in used]
+        return self.unused
+
+    def find_overridden_patterns(self, patterns):
+        #type:(list) -> list
+        """Function to search given unused line patterns in category and element overrides of all views
+        (e.g. only the ones selected for deletion, see analyze). Found ones are removed from unused.
+        :return: Line patterns that are used in overrides."""
+        pattern_ids = set(p.Id for p in patterns) - self.used_ids
+        with profiled('overrides'):
+            self._read_overrides(self.views, pattern_ids)
+        self.unused['Line Patterns'] = [p for p in self.unused['Line Patterns'] if p.Id not in self.used_ids]
+        return [p for p in patterns if p.Id in self.used_ids]
+
+    def is_used(self, typ):
+        """Function to check if a type is placed or referenced by another element."""
+        return self.type_usage[typ.Id] > 0 or typ.Id in self.used_ids
+
+    def _evaluate_types(self, types, default_ids):
+        """Function to find unused types.
+        - Loadable families without any used type are reported as a Family (a family needs at least one type).
+        - At least one type of every system family is kept."""
+        families = OrderedDict()    # {group key: [types]}
+        for typ in types:
+            if isinstance(typ, FamilySymbol):
+                key = typ.Family.Id
+            else:
+                key = (type(typ).__name__, typ.FamilyName)
+            families.setdefault(key, []).append(typ)
+
+        for key, family_types in families.items():
+            unused = [typ for typ in family_types if not self.is_used(typ) and typ.Id not in default_ids]
+            if len(unused) < len(family_types):
+                self.unused['Types'].extend(unused)
+                continue
+
+            family = family_types[0].Family if isinstance(family_types[0], FamilySymbol) else None
+            if family is not None and family.IsEditable and family.Id not in self.used_ids:
+                self.unused['Families'].append(family)
+            else:
+                self.unused['Types'].extend(unused[1:])
+
+    @property
+    def count(self):
+        return sum(len(elements) for elements in self.unused.values())
@@ -0,0 +1,586 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import re
+from collections import namedtuple
+
+import Autodesk.Revit.DB as DB
+from Autodesk.Revit.DB import *
+
+#.NET
+import clr
+clr.AddReference('System')
+from System import Type
+from System.Collections.Generic import List
+
+# CUSTOM IMPORTS
+from Snippets._parameters import RE_BUILTIN_NAME
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+app      = __revit__.Application
+rvt_year = int(app.VersionNumber)
+
+RE_TOKEN = re.compile(r'''\s*(?:
+                          (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*') |
+                          (?P<number>-?\d+(?:\.\d+)?(?![\w.])) |
+                          (?P<param>\$\w+) |
+                          (?P<word>[A-Za-z_][\w.]*) |
+                          (?P<op>!=|>=|<=|=|~|>|<) |
+                          (?P<punct>[(),])
+                          )''', re.VERBOSE)
+
+KEYWORDS = ('and', 'or', 'not', 'in')
+
+# Fields that are compiled into Quick Filters (element header data, no element has to be expanded in memory).
+# Number is the cost that is used to order terms of AND/OR: cheapest and most selective filters first.
+QUICK_FIELDS = {'class'   : 0,      # ElementClassFilter / ElementMulticlassFilter
+                'category': 1,      # ElementCategoryFilter / ElementMulticategoryFilter
+                'kind'    : 2,      # ElementIsElementTypeFilter  (kind = type / kind = instance)
+                'level'   : 3}      # ElementLevelFilter
+SLOW_COST = 10                      # ElementParameterFilter
+
+# Field aliases for common BuiltInParameters. Any BuiltInParameter name can be used as a field as well.
+PARAMETER_FIELDS = {'type'       : 'ELEM_TYPE_PARAM',
+                    'type.id'    : 'ELEM_TYPE_PARAM',
+                    'type.name'  : 'ALL_MODEL_TYPE_NAME',
+                    'family.name': 'ALL_MODEL_FAMILY_NAME',
+                    'mark'       : 'ALL_MODEL_MARK',
+                    'comments'   : 'ALL_MODEL_INSTANCE_COMMENTS'}
+
+NUMERIC_EVALUATORS = {'=' : FilterNumericEquals,
+                      '>' : FilterNumericGreater,
+                      '>=': FilterNumericGreaterOrEqual,
+                      '<' : FilterNumericLess,
+                      '<=': FilterNumericLessOrEqual}
+
+DOUBLE_EPSILON = 1e-6
+
+_plans = {}     # {query: QueryPlan}
+
+Condition = namedtuple('Condition', ['field', 'op', 'values', 'inverted'])
+Param     = namedtuple('Param', ['name'])   # $name placeholder, value is given when the plan is bound
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def compile_query(query):
+    #type:(str) -> QueryPlan
+    """Function to compile a selection query into a QueryPlan. Plans are cached by query string,
+    so use $placeholders for values that change between calls (e.g. 'family.name = $name').
+    :param query: e.g. 'category in (Doors, Windows) and type.name ~ "FD*" and level = "L02"'"""
+    query = query.strip()
+    if query not in _plans:
+        _plans[query] = QueryPlan(query)
+    return _plans[query]
+
+
+def query_elements(doc, query, view_id=None, **params):
+    """Function to get elements that match a query (see QueryPlan).
+    :param view_id: ElementId of a View to get only visible elements. Default: whole model
+    :param params:  Values for $placeholders"""
+    return compile_query(query).collect(doc, view_id, **params).ToElements()
+
+
+def query_ids(doc, query, view_id=None, **params):
+    """Function to get ElementIds of elements that match a query (see QueryPlan)."""
+    return compile_query(query).collect(doc, view_id, **params).ToElementIds()
+
+
+def quote(value):
+    #type:(str) -> str
+    """Function to quote a text value for a query (prefer $placeholders, so the plan is cached only once)."""
+    return '"{}"'.format(value.replace('\\', '\\\\').replace('"', '\\"'))
+
+
+def tokenize(query):
+    """Function to split a query into tokens [(kind, value), ...].
+    kind: 'string', 'number', 'param', 'word', 'keyword', 'op', 'punct'"""
+    tokens, pos = [], 0
+    query = query.rstrip()
+    while pos < len(query):
+        match = RE_TOKEN.match(query, pos)
+        if not match or match.end() == pos:
+            raise QueryError("Unexpected character at position {}: '{}'".format(pos, query[pos:pos + 10]))
+        kind  = match.lastgroup
+        value = match.group(kind)
+        if kind == 'string':
+            value = re.sub(r'\\(.)', r'\1', value[1:-1])
+        elif kind == 'number':
+            value = float(value) if '.' in value else int(value)
+        elif kind == 'param':
+            value = Param(value[1:])
+        elif kind == 'word' and value.lower() in KEYWORDS:
+            kind, value = 'keyword', value.lower()
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+def get_cost(node):
+    """Function to get the cost of a node. Compound nodes are as slow as their slowest term."""
+    if isinstance(node, Condition):
+        return QUICK_FIELDS.get(node.field, SLOW_COST)
+    return max(get_cost(n) for n in node[1])
+
+
+def _everything():
+    """Quick filter that passes all elements (a FilteredElementCollector needs at least one filter)."""
+    return LogicalOrFilter(ElementIsElementTypeFilter(False), ElementIsElementTypeFilter(True))
+
+
+def _nothing():
+    """Quick filter that passes no elements."""
+    return LogicalAndFilter(ElementIsElementTypeFilter(False), ElementIsElementTypeFilter(True))
+
+
+def _string_rule(bip, evaluator, value, case_sensitive):
+    provider = ParameterValueProvider(ElementId(bip))
+    if rvt_year < 2023:
+        return FilterStringRule(provider, evaluator, value, case_sensitive)
+    return FilterStringRule(provider, evaluator, value)      # 2023+ string rules are always case-insensitive
+
+
+def get_storage_type(doc, bip):
+    """Function to get StorageType of a BuiltInParameter (None if it's not known)."""
+    try:
+        return doc.get_TypeOfStorage(bip)
+    except Exception:
+        return None
+
+
+def create_rule(bip, op, value, storage=None):
+    """Function to create a FilterRule for a BuiltInParameter.
+    Numbers are compared with internal units (e.g. ROOM_AREA > 100 means 100 ft²).
+    :param op:      '=', '~' (wildcard: 'FD*', '*FD', '*FD*'), '>', '>=', '<', '<='
+    :param value:   str, int, float, bool, ElementId or Element
+    :param storage: StorageType of the parameter (get_storage_type). Numbers are compared as Double or Integer
+                    based on it - a rule of the wrong type silently matches nothing.
+                    If None - int values create FilterIntegerRule and float values FilterDoubleRule."""
+    if isinstance(value, Element):
+        value = value.Id
+    if isinstance(value, bool):
+        value = int(value)
+
+    if isinstance(value, ElementId):
+        if op != '=':
+            raise QueryError("Operator '{}' is not supported for ElementId values.".format(op))
+        return FilterElementIdRule(ParameterValueProvider(ElementId(bip)), FilterNumericEquals(), value)
+
+    if isinstance(value, (int, float)):
+        if op not in NUMERIC_EVALUATORS:
+            raise QueryError("Operator '{}' is not supported for numbers.".format(op))
+        if storage in (StorageType.String, StorageType.ElementId):
+            raise QueryError("Parameter '{}' doesn't store numbers ({}). Use a text or element value."
+                             .format(bip, storage))
+        provider, evaluator = ParameterValueProvider(ElementId(bip)), NUMERIC_EVALUATORS[op]()
+        if storage == StorageType.Double or (storage != StorageType.Integer and isinstance(value, float)):
+            return FilterDoubleRule(provider, evaluator, float(value), DOUBLE_EPSILON)
+        if value != int(value):
+            raise QueryError("Parameter '{}' stores whole numbers, but {} was given.".format(bip, value))
+        return FilterIntegerRule(provider, evaluator, int(value))
+
+    if op == '=':
+        return _string_rule(bip, FilterStringEquals(), value, True)
+    if op != '~':
+        raise QueryError("Operator '{}' is not supported for text.".format(op))
+
+    # WILDCARDS
+    text = value.strip('*')
+    if '*' in text or '?' in text or not text:
+        raise QueryError("Unsupported pattern '{}'. Use 'text*', '*text' or '*text*'.".format(value))
+    if value.startswith('*') and value.endswith('*'):   evaluator = FilterStringContains()
+    elif value.endswith('*'):                           evaluator = FilterStringBeginsWith()
+    elif value.startswith('*'):                         evaluator = FilterStringEndsWith()
+    else:                                               evaluator = FilterStringEquals()
+    return _string_rule(bip, evaluator, text, False)
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class QueryError(Exception):
+    """Raised for invalid queries and values that can't be resolved in the Document."""
+
+
+class _Parser(object):
+    """Recursive descent parser:
+        or_expr    := and_expr ('or' and_expr)*
+        and_expr   := not_expr ('and' not_expr)*
+        not_expr   := 'not' not_expr | '(' or_expr ')' | condition
+        condition  := field op value | field ['not'] 'in' ('(' value (',' value)* ')' | $param)
+        value      := "text" | number | word | $param"""
+
+    def __init__(self, query):
+        self.tokens = tokenize(query)
+        self.pos    = 0
+
+    def peek(self, kind=None, value=None):
+        if self.pos >= len(self.tokens):
+            return None
+        token = self.tokens[self.pos]
+        if (kind and token[0] != kind) or (value is not None and token[1] != value):
+            return None
+        return token
+
+    def take(self, kind=None, value=None):
+        token = self.peek(kind, value)
+        if token is None:
+            found = self.tokens[self.pos][1] if self.pos < len(self.tokens) else 'end of query'
+            raise QueryError("Expected {} but found '{}'.".format(value or kind, found))
+        self.pos += 1
+        return token
+
+    def parse(self):
+        node = self.or_expr()
+        if self.pos < len(self.tokens):
+            raise QueryError("Unexpected '{}'.".format(self.tokens[self.pos][1]))
+        return node
+
+    def or_expr(self):
+        nodes = [self.and_expr()]
+        while self.peek('keyword', 'or'):
+            self.take()
+            nodes.append(self.and_expr())
+        return nodes[0] if len(nodes) == 1 else ('or', nodes)
+
+    def and_expr(self):
+        nodes = [self.not_expr()]
+        while self.peek('keyword', 'and'):
+            self.take()
+            nodes.append(self.not_expr())
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    def not_expr(self):
+        if self.peek('keyword', 'not'):
+            self.take()
+            return ('not', self.not_expr())
+        if self.peek('punct', '('):
+            self.take()
+            node = self.or_expr()
+            self.take('punct', ')')
+            return node
+        return self.condition()
+
+    def condition(self):
+        field = self.take('word')[1]
+        if field not in QUICK_FIELDS and field not in PARAMETER_FIELDS and not RE_BUILTIN_NAME.match(field):
+            raise QueryError("Unknown field '{}'.".format(field))
+
+        inverted = bool(self.peek('keyword', 'not'))
+        if inverted:
+            self.take()
+        if inverted or self.peek('keyword', 'in'):
+            self.take('keyword', 'in')
+            return Condition(field, '=', self.value_list(), inverted)
+
+        op = self.take('op')[1]
+        if field in QUICK_FIELDS and op not in ('=', '!='):
+            raise QueryError("Field '{}' supports only '=', '!=' and 'in'.".format(field))
+        return Condition(field, '=' if op == '!=' else op, [self.value()], op == '!=')
+
+    def value_list(self):
+        if self.peek('param'):
+            return [self.take()[1]]
+        self.take('punct', '(')
+        values = [self.value()]
+        while self.peek('punct', ','):
+            self.take()
+            values.append(self.value())
+        self.take('punct', ')')
+        return values
+
+    def value(self):
+        for kind in ('string', 'number', 'param', 'word'):
+            if self.peek(kind):
+                return self.take()[1]
+        return self.take('value')
+
+
+class _Bound(object):
+    """Bound node: ElementFilter + rules of a single not-inverted ElementParameterFilter,
+    so AND terms can be merged into one slow filter with many rules."""
+    def __init__(self, element_filter, rules=None):
+        self.filter = element_filter
+        self.rules  = rules
+
+
+class QueryPlan(object):
+    """Compiled selection query.
+
+    Syntax:
+        category in (Doors, Windows) and type.name ~ "FD*" and level = "L02"
+        class = FamilyInstance and not family.name = $family
+        kind = instance and (mark = "A1" or comments ~ "*check*") and ALL_MODEL_INSTANCE_COMMENTS != ""
+
+    Fields:
+        class, category, kind (type/instance), level      -> Quick Filters
+        type(.id), type.name, family.name, mark, comments,
+        or any BuiltInParameter name                       -> ElementParameterFilter
+    Operators: =, !=, in (...), not in (...), ~ (wildcard), >, >=, <, <= (numbers in internal units)
+    Values:    "text", numbers, words, $placeholders (value or list given when the plan is bound)
+
+    Planner:
+        - NOT is pushed down to single conditions (inverted filters).
+        - ORs of class/category equalities are merged into ElementMulticlassFilter/ElementMulticategoryFilter.
+        - AND/OR terms are ordered: Quick Filters first, ElementParameterFilters last.
+        - AND-ed parameter conditions are merged into a single ElementParameterFilter with many rules.
+
+    Example:
+        plan  = compile_query('category in $categories and kind = instance')
+        elems = plan.collect(doc, categories=[BuiltInCategory.OST_Doors]).ToElements()"""
+
+    def __init__(self, query):
+        self.query = query
+        self.root  = self.optimize(self.normalize(_Parser(query).parse()))
+
+    # ╔═╗╦  ╔═╗╔╗╔
+    # ╠═╝║  ╠═╣║║║
+    # ╩  ╩═╝╩ ╩╝╚╝ PLAN (document independent, cached)
+    #==================================================
+    def normalize(self, node, negate=False):
+        """Function to push NOT down to conditions (De Morgan) and to flatten nested AND/OR."""
+        if isinstance(node, Condition):
+            return node._replace(inverted=node.inverted != negate)
+        if node[0] == 'not':
+            return self.normalize(node[1], not negate)
+
+        op = node[0] if not negate else {'and': 'or', 'or': 'and'}[node[0]]
+        children = []
+        for child in node[1]:
+            child = self.normalize(child, negate)
+            children.extend(child[1] if not isinstance(child, Condition) and child[0] == op else [child])
+        return (op, children)
+
+    def optimize(self, node):
+        """Function to merge class/category conditions and order terms by cost."""
+        if isinstance(node, Condition):
+            return node
+        op       = node[0]
+        children = [self.optimize(child) for child in node[1]]
+
+        # OR of equalities (or AND of inequalities) of the same field -> one multi-value condition
+        mergeable = op == 'and'     # 'a != x and a != y' == 'a not in (x, y)'
+        merged, result = {}, []
+        for child in children:
+            if isinstance(child, Condition) and child.field in ('class', 'category') and child.inverted == mergeable:
+                if child.field in merged:
+                    first = merged[child.field]
+                    result[first] = result[first]._replace(values=result[first].values + child.values)
+                    continue
+                merged[child.field] = len(result)
+            result.append(child)
+
+        result.sort(key=get_cost)   # stable - order of equal costs is kept
+        return result[0] if len(result) == 1 else (op, result)
+
+    def explain(self, node=None, indent=0):
+        #type:(...) -> str
+        """Function to get the plan as text (terms in the order they are evaluated)."""
+        node = self.root if node is None else node
+        pad  = '    ' * indent
+        if isinstance(node, Condition):
+            values = ', '.join('$' + v.name if isinstance(v, Param) else repr(v) for v in node.values)
+            kind   = 'quick' if node.field in QUICK_FIELDS else 'slow'
+            if len(node.values) > 1 or isinstance(node.values[0], Param):
+                op, values = 'not in' if node.inverted else 'in', '({})'.format(values)
+            else:
+                op = '!=' if node.inverted and node.op == '=' else ('not ' if node.inverted else '') + node.op
+            return '{}{} {} {}  [{}]'.format(pad, node.field, op, values, kind)
+        lines = ['{}{}'.format(pad, node[0].upper())]
+        lines.extend(self.explain(child, indent + 1) for child in node[1])
+        return '\n'.join(lines)
+
+    # ╔╗ ╦╔╗╔╔╦╗
+    # ╠╩╗║║║║ ║║
+    # ╚═╝╩╝╚╝═╩╝ BIND (Revit filters for a document)
+    #==================================================
+    def get_filters(self, doc, **params):
+        """Function to create Revit filters for a document. Top-level AND terms are returned separately,
+        so they can be applied with FilteredElementCollector.WherePasses in the planned order.
+        :param params: Values for $placeholders
+        :return:       List of ElementFilters. None - nothing can match, [] - everything matches."""
+        self._levels = None
+        bound = self._bind(doc, self.root, params)
+        if bound is False:  return None
+        if bound is True:   return []
+        if isinstance(bound.filter, LogicalAndFilter) and self._is_and(self.root):
+            return list(bound.filter.GetFilters())
+        return [bound.filter]
+
+    def get_filter(self, doc, **params):
+        #type:(...) -> ElementFilter
+        """Function to create a single Revit filter for a document (e.g. for ElementFilter.PassesFilter)."""
+        filters = self.get_filters(doc, **params)
+        if filters is None:     return _nothing()
+        if not filters:         return _everything()
+        if len(filters) == 1:   return filters[0]
+        return LogicalAndFilter(List[ElementFilter](filters))
+
+    def collect(self, doc, view_id=None, **params):
+        #type:(...) -> FilteredElementCollector
+        """Function to get a FilteredElementCollector with all filters of the plan.
+        :param view_id: ElementId of a View to get only visible elements. Default: whole model"""
+        collector = FilteredElementCollector(doc, view_id) if view_id else FilteredElementCollector(doc)
+        filters   = self.get_filters(doc, **params)
+        if filters is None:
+            return collector.WherePasses(_nothing())
+        for f in filters or [_everything()]:
+            collector = collector.WherePasses(f)
+        return collector
+
+    @staticmethod
+    def _is_and(node):
+        return not isinstance(node, Condition) and node[0] == 'and'
+
+    def _bind(self, doc, node, params):
+        """:return: _Bound, True (matches everything) or False (matches nothing)"""
+        if isinstance(node, Condition):
+            return self._bind_condition(doc, node, params)
+
+        op, terms, rules = node[0], [], []
+        for child in node[1]:
+            bound = self._bind(doc, child, params)
+            if bound is (op == 'or'):       # True in OR / False in AND decides the whole node
+                return bound
+            if bound is (op == 'and'):      # True in AND / False in OR is dropped
+                continue
+            if op == 'and' and bound.rules:
+                if not rules:
+                    terms.append(None)      # Position of the merged ElementParameterFilter
+                rules.extend(bound.rules)
+                continue
+            terms.append(bound.filter)
+
+        if rules:
+            merged = ElementParameterFilter(List[FilterRule](rules)) if len(rules) > 1 else \
+                     ElementParameterFilter(rules[0])
+            terms[terms.index(None)] = merged
+        if not terms:
+            return op == 'and'
+        if len(terms) == 1:
+            return _Bound(terms[0])
+        logical = LogicalAndFilter if op == 'and' else LogicalOrFilter
+        return _Bound(logical(List[ElementFilter](terms)))
+
+    def _get_values(self, node, params):
+        values = []
+        for value in node.values:
+            if isinstance(value, Param):
+                if value.name not in params:
+                    raise QueryError("No value was given for ${}.".format(value.name))
+                value = params[value.name]
+                if not isinstance(value, str) and hasattr(value, '__iter__'):      # list, set, List[ElementId]
+                    values.extend(value)
+                    continue
+            values.append(value)
+        return values
+
+    def _bind_condition(self, doc, node, params):
+        values = self._get_values(node, params)
+        if not values:                                  # e.g. 'category in $categories' with an empty list
+            return node.inverted
+
+        if node.field == 'kind':
+            kinds = set(self._resolve_kind(v) for v in values)
+            if len(kinds) == 2:
+                return not node.inverted
+            # ElementIsElementTypeFilter(inverted=False) passes ElementTypes
+            return _Bound(ElementIsElementTypeFilter((kinds.pop() == 'instance') != node.inverted))
+
+        if node.field == 'category':
+            ids = self._unique([self._resolve_category(doc, v) for v in values])
+            if len(ids) == 1:
+                return _Bound(ElementCategoryFilter(ids[0], node.inverted))
+            return _Bound(ElementMulticategoryFilter(List[ElementId](ids), node.inverted))
+
+        if node.field == 'class':
+            classes = self._unique([self._resolve_class(v) for v in values])
+            if len(classes) == 1:
+                return _Bound(ElementClassFilter(classes[0], node.inverted))
+            return _Bound(ElementMulticlassFilter(List[Type]([clr.GetClrType(c) for c in classes]), node.inverted))
+
+        if node.field == 'level':
+            filters = [ElementLevelFilter(self._resolve_level(doc, v), node.inverted) for v in self._unique(values)]
+            return self._combine(filters, node.inverted)
+
+        bip   = getattr(BuiltInParameter, PARAMETER_FIELDS.get(node.field, node.field), None)
+        if bip is None:
+            raise QueryError("Unknown BuiltInParameter '{}'.".format(node.field))
+        storage = get_storage_type(doc, bip)
+        rules   = [create_rule(bip, node.op, v, storage) for v in values]
+        if len(rules) == 1 and not node.inverted:
+            return _Bound(ElementParameterFilter(rules[0]), rules)
+        return self._combine([ElementParameterFilter(rule, node.inverted) for rule in rules], node.inverted)
+
+    @staticmethod
+    def _combine(filters, inverted):
+        """'x in (a, b)' -> a OR b, 'x not in (a, b)' -> not a AND not b"""
+        if len(filters) == 1:
+            return _Bound(filters[0])
+        logical = LogicalAndFilter if inverted else LogicalOrFilter
+        return _Bound(logical(List[ElementFilter](filters)))
+
+    @staticmethod
+    def _unique(values):
+        result = []
+        for value in values:
+            if value not in result:
+                result.append(value)
+        return result
+
+    # ╦═╗╔═╗╔═╗╔═╗╦  ╦  ╦╔═╗
+    # ╠╦╝║╣ ╚═╗║ ║║  ╚╗╔╝║╣
+    # ╩╚═╚═╝╚═╝╚═╝╩═╝ ╚╝ ╚═╝ RESOLVE VALUES
+    #==================================================
+    @staticmethod
+    def _resolve_kind(value):
+        kind = str(value).lower().rstrip('s')
+        if kind not in ('type', 'instance'):
+            raise QueryError("Unknown kind '{}'. Use 'type' or 'instance'.".format(value))
+        return kind
+
+    @staticmethod
+    def _resolve_category(doc, value):
+        """BuiltInCategory, ElementId, Category or name ('Doors', 'OST_Doors', 'Generic Models') -> ElementId"""
+        if isinstance(value, ElementId):    return value
+        if isinstance(value, Category):     return value.Id
+        if not isinstance(value, str):      return ElementId(value)       # BuiltInCategory
+
+        name = value if value.startswith('OST_') else 'OST_' + value.replace(' ', '')
+        bic  = getattr(BuiltInCategory, name, None)
+        if bic is not None:
+            return ElementId(bic)
+        for cat in doc.Settings.Categories:
+            if cat.Name.lower() == value.lower():
+                return cat.Id
+        raise QueryError("Category '{}' was not found.".format(value))
+
+    @staticmethod
+    def _resolve_class(value):
+        """Revit API class or its name ('FamilyInstance', 'Room') -> class"""
+        if not isinstance(value, str):
+            return value
+        import Autodesk.Revit.DB.Architecture as Architecture
+        for module in (DB, Architecture):
+            cls = getattr(module, value, None)
+            if isinstance(cls, type):
+                return cls
+        raise QueryError("Class '{}' was not found in Revit API.".format(value))
+
+    def _resolve_level(self, doc, value):
+        """Level, ElementId or Level name -> ElementId. Levels are read once per bind."""
+        if isinstance(value, ElementId):    return value
+        if isinstance(value, Element):      return value.Id
+        if self._levels is None:
+            self._levels = dict((lvl.Name, lvl.Id) for lvl in FilteredElementCollector(doc).OfClass(Level))
+        if str(value) not in self._levels:
+            raise QueryError("Level '{}' was not found.".format(value))
+        return self._levels[str(value)]
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import io, os, re, json, hashlib, tempfile
+from collections import OrderedDict
+
+from Autodesk.Revit.DB import *
+from Autodesk.Revit.DB.Architecture import RailingType, HandRailType, StairsType
+from Autodesk.Revit.DB.Mechanical import FlexDuctType, DuctSystemType, DuctType, DuctInsulationType, MechanicalSystemType
+from Autodesk.Revit.DB.Plumbing import FlexPipeType, PipingSystemType, PipeInsulationType, PipeType
+
+# CUSTOM IMPORTS
+from Snippets._context_manager import ef_Transaction, try_except, profiled
+from Snippets._profiling import count_api, get_parameter
+from Snippets._worksharing import PreCheckout
+from Snippets._csv import to_text
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+MAPPING_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            'Renaming', 'replace_words.json')
+
+STATE_VERSION = 2     # Increase if renaming logic changes, so all saved states are invalidated
+
+# Meaning of the mapping in all Batch Replace buttons: words are matched case-insensitive, "-" removes the word
+IGNORE_CASE = True
+REMOVE_WORD = '-'
+
+# Types that are renamed by Batch Replace (Types)
+RENAMABLE_TYPES = [FamilySymbol, WallType, FloorType, CeilingType, RoofType,
+                   FilledRegionType, TextNoteType, AnnotationSymbolType, AnnotationSymbol,
+                   DimensionType, SpotDimensionType, GridType, CurtainSystemType, MullionType, GroupType,
+                   FlexPipeType, FlexDuctType, RailingType, HandRailType, DuctSystemType, DuctType,
+                   MechanicalSystemType, DuctInsulationType, PipingSystemType, PipeInsulationType, PipeType,
+                   StairsType, BeamSystemType]
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def load_mapping(path=None):
+    #type:(str) -> OrderedDict
+    """Function to load a replacement mapping {find: replace} from a JSON file.
+    Order of the file is kept (WordReplacer applies longer phrases before single words anyway).
+    :param path: Path to a JSON file. Default: lib/Renaming/replace_words.json"""
+    with io.open(path or MAPPING_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f, object_pairs_hook=OrderedDict)
+
+
+def text_hash(text):
+    #type:(str) -> str
+    """Function to get a short hash of a text (names, mappings) for RenameState."""
+    if not isinstance(text, bytes):
+        text = text.encode('utf-8')
+    return hashlib.md5(text).hexdigest()[:10]
+
+
+def get_document_key(doc):
+    #type:(Document) -> str
+    """Function to get a key that identifies a document between sessions
+    (central model path for workshared models, so all local copies share it)."""
+    path = doc.PathName or doc.Title
+    if doc.IsWorkshared:
+        try:
+            path = ModelPathUtils.ConvertModelPathToUserVisiblePath(doc.GetWorksharingCentralModelPath())
+        except Exception:
+            pass
+    return text_hash(path.lower())
+
+
+def get_renamable_types(doc):
+    """Function to get all element types of RENAMABLE_TYPES classes."""
+    all_types = FilteredElementCollector(doc).WhereElementIsElementType().ToElements()
+    count_api('collector_passes')
+    return [typ for typ in all_types if type(typ) in RENAMABLE_TYPES]
+
+
+def plan_rename_types(doc, mapping=None):
+    #type:(Document, dict) -> list
+    """Function to get types that would be renamed by rename_types without changing anything
+    (works in linked and read-only documents as well).
+    :return: List of (type, current name, new name)"""
+    replacer = WordReplacer(mapping if mapping is not None else load_mapping())
+    plan     = []
+    types    = get_renamable_types(doc)
+    for typ in types:
+        p            = get_parameter(typ, BuiltInParameter.ALL_MODEL_TYPE_NAME)
+        current_name = (p.AsString() or '').strip() if p else ''
+        new_name     = replacer(current_name) if current_name else ''
+        if new_name and new_name != current_name:
+            plan.append((typ, current_name, new_name))
+    return plan
+
+
+def rename_types(doc, mapping=None, debug=True, incremental=True):
+    #type:(Document, dict, bool, bool) -> int
+    """Function to batch rename all element types (Type Name) based on a mapping.
+    Elements owned by other users in workshared models are skipped.
+    :param doc:         Revit Document
+    :param mapping:     {find: replace}. Default: load_mapping()
+    :param debug:       if True - every renamed/skipped type is printed.
+    :param incremental: if True - types with the same name as after the last run are not evaluated again
+                        (full pass if the mapping was changed). See RenameState.
+    :return:            Amount of renamed types.
+    :raise:             Exception if the Transaction was rolled back (nothing was renamed)."""
+    mapping  = mapping if mapping is not None else load_mapping()
+    replacer = WordReplacer(mapping)
+    state    = RenameState(doc, 'types', mapping) if incremental else None
+    with profiled('collect types'):
+        all_types = get_renamable_types(doc)
+    if debug:
+        print("Found {} types to rename.".format(len(all_types)))
+        if state and state.full_pass:
+            print("All types are evaluated (first run or the mapping was changed).")
+
+    # Collect types that will change first, so only these are checked out in workshared models.
+    to_rename = []
+    unchanged = 0
+    for typ in all_types:
+        with try_except():
+            current_name = get_parameter(typ, BuiltInParameter.ALL_MODEL_TYPE_NAME).AsString().strip()
+            if not current_name:
+                if debug: print("Skipping empty name.")
+                continue
+
+            if state and state.is_unchanged(typ.Id, current_name):
+                unchanged += 1
+                continue
+
+            new_name = replacer(current_name)
+            if new_name and new_name != current_name:
+                to_rename.append((typ, current_name, new_name))
+            else:
+                if state: state.update(typ.Id, current_name)
+                if debug: print("No change for '{}'.".format(current_name))
+
+    if debug and unchanged:
+        print("Skipped {} types that are unchanged since the last run.".format(unchanged))
+
+    renamed = 0
+    pre     = PreCheckout(doc, [typ for typ, _, _ in to_rename])
+    with profiled('transaction'), ef_Transaction(doc, 'Batch Rename FamilyTypes', debug=debug, checkout=pre) as t:
+        for typ, current_name, new_name in to_rename:
+            if not pre.is_editable(typ):
+                continue
+            with try_except():
+                typ.Name = new_name
+                renamed += 1
+                if state: state.update(typ.Id, new_name)
+                if debug: print("Renamed '{}' to '{}'.".format(current_name, new_name))
+
+    # If the Transaction was rolled back, names don't match the state and are evaluated next time.
+    if state:
+        state.save()
+    if t.GetStatus() != TransactionStatus.Committed:
+        raise Exception('Transaction [Batch Rename FamilyTypes] was rolled back - nothing was renamed.')
+    return renamed
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class WordReplacer(object):
+    """Whole-word find/replace with a mapping {find: replace}.
+    Patterns are compiled once and applied longest phrase first, so 'COCKTAIL BAR' is replaced
+    before 'BAR' regardless of the order of the mapping.
+    By default the mapping has the same meaning in all Batch Replace buttons (IGNORE_CASE, REMOVE_WORD).
+
+    Example:
+        replacer = WordReplacer(load_mapping())
+        new_name = replacer('Cocktail Bar 01')"""
+
+    def __init__(self, mapping, ignore_case=IGNORE_CASE, remove=REMOVE_WORD):
+        """
+        :param mapping:     {find: replace}. Phrases of the same length are applied in the order of the mapping.
+        :param ignore_case: if True - words are matched case-insensitive.
+        :param remove:      Replacement value that means "remove the word" (e.g. '-'). None - replace literally.
+                            Extra spaces are removed after a word is removed."""
+        flags = re.IGNORECASE if ignore_case else 0
+        self.mapping  = mapping
+        self.patterns = [(re.compile(r'\b' + re.escape(key) + r'\b', flags),
+                          '' if remove is not None and value == remove else value.replace('\\', r'\\'))
+                         for key, value in sorted(mapping.items(), key=lambda item: -len(item[0]))]
+        # Single pattern for all words - most texts don't contain any of them and are returned right away
+        self.any_word = re.compile(r'\b(?:' + '|'.join(re.escape(key) for key in mapping) + r')\b', flags) \
+                        if mapping else None
+
+    def __call__(self, text):
+        #type:(str) -> str
+        if self.any_word is None or not self.any_word.search(text):
+            return text
+        removed = False
+        for pattern, replacement in self.patterns:
+            text, n = pattern.subn(replacement, text)
+            removed = removed or bool(n and not replacement)
+        if removed:
+            text = re.sub(r'\s{2,}', ' ', text).strip()
+        return text
+
+
+class RenameState(object):
+    """Per-document state of the last rename run: mapping hash + {element id: name hash}.
+
+    An element is evaluated again only if it's new or its name was changed since the last run.
+    If the mapping is different from the last run - all elements are evaluated (full_pass).
+    States are stored as JSON in pyRevit data folder (one file per document and scope).
+    Used by rename_types (Batch Rename FamilyTypes). Other Batch Replace buttons evaluate all names on every run.
+
+    Example:
+        state = RenameState(doc, 'types', mapping)
+        for el in elements:
+            if state.is_unchanged(el.Id, el.Name):
+                continue
+            ...
+            state.update(el.Id, new_name)
+        state.save()"""
+
+    def __init__(self, doc, scope, mapping, path=None):
+        """
+        :param doc:     Revit Document
+        :param scope:   Name of the renaming (e.g. 'types', 'views') - each scope has its own state.
+        :param mapping: {find: replace} that is used for renaming
+        :param path:    Path to a state file. Default: pyRevit data file per document and scope."""
+        self.path         = path or self.get_path(doc, scope)
+        self.mapping_hash = text_hash('{}|{}'.format(STATE_VERSION, json.dumps(sorted(mapping.items()))))
+        self.names        = {}      # {str(ElementId): name hash}
+        self.seen         = set()   # ElementIds (str) that were checked in this run
+        self.full_pass    = True
+
+        data = self._load()
+        if data.get('mapping') == self.mapping_hash:
+            self.names     = data.get('names', {})
+            self.full_pass = False
+
+    @staticmethod
+    def get_path(doc, scope):
+        file_id = 'AA_Tools_rename_{}_{}'.format(scope, get_document_key(doc))
+        try:
+            from pyrevit import script
+            return script.get_universal_data_file(file_id, 'json')
+        except Exception:
+            return os.path.join(tempfile.gettempdir(), file_id + '.json')
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with io.open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except ValueError:
+            return {}
+
+    def is_unchanged(self, el_id, name):
+        #type:(ElementId, str) -> bool
+        """Function to check if an element has the same name as after the last run."""
+        key = str(el_id.IntegerValue)
+        self.seen.add(key)
+        return self.names.get(key) == text_hash(name)
+
+    def update(self, el_id, name):
+        """Function to store the name of an element after it was evaluated (and renamed)."""
+        key = str(el_id.IntegerValue)
+        self.seen.add(key)
+        self.names[key] = text_hash(name)
+
+    def save(self):
+        """Function to write the state. Elements that were not found in this run (deleted) are dropped."""
+        names  = dict((k, v) for k, v in self.names.items() if k in self.seen)
+        folder = os.path.dirname(self.path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+        with io.open(self.path, 'w', encoding='utf-8') as f:
+            f.write(to_text(json.dumps({'mapping': self.mapping_hash, 'names': names})))
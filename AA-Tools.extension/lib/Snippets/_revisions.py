@@ -3,27 +3,36 @@
 # ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
 # ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
 #====================================================================================================
-import traceback
-
 from Autodesk.Revit.DB import (RevisionNumberType,
                                Revision,
+                               RevisionCloud,
                                ViewSheet,
+                               Viewport,
+                               FilteredElementCollector,
                                ElementId)
 from Snippets._context_manager import try_except
+from Snippets._csv             import write_csv
+from Snippets._context         import ctx
+from Snippets._profiling       import get_element, count_api
+
+#.NET
+import clr
+clr.AddReference('System')
+from System.Collections.Generic import List
 
-doc = __revit__.ActiveUIDocument.Document
 app = __revit__.Application
 rvt_year = int(app.VersionNumber)
 
 
-def create_revision(description, date, revision_type = RevisionNumberType.None):
-    #type:(str,str,RevisionNumberType) -> Revision
+def create_revision(description, date, revision_type = getattr(RevisionNumberType, 'None'), doc = None):    # .None is a syntax error in Python 3
+    #type:(str,str,RevisionNumberType,Document) -> Revision
     """Function to create new Revision.
     :param description: string for Description
     :param date:        string for Date
+    :param doc:         Revit Document. Default: active document
     :return:            new Revision"""
     with try_except(debug=True):
-        new_rev              = Revision.Create(doc)
+        new_rev              = Revision.Create(doc or ctx.doc)
         new_rev.Description  = description
         new_rev.RevisionDate = date
 
@@ -57,6 +66,98 @@ def add_revision_to_sheet(sheet, revision_id):
         sheet.SetAdditionalRevisionIds(revisions_on_sheet)
 
 
+def assign_revisions(sheets, revision_ids):
+    #type:(list, list) -> list
+    """ Function to add existing revisions to many sheets at once.
+    Existing Additional Revisions are read once per sheet and compared with new ones,
+    so only sheets that actually change are written. Has to be used inside of a Transaction.
+    :param sheets:          List of ViewSheets
+    :param revision_ids:    List of Revision.Id that should be added to the sheets.
+    :return:                List of ViewSheets that were changed."""
+    new_ids = set(rev_id.IntegerValue for rev_id in revision_ids)
+
+    changed = []
+    for sheet in sheets:
+        existing     = list(sheet.GetAdditionalRevisionIds())
+        existing_ids = set(rev_id.IntegerValue for rev_id in existing)
+        missing      = [ElementId(i) for i in sorted(new_ids - existing_ids)]
+        if not missing:
+            continue
+
+        with try_except(debug=True):
+            sheet.SetAdditionalRevisionIds(List[ElementId](existing + missing))
+            changed.append(sheet)
+    return changed
+
+
+# ╔╦╗╔═╗╔╦╗╦═╗╦═╗ ╦
+# ║║║╠═╣ ║ ╠╦╝║╔╩╦╝
+# ╩ ╩╩ ╩ ╩ ╩╚═╩╩ ╚═ MATRIX
+#==================================================
+class RevisionMatrix():
+    """Sheet x Revision overview of the whole project.
+    All Sheets, Revisions, Viewports and RevisionClouds are read in a single pass each.
+
+    Example:
+        matrix = RevisionMatrix(doc)
+        matrix.sheet_revisions[sheet.Id]        # [Revision.Id, ...]
+        matrix.clouds_on_sheet[sheet.Id]        # [RevisionCloud, ...]
+        matrix.export_to_csv(path)"""
+
+    def __init__(self, doc):
+        self.doc = doc
+
+        self.revisions       = [get_element(doc, rev_id) for rev_id in Revision.GetAllRevisionIds(doc)]
+        count_api('collector_passes')
+        self.sheets          = sorted(FilteredElementCollector(doc).OfClass(ViewSheet).ToElements(),
+                                      key=lambda s: s.SheetNumber)
+        self.sheet_revisions = {}   # {sheet.Id: [Revision.Id, ...]}
+        self.clouds_on_sheet = {}   # {sheet.Id: [RevisionCloud, ...]}
+        self.cloud_sheet     = {}   # {cloud.Id: sheet.Id or None}
+        self.build()
+
+    def build(self):
+        """Function to collect Revisions of every sheet and owner sheet of every RevisionCloud."""
+        # SHEETS -> REVISIONS
+        for sheet in self.sheets:
+            self.sheet_revisions[sheet.Id] = list(sheet.GetAllRevisionIds())
+
+        # VIEW -> SHEET (Single pass over Viewports)
+        count_api('collector_passes')
+        view_sheet = {vp.ViewId: vp.SheetId for vp in FilteredElementCollector(self.doc).OfClass(Viewport)}
+        for sheet in self.sheets:
+            view_sheet[sheet.Id] = sheet.Id
+
+        # CLOUDS -> SHEET
+        count_api('collector_passes')
+        for cloud in FilteredElementCollector(self.doc).OfClass(RevisionCloud).ToElements():
+            sheet_id = view_sheet.get(cloud.OwnerViewId)
+            self.cloud_sheet[cloud.Id] = sheet_id
+            if sheet_id:
+                self.clouds_on_sheet.setdefault(sheet_id, []).append(cloud)
+
+    def get_rows(self):
+        """Function to get a transmittal table.
+        :return: (header, rows) - Sheet Number | Sheet Name | Revision Number on sheet for each Revision"""
+        header = ['Sheet Number', 'Sheet Name']
+        header += ['{} - {} - {}'.format(rev.SequenceNumber, rev.RevisionDate, rev.Description) for rev in self.revisions]
+
+        rows = []
+        for sheet in self.sheets:
+            on_sheet = set(rev_id.IntegerValue for rev_id in self.sheet_revisions[sheet.Id])
+            row      = [sheet.SheetNumber, sheet.Name]
+            for rev in self.revisions:
+                row.append(sheet.GetRevisionNumberOnSheet(rev.Id) if rev.Id.IntegerValue in on_sheet else '')
+            rows.append(row)
+        return header, rows
+
+    def export_to_csv(self, path):
+        """Function to export a transmittal table to a CSV file.
+        :return: Path to a CSV file."""
+        header, rows = self.get_rows()
+        return write_csv(path, rows, header)
+
+
 
 
 # ╔╦╗╔═╗╔═╗╔╦╗╦╔╗╔╔═╗
@@ -81,7 +182,7 @@ def revision_data(revision):
 def revision_cloud_data(reivsion_cloud):
     print(reivsion_cloud)
     print("OwnerViewId: " + str( reivsion_cloud.OwnerViewId) )
-    owner_view = doc.GetElement(reivsion_cloud.OwnerViewId)
+    owner_view = reivsion_cloud.Document.GetElement(reivsion_cloud.OwnerViewId)
     print("OwnerView: " + owner_view.Name)
     print("Hidden: " + str( reivsion_cloud.IsHidden(owner_view)))
 
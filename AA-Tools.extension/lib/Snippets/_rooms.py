@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+import math
+
+from Autodesk.Revit.DB import (FilteredElementCollector,
+                               BuiltInCategory,
+                               BuiltInParameter,
+                               LocationPoint,
+                               LocationCurve,
+                               ElementId,
+                               XYZ)
+
+# CUSTOM IMPORTS
+from Snippets._boundingbox      import get_BB_extents, is_point_in_extents_3D
+from Snippets._context_manager  import chunked_transactions
+from Snippets._csv              import write_csv
+from Snippets._selection        import get_selected_rooms
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def get_placed_rooms(doc):
+    """Function to get all placed Rooms in the project (Area > 0)."""
+    all_rooms = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Rooms).WhereElementIsNotElementType().ToElements()
+    return [r for r in all_rooms if r.Area > 0]
+
+
+def get_room_label(room):
+    """Function to get 'Number - Name' of a Room."""
+    number = room.get_Parameter(BuiltInParameter.ROOM_NUMBER).AsString() or ''
+    name   = room.get_Parameter(BuiltInParameter.ROOM_NAME).AsString()   or ''
+    return '{} - {}'.format(number, name)
+
+
+def get_element_point(element):
+    #type:(Element) -> XYZ
+    """Function to get a representative point of an element.
+    LocationPoint -> Point, LocationCurve -> Midpoint, Otherwise -> BoundingBox Center.
+    :return: XYZ or None"""
+    location = element.Location
+    if isinstance(location, LocationPoint):
+        return location.Point
+    if isinstance(location, LocationCurve):
+        return location.Curve.Evaluate(0.5, True)
+
+    BB = element.get_BoundingBox(None)
+    if BB:
+        return (BB.Min + BB.Max) / 2
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class RoomIndex(object):
+    """Spatial index of Rooms to quickly find a Room for many elements.
+
+    Rooms are grouped by Level and placed into a 2D grid of cells based on their BoundingBox.
+    For each element only Rooms from matching cells are checked with Room.IsPointInRoom,
+    instead of checking every Room/Element pair.
+
+    Example:
+        rooms   = get_selected_rooms(uidoc)
+        index   = RoomIndex(doc, rooms)
+        results = index.assign(elements)           # {ElementId: Room}
+        index.write_to_parameter(results, 'Comments')
+        index.export_to_csv(results, path_csv)"""
+
+    def __init__(self, doc, rooms=None, cell_size=20.0, z_offset=1.0):
+        #type:(Document, list, float, float) -> None
+        """
+        :param doc:       Revit Document
+        :param rooms:     List of Rooms. If None - all placed Rooms in the project are used.
+        :param cell_size: Size of a grid cell in feet.
+        :param z_offset:  Elements are usually placed exactly on the Level,
+                          so their point is lifted by z_offset(feet) before checking IsPointInRoom."""
+        self.doc        = doc
+        self.rooms      = rooms if rooms is not None else get_placed_rooms(doc)
+        self.cell_size  = float(cell_size)
+        self.z_offset   = z_offset
+
+        self._extents    = {}   # room_id   -> (min_x, min_y, min_z, max_x, max_y, max_z)
+        self._grid       = {}   # level_id  -> {(ix, iy): [Room, ...]}
+        self.stats       = {'candidates': 0, 'is_point_in_room': 0, 'assigned': 0, 'unassigned': 0}
+
+        self.build()
+
+    def _cells(self, min_x, min_y, max_x, max_y):
+        """Generator of grid cells that overlap given extents."""
+        size = self.cell_size
+        for ix in range(int(math.floor(min_x / size)), int(math.floor(max_x / size)) + 1):
+            for iy in range(int(math.floor(min_y / size)), int(math.floor(max_y / size)) + 1):
+                yield (ix, iy)
+
+    def build(self):
+        """Function to read Rooms once and place them into a Level-aware grid."""
+        for room in self.rooms:
+            BB = room.get_BoundingBox(None)
+            if not BB:
+                continue
+            extents = get_BB_extents(BB)
+            self._extents[room.Id] = extents
+
+            level_grid = self._grid.setdefault(room.LevelId, {})
+            for cell in self._cells(extents[0], extents[1], extents[3], extents[4]):
+                level_grid.setdefault(cell, []).append(room)
+
+    def get_candidates(self, point, level_id=None):
+        """Function to get Rooms whose BoundingBox contains given point.
+        :param point:    XYZ
+        :param level_id: ElementId of a Level. If None or Invalid - all Levels are checked."""
+        if level_id and level_id != ElementId.InvalidElementId and level_id in self._grid:
+            grids = [self._grid[level_id]]
+        else:
+            grids = self._grid.values()
+
+        size = self.cell_size
+        cell = (int(math.floor(point.X / size)), int(math.floor(point.Y / size)))
+        x, y, z = point.X, point.Y, point.Z
+
+        candidates = []
+        for level_grid in grids:
+            for room in level_grid.get(cell, []):
+                if is_point_in_extents_3D(self._extents[room.Id], x, y, z):
+                    candidates.append(room)
+        return candidates
+
+    def find_room(self, element):
+        """Function to find a Room where given element is located.
+        :return: Room or None"""
+        point = get_element_point(element)
+        if not point:
+            return
+
+        point      = XYZ(point.X, point.Y, point.Z + self.z_offset)
+        candidates = self.get_candidates(point, getattr(element, 'LevelId', None))
+        self.stats['candidates'] += len(candidates)
+
+        # Fallback: Element might be hosted on another Level than the Room (e.g. offset from a Level below)
+        if not candidates and getattr(element, 'LevelId', None) in self._grid:
+            candidates = self.get_candidates(point)
+            self.stats['candidates'] += len(candidates)
+
+        for room in candidates:
+            self.stats['is_point_in_room'] += 1
+            if room.IsPointInRoom(point):
+                return room
+
+    def assign(self, elements):
+        """Function to find Rooms for all given elements.
+        :return: dict {ElementId: Room or None}"""
+        results = {}
+        for el in elements:
+            room = self.find_room(el)
+            results[el.Id] = room
+            self.stats['assigned' if room else 'unassigned'] += 1
+        return results
+
+    # ╔═╗╦ ╦╔╦╗╔═╗╦ ╦╔╦╗
+    # ║ ║║ ║ ║ ╠═╝║ ║ ║
+    # ╚═╝╚═╝ ╩ ╩  ╚═╝ ╩  OUTPUT
+    #==================================================
+    def write_to_parameter(self, results, param_name, value_func=get_room_label, chunk_size=500):
+        """Function to write assigned Rooms into a text parameter of elements.
+        All changes are made in chunked Transactions that are assimilated into a single TransactionGroup.
+        :param results:    dict {ElementId: Room} from self.assign()
+        :param param_name: Name of a parameter of an element.
+        :param value_func: Function to get a value from a Room. Default: 'Number - Name'
+        :return:           list of ElementIds that could not be written (incl. elements of rolled back chunks)."""
+        failed = []
+
+        def write(item):
+            el_id, room = item
+            p = self.doc.GetElement(el_id).LookupParameter(param_name)
+            if not p or p.IsReadOnly:
+                failed.append(el_id)
+                return
+            value = value_func(room) if room else ''
+            if p.AsString() != value:
+                p.Set(value)
+
+        def rolled_back(chunk):
+            skipped = set(failed)
+            failed.extend(el_id for el_id, _ in chunk if el_id not in skipped)
+
+        chunked_transactions(self.doc, 'Assign Elements to Rooms', list(results.items()), write, chunk_size,
+                             on_rollback=rolled_back)
+        return failed
+
+    def export_to_csv(self, results, path):
+        """Function to export assigned Rooms to a CSV file.
+        :return: Path to a CSV file."""
+        rows = []
+        for el_id, room in sorted(results.items(), key=lambda x: x[0].IntegerValue):
+            el  = self.doc.GetElement(el_id)
+            cat = el.Category.Name if el.Category else ''
+            if room:
+                rows.append([el_id.IntegerValue, cat, el.Name, room.Id.IntegerValue,
+                             room.get_Parameter(BuiltInParameter.ROOM_NUMBER).AsString(),
+                             room.get_Parameter(BuiltInParameter.ROOM_NAME).AsString()])
+            else:
+                rows.append([el_id.IntegerValue, cat, el.Name, '', '', ''])
+
+        header = ['ElementId', 'Category', 'Name', 'RoomId', 'RoomNumber', 'RoomName']
+        return write_csv(path, rows, header)
+
+
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+#====================================================================================================
+def assign_elements_to_rooms(doc, elements, rooms=None, uidoc=None):
+    """Function to assign elements to Rooms.
+    :param doc:      Revit Document
+    :param elements: List of elements (Furniture, Doors, Equipment...)
+    :param rooms:    List of Rooms. If None and uidoc is given - user is asked to select Rooms.
+                     Otherwise all placed Rooms are used.
+    :return:         (RoomIndex, dict {ElementId: Room})"""
+    if rooms is None and uidoc is not None:
+        rooms = get_selected_rooms(uidoc)
+
+    index = RoomIndex(doc, rooms)
+    return index, index.assign(elements)
@@ -21,14 +21,15 @@ from System.Collections.Generic import List
 # CUSTOM IMPORTS
 from Snippets._variables import ALL_VIEW_TYPES
 from GUI.forms           import select_from_dict
+from Snippets._query     import compile_query, QueryError
+from Snippets._context   import ctx
 
 # ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
 # ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
 #  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝
 #==================================================
-uidoc     = __revit__.ActiveUIDocument
-doc       = __revit__.ActiveUIDocument.Document
-selection = uidoc.Selection                          # type: Selection
+# Active uidoc/doc are resolved on every call with ctx (Snippets._context),
+# so functions work with the active document when this module is reused in rocket mode.
 
 # ╔═╗╔═╗╔╦╗  ╔═╗╔═╗╦  ╔═╗╔═╗╔╦╗╔═╗╔╦╗
 # ║ ╦║╣  ║   ╚═╗║╣ ║  ║╣ ║   ║ ║╣  ║║
@@ -37,8 +38,9 @@ selection = uidoc.Selection                          # type: Selection
 
 
 
-def get_selected_elements(uidoc = uidoc, exitscript=True):
+def get_selected_elements(uidoc = None, exitscript=True):
     """Property that retrieves selected views or promt user to select some from the dialog box."""
+    uidoc     = uidoc or ctx.uidoc
     doc       = uidoc.Document
     selection = uidoc.Selection  # type: Selection
 
@@ -57,9 +59,10 @@ def get_selected_elements(uidoc = uidoc, exitscript=True):
 
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GET ROOMS
 
-def get_selected_rooms(uidoc=uidoc, exitscript = True):
+def get_selected_rooms(uidoc=None, exitscript = True):
     """Function to Pick Rooms.
     Previously selected rooms will be pre-selected."""
+    uidoc     = uidoc or ctx.uidoc
     doc       = uidoc.Document
     selection = uidoc.Selection  # type: Selection
 
@@ -92,7 +95,7 @@ def get_selected_rooms(uidoc=uidoc, exitscript = True):
 
 
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GET VIEWS
-def get_selected_views(given_uidoc = uidoc, exit_if_none = False, title = '__title__', version = 'Version: _'):
+def get_selected_views(given_uidoc = None, exit_if_none = False, title = '__title__', version = 'Version: _'):
     """Function to get selected views. If none selected give a menu for a user to select views.
     ALL_VIEW_TYPES = [ViewPlan, ViewSection, View3D , ViewSchedule, View, ViewDrafting]
     LastUpdates:
@@ -100,6 +103,7 @@ def get_selected_views(given_uidoc = uidoc, exit_if_none = False, title = '__tit
     :return: list of selected views."""
 
     # GET SELECTED ELEMENTS
+    given_uidoc = given_uidoc or ctx.uidoc
     doc         = given_uidoc.Document
     UI_selected = given_uidoc.Selection.GetElementIds()
 
@@ -119,13 +123,14 @@ def get_selected_views(given_uidoc = uidoc, exit_if_none = False, title = '__tit
     return selected_views
 
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GET SHEETS
-def get_selected_sheets(given_uidoc = uidoc, exit_if_none = False, title='__title__', label='Select Sheets',
+def get_selected_sheets(given_uidoc = None, exit_if_none = False, title='__title__', label='Select Sheets',
                         btn_name = 'Select Sheets',  version = 'Version: _'):
     """Function to get selected views. return list of selected views.
     LastUpdates:
     [15.02.2022] - If no sheets selected -> Select from DialogBox
     [01.06.2022] - Bug Fixed + added more controls(label, btn_name)"""
     #>>>>>>>>>> GET SELECTED ELEMENTS
+    given_uidoc = given_uidoc or ctx.uidoc
     doc         = given_uidoc.Document
     UI_selected = given_uidoc.Selection.GetElementIds()
 
@@ -181,10 +186,11 @@ def get_selected_walls(uidoc, exitscript = True):
 # ╚═╝╚═╝╩═╝╚═╝╚═╝ ╩
 #==================================================
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> SELECT TITLEBLOCK
-def select_title_block(given_uidoc = uidoc, exitscript = True):
+def select_title_block(given_uidoc = None, exitscript = True):
     """Function to let user select a title block.
     LastUpdates:
     [15.02.2022] - SelectFromList -> select_from_dict()"""
+    given_uidoc = given_uidoc or ctx.uidoc
     doc = given_uidoc.Document
     #>>>>>>>>>> SELECT TITLE BLOCK
     all_title_blocks = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_TitleBlocks).WhereElementIsElementType().ToElements()
@@ -204,7 +210,8 @@ def select_title_block(given_uidoc = uidoc, exitscript = True):
     return selected_title_block[0]
 
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GET RegionType
-def select_region_type(given_uidoc = uidoc):
+def select_region_type(given_uidoc = None):
+    given_uidoc = given_uidoc or ctx.uidoc
     all_filled_regions = FilteredElementCollector(given_uidoc.Document).OfClass(FilledRegionType)
     dict_filled_regions = {Element.Name.GetValue(fr):fr for fr in all_filled_regions}
 
@@ -214,7 +221,8 @@ def select_region_type(given_uidoc = uidoc):
     return dict_filled_regions[selection]
 
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GET FloorType
-def select_floor_type(given_uidoc = uidoc):
+def select_floor_type(given_uidoc = None):
+    given_uidoc = given_uidoc or ctx.uidoc
     all_floor_types = FilteredElementCollector(given_uidoc.Document).OfCategory(BuiltInCategory.OST_Floors).WhereElementIsElementType().ToElements()
     dict_floor_types = {Element.Name.GetValue(fr):fr for fr in all_floor_types}
 
@@ -251,6 +259,17 @@ class ISelectionFilter_Classes(ISelectionFilter):
 
 
 
+class ISelectionFilter_Query(ISelectionFilter):
+    def __init__(self, element_filter):
+        """ ISelectionFilter made to filter with a Revit ElementFilter (e.g. compiled selection query)
+        :param element_filter: ElementFilter"""
+        self.element_filter = element_filter
+
+    def AllowElement(self, element):
+        return self.element_filter.PassesFilter(element)
+
+
+
 class ISelectionFilter_Categories(ISelectionFilter):
     def __init__(self, allowed_cats):
         """ ISelectionFilter made to filter with types
@@ -269,14 +288,16 @@ class ISelectionFilter_Categories(ISelectionFilter):
 # ╩  ╩╚═╝╩ ╩  ╚═╝╩═╝╚═╝╩ ╩╚═╝╝╚╝ ╩ ╚═╝
 #==================================================
 #>>>>>>>>>> PICK WALL
-def pick_wall(given_uidoc = uidoc):
+def pick_wall(given_uidoc = None):
     """Function to promt user to select a wall element in Revit UI."""
+    given_uidoc = given_uidoc or ctx.uidoc
     wall_ref = given_uidoc.Selection.PickObject(ObjectType.Element, CustomISelectionFilter("-2000011"), "Select a Wall")    # -2000011 <- Id of OST_Walls
     wall     = given_uidoc.Document.GetElement(wall_ref)
     return wall
 
-def pick_curve(given_uidoc = uidoc):
+def pick_curve(given_uidoc = None):
     """Function to promt user to select a curve element in Revit UI."""
+    given_uidoc = given_uidoc or ctx.uidoc
     curve_ref = given_uidoc.Selection.PickObject(ObjectType.Element, CustomISelectionFilter("-2000051"), "Select a Curve")
     selected_curve = given_uidoc.Document.GetElement(curve_ref)
     curve = selected_curve.GeometryCurve
@@ -289,28 +310,45 @@ def pick_curve(given_uidoc = uidoc):
 
 
 
-def pick_by_category(list_categories):
+def pick_by_category(list_categories, exit_if_none = True):
     """Picks elements of specified categories from a selection.
     Args:
-        list_types (list): A list of BuiltInCategories to filter selections by.
+        list_categories (list): A list of BuiltInCategories to filter selections by.
         exit_if_none (bool, optional): Whether to exit if no elements are selected. Defaults to True.
 
     Returns:
-        list: A list of selected elements that match the specified class types."""
+        list: A list of selected elements that match the specified categories."""
 
-    #✅ Ensure list_types is a list
+    #✅ Ensure list_categories is a list
     if not isinstance(list_categories, list):
         list_categories = [list_categories]
 
+    return pick_by_query('category in $categories', exit_if_none, categories=list_categories)
+
+
+
+def pick_by_query(query, exit_if_none = True, given_uidoc = None, **params):
+    """Picks elements that match a selection query (see Snippets._query.QueryPlan).
+    e.g. pick_by_query('category in (Doors, Windows) and level = $level', level=level)
+    Args:
+        query (str): Selection query. Values can be given as $placeholders in params.
+        exit_if_none (bool, optional): Whether to exit if no elements are selected. Defaults to True.
+
+    Returns:
+        list: A list of selected elements that match the query."""
+    given_uidoc = given_uidoc or ctx.uidoc
+    doc = given_uidoc.Document
 
     #👉 Pick Elements
     selected_elems = []
     try:
-        ISF = ISelectionFilter_Categories(list_categories)
+        ISF = ISelectionFilter_Query(compile_query(query).get_filter(doc, **params))
 
         with forms.WarningBar(title='Select Elements and click "Finish"'):
-            ref_selected_elems = selection.PickObjects(ObjectType.Element,ISF)
+            ref_selected_elems = given_uidoc.Selection.PickObjects(ObjectType.Element,ISF)
         selected_elems = [doc.GetElement(ref) for ref in ref_selected_elems]
+    except QueryError as e:
+        forms.alert(str(e), title='Invalid Query.', exitscript=True)
     except: pass
 
     #❌ Exitscript if nothing selected
@@ -335,13 +373,14 @@ def pick_by_class(list_types, exit_if_none = True):
         list_types = [list_types]
 
     #👉 Pick Elements
+    uidoc          = ctx.uidoc
     selected_elems = []
     try:
         ISF = ISelectionFilter_Classes(list_types)
 
         with forms.WarningBar(title='Select Elements and click "Finish"'):
-            ref_selected_elems = selection.PickObjects(ObjectType.Element,ISF)
-        selected_elems = [doc.GetElement(ref) for ref in ref_selected_elems]
+            ref_selected_elems = uidoc.Selection.PickObjects(ObjectType.Element,ISF)
+        selected_elems = [uidoc.Document.GetElement(ref) for ref in ref_selected_elems]
     except: pass
 
     #❌ Exitscript if nothing selected
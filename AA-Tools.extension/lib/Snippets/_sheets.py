@@ -1,14 +1,14 @@
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import UIDocument
-default_uidoc = __revit__.ActiveUIDocument
-default_doc = default_uidoc.Document
+from Snippets._context import ctx, DocCache
+from Snippets._profiling import get_element, count_api
 
 
 
 
-def get_views_on_sheet(sheet, uidoc=default_uidoc):
+def get_views_on_sheet(sheet, uidoc=None):
     """Function to return all views found on the given sheet."""
-    doc = uidoc.Document
+    doc = (uidoc or ctx.uidoc).Document
     viewports_ids   = sheet.GetAllViewports()
     viewports       = [doc.GetElement(viewport_id)  for viewport_id in viewports_ids]
     views_ids       = [viewport.ViewId              for viewport    in viewports]
@@ -16,12 +16,12 @@ def get_views_on_sheet(sheet, uidoc=default_uidoc):
     return views
 
 
-def get_titleblock_on_sheet(sheet, uidoc=default_uidoc):
+def get_titleblock_on_sheet(sheet, uidoc=None):
     """Function to get TitleBlock from given ViewSheet.
     It will not return any TitleBlocks if there are more than 1 on ViewSheet.
     :returns TitleBlock"""
     #TODO THIS FUNCTION IS OBSOLETE
-    doc = uidoc.Document
+    doc = (uidoc or ctx.uidoc).Document
 
     all_TitleBlocks = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_TitleBlocks).WhereElementIsNotElementType().ToElements()
     title_blocks_on_sheet = []
@@ -61,3 +61,117 @@ def get_titleblocks_from_sheet(sheet, uidoc):
 
     return list(tb)
 
+
+
+def get_document_version_key(doc):
+    """Function to get a key that changes when the document is saved (Revit 2021+).
+    :return: (VersionGUID, NumberOfSaves) or None if not supported."""
+    try:
+        version = Document.GetDocumentVersion(doc)
+        return (str(version.VersionGUID), version.NumberOfSaves)
+    except:
+        return None
+
+
+class ViewSheetMap(object):
+    """Bidirectional View <-> Sheet map built from a single pass over Viewports and ScheduleSheetInstances.
+    Use ViewSheetMap.get(doc) to reuse a cached map for the same document version.
+
+    Viewports can be moved or deleted without saving, so lookups are answered from the map and checked
+    without collectors: placements (Viewport/ScheduleSheetInstance) are looked up by Id, Sheet Number
+    of a view shows that it was placed and sheet.GetAllViewports() shows new viewports on a sheet.
+    The map is built again if it's outdated. Schedules and Legends placed on another sheet
+    since the map was built are found after build() (or when the document is saved).
+
+    Example:
+        vs_map = ViewSheetMap.get(doc)
+        sheet  = vs_map.get_sheet(view)
+        views  = vs_map.get_views(sheet)"""
+    _cache = DocCache()
+
+    def __init__(self, doc):
+        self.doc            = doc
+        self.version        = get_document_version_key(doc)
+        self.view_to_sheets = {}    # {view_id: [sheet_id, ...]}  (Schedules can be placed on many sheets)
+        self.sheet_to_views = {}    # {sheet_id: [view_id, ...]}
+        self.placements     = {}    # {(view_id, sheet_id): Viewport/ScheduleSheetInstance Id}
+        self.viewports      = {}    # {sheet_id: set(Viewport Ids)}
+        self.build()
+
+    @classmethod
+    def get(cls, doc):
+        """Function to get a cached ViewSheetMap for the given document.
+        A new map is built if the document was saved since the last time."""
+        values  = cls._cache.get_values(doc)
+        cached  = values.get(cls)
+        version = get_document_version_key(doc)
+        if not cached or version is None or cached.version != version:     # No version - can't be reused
+            cached = values[cls] = cls(doc)
+        return cached
+
+    def _add(self, view_id, sheet_id, placement_id):
+        self.view_to_sheets.setdefault(view_id, []).append(sheet_id)
+        self.sheet_to_views.setdefault(sheet_id, []).append(view_id)
+        self.placements[(view_id, sheet_id)] = placement_id
+
+    def build(self):
+        """Function to read all Viewports and ScheduleSheetInstances once."""
+        self.view_to_sheets = {}
+        self.sheet_to_views = {}
+        self.placements     = {}
+        self.viewports      = {}
+
+        count_api('collector_passes')
+        for vp in FilteredElementCollector(self.doc).OfClass(Viewport):
+            self._add(vp.ViewId, vp.SheetId, vp.Id)
+            self.viewports.setdefault(vp.SheetId, set()).add(vp.Id)
+
+        count_api('collector_passes')
+        for schedule_instance in FilteredElementCollector(self.doc).OfClass(ScheduleSheetInstance):
+            if not schedule_instance.IsTitleblockRevisionSchedule:
+                self._add(schedule_instance.ScheduleId, schedule_instance.OwnerViewId, schedule_instance.Id)
+
+    def _is_placed(self, view_id, sheet_id):
+        """Function to check that a placement of the map still exists on the same sheet (single GetElement)."""
+        placement = get_element(self.doc, self.placements[(view_id, sheet_id)])
+        if placement is None or not placement.IsValidObject:
+            return False
+        if isinstance(placement, Viewport):
+            return placement.SheetId == sheet_id
+        return placement.OwnerViewId == sheet_id
+
+    def get_sheet_ids(self, view):
+        """Function to get Ids of all sheets where view is placed."""
+        sheet_ids = self.view_to_sheets.get(view.Id, [])
+        if not all(self._is_placed(view.Id, i) for i in sheet_ids):
+            self.build()                # Viewport/Sheet was deleted since the map was built
+            sheet_ids = self.view_to_sheets.get(view.Id, [])
+
+        # Other views can be placed only once - Sheet Number shows a new placement
+        elif not sheet_ids and not (isinstance(view, ViewSchedule) or view.ViewType == ViewType.Legend):
+            if _get_sheet_number(view) not in (None, '', '---'):
+                self.build()
+                sheet_ids = self.view_to_sheets.get(view.Id, [])
+        return list(sheet_ids)
+
+    def get_sheet(self, view):
+        #type:(View) -> ViewSheet
+        """Function to get ViewSheet where the given view is placed (first one for schedules)."""
+        sheet_ids = self.get_sheet_ids(view)
+        if sheet_ids:
+            return get_element(self.doc, sheet_ids[0])
+
+    def get_views(self, sheet):
+        """Function to get all views (incl. schedules) placed on the given sheet."""
+        view_ids = self.sheet_to_views.get(sheet.Id, [])
+        if set(sheet.GetAllViewports()) != self.viewports.get(sheet.Id, set()) or \
+           not all(self._is_placed(view_id, sheet.Id) for view_id in view_ids):
+            self.build()
+            view_ids = self.sheet_to_views.get(sheet.Id, [])
+        return [get_element(self.doc, view_id) for view_id in view_ids]
+
+
+def _get_sheet_number(view):
+    """Function to get Sheet Number parameter of a View ('---' or empty if not placed, None if not available)."""
+    p = view.get_Parameter(BuiltInParameter.VIEWER_SHEET_NUMBER)
+    return p.AsString() if p else None
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+from Autodesk.Revit.DB import (ViewSheet,
+                               ViewSchedule,
+                               Viewport,
+                               BuiltInParameter,
+                               XYZ)
+
+# CUSTOM IMPORTS
+from Snippets._context_manager import ef_Transaction
+from Snippets._sheets          import get_titleblocks_from_sheet
+from Snippets._selection       import select_title_block
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+#====================================================================================================
+def pack_shelves(items, bin_width, bin_height, spacing=0.0):
+    #type:(list, float, float, float) -> list
+    """Function to pack rectangles into bins with First-Fit Decreasing Height shelf algorithm (pure Python).
+    Rectangles are sorted by height, then placed left to right on horizontal shelves.
+    A new shelf is opened below the last one, and a new bin when there is no space left.
+    Rectangles larger than a bin are placed alone in their own bin.
+
+    :param items:      [(key, width, height), ...]
+    :param bin_width:  Usable width of a bin
+    :param bin_height: Usable height of a bin
+    :param spacing:    Gap between rectangles
+    :return:           [[(key, x, y, width, height), ...], ...] - list of bins.
+                       x, y - offset of the top-left corner from the top-left corner of a bin."""
+    bins = []   # [{'shelves': [[y, height, used_width], ...], 'used_height': float, 'items': []}]
+
+    for key, w, h in sorted(items, key=lambda i: (-i[2], -i[1])):
+        # OVERSIZED
+        if w > bin_width or h > bin_height:
+            bins.append({'shelves': [], 'used_height': bin_height, 'items': [(key, 0.0, 0.0, w, h)]})
+            continue
+
+        placed = False
+        for b in bins:
+            # EXISTING SHELF
+            for shelf in b['shelves']:
+                shelf_y, shelf_h, used_w = shelf
+                x = used_w + spacing if used_w else 0.0
+                if h <= shelf_h and x + w <= bin_width:
+                    b['items'].append((key, x, shelf_y, w, h))
+                    shelf[2] = x + w
+                    placed = True
+                    break
+            if placed:
+                break
+
+            # NEW SHELF
+            y = b['used_height'] + spacing if b['used_height'] else 0.0
+            if y + h <= bin_height:
+                b['shelves'].append([y, h, w])
+                b['used_height'] = y + h
+                b['items'].append((key, 0.0, y, w, h))
+                placed = True
+                break
+
+        # NEW BIN
+        if not placed:
+            bins.append({'shelves': [[0.0, h, w]], 'used_height': h, 'items': [(key, 0.0, 0.0, w, h)]})
+
+    return [b['items'] for b in bins]
+
+
+def get_view_size(view):
+    """Function to get size of a View on a sheet in paper space (feet).
+    :return: (width, height)"""
+    outline = view.Outline
+    return (outline.Max.U - outline.Min.U, outline.Max.V - outline.Min.V)
+
+
+def get_skip_reason(view):
+    #type:(View) -> str
+    """Function to explain why a View can't be placed on a sheet with a Viewport (Viewport.CanAddViewToSheet is False)."""
+    if isinstance(view, ViewSheet):
+        return 'View is a Sheet'
+    if isinstance(view, ViewSchedule):
+        return 'Schedules are placed as Schedule Instances, not Viewports'
+    if view.IsTemplate:
+        return 'View Template'
+
+    p = view.get_Parameter(BuiltInParameter.VIEWER_SHEET_NUMBER)
+    sheet_number = p.AsString() if p else None
+    if sheet_number and sheet_number != '---':
+        return 'View is already placed on a sheet: {}'.format(sheet_number)
+    return 'View can not be placed on a sheet (e.g. empty view or browser view)'
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class ViewportLayout(object):
+    """Class to place many views on new sheets automatically.
+
+    1. View sizes are read from View.Outline
+    2. Usable area is measured from a TitleBlock on the first created sheet (minus margins)
+    3. Views are packed with pack_shelves()
+    4. Sheets and Viewports are created in a single Transaction
+
+    Example:
+        layout = ViewportLayout(uidoc, views, margins=(0.05, 0.05, 0.05, 0.4))
+        sheets = layout.create()"""
+
+    def __init__(self, uidoc, views, title_block_id=None, margins=(0.03, 0.03, 0.03, 0.03),
+                 spacing=0.02, sheet_name='Layout'):
+        """
+        :param uidoc:          UIDocument
+        :param views:          List of Views to place
+        :param title_block_id: ElementId of a TitleBlock Type. User is asked to select one if None.
+        :param margins:        (left, bottom, right, top) margins inside of the TitleBlock in feet.
+                               Use bigger values to keep title strip/legend free.
+        :param spacing:        Gap between viewports in feet.
+        :param sheet_name:     Name for created sheets. ' - N' will be added."""
+        self.uidoc          = uidoc
+        self.doc            = uidoc.Document
+        self.views          = views
+        self.title_block_id = title_block_id or select_title_block(uidoc)
+        self.margins        = margins
+        self.spacing        = spacing
+        self.sheet_name     = sheet_name
+
+        self.sheets    = []
+        self.skipped   = []    # [(view, reason), ...]
+        self.oversized = []    # [view, ...]
+
+    def get_usable_area(self, sheet):
+        """Function to get usable area of a sheet from its TitleBlock BoundingBox.
+        :return: (min_x, min_y, max_x, max_y) in sheet coordinates."""
+        title_blocks = get_titleblocks_from_sheet(sheet, self.uidoc)
+        if not title_blocks:
+            raise Exception('TitleBlock was not found on a sheet: {}'.format(sheet.SheetNumber))
+
+        BB = title_blocks[0].get_BoundingBox(sheet)
+        left, bottom, right, top = self.margins
+        return (BB.Min.X + left, BB.Min.Y + bottom, BB.Max.X - right, BB.Max.Y - top)
+
+    def get_items(self):
+        """Function to read sizes of all views that can be placed on a new sheet.
+        :return: [(view, width, height), ...]"""
+        items = []
+        for view in self.views:
+            if view.IsTemplate:
+                self.skipped.append((view, 'View Template'))
+                continue
+            try:
+                width, height = get_view_size(view)
+            except:
+                self.skipped.append((view, 'View has no Outline'))
+                continue
+            items.append((view, width, height))
+        return items
+
+    def _create_sheet(self, n):
+        sheet = ViewSheet.Create(self.doc, self.title_block_id)
+        try:
+            sheet.Name = '{} - {}'.format(self.sheet_name, n)
+        except:
+            pass
+        self.sheets.append(sheet)
+        return sheet
+
+    def create(self, title='Layout Views on Sheets'):
+        """Function to create sheets and place all views in a single Transaction.
+        :return: list of created ViewSheets"""
+        items = self.get_items()
+        if not items:
+            return []
+
+        with ef_Transaction(self.doc, title, failures=True):
+            # MEASURE USABLE AREA ON THE FIRST SHEET
+            first_sheet = self._create_sheet(1)
+            self.doc.Regenerate()
+            min_x, min_y, max_x, max_y = self.get_usable_area(first_sheet)
+
+            # SKIP VIEWS THAT CAN'T BE PLACED (ALREADY PLACED, SCHEDULES, EMPTY...)
+            placeable = []
+            for view, w, h in items:
+                if Viewport.CanAddViewToSheet(self.doc, first_sheet.Id, view.Id):
+                    placeable.append((view, w, h))
+                else:
+                    self.skipped.append((view, get_skip_reason(view)))
+
+            if not placeable:
+                self.doc.Delete(first_sheet.Id)
+                return []
+
+            # PACK
+            bins = pack_shelves(placeable, max_x - min_x, max_y - min_y, self.spacing)
+
+            # CREATE SHEETS + VIEWPORTS
+            for n, packed in enumerate(bins):
+                sheet = first_sheet if n == 0 else self._create_sheet(n + 1)
+                for view, x, y, w, h in packed:
+                    if w > max_x - min_x or h > max_y - min_y:
+                        self.oversized.append(view)
+
+                    center = XYZ(min_x + x + w / 2.0, max_y - y - h / 2.0, 0)
+                    Viewport.Create(self.doc, sheet.Id, view.Id, center)
+
+        return [s for s in self.sheets if s.IsValidObject]
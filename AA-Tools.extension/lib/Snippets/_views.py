@@ -3,15 +3,19 @@
 # ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
 # ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
 # ==================================================
+import math
+
 from pyrevit import forms
 from Autodesk.Revit.DB import *
 
+# CUSTOM IMPORTS
+from Snippets._context_manager import chunked_transactions
+from Snippets._sheets          import ViewSheetMap
+
 # ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
 # ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
 #  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
 # ==================================================
-uidoc    = __revit__.ActiveUIDocument
-doc      = __revit__.ActiveUIDocument.Document
 app      = __revit__.Application
 rvt_year = int(app.VersionNumber)
 
@@ -32,14 +36,10 @@ def create_string_equals_filter(key_parameter, element_value, caseSensitive = Tr
     return ElementParameterFilter(f_rule)
 
 def get_sheet_from_view(view):
-    #type:(View) -> ViewPlan
-    """Function to get ViewSheet associated with the given ViewPlan"""
-
-    #>>>>>>>>>> CREATE FILTER
-    my_filter = create_string_equals_filter(key_parameter=BuiltInParameter.SHEET_NUMBER,
-                                            element_value=view.get_Parameter(BuiltInParameter.VIEWER_SHEET_NUMBER).AsString() )
-    #>>>>>>>>>> GET SHEET
-    return FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Sheets).WhereElementIsNotElementType().WherePasses(my_filter).FirstElement()
+    #type:(View) -> ViewSheet
+    """Function to get ViewSheet associated with the given View.
+    It uses cached ViewSheetMap, so it's fast to call it for many views."""
+    return ViewSheetMap.get(view.Document).get_sheet(view)
 
 # CREATE VIEW
 def create_3D_view(uidoc, name=''):
@@ -231,4 +231,163 @@ class SectionGenerator():
 
 
 
+# ╔═╗╔═╗╔═╗╔╦╗╦╔═╗╔╗╔  ╔╗ ╔═╗╔╦╗╔═╗╦ ╦
+# ╚═╗║╣ ║   ║ ║║ ║║║║  ╠╩╗╠═╣ ║ ║  ╠═╣
+# ╚═╝╚═╝╚═╝ ╩ ╩╚═╝╝╚╝  ╚═╝╩ ╩ ╩ ╚═╝╩ ╩ SECTION BATCH
+def get_section_basis(vector, mode='elevation'):
+    #type:(tuple, str) -> tuple
+    """Function to calculate Transform basis for a section in pure Python.
+    Same logic as SectionGenerator.create_transform, but without creating Revit objects.
+    :param vector: (x, y, z) - direction of an element
+    :param mode:   'elevation' / 'cross' / 'plan'
+    :return:       (BasisX, BasisY, BasisZ) as (x, y, z) tuples"""
+    x, y, z = vector
+    length  = math.sqrt(x*x + y*y + z*z)
+    x, y, z = x / length, y / length, z / length
+
+    mode = mode.lower()
+    if mode == 'elevation':
+        return (x, y, z), (0.0, 0.0, 1.0), (y, -x, 0.0)        # BasisZ = vector x Z
+
+    elif mode == 'cross':
+        return (y, -x, 0.0), (0.0, 0.0, 1.0), (-x, -y, 0.0)    # BasisX = vector x Z
+
+    elif mode == 'plan':
+        length_xy = math.sqrt(x*x + y*y) or 1.0
+        return (-x, -y, -z), (-y / length_xy, x / length_xy, 0.0), (0.0, 0.0, -1.0)
+
+    raise ValueError('Wrong mode: {}'.format(mode))
+
+
+def get_section_extents(width, height, depth, offset, mode='elevation'):
+    #type:(float, float, float, float, str) -> tuple
+    """Function to calculate SectionBox Min/Max in pure Python.
+    Same logic as SectionGenerator.create_section_box.
+    :return: ((min_x, min_y, min_z), (max_x, max_y, max_z))"""
+    W_half, H_half, D_half = width / 2.0, height / 2.0, depth / 2.0
+
+    if mode == 'elevation':
+        return (-W_half - offset, -H_half - offset, 0), (W_half + offset, H_half + offset, D_half + offset)
+    elif mode == 'cross':
+        return (-D_half - offset, -H_half - offset, 0), (D_half + offset, H_half + offset, W_half + offset)
+    elif mode == 'plan':
+        return (-W_half - offset, -D_half - offset, 0), (W_half + offset, D_half + offset, H_half + offset)
+
+    raise ValueError('Wrong mode: {}'.format(mode))
+
+
+def get_unique_name(name, existing_names, suffix='*'):
+    """Function to get a unique name by adding suffix until it's not in existing_names.
+    New name is added to existing_names, so it can be used for many names in a row."""
+    while name in existing_names:
+        name += suffix
+    existing_names.add(name)
+    return name
+
+
+class SectionBatch():
+    """Class to create many Sections at once (e.g. for 800 walls).
+
+    Unlike SectionGenerator:
+    - Section Type, View Template and Scale are resolved once.
+    - Transforms and SectionBoxes are calculated in pure Python before the Transaction.
+    - Unique names are resolved from a set of existing view names, so there are no rename retries.
+    - Views are created in chunked Transactions (single Undo).
+
+    Example:
+        batch = SectionBatch(doc, view_template=template, scale=50)
+        for wall in walls:
+            batch.add(origin, vector, width, height, depth, name='Wall_{}'.format(wall.Id))
+        results = batch.create()     # [(name, {'elevation': ViewSection, ...}), ...]"""
+
+    def __init__(self, doc, modes=('elevation', 'cross', 'plan'), offset=1, section_type_id=None,
+                 view_template=None, scale=None, chunk_size=100):
+        """
+        :param doc:             Revit Document
+        :param modes:           Sections to create for each spec: 'elevation', 'cross', 'plan'
+        :param offset:          Offset of a SectionBox around an element (feet)
+        :param section_type_id: ElementId of ViewFamilyType. Default Section Type is used if None.
+        :param view_template:   View Template to assign (optional)
+        :param scale:           View Scale (optional)
+        :param chunk_size:      Amount of specs per Transaction"""
+        self.doc             = doc
+        self.modes           = modes
+        self.offset          = offset
+        self.section_type_id = section_type_id or doc.GetDefaultElementTypeId(ElementTypeGroup.ViewTypeSection)
+        self.template_id     = view_template.Id if view_template else None
+        self.scale           = scale
+        self.chunk_size      = chunk_size
+
+        self.specs   = []       # [dict, ...]
+        self.results = []       # [(name, {mode: ViewSection}), ...]
+
+    def add(self, origin, vector, width=1, height=1, depth=1, name='Section', sheet=None, points=None):
+        """Function to add a section spec.
+        :param origin: XYZ - Origin of an element
+        :param vector: XYZ - Direction of an element
+        :param name:   Base name for views. '_Elevation', '_Cross', '_Plan' will be added.
+        :param sheet:  ViewSheet to place views on (optional)
+        :param points: {mode: XYZ} - Viewport centers on a sheet (required if sheet is given)"""
+        self.specs.append({'origin': (origin.X, origin.Y, origin.Z),
+                           'vector': (vector.X, vector.Y, vector.Z),
+                           'size'  : (width, height, depth),
+                           'name'  : name,
+                           'sheet' : sheet,
+                           'points': points or {}})
+
+    def prepare(self):
+        """Function to calculate all transforms, boxes and unique names in pure Python.
+        :return: list of prepared specs"""
+        existing_names = set(v.Name for v in FilteredElementCollector(self.doc).OfClass(View).ToElements())
+
+        prepared = []
+        for spec in self.specs:
+            width, height, depth = spec['size']
+            sections = []
+            for mode in self.modes:
+                basis     = get_section_basis(spec['vector'], mode)
+                min_, max_ = get_section_extents(width, height, depth, self.offset, mode)
+                name      = get_unique_name('{}_{}'.format(spec['name'], mode.capitalize()), existing_names)
+                sections.append((mode, basis, min_, max_, name))
+            prepared.append((spec, sections))
+        return prepared
+
+    def _create_spec(self, item):
+        """Function to create Sections for a single prepared spec. Has to be used inside a Transaction."""
+        spec, sections = item
+        origin = XYZ(*spec['origin'])
+
+        views = {}
+        for mode, basis, min_, max_, name in sections:
+            trans        = Transform.Identity
+            trans.Origin = origin
+            trans.BasisX = XYZ(*basis[0])
+            trans.BasisY = XYZ(*basis[1])
+            trans.BasisZ = XYZ(*basis[2])
+
+            section_box           = BoundingBoxXYZ()
+            section_box.Min       = XYZ(*min_)
+            section_box.Max       = XYZ(*max_)
+            section_box.Transform = trans
+
+            view      = ViewSection.CreateSection(self.doc, self.section_type_id, section_box)
+            view.Name = name
+            if self.scale:       view.Scale          = self.scale
+            if self.template_id: view.ViewTemplateId = self.template_id
+
+            if spec['sheet'] and mode in spec['points']:
+                Viewport.Create(self.doc, spec['sheet'].Id, view.Id, spec['points'][mode])
+            views[mode] = view
+
+        self.results.append((spec['name'], views))
+
+    def create(self, title='Create Sections'):
+        """Function to create all Sections.
+        :return: [(name, {mode: ViewSection}), ...]"""
+        prepared = self.prepare()
+        chunked_transactions(self.doc, title, prepared, self._create_spec, self.chunk_size, failures=True)
 
+        # Views from rolled back chunks are no longer valid
+        self.results = [(name, views) for name, views in self.results
+                        if all(v.IsValidObject for v in views.values())]
+        return self.results
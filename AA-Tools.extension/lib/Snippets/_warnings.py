@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+from collections import OrderedDict
+
+from Autodesk.Revit.DB import (FilteredWorksetCollector,
+                               WorksetKind,
+                               ElementId)
+
+# CUSTOM IMPORTS
+from Snippets._csv import write_csv
+from Snippets._profiling import get_element, count_api
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+#====================================================================================================
+NO_LEVEL   = '<No Level>'
+NO_WORKSET = '<No Workset>'
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class WarningsIndex(object):
+    """Index of all warnings of a document for triage.
+
+    doc.GetWarnings() is read once into plain Python lists:
+    - groups:   warnings grouped by failure definition {definition guid: [warning index, ...]}
+    - elements: inverted index {ElementId: [warning index, ...]}
+    Levels and worksets of failing elements are read only once per element, when they are needed.
+
+    Example:
+        index = WarningsIndex(doc)
+        for key, indexes in index.groups.items():
+            print(len(indexes), index.get_description(key))
+        uidoc.Selection.SetElementIds(List[ElementId](index.get_element_ids(key)))
+        index.export_csv(path)"""
+
+    def __init__(self, doc):
+        self.doc          = doc
+        self.descriptions = []      # [description, ...] per warning
+        self.definitions  = []      # [definition guid, ...] per warning
+        self.element_ids  = []      # [[ElementId, ...], ...] per warning
+        self.groups       = OrderedDict()   # {definition guid: [warning index, ...]} (biggest group first)
+        self.elements     = {}      # {ElementId: [warning index, ...]}
+        self._levels      = {}      # {ElementId: level name}
+        self._worksets    = {}      # {ElementId: workset name}
+        self._workset_names = None  # {workset id (int): name}
+        self.build()
+
+    def build(self):
+        """Function to read all warnings once and build the groups and the inverted element index."""
+        groups = {}
+        for i, warning in enumerate(self.doc.GetWarnings()):
+            key = str(warning.GetFailureDefinitionId().Guid)
+            ids = list(warning.GetFailingElements()) + list(warning.GetAdditionalElements())
+            self.descriptions.append(warning.GetDescriptionText())
+            self.definitions.append(key)
+            self.element_ids.append(ids)
+
+            groups.setdefault(key, []).append(i)
+            for el_id in ids:
+                self.elements.setdefault(el_id, []).append(i)
+
+        for key in sorted(groups, key=lambda k: -len(groups[k])):
+            self.groups[key] = groups[key]
+
+    def __len__(self):
+        return len(self.descriptions)
+
+    # ╔═╗╦═╗╔═╗╦ ╦╔═╗╔═╗
+    # ║ ╦╠╦╝║ ║║ ║╠═╝╚═╗
+    # ╚═╝╩╚═╚═╝╚═╝╩  ╚═╝ GROUPS
+    #==================================================
+    def get_description(self, key):
+        #type:(str) -> str
+        """Function to get the description of a warning group (first warning of the group)."""
+        return self.descriptions[self.groups[key][0]]
+
+    def get_by_description(self):
+        #type:() -> OrderedDict
+        """Function to group warnings by description text (biggest group first).
+        :return: {description: [warning index, ...]}"""
+        groups = {}
+        for i, description in enumerate(self.descriptions):
+            groups.setdefault(description, []).append(i)
+        return OrderedDict((d, groups[d]) for d in sorted(groups, key=lambda d: -len(groups[d])))
+
+    def get_element_ids(self, key):
+        #type:(str) -> list
+        """Function to get unique Ids of all elements behind a warning group."""
+        element_ids = OrderedDict()
+        for i in self.groups[key]:
+            for el_id in self.element_ids[i]:
+                element_ids[el_id] = None
+        return list(element_ids)
+
+    def get_warnings(self, element_id):
+        #type:(ElementId) -> list
+        """Function to get descriptions of all warnings of an element."""
+        return [self.descriptions[i] for i in self.elements.get(element_id, [])]
+
+    # ╔╦╗╦═╗╦╦  ╦    ╔╦╗╔═╗╦ ╦╔╗╔
+    #  ║║╠╦╝║║  ║     ║║║ ║║║║║║║
+    # ═╩╝╩╚═╩╩═╝╩═╝  ═╩╝╚═╝╚╩╝╝╚╝ DRILL-DOWN
+    #==================================================
+    def get_level(self, element_id):
+        #type:(ElementId) -> str
+        """Function to get the Level name of an element (read once per element)."""
+        if element_id is None:
+            return NO_LEVEL
+        if element_id not in self._levels:
+            name     = NO_LEVEL
+            element  = get_element(self.doc, element_id)
+            level_id = getattr(element, 'LevelId', None) if element else None
+            if level_id and level_id != ElementId.InvalidElementId:
+                level = get_element(self.doc, level_id)
+                name  = level.Name if level else NO_LEVEL
+            self._levels[element_id] = name
+        return self._levels[element_id]
+
+    def get_workset(self, element_id):
+        #type:(ElementId) -> str
+        """Function to get the Workset name of an element (read once per element)."""
+        if element_id is None:
+            return NO_WORKSET
+        if self._workset_names is None:
+            count_api('collector_passes')
+            self._workset_names = dict((ws.Id.IntegerValue, ws.Name) for ws in
+                                       FilteredWorksetCollector(self.doc).OfKind(WorksetKind.UserWorkset))
+        if element_id not in self._worksets:
+            element    = get_element(self.doc, element_id)
+            workset_id = getattr(element, 'WorksetId', None) if element else None
+            self._worksets[element_id] = self._workset_names.get(workset_id.IntegerValue, NO_WORKSET) \
+                                         if workset_id is not None else NO_WORKSET
+        return self._worksets[element_id]
+
+    def group_by(self, func):
+        """Function to count warnings per group of their elements (e.g. get_level, get_workset).
+        A warning is counted once per group, even if it has several elements there.
+        :return: {name: {definition guid: amount}}"""
+        results = {}
+        for key, indexes in self.groups.items():
+            for i in indexes:
+                for name in set(func(el_id) for el_id in self.element_ids[i] or [None]):
+                    counts      = results.setdefault(name, OrderedDict())
+                    counts[key] = counts.get(key, 0) + 1
+        return results
+
+    def group_by_level(self):
+        """Function to count warnings per Level (see group_by)."""
+        return self.group_by(self.get_level)
+
+    def group_by_workset(self):
+        """Function to count warnings per Workset (see group_by)."""
+        return self.group_by(self.get_workset)
+
+    # ╔═╗╦ ╦╔╦╗╔═╗╦ ╦╔╦╗
+    # ║ ║║ ║ ║ ╠═╝║ ║ ║
+    # ╚═╝╚═╝ ╩ ╩  ╚═╝ ╩  OUTPUT
+    #==================================================
+    def export_csv(self, path):
+        #type:(str) -> str
+        """Function to export all warnings to a CSV file (one row per warning and element).
+        :return: Path to a CSV file."""
+        rows = []
+        for key, indexes in self.groups.items():
+            for i in indexes:
+                for el_id in self.element_ids[i] or [None]:
+                    element = get_element(self.doc, el_id) if el_id else None
+                    rows.append([self.descriptions[i], key,
+                                 el_id.IntegerValue if el_id else '',
+                                 element.Category.Name if element and element.Category else '',
+                                 self.get_level(el_id), self.get_workset(el_id)])
+
+        header = ['Warning', 'Definition', 'ElementId', 'Category', 'Level', 'Workset']
+        return write_csv(path, rows, header)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+#====================================================================================================
+from Autodesk.Revit.DB import (WorksharingUtils,
+                               CheckoutStatus,
+                               ModelUpdatesStatus,
+                               ElementId)
+
+#.NET
+import clr
+clr.AddReference('System')
+from System.Collections.Generic import List
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+#====================================================================================================
+class PreCheckout(object):
+    """Pre-flight stage for bulk modifications in workshared models.
+
+    - Checkout status of all elements is read in a single sweep (no Transaction, no exceptions).
+    - Elements that are not owned are checked out with a single CheckoutElements call.
+    - Elements owned by other users (or changed in central) are reported as blocked,
+      so they can be skipped before the Transaction starts.
+
+    Has to be run outside of a Transaction. ef_Transaction(checkout=PreCheckout(...)) runs it automatically
+    and prints blocked elements.
+
+    Example:
+        pre = PreCheckout(doc, elements)
+        with ef_Transaction(doc, 'Rename', checkout=pre):
+            for el in pre.filter(elements):
+                ..."""
+
+    def __init__(self, doc, elements):
+        """
+        :param doc:      Revit Document
+        :param elements: List of Elements or ElementIds that will be modified."""
+        self.doc     = doc
+        self.ids     = [el if isinstance(el, ElementId) else el.Id for el in elements]
+        self.blocked = {}       # {ElementId: reason}
+        self.done    = False
+
+    def run(self):
+        """Function to check and checkout all elements.
+        :return: dict {ElementId: reason} of blocked elements."""
+        # Detached models have no central model, so there is nothing to checkout
+        if self.done or not self.doc.IsWorkshared or self.doc.IsDetached:
+            self.done = True
+            return self.blocked
+
+        # SINGLE SWEEP
+        to_checkout = []
+        for el_id in self.ids:
+            status = WorksharingUtils.GetCheckoutStatus(self.doc, el_id)
+            if status == CheckoutStatus.OwnedByOtherUser:
+                owner = WorksharingUtils.GetWorksharingTooltipInfo(self.doc, el_id).Owner
+                self.blocked[el_id] = 'Owned by {}'.format(owner)
+                continue
+
+            updates = WorksharingUtils.GetModelUpdatesStatus(self.doc, el_id)
+            if updates == ModelUpdatesStatus.DeletedInCentral:
+                self.blocked[el_id] = 'Deleted in central'
+            elif updates == ModelUpdatesStatus.UpdatedInCentral:
+                self.blocked[el_id] = 'Updated in central (Reload Latest)'
+            elif status == CheckoutStatus.NotOwned:
+                to_checkout.append(el_id)
+
+        # SINGLE CHECKOUT
+        if to_checkout:
+            checked_out = set(WorksharingUtils.CheckoutElements(self.doc, List[ElementId](to_checkout)))
+            for el_id in to_checkout:
+                if el_id not in checked_out:
+                    self.blocked[el_id] = 'Could not be checked out'
+
+        self.done = True
+        return self.blocked
+
+    def is_editable(self, element):
+        el_id = element if isinstance(element, ElementId) else element.Id
+        return el_id not in self.blocked
+
+    def filter(self, elements):
+        """Function to drop blocked elements from given list."""
+        if not self.done:
+            self.run()
+        return [el for el in elements if self.is_editable(el)]
+
+    def report(self):
+        """Function to print blocked elements."""
+        if not self.blocked:
+            return
+        print('{} elements are blocked and were skipped:'.format(len(self.blocked)))
+        for el_id, reason in self.blocked.items():
+            print('- [{}] {}'.format(el_id, reason))